@@ -759,9 +759,6 @@ static CYTHON_INLINE float __PYX_NAN() {
 #include <stdio.h>
 #include "numpy/arrayobject.h"
 #include "numpy/ufuncobject.h"
-
-    /* NumPy API declarations from "numpy/__init__.pxd" */
-    
 #include <math.h>
 #include "math.h"
 #ifdef _OPENMP
@@ -1036,7 +1033,7 @@ typedef struct {
 } __Pyx_BufFmt_Context;
 
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":697
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":775
  * # in Cython to enable them only on the right systems.
  * 
  * ctypedef npy_int8       int8_t             # <<<<<<<<<<<<<<
@@ -1045,7 +1042,7 @@ typedef struct {
  */
 typedef npy_int8 __pyx_t_5numpy_int8_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":698
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":776
  * 
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t             # <<<<<<<<<<<<<<
@@ -1054,7 +1051,7 @@ typedef npy_int8 __pyx_t_5numpy_int8_t;
  */
 typedef npy_int16 __pyx_t_5numpy_int16_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":699
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":777
  * ctypedef npy_int8       int8_t
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t             # <<<<<<<<<<<<<<
@@ -1063,7 +1060,7 @@ typedef npy_int16 __pyx_t_5numpy_int16_t;
  */
 typedef npy_int32 __pyx_t_5numpy_int32_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":700
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":778
  * ctypedef npy_int16      int16_t
  * ctypedef npy_int32      int32_t
  * ctypedef npy_int64      int64_t             # <<<<<<<<<<<<<<
@@ -1072,7 +1069,7 @@ typedef npy_int32 __pyx_t_5numpy_int32_t;
  */
 typedef npy_int64 __pyx_t_5numpy_int64_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":704
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":782
  * #ctypedef npy_int128     int128_t
  * 
  * ctypedef npy_uint8      uint8_t             # <<<<<<<<<<<<<<
@@ -1081,7 +1078,7 @@ typedef npy_int64 __pyx_t_5numpy_int64_t;
  */
 typedef npy_uint8 __pyx_t_5numpy_uint8_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":705
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":783
  * 
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t             # <<<<<<<<<<<<<<
@@ -1090,7 +1087,7 @@ typedef npy_uint8 __pyx_t_5numpy_uint8_t;
  */
 typedef npy_uint16 __pyx_t_5numpy_uint16_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":706
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":784
  * ctypedef npy_uint8      uint8_t
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t             # <<<<<<<<<<<<<<
@@ -1099,7 +1096,7 @@ typedef npy_uint16 __pyx_t_5numpy_uint16_t;
  */
 typedef npy_uint32 __pyx_t_5numpy_uint32_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":707
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":785
  * ctypedef npy_uint16     uint16_t
  * ctypedef npy_uint32     uint32_t
  * ctypedef npy_uint64     uint64_t             # <<<<<<<<<<<<<<
@@ -1108,7 +1105,7 @@ typedef npy_uint32 __pyx_t_5numpy_uint32_t;
  */
 typedef npy_uint64 __pyx_t_5numpy_uint64_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":711
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":789
  * #ctypedef npy_uint128    uint128_t
  * 
  * ctypedef npy_float32    float32_t             # <<<<<<<<<<<<<<
@@ -1117,7 +1114,7 @@ typedef npy_uint64 __pyx_t_5numpy_uint64_t;
  */
 typedef npy_float32 __pyx_t_5numpy_float32_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":712
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":790
  * 
  * ctypedef npy_float32    float32_t
  * ctypedef npy_float64    float64_t             # <<<<<<<<<<<<<<
@@ -1126,7 +1123,7 @@ typedef npy_float32 __pyx_t_5numpy_float32_t;
  */
 typedef npy_float64 __pyx_t_5numpy_float64_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":721
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":799
  * # The int types are mapped a bit surprising --
  * # numpy.int corresponds to 'l' and numpy.long to 'q'
  * ctypedef npy_long       int_t             # <<<<<<<<<<<<<<
@@ -1135,7 +1132,7 @@ typedef npy_float64 __pyx_t_5numpy_float64_t;
  */
 typedef npy_long __pyx_t_5numpy_int_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":722
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":800
  * # numpy.int corresponds to 'l' and numpy.long to 'q'
  * ctypedef npy_long       int_t
  * ctypedef npy_longlong   long_t             # <<<<<<<<<<<<<<
@@ -1144,7 +1141,7 @@ typedef npy_long __pyx_t_5numpy_int_t;
  */
 typedef npy_longlong __pyx_t_5numpy_long_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":723
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":801
  * ctypedef npy_long       int_t
  * ctypedef npy_longlong   long_t
  * ctypedef npy_longlong   longlong_t             # <<<<<<<<<<<<<<
@@ -1153,7 +1150,7 @@ typedef npy_longlong __pyx_t_5numpy_long_t;
  */
 typedef npy_longlong __pyx_t_5numpy_longlong_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":725
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":803
  * ctypedef npy_longlong   longlong_t
  * 
  * ctypedef npy_ulong      uint_t             # <<<<<<<<<<<<<<
@@ -1162,7 +1159,7 @@ typedef npy_longlong __pyx_t_5numpy_longlong_t;
  */
 typedef npy_ulong __pyx_t_5numpy_uint_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":726
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":804
  * 
  * ctypedef npy_ulong      uint_t
  * ctypedef npy_ulonglong  ulong_t             # <<<<<<<<<<<<<<
@@ -1171,7 +1168,7 @@ typedef npy_ulong __pyx_t_5numpy_uint_t;
  */
 typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":727
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":805
  * ctypedef npy_ulong      uint_t
  * ctypedef npy_ulonglong  ulong_t
  * ctypedef npy_ulonglong  ulonglong_t             # <<<<<<<<<<<<<<
@@ -1180,7 +1177,7 @@ typedef npy_ulonglong __pyx_t_5numpy_ulong_t;
  */
 typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":729
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":807
  * ctypedef npy_ulonglong  ulonglong_t
  * 
  * ctypedef npy_intp       intp_t             # <<<<<<<<<<<<<<
@@ -1189,7 +1186,7 @@ typedef npy_ulonglong __pyx_t_5numpy_ulonglong_t;
  */
 typedef npy_intp __pyx_t_5numpy_intp_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":730
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":808
  * 
  * ctypedef npy_intp       intp_t
  * ctypedef npy_uintp      uintp_t             # <<<<<<<<<<<<<<
@@ -1198,7 +1195,7 @@ typedef npy_intp __pyx_t_5numpy_intp_t;
  */
 typedef npy_uintp __pyx_t_5numpy_uintp_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":732
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":810
  * ctypedef npy_uintp      uintp_t
  * 
  * ctypedef npy_double     float_t             # <<<<<<<<<<<<<<
@@ -1207,7 +1204,7 @@ typedef npy_uintp __pyx_t_5numpy_uintp_t;
  */
 typedef npy_double __pyx_t_5numpy_float_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":733
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":811
  * 
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t             # <<<<<<<<<<<<<<
@@ -1216,7 +1213,7 @@ typedef npy_double __pyx_t_5numpy_float_t;
  */
 typedef npy_double __pyx_t_5numpy_double_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":734
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":812
  * ctypedef npy_double     float_t
  * ctypedef npy_double     double_t
  * ctypedef npy_longdouble longdouble_t             # <<<<<<<<<<<<<<
@@ -1248,9 +1245,18 @@ typedef __pyx_t_5numpy_int64_t __pyx_t_5tombo_9_c_helper_DTYPE_INT_t;
  * DTYPE_INT16 = np.int16
  * ctypedef np.int16_t DTYPE_INT16_t             # <<<<<<<<<<<<<<
  * 
- * from libc.math cimport log, exp
+ * DTYPE_UINT8 = np.uint8
  */
 typedef __pyx_t_5numpy_int16_t __pyx_t_5tombo_9_c_helper_DTYPE_INT16_t;
+
+/* "tombo/_c_helper.pyx":16
+ * 
+ * DTYPE_UINT8 = np.uint8
+ * ctypedef np.uint8_t DTYPE_UINT8_t             # <<<<<<<<<<<<<<
+ * 
+ * from libc.math cimport log, exp
+ */
+typedef __pyx_t_5numpy_uint8_t __pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t;
 /* Declarations.proto */
 #if CYTHON_CCOMPLEX
   #ifdef __cplusplus
@@ -1278,7 +1284,7 @@ static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(do
 
 /*--- Type declarations ---*/
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":736
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":814
  * ctypedef npy_longdouble longdouble_t
  * 
  * ctypedef npy_cfloat      cfloat_t             # <<<<<<<<<<<<<<
@@ -1287,7 +1293,7 @@ static CYTHON_INLINE __pyx_t_double_complex __pyx_t_double_complex_from_parts(do
  */
 typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":737
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":815
  * 
  * ctypedef npy_cfloat      cfloat_t
  * ctypedef npy_cdouble     cdouble_t             # <<<<<<<<<<<<<<
@@ -1296,7 +1302,7 @@ typedef npy_cfloat __pyx_t_5numpy_cfloat_t;
  */
 typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":738
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":816
  * ctypedef npy_cfloat      cfloat_t
  * ctypedef npy_cdouble     cdouble_t
  * ctypedef npy_clongdouble clongdouble_t             # <<<<<<<<<<<<<<
@@ -1305,7 +1311,7 @@ typedef npy_cdouble __pyx_t_5numpy_cdouble_t;
  */
 typedef npy_clongdouble __pyx_t_5numpy_clongdouble_t;
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":740
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":818
  * ctypedef npy_clongdouble clongdouble_t
  * 
  * ctypedef npy_cdouble     complex_t             # <<<<<<<<<<<<<<
@@ -1675,6 +1681,9 @@ static CYTHON_INLINE int __Pyx_IterFinish(void);
 /* UnpackItemEndCheck.proto */
 static int __Pyx_IternextUnpackEndCheck(PyObject *retval, Py_ssize_t expected);
 
+/* BufferFallbackError.proto */
+static void __Pyx_RaiseBufferFallbackError(void);
+
 /* DictGetItem.proto */
 #if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
 static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
@@ -1972,6 +1981,7 @@ static __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_f_5tombo_9_c_helper__c_search
 static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t = { "DTYPE_t", NULL, sizeof(__pyx_t_5tombo_9_c_helper_DTYPE_t), { 0 }, 0, 'R', 0, 0 };
 static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT_t = { "DTYPE_INT_t", NULL, sizeof(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t), { 0 }, 0, IS_UNSIGNED(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t) ? 'U' : 'I', IS_UNSIGNED(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t), 0 };
 static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT16_t = { "DTYPE_INT16_t", NULL, sizeof(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t), { 0 }, 0, IS_UNSIGNED(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t) ? 'U' : 'I', IS_UNSIGNED(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t), 0 };
+static __Pyx_TypeInfo __Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t = { "DTYPE_UINT8_t", NULL, sizeof(__pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t), { 0 }, 0, IS_UNSIGNED(__pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t) ? 'U' : 'I', IS_UNSIGNED(__pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t), 0 };
 #define __Pyx_MODULE_NAME "tombo._c_helper"
 extern int __pyx_module_is_main_tombo___c_helper;
 int __pyx_module_is_main_tombo___c_helper = 0;
@@ -1981,14 +1991,15 @@ static PyObject *__pyx_builtin_range;
 static PyObject *__pyx_builtin_NotImplementedError;
 static PyObject *__pyx_builtin_reversed;
 static PyObject *__pyx_builtin_enumerate;
-static PyObject *__pyx_builtin_RuntimeError;
 static PyObject *__pyx_builtin_ValueError;
+static PyObject *__pyx_builtin_RuntimeError;
 static PyObject *__pyx_builtin_ImportError;
 static const char __pyx_k_i[] = "i";
 static const char __pyx_k_j[] = "j";
 static const char __pyx_k_m1[] = "m1";
 static const char __pyx_k_m2[] = "m2";
 static const char __pyx_k_np[] = "np";
+static const char __pyx_k_up[] = "up";
 static const char __pyx_k_NAN[] = "NAN";
 static const char __pyx_k_abs[] = "abs";
 static const char __pyx_k_arr[] = "arr";
@@ -1997,8 +2008,10 @@ static const char __pyx_k_pos[] = "pos";
 static const char __pyx_k_s_i[] = "s_i";
 static const char __pyx_k_copy[] = "copy";
 static const char __pyx_k_cpts[] = "cpts";
+static const char __pyx_k_down[] = "down";
 static const char __pyx_k_main[] = "__main__";
 static const char __pyx_k_name[] = "__name__";
+static const char __pyx_k_segs[] = "segs";
 static const char __pyx_k_sort[] = "sort";
 static const char __pyx_k_test[] = "__test__";
 static const char __pyx_k_var1[] = "var1";
@@ -2011,24 +2024,31 @@ static const char __pyx_k_empty[] = "empty";
 static const char __pyx_k_int16[] = "int16";
 static const char __pyx_k_int32[] = "int32";
 static const char __pyx_k_int64[] = "int64";
+static const char __pyx_k_k_idx[] = "k_idx";
+static const char __pyx_k_moves[] = "moves";
 static const char __pyx_k_numpy[] = "numpy";
 static const char __pyx_k_range[] = "range";
+static const char __pyx_k_uint8[] = "uint8";
 static const char __pyx_k_v_len[] = "v_len";
 static const char __pyx_k_v_var[] = "v_var";
 static const char __pyx_k_astype[] = "astype";
 static const char __pyx_k_cumsum[] = "cumsum";
 static const char __pyx_k_import[] = "__import__";
+static const char __pyx_k_n_keep[] = "n_keep";
 static const char __pyx_k_n_segs[] = "n_segs";
 static const char __pyx_k_slopes[] = "slopes";
 static const char __pyx_k_update[] = "update";
 static const char __pyx_k_v_mean[] = "v_mean";
 static const char __pyx_k_values[] = "values";
 static const char __pyx_k_argsort[] = "argsort";
+static const char __pyx_k_end_pos[] = "end_pos";
 static const char __pyx_k_float64[] = "float64";
+static const char __pyx_k_n_moves[] = "n_moves";
 static const char __pyx_k_pop_val[] = "pop_val";
 static const char __pyx_k_pos_sig[] = "pos_sig";
 static const char __pyx_k_seg_idx[] = "seg_idx";
 static const char __pyx_k_seg_len[] = "seg_len";
+static const char __pyx_k_sig_len[] = "sig_len";
 static const char __pyx_k_alt_diff[] = "alt_diff";
 static const char __pyx_k_alt_mean[] = "alt_mean";
 static const char __pyx_k_cand_idx[] = "cand_idx";
@@ -2049,10 +2069,15 @@ static const char __pyx_k_seg_mean[] = "seg_mean";
 static const char __pyx_k_stds_arr[] = "stds_arr";
 static const char __pyx_k_t_scores[] = "t_scores";
 static const char __pyx_k_DTYPE_INT[] = "DTYPE_INT";
+static const char __pyx_k_after_len[] = "after_len";
+static const char __pyx_k_after_seq[] = "after_seq";
 static const char __pyx_k_alt_z_sum[] = "alt_z_sum";
 static const char __pyx_k_const_var[] = "const_var";
 static const char __pyx_k_enumerate[] = "enumerate";
+static const char __pyx_k_indel_len[] = "indel_len";
+static const char __pyx_k_indel_seq[] = "indel_seq";
 static const char __pyx_k_itertools[] = "itertools";
+static const char __pyx_k_keep_idxs[] = "keep_idxs";
 static const char __pyx_k_lower_lim[] = "lower_lim";
 static const char __pyx_k_max_slope[] = "max_slope";
 static const char __pyx_k_means_arr[] = "means_arr";
@@ -2064,6 +2089,8 @@ static const char __pyx_k_rolling_i[] = "rolling_i";
 static const char __pyx_k_upper_lim[] = "upper_lim";
 static const char __pyx_k_ValueError[] = "ValueError";
 static const char __pyx_k_added_cpts[] = "added_cpts";
+static const char __pyx_k_before_len[] = "before_len";
+static const char __pyx_k_before_seq[] = "before_seq";
 static const char __pyx_k_c_mean_std[] = "c_mean_std";
 static const char __pyx_k_curr_index[] = "curr_index";
 static const char __pyx_k_lower_pctl[] = "lower_pctl";
@@ -2074,8 +2101,10 @@ static const char __pyx_k_raw_signal[] = "raw_signal";
 static const char __pyx_k_scale_diff[] = "scale_diff";
 static const char __pyx_k_scale_mean[] = "scale_mean";
 static const char __pyx_k_sorted_arr[] = "sorted_arr";
+static const char __pyx_k_start_clip[] = "start_clip";
 static const char __pyx_k_upper_pctl[] = "upper_pctl";
 static const char __pyx_k_DTYPE_INT16[] = "DTYPE_INT16";
+static const char __pyx_k_DTYPE_UINT8[] = "DTYPE_UINT8";
 static const char __pyx_k_ImportError[] = "ImportError";
 static const char __pyx_k_c_new_means[] = "c_new_means";
 static const char __pyx_k_concatenate[] = "concatenate";
@@ -2100,6 +2129,7 @@ static const char __pyx_k_candidate_poss[] = "candidate_poss";
 static const char __pyx_k_clipped_signal[] = "clipped_signal";
 static const char __pyx_k_alt_log_var_sum[] = "alt_log_var_sum";
 static const char __pyx_k_c_new_mean_stds[] = "c_new_mean_stds";
+static const char __pyx_k_c_validate_segs[] = "c_validate_segs";
 static const char __pyx_k_ref_log_var_sum[] = "ref_log_var_sum";
 static const char __pyx_k_tombo__c_helper[] = "tombo._c_helper";
 static const char __pyx_k_c_calc_llh_ratio[] = "c_calc_llh_ratio";
@@ -2113,11 +2143,14 @@ static const char __pyx_k_running_scaled_lhr[] = "running_scaled_lhr";
 static const char __pyx_k_running_stat_width[] = "running_stat_width";
 static const char __pyx_k_NotImplementedError[] = "NotImplementedError";
 static const char __pyx_k_tombo__c_helper_pyx[] = "tombo/_c_helper.pyx";
+static const char __pyx_k_c_extend_ambig_indel[] = "c_extend_ambig_indel";
 static const char __pyx_k_density_height_power[] = "density_height_power";
 static const char __pyx_k_density_height_factor[] = "density_height_factor";
 static const char __pyx_k_c_apply_outlier_thresh[] = "c_apply_outlier_thresh";
+static const char __pyx_k_c_stay_state_keep_idxs[] = "c_stay_state_keep_idxs";
 static const char __pyx_k_c_valid_cpts_w_cap_t_test[] = "c_valid_cpts_w_cap_t_test";
 static const char __pyx_k_c_calc_llh_ratio_const_var[] = "c_calc_llh_ratio_const_var";
+static const char __pyx_k_ndarray_is_not_C_contiguous[] = "ndarray is not C contiguous";
 static const char __pyx_k_c_compute_running_pctl_diffs[] = "c_compute_running_pctl_diffs";
 static const char __pyx_k_numpy_core_multiarray_failed_to[] = "numpy.core.multiarray failed to import";
 static const char __pyx_k_unknown_dtype_code_in_numpy_pxd[] = "unknown dtype code in numpy.pxd (%d)";
@@ -2125,11 +2158,13 @@ static const char __pyx_k_Fewer_changepoints_found_than_re[] = "Fewer changepoin
 static const char __pyx_k_Format_string_allocated_too_shor[] = "Format string allocated too short, see comment in numpy.pxd";
 static const char __pyx_k_Non_native_byte_order_not_suppor[] = "Non-native byte order not supported";
 static const char __pyx_k_c_calc_scaled_llh_ratio_const_va[] = "c_calc_scaled_llh_ratio_const_var";
+static const char __pyx_k_ndarray_is_not_Fortran_contiguou[] = "ndarray is not Fortran contiguous";
 static const char __pyx_k_numpy_core_umath_failed_to_impor[] = "numpy.core.umath failed to import";
 static const char __pyx_k_Format_string_allocated_too_shor_2[] = "Format string allocated too short.";
 static PyObject *__pyx_n_s_DTYPE;
 static PyObject *__pyx_n_s_DTYPE_INT;
 static PyObject *__pyx_n_s_DTYPE_INT16;
+static PyObject *__pyx_n_s_DTYPE_UINT8;
 static PyObject *__pyx_kp_s_Fewer_changepoints_found_than_re;
 static PyObject *__pyx_kp_u_Format_string_allocated_too_shor;
 static PyObject *__pyx_kp_u_Format_string_allocated_too_shor_2;
@@ -2141,6 +2176,8 @@ static PyObject *__pyx_n_s_RuntimeError;
 static PyObject *__pyx_n_s_ValueError;
 static PyObject *__pyx_n_s_abs;
 static PyObject *__pyx_n_s_added_cpts;
+static PyObject *__pyx_n_s_after_len;
+static PyObject *__pyx_n_s_after_seq;
 static PyObject *__pyx_n_s_alt_diff;
 static PyObject *__pyx_n_s_alt_log_var_sum;
 static PyObject *__pyx_n_s_alt_mean;
@@ -2150,6 +2187,8 @@ static PyObject *__pyx_n_s_arr;
 static PyObject *__pyx_n_s_arr_i;
 static PyObject *__pyx_n_s_array;
 static PyObject *__pyx_n_s_astype;
+static PyObject *__pyx_n_s_before_len;
+static PyObject *__pyx_n_s_before_seq;
 static PyObject *__pyx_n_s_blacklist_pos;
 static PyObject *__pyx_n_s_c_apply_outlier_thresh;
 static PyObject *__pyx_n_s_c_calc_llh_ratio;
@@ -2157,12 +2196,15 @@ static PyObject *__pyx_n_s_c_calc_llh_ratio_const_var;
 static PyObject *__pyx_n_s_c_calc_scaled_llh_ratio_const_va;
 static PyObject *__pyx_n_s_c_compute_running_pctl_diffs;
 static PyObject *__pyx_n_s_c_compute_slopes;
+static PyObject *__pyx_n_s_c_extend_ambig_indel;
 static PyObject *__pyx_n_s_c_mean_std;
 static PyObject *__pyx_n_s_c_new_mean_stds;
 static PyObject *__pyx_n_s_c_new_means;
+static PyObject *__pyx_n_s_c_stay_state_keep_idxs;
 static PyObject *__pyx_n_s_c_valid_cpts;
 static PyObject *__pyx_n_s_c_valid_cpts_w_cap;
 static PyObject *__pyx_n_s_c_valid_cpts_w_cap_t_test;
+static PyObject *__pyx_n_s_c_validate_segs;
 static PyObject *__pyx_n_s_cand_idx;
 static PyObject *__pyx_n_s_cand_pos;
 static PyObject *__pyx_n_s_candidate_poss;
@@ -2179,18 +2221,24 @@ static PyObject *__pyx_n_s_curr_sum;
 static PyObject *__pyx_n_s_curr_var;
 static PyObject *__pyx_n_s_density_height_factor;
 static PyObject *__pyx_n_s_density_height_power;
+static PyObject *__pyx_n_s_down;
 static PyObject *__pyx_n_s_dtype;
 static PyObject *__pyx_n_s_empty;
+static PyObject *__pyx_n_s_end_pos;
 static PyObject *__pyx_n_s_enumerate;
 static PyObject *__pyx_n_s_float64;
 static PyObject *__pyx_n_s_i;
 static PyObject *__pyx_n_s_idx;
 static PyObject *__pyx_n_s_import;
+static PyObject *__pyx_n_s_indel_len;
+static PyObject *__pyx_n_s_indel_seq;
 static PyObject *__pyx_n_s_int16;
 static PyObject *__pyx_n_s_int32;
 static PyObject *__pyx_n_s_int64;
 static PyObject *__pyx_n_s_itertools;
 static PyObject *__pyx_n_s_j;
+static PyObject *__pyx_n_s_k_idx;
+static PyObject *__pyx_n_s_keep_idxs;
 static PyObject *__pyx_n_s_log_lh_ratio;
 static PyObject *__pyx_n_s_lower_lim;
 static PyObject *__pyx_n_s_lower_pctl;
@@ -2202,9 +2250,14 @@ static PyObject *__pyx_n_s_max_slope;
 static PyObject *__pyx_n_s_means_arr;
 static PyObject *__pyx_n_s_means_diff;
 static PyObject *__pyx_n_s_min_base_obs;
+static PyObject *__pyx_n_s_moves;
 static PyObject *__pyx_n_s_n_events;
+static PyObject *__pyx_n_s_n_keep;
+static PyObject *__pyx_n_s_n_moves;
 static PyObject *__pyx_n_s_n_segs;
 static PyObject *__pyx_n_s_name;
+static PyObject *__pyx_kp_u_ndarray_is_not_C_contiguous;
+static PyObject *__pyx_kp_u_ndarray_is_not_Fortran_contiguou;
 static PyObject *__pyx_n_s_new_segs;
 static PyObject *__pyx_n_s_norm_signal;
 static PyObject *__pyx_n_s_np;
@@ -2250,15 +2303,20 @@ static PyObject *__pyx_n_s_scale_mean;
 static PyObject *__pyx_n_s_seg_idx;
 static PyObject *__pyx_n_s_seg_len;
 static PyObject *__pyx_n_s_seg_mean;
+static PyObject *__pyx_n_s_segs;
+static PyObject *__pyx_n_s_sig_len;
 static PyObject *__pyx_n_s_slopes;
 static PyObject *__pyx_n_s_sort;
 static PyObject *__pyx_n_s_sorted_arr;
+static PyObject *__pyx_n_s_start_clip;
 static PyObject *__pyx_n_s_stds_arr;
 static PyObject *__pyx_n_s_t_scores;
 static PyObject *__pyx_n_s_test;
 static PyObject *__pyx_n_s_tombo__c_helper;
 static PyObject *__pyx_kp_s_tombo__c_helper_pyx;
+static PyObject *__pyx_n_s_uint8;
 static PyObject *__pyx_kp_u_unknown_dtype_code_in_numpy_pxd;
+static PyObject *__pyx_n_s_up;
 static PyObject *__pyx_n_s_update;
 static PyObject *__pyx_n_s_upper_lim;
 static PyObject *__pyx_n_s_upper_pctl;
@@ -2282,10 +2340,17 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
 static PyObject *__pyx_pf_5tombo_9_c_helper_18c_calc_llh_ratio_const_var(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_reg_means, PyArrayObject *__pyx_v_reg_ref_means, PyArrayObject *__pyx_v_reg_alt_means, __pyx_t_5tombo_9_c_helper_DTYPE_t __pyx_v_const_var); /* proto */
 static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_reg_means, PyArrayObject *__pyx_v_reg_ref_means, PyArrayObject *__pyx_v_reg_alt_means, __pyx_t_5tombo_9_c_helper_DTYPE_t __pyx_v_const_var, __pyx_t_5tombo_9_c_helper_DTYPE_t __pyx_v_scale_factor, __pyx_t_5tombo_9_c_helper_DTYPE_t __pyx_v_density_height_factor, __pyx_t_5tombo_9_c_helper_DTYPE_t __pyx_v_density_height_power); /* proto */
 static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_r_event_means, PyArrayObject *__pyx_v_r_model_means, __pyx_t_5tombo_9_c_helper_DTYPE_t __pyx_v_max_slope); /* proto */
+static PyObject *__pyx_pf_5tombo_9_c_helper_24c_extend_ambig_indel(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_indel_seq, PyArrayObject *__pyx_v_before_seq, PyArrayObject *__pyx_v_after_seq); /* proto */
+static PyObject *__pyx_pf_5tombo_9_c_helper_26c_validate_segs(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_segs, __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_sig_len); /* proto */
+static PyObject *__pyx_pf_5tombo_9_c_helper_28c_stay_state_keep_idxs(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_moves); /* proto */
+static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /* proto */
+static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info); /* proto */
 static __Pyx_CachedCFunction __pyx_umethod_PySet_Type_update = {0, &__pyx_n_s_update, 0, 0, 0};
 static PyObject *__pyx_float_0_0;
+static PyObject *__pyx_int_0;
 static PyObject *__pyx_int_1;
 static PyObject *__pyx_int_2;
+static PyObject *__pyx_int_3;
 static PyObject *__pyx_int_neg_1;
 static PyObject *__pyx_slice_;
 static PyObject *__pyx_slice__3;
@@ -2297,6 +2362,7 @@ static PyObject *__pyx_tuple__7;
 static PyObject *__pyx_tuple__8;
 static PyObject *__pyx_tuple__9;
 static PyObject *__pyx_tuple__10;
+static PyObject *__pyx_tuple__11;
 static PyObject *__pyx_tuple__12;
 static PyObject *__pyx_tuple__14;
 static PyObject *__pyx_tuple__16;
@@ -2308,7 +2374,10 @@ static PyObject *__pyx_tuple__26;
 static PyObject *__pyx_tuple__28;
 static PyObject *__pyx_tuple__30;
 static PyObject *__pyx_tuple__32;
-static PyObject *__pyx_codeobj__11;
+static PyObject *__pyx_tuple__34;
+static PyObject *__pyx_tuple__36;
+static PyObject *__pyx_tuple__38;
+static PyObject *__pyx_tuple__40;
 static PyObject *__pyx_codeobj__13;
 static PyObject *__pyx_codeobj__15;
 static PyObject *__pyx_codeobj__17;
@@ -2320,9 +2389,13 @@ static PyObject *__pyx_codeobj__27;
 static PyObject *__pyx_codeobj__29;
 static PyObject *__pyx_codeobj__31;
 static PyObject *__pyx_codeobj__33;
+static PyObject *__pyx_codeobj__35;
+static PyObject *__pyx_codeobj__37;
+static PyObject *__pyx_codeobj__39;
+static PyObject *__pyx_codeobj__41;
 /* Late includes */
 
-/* "tombo/_c_helper.pyx":22
+/* "tombo/_c_helper.pyx":25
  * from itertools import combinations
  * 
  * def c_mean_std(np.ndarray[DTYPE_t] values):             # <<<<<<<<<<<<<<
@@ -2341,7 +2414,7 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_1c_mean_std(PyObject *__pyx_self, Py
   PyObject *__pyx_r = 0;
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("c_mean_std (wrapper)", 0);
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_values), __pyx_ptype_5numpy_ndarray, 1, "values", 0))) __PYX_ERR(0, 22, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_values), __pyx_ptype_5numpy_ndarray, 1, "values", 0))) __PYX_ERR(0, 25, __pyx_L1_error)
   __pyx_r = __pyx_pf_5tombo_9_c_helper_c_mean_std(__pyx_self, ((PyArrayObject *)__pyx_v_values));
 
   /* function exit code */
@@ -2380,11 +2453,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_c_mean_std(CYTHON_UNUSED PyObject *_
   __pyx_pybuffernd_values.rcbuffer = &__pyx_pybuffer_values;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_values.rcbuffer->pybuffer, (PyObject*)__pyx_v_values, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 22, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_values.rcbuffer->pybuffer, (PyObject*)__pyx_v_values, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 25, __pyx_L1_error)
   }
   __pyx_pybuffernd_values.diminfo[0].strides = __pyx_pybuffernd_values.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_values.diminfo[0].shape = __pyx_pybuffernd_values.rcbuffer->pybuffer.shape[0];
 
-  /* "tombo/_c_helper.pyx":28
+  /* "tombo/_c_helper.pyx":31
  *     cdef DTYPE_t v_mean, v_var
  *     cdef DTYPE_INT_t idx
  *     cdef DTYPE_INT_t v_len = values.shape[0]             # <<<<<<<<<<<<<<
@@ -2393,7 +2466,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_c_mean_std(CYTHON_UNUSED PyObject *_
  */
   __pyx_v_v_len = (__pyx_v_values->dimensions[0]);
 
-  /* "tombo/_c_helper.pyx":29
+  /* "tombo/_c_helper.pyx":32
  *     cdef DTYPE_INT_t idx
  *     cdef DTYPE_INT_t v_len = values.shape[0]
  *     v_mean = 0             # <<<<<<<<<<<<<<
@@ -2402,7 +2475,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_c_mean_std(CYTHON_UNUSED PyObject *_
  */
   __pyx_v_v_mean = 0.0;
 
-  /* "tombo/_c_helper.pyx":30
+  /* "tombo/_c_helper.pyx":33
  *     cdef DTYPE_INT_t v_len = values.shape[0]
  *     v_mean = 0
  *     for idx in range(v_len):             # <<<<<<<<<<<<<<
@@ -2414,7 +2487,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_c_mean_std(CYTHON_UNUSED PyObject *_
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_idx = __pyx_t_3;
 
-    /* "tombo/_c_helper.pyx":31
+    /* "tombo/_c_helper.pyx":34
  *     v_mean = 0
  *     for idx in range(v_len):
  *         v_mean += values[idx]             # <<<<<<<<<<<<<<
@@ -2429,12 +2502,12 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_c_mean_std(CYTHON_UNUSED PyObject *_
     } else if (unlikely(__pyx_t_4 >= __pyx_pybuffernd_values.diminfo[0].shape)) __pyx_t_5 = 0;
     if (unlikely(__pyx_t_5 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_5);
-      __PYX_ERR(0, 31, __pyx_L1_error)
+      __PYX_ERR(0, 34, __pyx_L1_error)
     }
     __pyx_v_v_mean = (__pyx_v_v_mean + (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_values.rcbuffer->pybuffer.buf, __pyx_t_4, __pyx_pybuffernd_values.diminfo[0].strides)));
   }
 
-  /* "tombo/_c_helper.pyx":32
+  /* "tombo/_c_helper.pyx":35
  *     for idx in range(v_len):
  *         v_mean += values[idx]
  *     v_mean /= v_len             # <<<<<<<<<<<<<<
@@ -2443,11 +2516,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_c_mean_std(CYTHON_UNUSED PyObject *_
  */
   if (unlikely(__pyx_v_v_len == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 32, __pyx_L1_error)
+    __PYX_ERR(0, 35, __pyx_L1_error)
   }
   __pyx_v_v_mean = (__pyx_v_v_mean / __pyx_v_v_len);
 
-  /* "tombo/_c_helper.pyx":33
+  /* "tombo/_c_helper.pyx":36
  *         v_mean += values[idx]
  *     v_mean /= v_len
  *     v_var = 0             # <<<<<<<<<<<<<<
@@ -2456,7 +2529,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_c_mean_std(CYTHON_UNUSED PyObject *_
  */
   __pyx_v_v_var = 0.0;
 
-  /* "tombo/_c_helper.pyx":34
+  /* "tombo/_c_helper.pyx":37
  *     v_mean /= v_len
  *     v_var = 0
  *     for idx in range(v_len):             # <<<<<<<<<<<<<<
@@ -2468,7 +2541,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_c_mean_std(CYTHON_UNUSED PyObject *_
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_idx = __pyx_t_3;
 
-    /* "tombo/_c_helper.pyx":35
+    /* "tombo/_c_helper.pyx":38
  *     v_var = 0
  *     for idx in range(v_len):
  *         v_var += (values[idx] - v_mean)**2             # <<<<<<<<<<<<<<
@@ -2483,12 +2556,12 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_c_mean_std(CYTHON_UNUSED PyObject *_
     } else if (unlikely(__pyx_t_4 >= __pyx_pybuffernd_values.diminfo[0].shape)) __pyx_t_5 = 0;
     if (unlikely(__pyx_t_5 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_5);
-      __PYX_ERR(0, 35, __pyx_L1_error)
+      __PYX_ERR(0, 38, __pyx_L1_error)
     }
     __pyx_v_v_var = (__pyx_v_v_var + pow(((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_values.rcbuffer->pybuffer.buf, __pyx_t_4, __pyx_pybuffernd_values.diminfo[0].strides)) - __pyx_v_v_mean), 2.0));
   }
 
-  /* "tombo/_c_helper.pyx":36
+  /* "tombo/_c_helper.pyx":39
  *     for idx in range(v_len):
  *         v_var += (values[idx] - v_mean)**2
  *     return v_mean, sqrt(v_var / v_len)             # <<<<<<<<<<<<<<
@@ -2496,15 +2569,15 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_c_mean_std(CYTHON_UNUSED PyObject *_
  * def c_new_mean_stds(
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_v_mean); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 36, __pyx_L1_error)
+  __pyx_t_6 = PyFloat_FromDouble(__pyx_v_v_mean); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   if (unlikely(__pyx_v_v_len == 0)) {
     PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-    __PYX_ERR(0, 36, __pyx_L1_error)
+    __PYX_ERR(0, 39, __pyx_L1_error)
   }
-  __pyx_t_7 = PyFloat_FromDouble(sqrt((__pyx_v_v_var / __pyx_v_v_len))); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 36, __pyx_L1_error)
+  __pyx_t_7 = PyFloat_FromDouble(sqrt((__pyx_v_v_var / __pyx_v_v_len))); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
-  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 36, __pyx_L1_error)
+  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 39, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_GIVEREF(__pyx_t_6);
   PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6);
@@ -2516,7 +2589,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_c_mean_std(CYTHON_UNUSED PyObject *_
   __pyx_t_8 = 0;
   goto __pyx_L0;
 
-  /* "tombo/_c_helper.pyx":22
+  /* "tombo/_c_helper.pyx":25
  * from itertools import combinations
  * 
  * def c_mean_std(np.ndarray[DTYPE_t] values):             # <<<<<<<<<<<<<<
@@ -2546,7 +2619,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_c_mean_std(CYTHON_UNUSED PyObject *_
   return __pyx_r;
 }
 
-/* "tombo/_c_helper.pyx":38
+/* "tombo/_c_helper.pyx":41
  *     return v_mean, sqrt(v_var / v_len)
  * 
  * def c_new_mean_stds(             # <<<<<<<<<<<<<<
@@ -2590,11 +2663,11 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_3c_new_mean_stds(PyObject *__pyx_sel
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_new_segs)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_new_mean_stds", 1, 2, 2, 1); __PYX_ERR(0, 38, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_new_mean_stds", 1, 2, 2, 1); __PYX_ERR(0, 41, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_new_mean_stds") < 0)) __PYX_ERR(0, 38, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_new_mean_stds") < 0)) __PYX_ERR(0, 41, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -2607,14 +2680,14 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_3c_new_mean_stds(PyObject *__pyx_sel
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("c_new_mean_stds", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 38, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("c_new_mean_stds", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 41, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("tombo._c_helper.c_new_mean_stds", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_norm_signal), __pyx_ptype_5numpy_ndarray, 0, "norm_signal", 0))) __PYX_ERR(0, 39, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_new_segs), __pyx_ptype_5numpy_ndarray, 0, "new_segs", 0))) __PYX_ERR(0, 40, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_norm_signal), __pyx_ptype_5numpy_ndarray, 0, "norm_signal", 0))) __PYX_ERR(0, 42, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_new_segs), __pyx_ptype_5numpy_ndarray, 0, "new_segs", 0))) __PYX_ERR(0, 43, __pyx_L1_error)
   __pyx_r = __pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(__pyx_self, __pyx_v_norm_signal, __pyx_v_new_segs);
 
   /* function exit code */
@@ -2683,16 +2756,16 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
   __pyx_pybuffernd_new_segs.rcbuffer = &__pyx_pybuffer_new_segs;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_norm_signal.rcbuffer->pybuffer, (PyObject*)__pyx_v_norm_signal, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 38, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_norm_signal.rcbuffer->pybuffer, (PyObject*)__pyx_v_norm_signal, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 41, __pyx_L1_error)
   }
   __pyx_pybuffernd_norm_signal.diminfo[0].strides = __pyx_pybuffernd_norm_signal.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_norm_signal.diminfo[0].shape = __pyx_pybuffernd_norm_signal.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_new_segs.rcbuffer->pybuffer, (PyObject*)__pyx_v_new_segs, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 38, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_new_segs.rcbuffer->pybuffer, (PyObject*)__pyx_v_new_segs, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 41, __pyx_L1_error)
   }
   __pyx_pybuffernd_new_segs.diminfo[0].strides = __pyx_pybuffernd_new_segs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_new_segs.diminfo[0].shape = __pyx_pybuffernd_new_segs.rcbuffer->pybuffer.shape[0];
 
-  /* "tombo/_c_helper.pyx":41
+  /* "tombo/_c_helper.pyx":44
  *         np.ndarray[DTYPE_t] norm_signal not None,
  *         np.ndarray[DTYPE_INT_t] new_segs not None):
  *     cdef DTYPE_INT_t n_segs = new_segs.shape[0] - 1             # <<<<<<<<<<<<<<
@@ -2701,43 +2774,43 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
  */
   __pyx_v_n_segs = ((__pyx_v_new_segs->dimensions[0]) - 1);
 
-  /* "tombo/_c_helper.pyx":42
+  /* "tombo/_c_helper.pyx":45
  *         np.ndarray[DTYPE_INT_t] new_segs not None):
  *     cdef DTYPE_INT_t n_segs = new_segs.shape[0] - 1
  *     cdef np.ndarray[DTYPE_t] means_arr = np.empty(n_segs, dtype=DTYPE)             # <<<<<<<<<<<<<<
  *     cdef np.ndarray[DTYPE_t] stds_arr = np.empty(n_segs, dtype=DTYPE)
  *     cdef DTYPE_t curr_sum, curr_var, seg_mean
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 45, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 45, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__pyx_v_n_segs); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__pyx_v_n_segs); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 45, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 45, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
   __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 45, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 45, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 42, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 45, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 42, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 45, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 42, __pyx_L1_error)
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 45, __pyx_L1_error)
   __pyx_t_5 = ((PyArrayObject *)__pyx_t_4);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_means_arr.rcbuffer->pybuffer, (PyObject*)__pyx_t_5, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_means_arr = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_means_arr.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 42, __pyx_L1_error)
+      __PYX_ERR(0, 45, __pyx_L1_error)
     } else {__pyx_pybuffernd_means_arr.diminfo[0].strides = __pyx_pybuffernd_means_arr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_means_arr.diminfo[0].shape = __pyx_pybuffernd_means_arr.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -2745,43 +2818,43 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
   __pyx_v_means_arr = ((PyArrayObject *)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "tombo/_c_helper.pyx":43
+  /* "tombo/_c_helper.pyx":46
  *     cdef DTYPE_INT_t n_segs = new_segs.shape[0] - 1
  *     cdef np.ndarray[DTYPE_t] means_arr = np.empty(n_segs, dtype=DTYPE)
  *     cdef np.ndarray[DTYPE_t] stds_arr = np.empty(n_segs, dtype=DTYPE)             # <<<<<<<<<<<<<<
  *     cdef DTYPE_t curr_sum, curr_var, seg_mean
  *     cdef DTYPE_INT_t idx, seg_idx, seg_len
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 46, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 46, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyInt_From_npy_int64(__pyx_v_n_segs); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyInt_From_npy_int64(__pyx_v_n_segs); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 46, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 46, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_4);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_4);
   __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 46, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_2) < 0) __PYX_ERR(0, 43, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_4, __pyx_n_s_dtype, __pyx_t_2) < 0) __PYX_ERR(0, 46, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 43, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_3, __pyx_t_4); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 46, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 43, __pyx_L1_error)
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 46, __pyx_L1_error)
   __pyx_t_6 = ((PyArrayObject *)__pyx_t_2);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_stds_arr.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_stds_arr = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_stds_arr.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 43, __pyx_L1_error)
+      __PYX_ERR(0, 46, __pyx_L1_error)
     } else {__pyx_pybuffernd_stds_arr.diminfo[0].strides = __pyx_pybuffernd_stds_arr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_stds_arr.diminfo[0].shape = __pyx_pybuffernd_stds_arr.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -2789,7 +2862,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
   __pyx_v_stds_arr = ((PyArrayObject *)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":46
+  /* "tombo/_c_helper.pyx":49
  *     cdef DTYPE_t curr_sum, curr_var, seg_mean
  *     cdef DTYPE_INT_t idx, seg_idx, seg_len
  *     for idx in range(n_segs):             # <<<<<<<<<<<<<<
@@ -2801,7 +2874,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
   for (__pyx_t_9 = 0; __pyx_t_9 < __pyx_t_8; __pyx_t_9+=1) {
     __pyx_v_idx = __pyx_t_9;
 
-    /* "tombo/_c_helper.pyx":47
+    /* "tombo/_c_helper.pyx":50
  *     cdef DTYPE_INT_t idx, seg_idx, seg_len
  *     for idx in range(n_segs):
  *         seg_len = new_segs[idx + 1] - new_segs[idx]             # <<<<<<<<<<<<<<
@@ -2816,7 +2889,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
     } else if (unlikely(__pyx_t_10 >= __pyx_pybuffernd_new_segs.diminfo[0].shape)) __pyx_t_11 = 0;
     if (unlikely(__pyx_t_11 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_11);
-      __PYX_ERR(0, 47, __pyx_L1_error)
+      __PYX_ERR(0, 50, __pyx_L1_error)
     }
     __pyx_t_12 = __pyx_v_idx;
     __pyx_t_11 = -1;
@@ -2826,11 +2899,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
     } else if (unlikely(__pyx_t_12 >= __pyx_pybuffernd_new_segs.diminfo[0].shape)) __pyx_t_11 = 0;
     if (unlikely(__pyx_t_11 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_11);
-      __PYX_ERR(0, 47, __pyx_L1_error)
+      __PYX_ERR(0, 50, __pyx_L1_error)
     }
     __pyx_v_seg_len = ((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_new_segs.rcbuffer->pybuffer.buf, __pyx_t_10, __pyx_pybuffernd_new_segs.diminfo[0].strides)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_new_segs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_new_segs.diminfo[0].strides)));
 
-    /* "tombo/_c_helper.pyx":48
+    /* "tombo/_c_helper.pyx":51
  *     for idx in range(n_segs):
  *         seg_len = new_segs[idx + 1] - new_segs[idx]
  *         curr_sum = 0             # <<<<<<<<<<<<<<
@@ -2839,7 +2912,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
  */
     __pyx_v_curr_sum = 0.0;
 
-    /* "tombo/_c_helper.pyx":49
+    /* "tombo/_c_helper.pyx":52
  *         seg_len = new_segs[idx + 1] - new_segs[idx]
  *         curr_sum = 0
  *         for seg_idx in range(new_segs[idx], new_segs[idx + 1]):             # <<<<<<<<<<<<<<
@@ -2854,7 +2927,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
     } else if (unlikely(__pyx_t_12 >= __pyx_pybuffernd_new_segs.diminfo[0].shape)) __pyx_t_11 = 0;
     if (unlikely(__pyx_t_11 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_11);
-      __PYX_ERR(0, 49, __pyx_L1_error)
+      __PYX_ERR(0, 52, __pyx_L1_error)
     }
     __pyx_t_10 = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_new_segs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_new_segs.diminfo[0].strides));
     __pyx_t_12 = __pyx_v_idx;
@@ -2865,13 +2938,13 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
     } else if (unlikely(__pyx_t_12 >= __pyx_pybuffernd_new_segs.diminfo[0].shape)) __pyx_t_11 = 0;
     if (unlikely(__pyx_t_11 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_11);
-      __PYX_ERR(0, 49, __pyx_L1_error)
+      __PYX_ERR(0, 52, __pyx_L1_error)
     }
     __pyx_t_13 = __pyx_t_10;
     for (__pyx_t_14 = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_new_segs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_new_segs.diminfo[0].strides)); __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
       __pyx_v_seg_idx = __pyx_t_14;
 
-      /* "tombo/_c_helper.pyx":50
+      /* "tombo/_c_helper.pyx":53
  *         curr_sum = 0
  *         for seg_idx in range(new_segs[idx], new_segs[idx + 1]):
  *             curr_sum += norm_signal[seg_idx]             # <<<<<<<<<<<<<<
@@ -2886,12 +2959,12 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
       } else if (unlikely(__pyx_t_15 >= __pyx_pybuffernd_norm_signal.diminfo[0].shape)) __pyx_t_11 = 0;
       if (unlikely(__pyx_t_11 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_11);
-        __PYX_ERR(0, 50, __pyx_L1_error)
+        __PYX_ERR(0, 53, __pyx_L1_error)
       }
       __pyx_v_curr_sum = (__pyx_v_curr_sum + (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_norm_signal.rcbuffer->pybuffer.buf, __pyx_t_15, __pyx_pybuffernd_norm_signal.diminfo[0].strides)));
     }
 
-    /* "tombo/_c_helper.pyx":51
+    /* "tombo/_c_helper.pyx":54
  *         for seg_idx in range(new_segs[idx], new_segs[idx + 1]):
  *             curr_sum += norm_signal[seg_idx]
  *         seg_mean = curr_sum / seg_len             # <<<<<<<<<<<<<<
@@ -2900,11 +2973,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
  */
     if (unlikely(__pyx_v_seg_len == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 51, __pyx_L1_error)
+      __PYX_ERR(0, 54, __pyx_L1_error)
     }
     __pyx_v_seg_mean = (__pyx_v_curr_sum / __pyx_v_seg_len);
 
-    /* "tombo/_c_helper.pyx":52
+    /* "tombo/_c_helper.pyx":55
  *             curr_sum += norm_signal[seg_idx]
  *         seg_mean = curr_sum / seg_len
  *         means_arr[idx] = seg_mean             # <<<<<<<<<<<<<<
@@ -2919,11 +2992,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
     } else if (unlikely(__pyx_t_10 >= __pyx_pybuffernd_means_arr.diminfo[0].shape)) __pyx_t_11 = 0;
     if (unlikely(__pyx_t_11 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_11);
-      __PYX_ERR(0, 52, __pyx_L1_error)
+      __PYX_ERR(0, 55, __pyx_L1_error)
     }
     *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_means_arr.rcbuffer->pybuffer.buf, __pyx_t_10, __pyx_pybuffernd_means_arr.diminfo[0].strides) = __pyx_v_seg_mean;
 
-    /* "tombo/_c_helper.pyx":53
+    /* "tombo/_c_helper.pyx":56
  *         seg_mean = curr_sum / seg_len
  *         means_arr[idx] = seg_mean
  *         curr_var = 0             # <<<<<<<<<<<<<<
@@ -2932,7 +3005,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
  */
     __pyx_v_curr_var = 0.0;
 
-    /* "tombo/_c_helper.pyx":54
+    /* "tombo/_c_helper.pyx":57
  *         means_arr[idx] = seg_mean
  *         curr_var = 0
  *         for seg_idx in range(new_segs[idx], new_segs[idx + 1]):             # <<<<<<<<<<<<<<
@@ -2947,7 +3020,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
     } else if (unlikely(__pyx_t_10 >= __pyx_pybuffernd_new_segs.diminfo[0].shape)) __pyx_t_11 = 0;
     if (unlikely(__pyx_t_11 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_11);
-      __PYX_ERR(0, 54, __pyx_L1_error)
+      __PYX_ERR(0, 57, __pyx_L1_error)
     }
     __pyx_t_13 = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_new_segs.rcbuffer->pybuffer.buf, __pyx_t_10, __pyx_pybuffernd_new_segs.diminfo[0].strides));
     __pyx_t_10 = __pyx_v_idx;
@@ -2958,13 +3031,13 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
     } else if (unlikely(__pyx_t_10 >= __pyx_pybuffernd_new_segs.diminfo[0].shape)) __pyx_t_11 = 0;
     if (unlikely(__pyx_t_11 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_11);
-      __PYX_ERR(0, 54, __pyx_L1_error)
+      __PYX_ERR(0, 57, __pyx_L1_error)
     }
     __pyx_t_12 = __pyx_t_13;
     for (__pyx_t_14 = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_new_segs.rcbuffer->pybuffer.buf, __pyx_t_10, __pyx_pybuffernd_new_segs.diminfo[0].strides)); __pyx_t_14 < __pyx_t_12; __pyx_t_14+=1) {
       __pyx_v_seg_idx = __pyx_t_14;
 
-      /* "tombo/_c_helper.pyx":55
+      /* "tombo/_c_helper.pyx":58
  *         curr_var = 0
  *         for seg_idx in range(new_segs[idx], new_segs[idx + 1]):
  *             curr_var += (norm_signal[seg_idx] - seg_mean)**2             # <<<<<<<<<<<<<<
@@ -2979,12 +3052,12 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
       } else if (unlikely(__pyx_t_15 >= __pyx_pybuffernd_norm_signal.diminfo[0].shape)) __pyx_t_11 = 0;
       if (unlikely(__pyx_t_11 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_11);
-        __PYX_ERR(0, 55, __pyx_L1_error)
+        __PYX_ERR(0, 58, __pyx_L1_error)
       }
       __pyx_v_curr_var = (__pyx_v_curr_var + pow(((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_norm_signal.rcbuffer->pybuffer.buf, __pyx_t_15, __pyx_pybuffernd_norm_signal.diminfo[0].strides)) - __pyx_v_seg_mean), 2.0));
     }
 
-    /* "tombo/_c_helper.pyx":56
+    /* "tombo/_c_helper.pyx":59
  *         for seg_idx in range(new_segs[idx], new_segs[idx + 1]):
  *             curr_var += (norm_signal[seg_idx] - seg_mean)**2
  *         stds_arr[idx] = sqrt(curr_var / seg_len)             # <<<<<<<<<<<<<<
@@ -2993,7 +3066,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
  */
     if (unlikely(__pyx_v_seg_len == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 56, __pyx_L1_error)
+      __PYX_ERR(0, 59, __pyx_L1_error)
     }
     __pyx_t_13 = __pyx_v_idx;
     __pyx_t_11 = -1;
@@ -3003,12 +3076,12 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
     } else if (unlikely(__pyx_t_13 >= __pyx_pybuffernd_stds_arr.diminfo[0].shape)) __pyx_t_11 = 0;
     if (unlikely(__pyx_t_11 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_11);
-      __PYX_ERR(0, 56, __pyx_L1_error)
+      __PYX_ERR(0, 59, __pyx_L1_error)
     }
     *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_stds_arr.rcbuffer->pybuffer.buf, __pyx_t_13, __pyx_pybuffernd_stds_arr.diminfo[0].strides) = sqrt((__pyx_v_curr_var / __pyx_v_seg_len));
   }
 
-  /* "tombo/_c_helper.pyx":57
+  /* "tombo/_c_helper.pyx":60
  *             curr_var += (norm_signal[seg_idx] - seg_mean)**2
  *         stds_arr[idx] = sqrt(curr_var / seg_len)
  *     return means_arr, stds_arr             # <<<<<<<<<<<<<<
@@ -3016,7 +3089,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
  * def c_new_means(
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 57, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 60, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_INCREF(((PyObject *)__pyx_v_means_arr));
   __Pyx_GIVEREF(((PyObject *)__pyx_v_means_arr));
@@ -3028,7 +3101,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "tombo/_c_helper.pyx":38
+  /* "tombo/_c_helper.pyx":41
  *     return v_mean, sqrt(v_var / v_len)
  * 
  * def c_new_mean_stds(             # <<<<<<<<<<<<<<
@@ -3067,7 +3140,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_2c_new_mean_stds(CYTHON_UNUSED PyObj
   return __pyx_r;
 }
 
-/* "tombo/_c_helper.pyx":59
+/* "tombo/_c_helper.pyx":62
  *     return means_arr, stds_arr
  * 
  * def c_new_means(             # <<<<<<<<<<<<<<
@@ -3111,11 +3184,11 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_5c_new_means(PyObject *__pyx_self, P
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_new_segs)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_new_means", 1, 2, 2, 1); __PYX_ERR(0, 59, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_new_means", 1, 2, 2, 1); __PYX_ERR(0, 62, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_new_means") < 0)) __PYX_ERR(0, 59, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_new_means") < 0)) __PYX_ERR(0, 62, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
       goto __pyx_L5_argtuple_error;
@@ -3128,14 +3201,14 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_5c_new_means(PyObject *__pyx_self, P
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("c_new_means", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 59, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("c_new_means", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 62, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("tombo._c_helper.c_new_means", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_norm_signal), __pyx_ptype_5numpy_ndarray, 0, "norm_signal", 0))) __PYX_ERR(0, 60, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_new_segs), __pyx_ptype_5numpy_ndarray, 0, "new_segs", 0))) __PYX_ERR(0, 61, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_norm_signal), __pyx_ptype_5numpy_ndarray, 0, "norm_signal", 0))) __PYX_ERR(0, 63, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_new_segs), __pyx_ptype_5numpy_ndarray, 0, "new_segs", 0))) __PYX_ERR(0, 64, __pyx_L1_error)
   __pyx_r = __pyx_pf_5tombo_9_c_helper_4c_new_means(__pyx_self, __pyx_v_norm_signal, __pyx_v_new_segs);
 
   /* function exit code */
@@ -3193,16 +3266,16 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_4c_new_means(CYTHON_UNUSED PyObject
   __pyx_pybuffernd_new_segs.rcbuffer = &__pyx_pybuffer_new_segs;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_norm_signal.rcbuffer->pybuffer, (PyObject*)__pyx_v_norm_signal, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 59, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_norm_signal.rcbuffer->pybuffer, (PyObject*)__pyx_v_norm_signal, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 62, __pyx_L1_error)
   }
   __pyx_pybuffernd_norm_signal.diminfo[0].strides = __pyx_pybuffernd_norm_signal.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_norm_signal.diminfo[0].shape = __pyx_pybuffernd_norm_signal.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_new_segs.rcbuffer->pybuffer, (PyObject*)__pyx_v_new_segs, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 59, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_new_segs.rcbuffer->pybuffer, (PyObject*)__pyx_v_new_segs, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 62, __pyx_L1_error)
   }
   __pyx_pybuffernd_new_segs.diminfo[0].strides = __pyx_pybuffernd_new_segs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_new_segs.diminfo[0].shape = __pyx_pybuffernd_new_segs.rcbuffer->pybuffer.shape[0];
 
-  /* "tombo/_c_helper.pyx":62
+  /* "tombo/_c_helper.pyx":65
  *         np.ndarray[DTYPE_t] norm_signal not None,
  *         np.ndarray[DTYPE_INT_t] new_segs not None):
  *     cdef DTYPE_INT_t n_segs = new_segs.shape[0] - 1             # <<<<<<<<<<<<<<
@@ -3211,43 +3284,43 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_4c_new_means(CYTHON_UNUSED PyObject
  */
   __pyx_v_n_segs = ((__pyx_v_new_segs->dimensions[0]) - 1);
 
-  /* "tombo/_c_helper.pyx":63
+  /* "tombo/_c_helper.pyx":66
  *         np.ndarray[DTYPE_INT_t] new_segs not None):
  *     cdef DTYPE_INT_t n_segs = new_segs.shape[0] - 1
  *     cdef np.ndarray[DTYPE_t] means_arr = np.empty(n_segs, dtype=DTYPE)             # <<<<<<<<<<<<<<
  *     cdef DTYPE_t curr_sum
  *     cdef DTYPE_INT_t idx, seg_idx
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 66, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 66, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__pyx_v_n_segs); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__pyx_v_n_segs); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 66, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 66, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
   __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 66, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 66, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 63, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 66, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 63, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 66, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 63, __pyx_L1_error)
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 66, __pyx_L1_error)
   __pyx_t_5 = ((PyArrayObject *)__pyx_t_4);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_means_arr.rcbuffer->pybuffer, (PyObject*)__pyx_t_5, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_means_arr = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_means_arr.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 63, __pyx_L1_error)
+      __PYX_ERR(0, 66, __pyx_L1_error)
     } else {__pyx_pybuffernd_means_arr.diminfo[0].strides = __pyx_pybuffernd_means_arr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_means_arr.diminfo[0].shape = __pyx_pybuffernd_means_arr.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -3255,7 +3328,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_4c_new_means(CYTHON_UNUSED PyObject
   __pyx_v_means_arr = ((PyArrayObject *)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "tombo/_c_helper.pyx":66
+  /* "tombo/_c_helper.pyx":69
  *     cdef DTYPE_t curr_sum
  *     cdef DTYPE_INT_t idx, seg_idx
  *     for idx in range(n_segs):             # <<<<<<<<<<<<<<
@@ -3267,7 +3340,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_4c_new_means(CYTHON_UNUSED PyObject
   for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
     __pyx_v_idx = __pyx_t_8;
 
-    /* "tombo/_c_helper.pyx":67
+    /* "tombo/_c_helper.pyx":70
  *     cdef DTYPE_INT_t idx, seg_idx
  *     for idx in range(n_segs):
  *         curr_sum = 0             # <<<<<<<<<<<<<<
@@ -3276,7 +3349,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_4c_new_means(CYTHON_UNUSED PyObject
  */
     __pyx_v_curr_sum = 0.0;
 
-    /* "tombo/_c_helper.pyx":68
+    /* "tombo/_c_helper.pyx":71
  *     for idx in range(n_segs):
  *         curr_sum = 0
  *         for seg_idx in range(new_segs[idx], new_segs[idx + 1]):             # <<<<<<<<<<<<<<
@@ -3291,7 +3364,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_4c_new_means(CYTHON_UNUSED PyObject
     } else if (unlikely(__pyx_t_9 >= __pyx_pybuffernd_new_segs.diminfo[0].shape)) __pyx_t_10 = 0;
     if (unlikely(__pyx_t_10 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_10);
-      __PYX_ERR(0, 68, __pyx_L1_error)
+      __PYX_ERR(0, 71, __pyx_L1_error)
     }
     __pyx_t_11 = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_new_segs.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_new_segs.diminfo[0].strides));
     __pyx_t_9 = __pyx_v_idx;
@@ -3302,13 +3375,13 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_4c_new_means(CYTHON_UNUSED PyObject
     } else if (unlikely(__pyx_t_9 >= __pyx_pybuffernd_new_segs.diminfo[0].shape)) __pyx_t_10 = 0;
     if (unlikely(__pyx_t_10 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_10);
-      __PYX_ERR(0, 68, __pyx_L1_error)
+      __PYX_ERR(0, 71, __pyx_L1_error)
     }
     __pyx_t_12 = __pyx_t_11;
     for (__pyx_t_13 = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_new_segs.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_new_segs.diminfo[0].strides)); __pyx_t_13 < __pyx_t_12; __pyx_t_13+=1) {
       __pyx_v_seg_idx = __pyx_t_13;
 
-      /* "tombo/_c_helper.pyx":69
+      /* "tombo/_c_helper.pyx":72
  *         curr_sum = 0
  *         for seg_idx in range(new_segs[idx], new_segs[idx + 1]):
  *             curr_sum += norm_signal[seg_idx]             # <<<<<<<<<<<<<<
@@ -3323,12 +3396,12 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_4c_new_means(CYTHON_UNUSED PyObject
       } else if (unlikely(__pyx_t_14 >= __pyx_pybuffernd_norm_signal.diminfo[0].shape)) __pyx_t_10 = 0;
       if (unlikely(__pyx_t_10 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_10);
-        __PYX_ERR(0, 69, __pyx_L1_error)
+        __PYX_ERR(0, 72, __pyx_L1_error)
       }
       __pyx_v_curr_sum = (__pyx_v_curr_sum + (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_norm_signal.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_norm_signal.diminfo[0].strides)));
     }
 
-    /* "tombo/_c_helper.pyx":70
+    /* "tombo/_c_helper.pyx":73
  *         for seg_idx in range(new_segs[idx], new_segs[idx + 1]):
  *             curr_sum += norm_signal[seg_idx]
  *         means_arr[idx] = curr_sum / (new_segs[idx + 1] - new_segs[idx])             # <<<<<<<<<<<<<<
@@ -3343,7 +3416,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_4c_new_means(CYTHON_UNUSED PyObject
     } else if (unlikely(__pyx_t_11 >= __pyx_pybuffernd_new_segs.diminfo[0].shape)) __pyx_t_10 = 0;
     if (unlikely(__pyx_t_10 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_10);
-      __PYX_ERR(0, 70, __pyx_L1_error)
+      __PYX_ERR(0, 73, __pyx_L1_error)
     }
     __pyx_t_12 = __pyx_v_idx;
     __pyx_t_10 = -1;
@@ -3353,12 +3426,12 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_4c_new_means(CYTHON_UNUSED PyObject
     } else if (unlikely(__pyx_t_12 >= __pyx_pybuffernd_new_segs.diminfo[0].shape)) __pyx_t_10 = 0;
     if (unlikely(__pyx_t_10 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_10);
-      __PYX_ERR(0, 70, __pyx_L1_error)
+      __PYX_ERR(0, 73, __pyx_L1_error)
     }
     __pyx_t_9 = ((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_new_segs.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_new_segs.diminfo[0].strides)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_new_segs.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_new_segs.diminfo[0].strides)));
     if (unlikely(__pyx_t_9 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 70, __pyx_L1_error)
+      __PYX_ERR(0, 73, __pyx_L1_error)
     }
     __pyx_t_12 = __pyx_v_idx;
     __pyx_t_10 = -1;
@@ -3368,12 +3441,12 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_4c_new_means(CYTHON_UNUSED PyObject
     } else if (unlikely(__pyx_t_12 >= __pyx_pybuffernd_means_arr.diminfo[0].shape)) __pyx_t_10 = 0;
     if (unlikely(__pyx_t_10 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_10);
-      __PYX_ERR(0, 70, __pyx_L1_error)
+      __PYX_ERR(0, 73, __pyx_L1_error)
     }
     *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_means_arr.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_means_arr.diminfo[0].strides) = (__pyx_v_curr_sum / __pyx_t_9);
   }
 
-  /* "tombo/_c_helper.pyx":71
+  /* "tombo/_c_helper.pyx":74
  *             curr_sum += norm_signal[seg_idx]
  *         means_arr[idx] = curr_sum / (new_segs[idx + 1] - new_segs[idx])
  *     return means_arr             # <<<<<<<<<<<<<<
@@ -3385,7 +3458,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_4c_new_means(CYTHON_UNUSED PyObject
   __pyx_r = ((PyObject *)__pyx_v_means_arr);
   goto __pyx_L0;
 
-  /* "tombo/_c_helper.pyx":59
+  /* "tombo/_c_helper.pyx":62
  *     return means_arr, stds_arr
  * 
  * def c_new_means(             # <<<<<<<<<<<<<<
@@ -3421,7 +3494,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_4c_new_means(CYTHON_UNUSED PyObject
   return __pyx_r;
 }
 
-/* "tombo/_c_helper.pyx":73
+/* "tombo/_c_helper.pyx":76
  *     return means_arr
  * 
  * def c_apply_outlier_thresh(             # <<<<<<<<<<<<<<
@@ -3468,17 +3541,17 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_7c_apply_outlier_thresh(PyObject *__
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lower_lim)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_apply_outlier_thresh", 1, 3, 3, 1); __PYX_ERR(0, 73, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_apply_outlier_thresh", 1, 3, 3, 1); __PYX_ERR(0, 76, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_upper_lim)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_apply_outlier_thresh", 1, 3, 3, 2); __PYX_ERR(0, 73, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_apply_outlier_thresh", 1, 3, 3, 2); __PYX_ERR(0, 76, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_apply_outlier_thresh") < 0)) __PYX_ERR(0, 73, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_apply_outlier_thresh") < 0)) __PYX_ERR(0, 76, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -3488,18 +3561,18 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_7c_apply_outlier_thresh(PyObject *__
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
     }
     __pyx_v_raw_signal = ((PyArrayObject *)values[0]);
-    __pyx_v_lower_lim = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_lower_lim == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 74, __pyx_L3_error)
-    __pyx_v_upper_lim = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_upper_lim == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 74, __pyx_L3_error)
+    __pyx_v_lower_lim = __pyx_PyFloat_AsDouble(values[1]); if (unlikely((__pyx_v_lower_lim == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 77, __pyx_L3_error)
+    __pyx_v_upper_lim = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_upper_lim == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 77, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("c_apply_outlier_thresh", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 73, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("c_apply_outlier_thresh", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 76, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("tombo._c_helper.c_apply_outlier_thresh", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_raw_signal), __pyx_ptype_5numpy_ndarray, 1, "raw_signal", 0))) __PYX_ERR(0, 74, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_raw_signal), __pyx_ptype_5numpy_ndarray, 1, "raw_signal", 0))) __PYX_ERR(0, 77, __pyx_L1_error)
   __pyx_r = __pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(__pyx_self, __pyx_v_raw_signal, __pyx_v_lower_lim, __pyx_v_upper_lim);
 
   /* function exit code */
@@ -3547,11 +3620,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(CYTHON_UNUSE
   __pyx_pybuffernd_raw_signal.rcbuffer = &__pyx_pybuffer_raw_signal;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_raw_signal.rcbuffer->pybuffer, (PyObject*)__pyx_v_raw_signal, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 73, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_raw_signal.rcbuffer->pybuffer, (PyObject*)__pyx_v_raw_signal, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 76, __pyx_L1_error)
   }
   __pyx_pybuffernd_raw_signal.diminfo[0].strides = __pyx_pybuffernd_raw_signal.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_raw_signal.diminfo[0].shape = __pyx_pybuffernd_raw_signal.rcbuffer->pybuffer.shape[0];
 
-  /* "tombo/_c_helper.pyx":75
+  /* "tombo/_c_helper.pyx":78
  * def c_apply_outlier_thresh(
  *         np.ndarray[DTYPE_t] raw_signal, DTYPE_t lower_lim, DTYPE_t upper_lim):
  *     cdef DTYPE_INT_t raw_size = raw_signal.shape[0]             # <<<<<<<<<<<<<<
@@ -3560,43 +3633,43 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(CYTHON_UNUSE
  */
   __pyx_v_raw_size = (__pyx_v_raw_signal->dimensions[0]);
 
-  /* "tombo/_c_helper.pyx":76
+  /* "tombo/_c_helper.pyx":79
  *         np.ndarray[DTYPE_t] raw_signal, DTYPE_t lower_lim, DTYPE_t upper_lim):
  *     cdef DTYPE_INT_t raw_size = raw_signal.shape[0]
  *     cdef np.ndarray[DTYPE_t] clipped_signal = np.empty(raw_size, dtype=DTYPE)             # <<<<<<<<<<<<<<
  *     cdef DTYPE_INT_t pos
  *     cdef DTYPE_t pos_sig
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__pyx_v_raw_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__pyx_v_raw_size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
   __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 76, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 79, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 76, __pyx_L1_error)
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 79, __pyx_L1_error)
   __pyx_t_5 = ((PyArrayObject *)__pyx_t_4);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_clipped_signal.rcbuffer->pybuffer, (PyObject*)__pyx_t_5, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_clipped_signal = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_clipped_signal.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 76, __pyx_L1_error)
+      __PYX_ERR(0, 79, __pyx_L1_error)
     } else {__pyx_pybuffernd_clipped_signal.diminfo[0].strides = __pyx_pybuffernd_clipped_signal.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_clipped_signal.diminfo[0].shape = __pyx_pybuffernd_clipped_signal.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -3604,7 +3677,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(CYTHON_UNUSE
   __pyx_v_clipped_signal = ((PyArrayObject *)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "tombo/_c_helper.pyx":79
+  /* "tombo/_c_helper.pyx":82
  *     cdef DTYPE_INT_t pos
  *     cdef DTYPE_t pos_sig
  *     for pos in range(raw_size):             # <<<<<<<<<<<<<<
@@ -3616,7 +3689,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(CYTHON_UNUSE
   for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
     __pyx_v_pos = __pyx_t_8;
 
-    /* "tombo/_c_helper.pyx":80
+    /* "tombo/_c_helper.pyx":83
  *     cdef DTYPE_t pos_sig
  *     for pos in range(raw_size):
  *         pos_sig = raw_signal[pos]             # <<<<<<<<<<<<<<
@@ -3631,11 +3704,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(CYTHON_UNUSE
     } else if (unlikely(__pyx_t_9 >= __pyx_pybuffernd_raw_signal.diminfo[0].shape)) __pyx_t_10 = 0;
     if (unlikely(__pyx_t_10 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_10);
-      __PYX_ERR(0, 80, __pyx_L1_error)
+      __PYX_ERR(0, 83, __pyx_L1_error)
     }
     __pyx_v_pos_sig = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_raw_signal.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_raw_signal.diminfo[0].strides));
 
-    /* "tombo/_c_helper.pyx":81
+    /* "tombo/_c_helper.pyx":84
  *     for pos in range(raw_size):
  *         pos_sig = raw_signal[pos]
  *         if pos_sig > upper_lim:             # <<<<<<<<<<<<<<
@@ -3645,7 +3718,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(CYTHON_UNUSE
     __pyx_t_11 = ((__pyx_v_pos_sig > __pyx_v_upper_lim) != 0);
     if (__pyx_t_11) {
 
-      /* "tombo/_c_helper.pyx":82
+      /* "tombo/_c_helper.pyx":85
  *         pos_sig = raw_signal[pos]
  *         if pos_sig > upper_lim:
  *             clipped_signal[pos] = upper_lim             # <<<<<<<<<<<<<<
@@ -3660,11 +3733,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(CYTHON_UNUSE
       } else if (unlikely(__pyx_t_9 >= __pyx_pybuffernd_clipped_signal.diminfo[0].shape)) __pyx_t_10 = 0;
       if (unlikely(__pyx_t_10 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_10);
-        __PYX_ERR(0, 82, __pyx_L1_error)
+        __PYX_ERR(0, 85, __pyx_L1_error)
       }
       *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_clipped_signal.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_clipped_signal.diminfo[0].strides) = __pyx_v_upper_lim;
 
-      /* "tombo/_c_helper.pyx":81
+      /* "tombo/_c_helper.pyx":84
  *     for pos in range(raw_size):
  *         pos_sig = raw_signal[pos]
  *         if pos_sig > upper_lim:             # <<<<<<<<<<<<<<
@@ -3674,7 +3747,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(CYTHON_UNUSE
       goto __pyx_L5;
     }
 
-    /* "tombo/_c_helper.pyx":83
+    /* "tombo/_c_helper.pyx":86
  *         if pos_sig > upper_lim:
  *             clipped_signal[pos] = upper_lim
  *         elif pos_sig < lower_lim:             # <<<<<<<<<<<<<<
@@ -3684,7 +3757,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(CYTHON_UNUSE
     __pyx_t_11 = ((__pyx_v_pos_sig < __pyx_v_lower_lim) != 0);
     if (__pyx_t_11) {
 
-      /* "tombo/_c_helper.pyx":84
+      /* "tombo/_c_helper.pyx":87
  *             clipped_signal[pos] = upper_lim
  *         elif pos_sig < lower_lim:
  *             clipped_signal[pos] = lower_lim             # <<<<<<<<<<<<<<
@@ -3699,11 +3772,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(CYTHON_UNUSE
       } else if (unlikely(__pyx_t_9 >= __pyx_pybuffernd_clipped_signal.diminfo[0].shape)) __pyx_t_10 = 0;
       if (unlikely(__pyx_t_10 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_10);
-        __PYX_ERR(0, 84, __pyx_L1_error)
+        __PYX_ERR(0, 87, __pyx_L1_error)
       }
       *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_clipped_signal.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_clipped_signal.diminfo[0].strides) = __pyx_v_lower_lim;
 
-      /* "tombo/_c_helper.pyx":83
+      /* "tombo/_c_helper.pyx":86
  *         if pos_sig > upper_lim:
  *             clipped_signal[pos] = upper_lim
  *         elif pos_sig < lower_lim:             # <<<<<<<<<<<<<<
@@ -3713,7 +3786,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(CYTHON_UNUSE
       goto __pyx_L5;
     }
 
-    /* "tombo/_c_helper.pyx":86
+    /* "tombo/_c_helper.pyx":89
  *             clipped_signal[pos] = lower_lim
  *         else:
  *             clipped_signal[pos] = pos_sig             # <<<<<<<<<<<<<<
@@ -3729,14 +3802,14 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(CYTHON_UNUSE
       } else if (unlikely(__pyx_t_9 >= __pyx_pybuffernd_clipped_signal.diminfo[0].shape)) __pyx_t_10 = 0;
       if (unlikely(__pyx_t_10 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_10);
-        __PYX_ERR(0, 86, __pyx_L1_error)
+        __PYX_ERR(0, 89, __pyx_L1_error)
       }
       *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_clipped_signal.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_clipped_signal.diminfo[0].strides) = __pyx_v_pos_sig;
     }
     __pyx_L5:;
   }
 
-  /* "tombo/_c_helper.pyx":87
+  /* "tombo/_c_helper.pyx":90
  *         else:
  *             clipped_signal[pos] = pos_sig
  *     return clipped_signal             # <<<<<<<<<<<<<<
@@ -3748,7 +3821,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(CYTHON_UNUSE
   __pyx_r = ((PyObject *)__pyx_v_clipped_signal);
   goto __pyx_L0;
 
-  /* "tombo/_c_helper.pyx":73
+  /* "tombo/_c_helper.pyx":76
  *     return means_arr
  * 
  * def c_apply_outlier_thresh(             # <<<<<<<<<<<<<<
@@ -3782,7 +3855,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_6c_apply_outlier_thresh(CYTHON_UNUSE
   return __pyx_r;
 }
 
-/* "tombo/_c_helper.pyx":89
+/* "tombo/_c_helper.pyx":92
  *     return clipped_signal
  * 
  * def c_valid_cpts_w_cap(             # <<<<<<<<<<<<<<
@@ -3832,23 +3905,23 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_9c_valid_cpts_w_cap(PyObject *__pyx_
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_min_base_obs)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap", 1, 4, 4, 1); __PYX_ERR(0, 89, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap", 1, 4, 4, 1); __PYX_ERR(0, 92, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_running_stat_width)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap", 1, 4, 4, 2); __PYX_ERR(0, 89, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap", 1, 4, 4, 2); __PYX_ERR(0, 92, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_cpts)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap", 1, 4, 4, 3); __PYX_ERR(0, 89, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap", 1, 4, 4, 3); __PYX_ERR(0, 92, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_valid_cpts_w_cap") < 0)) __PYX_ERR(0, 89, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_valid_cpts_w_cap") < 0)) __PYX_ERR(0, 92, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -3859,19 +3932,19 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_9c_valid_cpts_w_cap(PyObject *__pyx_
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
     __pyx_v_raw_signal = ((PyArrayObject *)values[0]);
-    __pyx_v_min_base_obs = __Pyx_PyInt_As_npy_int64(values[1]); if (unlikely((__pyx_v_min_base_obs == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 90, __pyx_L3_error)
-    __pyx_v_running_stat_width = __Pyx_PyInt_As_npy_int64(values[2]); if (unlikely((__pyx_v_running_stat_width == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 91, __pyx_L3_error)
-    __pyx_v_num_cpts = __Pyx_PyInt_As_npy_int64(values[3]); if (unlikely((__pyx_v_num_cpts == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 91, __pyx_L3_error)
+    __pyx_v_min_base_obs = __Pyx_PyInt_As_npy_int64(values[1]); if (unlikely((__pyx_v_min_base_obs == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 93, __pyx_L3_error)
+    __pyx_v_running_stat_width = __Pyx_PyInt_As_npy_int64(values[2]); if (unlikely((__pyx_v_running_stat_width == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 94, __pyx_L3_error)
+    __pyx_v_num_cpts = __Pyx_PyInt_As_npy_int64(values[3]); if (unlikely((__pyx_v_num_cpts == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 94, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 89, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 92, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("tombo._c_helper.c_valid_cpts_w_cap", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_raw_signal), __pyx_ptype_5numpy_ndarray, 1, "raw_signal", 0))) __PYX_ERR(0, 90, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_raw_signal), __pyx_ptype_5numpy_ndarray, 1, "raw_signal", 0))) __PYX_ERR(0, 93, __pyx_L1_error)
   __pyx_r = __pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(__pyx_self, __pyx_v_raw_signal, __pyx_v_min_base_obs, __pyx_v_running_stat_width, __pyx_v_num_cpts);
 
   /* function exit code */
@@ -3941,41 +4014,41 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   __pyx_pybuffernd_raw_signal.rcbuffer = &__pyx_pybuffer_raw_signal;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_raw_signal.rcbuffer->pybuffer, (PyObject*)__pyx_v_raw_signal, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 89, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_raw_signal.rcbuffer->pybuffer, (PyObject*)__pyx_v_raw_signal, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 92, __pyx_L1_error)
   }
   __pyx_pybuffernd_raw_signal.diminfo[0].strides = __pyx_pybuffernd_raw_signal.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_raw_signal.diminfo[0].shape = __pyx_pybuffernd_raw_signal.rcbuffer->pybuffer.shape[0];
 
-  /* "tombo/_c_helper.pyx":92
+  /* "tombo/_c_helper.pyx":95
  *         np.ndarray[DTYPE_t] raw_signal, DTYPE_INT_t min_base_obs,
  *         DTYPE_INT_t running_stat_width, DTYPE_INT_t num_cpts):
  *     cdef np.ndarray[DTYPE_t] raw_cumsum = np.cumsum(             # <<<<<<<<<<<<<<
  *         np.concatenate([[0.0], raw_signal]))
  *     # get difference between all neighboring running_stat_width regions
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_cumsum); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_cumsum); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":93
+  /* "tombo/_c_helper.pyx":96
  *         DTYPE_INT_t running_stat_width, DTYPE_INT_t num_cpts):
  *     cdef np.ndarray[DTYPE_t] raw_cumsum = np.cumsum(
  *         np.concatenate([[0.0], raw_signal]))             # <<<<<<<<<<<<<<
  *     # get difference between all neighboring running_stat_width regions
  *     cdef np.ndarray[DTYPE_INT_t] candidate_poss = np.argsort(np.abs(
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_concatenate); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_concatenate); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_INCREF(__pyx_float_0_0);
   __Pyx_GIVEREF(__pyx_float_0_0);
   PyList_SET_ITEM(__pyx_t_4, 0, __pyx_float_0_0);
-  __pyx_t_6 = PyList_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 93, __pyx_L1_error)
+  __pyx_t_6 = PyList_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_4);
   PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_4);
@@ -3996,7 +4069,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_4, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 93, __pyx_L1_error)
+  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 96, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_5 = NULL;
@@ -4012,24 +4085,24 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2);
   __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 92, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 95, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "tombo/_c_helper.pyx":92
+  /* "tombo/_c_helper.pyx":95
  *         np.ndarray[DTYPE_t] raw_signal, DTYPE_INT_t min_base_obs,
  *         DTYPE_INT_t running_stat_width, DTYPE_INT_t num_cpts):
  *     cdef np.ndarray[DTYPE_t] raw_cumsum = np.cumsum(             # <<<<<<<<<<<<<<
  *         np.concatenate([[0.0], raw_signal]))
  *     # get difference between all neighboring running_stat_width regions
  */
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 92, __pyx_L1_error)
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 95, __pyx_L1_error)
   __pyx_t_7 = ((PyArrayObject *)__pyx_t_1);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_raw_cumsum.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_raw_cumsum = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_raw_cumsum.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 92, __pyx_L1_error)
+      __PYX_ERR(0, 95, __pyx_L1_error)
     } else {__pyx_pybuffernd_raw_cumsum.diminfo[0].strides = __pyx_pybuffernd_raw_cumsum.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_raw_cumsum.diminfo[0].shape = __pyx_pybuffernd_raw_cumsum.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -4037,98 +4110,98 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   __pyx_v_raw_cumsum = ((PyArrayObject *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "tombo/_c_helper.pyx":95
+  /* "tombo/_c_helper.pyx":98
  *         np.concatenate([[0.0], raw_signal]))
  *     # get difference between all neighboring running_stat_width regions
  *     cdef np.ndarray[DTYPE_INT_t] candidate_poss = np.argsort(np.abs(             # <<<<<<<<<<<<<<
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -
  *         raw_cumsum[:-2*running_stat_width] -
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_argsort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_argsort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_abs); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 95, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_abs); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-  /* "tombo/_c_helper.pyx":96
+  /* "tombo/_c_helper.pyx":99
  *     # get difference between all neighboring running_stat_width regions
  *     cdef np.ndarray[DTYPE_INT_t] candidate_poss = np.argsort(np.abs(
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -             # <<<<<<<<<<<<<<
  *         raw_cumsum[:-2*running_stat_width] -
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]
  */
-  __pyx_t_6 = __Pyx_PyInt_From_npy_int64(__pyx_v_running_stat_width); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_From_npy_int64(__pyx_v_running_stat_width); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 99, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_8 = __Pyx_PyInt_From_npy_int64((-__pyx_v_running_stat_width)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyInt_From_npy_int64((-__pyx_v_running_stat_width)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 99, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_9 = PySlice_New(__pyx_t_6, __pyx_t_8, Py_None); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_9 = PySlice_New(__pyx_t_6, __pyx_t_8, Py_None); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 99, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_raw_cumsum), __pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_raw_cumsum), __pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 99, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __pyx_t_9 = PyNumber_Multiply(__pyx_int_2, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_9 = PyNumber_Multiply(__pyx_int_2, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 99, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-  /* "tombo/_c_helper.pyx":97
+  /* "tombo/_c_helper.pyx":100
  *     cdef np.ndarray[DTYPE_INT_t] candidate_poss = np.argsort(np.abs(
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -
  *         raw_cumsum[:-2*running_stat_width] -             # <<<<<<<<<<<<<<
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]
  * 
  */
-  __pyx_t_8 = __Pyx_PyInt_From_npy_int64((-2LL * __pyx_v_running_stat_width)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyInt_From_npy_int64((-2LL * __pyx_v_running_stat_width)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_8, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_8, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_raw_cumsum), __pyx_t_6); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_raw_cumsum), __pyx_t_6); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-  /* "tombo/_c_helper.pyx":96
+  /* "tombo/_c_helper.pyx":99
  *     # get difference between all neighboring running_stat_width regions
  *     cdef np.ndarray[DTYPE_INT_t] candidate_poss = np.argsort(np.abs(
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -             # <<<<<<<<<<<<<<
  *         raw_cumsum[:-2*running_stat_width] -
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]
  */
-  __pyx_t_6 = PyNumber_Subtract(__pyx_t_9, __pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 96, __pyx_L1_error)
+  __pyx_t_6 = PyNumber_Subtract(__pyx_t_9, __pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 99, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-  /* "tombo/_c_helper.pyx":98
+  /* "tombo/_c_helper.pyx":101
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -
  *         raw_cumsum[:-2*running_stat_width] -
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]             # <<<<<<<<<<<<<<
  * 
  *     cdef np.ndarray[DTYPE_INT_t] cpts = np.empty(num_cpts, dtype=DTYPE_INT)
  */
-  __pyx_t_8 = __Pyx_PyInt_From_npy_int64((2 * __pyx_v_running_stat_width)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 98, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyInt_From_npy_int64((2 * __pyx_v_running_stat_width)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_9 = PySlice_New(__pyx_t_8, Py_None, Py_None); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 98, __pyx_L1_error)
+  __pyx_t_9 = PySlice_New(__pyx_t_8, Py_None, Py_None); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_raw_cumsum), __pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 98, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_raw_cumsum), __pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-  /* "tombo/_c_helper.pyx":97
+  /* "tombo/_c_helper.pyx":100
  *     cdef np.ndarray[DTYPE_INT_t] candidate_poss = np.argsort(np.abs(
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -
  *         raw_cumsum[:-2*running_stat_width] -             # <<<<<<<<<<<<<<
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]
  * 
  */
-  __pyx_t_9 = PyNumber_Subtract(__pyx_t_6, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 97, __pyx_L1_error)
+  __pyx_t_9 = PyNumber_Subtract(__pyx_t_6, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 100, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -4145,7 +4218,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   __pyx_t_2 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_8, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_9);
   __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 95, __pyx_L1_error)
+  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_t_4 = NULL;
@@ -4161,21 +4234,21 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_4, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_2);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 95, __pyx_L1_error)
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 98, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "tombo/_c_helper.pyx":98
+  /* "tombo/_c_helper.pyx":101
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -
  *         raw_cumsum[:-2*running_stat_width] -
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]             # <<<<<<<<<<<<<<
  * 
  *     cdef np.ndarray[DTYPE_INT_t] cpts = np.empty(num_cpts, dtype=DTYPE_INT)
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_astype); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 98, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_astype); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_DTYPE_INT); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 98, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_DTYPE_INT); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_2 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
@@ -4190,19 +4263,19 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 98, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_t_1, __pyx_slice_); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 98, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_t_1, __pyx_slice_); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 98, __pyx_L1_error)
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 101, __pyx_L1_error)
   __pyx_t_10 = ((PyArrayObject *)__pyx_t_5);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer, (PyObject*)__pyx_t_10, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_candidate_poss = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 95, __pyx_L1_error)
+      __PYX_ERR(0, 98, __pyx_L1_error)
     } else {__pyx_pybuffernd_candidate_poss.diminfo[0].strides = __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_candidate_poss.diminfo[0].shape = __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -4210,43 +4283,43 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   __pyx_v_candidate_poss = ((PyArrayObject *)__pyx_t_5);
   __pyx_t_5 = 0;
 
-  /* "tombo/_c_helper.pyx":100
+  /* "tombo/_c_helper.pyx":103
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]
  * 
  *     cdef np.ndarray[DTYPE_INT_t] cpts = np.empty(num_cpts, dtype=DTYPE_INT)             # <<<<<<<<<<<<<<
  *     cpts[0] = candidate_poss[0] + running_stat_width
  *     blacklist_pos = set(range(
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_n_s_np); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 103, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_5, __pyx_n_s_empty); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 103, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyInt_From_npy_int64(__pyx_v_num_cpts); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_npy_int64(__pyx_v_num_cpts); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 103, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 103, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_5);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_5);
   __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 103, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_DTYPE_INT); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_DTYPE_INT); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 103, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_t_2) < 0) __PYX_ERR(0, 100, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_5, __pyx_n_s_dtype, __pyx_t_2) < 0) __PYX_ERR(0, 103, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_3, __pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 103, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 100, __pyx_L1_error)
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 103, __pyx_L1_error)
   __pyx_t_11 = ((PyArrayObject *)__pyx_t_2);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_cpts.rcbuffer->pybuffer, (PyObject*)__pyx_t_11, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_cpts = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_cpts.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 100, __pyx_L1_error)
+      __PYX_ERR(0, 103, __pyx_L1_error)
     } else {__pyx_pybuffernd_cpts.diminfo[0].strides = __pyx_pybuffernd_cpts.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_cpts.diminfo[0].shape = __pyx_pybuffernd_cpts.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -4254,7 +4327,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   __pyx_v_cpts = ((PyArrayObject *)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":101
+  /* "tombo/_c_helper.pyx":104
  * 
  *     cdef np.ndarray[DTYPE_INT_t] cpts = np.empty(num_cpts, dtype=DTYPE_INT)
  *     cpts[0] = candidate_poss[0] + running_stat_width             # <<<<<<<<<<<<<<
@@ -4269,7 +4342,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   } else if (unlikely(__pyx_t_12 >= __pyx_pybuffernd_candidate_poss.diminfo[0].shape)) __pyx_t_13 = 0;
   if (unlikely(__pyx_t_13 != -1)) {
     __Pyx_RaiseBufferIndexError(__pyx_t_13);
-    __PYX_ERR(0, 101, __pyx_L1_error)
+    __PYX_ERR(0, 104, __pyx_L1_error)
   }
   __pyx_t_14 = 0;
   __pyx_t_13 = -1;
@@ -4279,11 +4352,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   } else if (unlikely(__pyx_t_14 >= __pyx_pybuffernd_cpts.diminfo[0].shape)) __pyx_t_13 = 0;
   if (unlikely(__pyx_t_13 != -1)) {
     __Pyx_RaiseBufferIndexError(__pyx_t_13);
-    __PYX_ERR(0, 101, __pyx_L1_error)
+    __PYX_ERR(0, 104, __pyx_L1_error)
   }
   *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_cpts.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_cpts.diminfo[0].strides) = ((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_candidate_poss.diminfo[0].strides)) + __pyx_v_running_stat_width);
 
-  /* "tombo/_c_helper.pyx":103
+  /* "tombo/_c_helper.pyx":106
  *     cpts[0] = candidate_poss[0] + running_stat_width
  *     blacklist_pos = set(range(
  *         candidate_poss[0] - min_base_obs + 1, candidate_poss[0] + min_base_obs))             # <<<<<<<<<<<<<<
@@ -4298,9 +4371,9 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   } else if (unlikely(__pyx_t_12 >= __pyx_pybuffernd_candidate_poss.diminfo[0].shape)) __pyx_t_13 = 0;
   if (unlikely(__pyx_t_13 != -1)) {
     __Pyx_RaiseBufferIndexError(__pyx_t_13);
-    __PYX_ERR(0, 103, __pyx_L1_error)
+    __PYX_ERR(0, 106, __pyx_L1_error)
   }
-  __pyx_t_2 = __Pyx_PyInt_From_npy_int64((((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_candidate_poss.diminfo[0].strides)) - __pyx_v_min_base_obs) + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_npy_int64((((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_candidate_poss.diminfo[0].strides)) - __pyx_v_min_base_obs) + 1)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 106, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_12 = 0;
   __pyx_t_13 = -1;
@@ -4310,19 +4383,19 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   } else if (unlikely(__pyx_t_12 >= __pyx_pybuffernd_candidate_poss.diminfo[0].shape)) __pyx_t_13 = 0;
   if (unlikely(__pyx_t_13 != -1)) {
     __Pyx_RaiseBufferIndexError(__pyx_t_13);
-    __PYX_ERR(0, 103, __pyx_L1_error)
+    __PYX_ERR(0, 106, __pyx_L1_error)
   }
-  __pyx_t_5 = __Pyx_PyInt_From_npy_int64(((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_candidate_poss.diminfo[0].strides)) + __pyx_v_min_base_obs)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 103, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_npy_int64(((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_candidate_poss.diminfo[0].strides)) + __pyx_v_min_base_obs)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 106, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
 
-  /* "tombo/_c_helper.pyx":102
+  /* "tombo/_c_helper.pyx":105
  *     cdef np.ndarray[DTYPE_INT_t] cpts = np.empty(num_cpts, dtype=DTYPE_INT)
  *     cpts[0] = candidate_poss[0] + running_stat_width
  *     blacklist_pos = set(range(             # <<<<<<<<<<<<<<
  *         candidate_poss[0] - min_base_obs + 1, candidate_poss[0] + min_base_obs))
  *     cdef DTYPE_INT_t cand_pos
  */
-  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 105, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_2);
@@ -4330,16 +4403,16 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_5);
   __pyx_t_2 = 0;
   __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_3, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 105, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = PySet_New(__pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __pyx_t_3 = PySet_New(__pyx_t_5); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 105, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_v_blacklist_pos = ((PyObject*)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "tombo/_c_helper.pyx":105
+  /* "tombo/_c_helper.pyx":108
  *         candidate_poss[0] - min_base_obs + 1, candidate_poss[0] + min_base_obs))
  *     cdef DTYPE_INT_t cand_pos
  *     cdef DTYPE_INT_t num_cands = candidate_poss.shape[0] - (             # <<<<<<<<<<<<<<
@@ -4348,7 +4421,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
  */
   __pyx_v_num_cands = ((__pyx_v_candidate_poss->dimensions[0]) - (2 * __pyx_v_running_stat_width));
 
-  /* "tombo/_c_helper.pyx":107
+  /* "tombo/_c_helper.pyx":110
  *     cdef DTYPE_INT_t num_cands = candidate_poss.shape[0] - (
  *         2 * running_stat_width)
  *     cdef DTYPE_INT_t cand_idx = 1             # <<<<<<<<<<<<<<
@@ -4357,7 +4430,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
  */
   __pyx_v_cand_idx = 1;
 
-  /* "tombo/_c_helper.pyx":108
+  /* "tombo/_c_helper.pyx":111
  *         2 * running_stat_width)
  *     cdef DTYPE_INT_t cand_idx = 1
  *     cdef DTYPE_INT_t added_cpts = 1             # <<<<<<<<<<<<<<
@@ -4366,7 +4439,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
  */
   __pyx_v_added_cpts = 1;
 
-  /* "tombo/_c_helper.pyx":109
+  /* "tombo/_c_helper.pyx":112
  *     cdef DTYPE_INT_t cand_idx = 1
  *     cdef DTYPE_INT_t added_cpts = 1
  *     while added_cpts < num_cpts:             # <<<<<<<<<<<<<<
@@ -4377,7 +4450,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
     __pyx_t_15 = ((__pyx_v_added_cpts < __pyx_v_num_cpts) != 0);
     if (!__pyx_t_15) break;
 
-    /* "tombo/_c_helper.pyx":110
+    /* "tombo/_c_helper.pyx":113
  *     cdef DTYPE_INT_t added_cpts = 1
  *     while added_cpts < num_cpts:
  *         cand_pos = candidate_poss[cand_idx]             # <<<<<<<<<<<<<<
@@ -4392,25 +4465,25 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
     } else if (unlikely(__pyx_t_16 >= __pyx_pybuffernd_candidate_poss.diminfo[0].shape)) __pyx_t_13 = 0;
     if (unlikely(__pyx_t_13 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_13);
-      __PYX_ERR(0, 110, __pyx_L1_error)
+      __PYX_ERR(0, 113, __pyx_L1_error)
     }
     __pyx_v_cand_pos = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf, __pyx_t_16, __pyx_pybuffernd_candidate_poss.diminfo[0].strides));
 
-    /* "tombo/_c_helper.pyx":111
+    /* "tombo/_c_helper.pyx":114
  *     while added_cpts < num_cpts:
  *         cand_pos = candidate_poss[cand_idx]
  *         if cand_pos not in blacklist_pos:             # <<<<<<<<<<<<<<
  *             cpts[added_cpts] = cand_pos + running_stat_width
  *             added_cpts += 1
  */
-    __pyx_t_3 = __Pyx_PyInt_From_npy_int64(__pyx_v_cand_pos); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 111, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyInt_From_npy_int64(__pyx_v_cand_pos); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 114, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    __pyx_t_15 = (__Pyx_PySet_ContainsTF(__pyx_t_3, __pyx_v_blacklist_pos, Py_NE)); if (unlikely(__pyx_t_15 < 0)) __PYX_ERR(0, 111, __pyx_L1_error)
+    __pyx_t_15 = (__Pyx_PySet_ContainsTF(__pyx_t_3, __pyx_v_blacklist_pos, Py_NE)); if (unlikely(__pyx_t_15 < 0)) __PYX_ERR(0, 114, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_t_17 = (__pyx_t_15 != 0);
     if (__pyx_t_17) {
 
-      /* "tombo/_c_helper.pyx":112
+      /* "tombo/_c_helper.pyx":115
  *         cand_pos = candidate_poss[cand_idx]
  *         if cand_pos not in blacklist_pos:
  *             cpts[added_cpts] = cand_pos + running_stat_width             # <<<<<<<<<<<<<<
@@ -4425,11 +4498,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
       } else if (unlikely(__pyx_t_16 >= __pyx_pybuffernd_cpts.diminfo[0].shape)) __pyx_t_13 = 0;
       if (unlikely(__pyx_t_13 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_13);
-        __PYX_ERR(0, 112, __pyx_L1_error)
+        __PYX_ERR(0, 115, __pyx_L1_error)
       }
       *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_cpts.rcbuffer->pybuffer.buf, __pyx_t_16, __pyx_pybuffernd_cpts.diminfo[0].strides) = (__pyx_v_cand_pos + __pyx_v_running_stat_width);
 
-      /* "tombo/_c_helper.pyx":113
+      /* "tombo/_c_helper.pyx":116
  *         if cand_pos not in blacklist_pos:
  *             cpts[added_cpts] = cand_pos + running_stat_width
  *             added_cpts += 1             # <<<<<<<<<<<<<<
@@ -4438,26 +4511,26 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
  */
       __pyx_v_added_cpts = (__pyx_v_added_cpts + 1);
 
-      /* "tombo/_c_helper.pyx":115
+      /* "tombo/_c_helper.pyx":118
  *             added_cpts += 1
  *             blacklist_pos.update(range(
  *                 cand_pos - min_base_obs + 1, cand_pos + min_base_obs))             # <<<<<<<<<<<<<<
  *         cand_idx += 1
  *         if cand_idx >= num_cands:
  */
-      __pyx_t_3 = __Pyx_PyInt_From_npy_int64(((__pyx_v_cand_pos - __pyx_v_min_base_obs) + 1)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 115, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyInt_From_npy_int64(((__pyx_v_cand_pos - __pyx_v_min_base_obs) + 1)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 118, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_5 = __Pyx_PyInt_From_npy_int64((__pyx_v_cand_pos + __pyx_v_min_base_obs)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 115, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyInt_From_npy_int64((__pyx_v_cand_pos + __pyx_v_min_base_obs)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 118, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
 
-      /* "tombo/_c_helper.pyx":114
+      /* "tombo/_c_helper.pyx":117
  *             cpts[added_cpts] = cand_pos + running_stat_width
  *             added_cpts += 1
  *             blacklist_pos.update(range(             # <<<<<<<<<<<<<<
  *                 cand_pos - min_base_obs + 1, cand_pos + min_base_obs))
  *         cand_idx += 1
  */
-      __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 114, __pyx_L1_error)
+      __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 117, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_GIVEREF(__pyx_t_3);
       PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_3);
@@ -4465,15 +4538,15 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
       PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_5);
       __pyx_t_3 = 0;
       __pyx_t_5 = 0;
-      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_2, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 114, __pyx_L1_error)
+      __pyx_t_5 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_2, NULL); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 117, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PySet_Type_update, __pyx_v_blacklist_pos, __pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 114, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PySet_Type_update, __pyx_v_blacklist_pos, __pyx_t_5); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 117, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-      /* "tombo/_c_helper.pyx":111
+      /* "tombo/_c_helper.pyx":114
  *     while added_cpts < num_cpts:
  *         cand_pos = candidate_poss[cand_idx]
  *         if cand_pos not in blacklist_pos:             # <<<<<<<<<<<<<<
@@ -4482,7 +4555,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
  */
     }
 
-    /* "tombo/_c_helper.pyx":116
+    /* "tombo/_c_helper.pyx":119
  *             blacklist_pos.update(range(
  *                 cand_pos - min_base_obs + 1, cand_pos + min_base_obs))
  *         cand_idx += 1             # <<<<<<<<<<<<<<
@@ -4491,7 +4564,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
  */
     __pyx_v_cand_idx = (__pyx_v_cand_idx + 1);
 
-    /* "tombo/_c_helper.pyx":117
+    /* "tombo/_c_helper.pyx":120
  *                 cand_pos - min_base_obs + 1, cand_pos + min_base_obs))
  *         cand_idx += 1
  *         if cand_idx >= num_cands:             # <<<<<<<<<<<<<<
@@ -4501,20 +4574,20 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
     __pyx_t_17 = ((__pyx_v_cand_idx >= __pyx_v_num_cands) != 0);
     if (unlikely(__pyx_t_17)) {
 
-      /* "tombo/_c_helper.pyx":118
+      /* "tombo/_c_helper.pyx":121
  *         cand_idx += 1
  *         if cand_idx >= num_cands:
  *             raise NotImplementedError('Fewer changepoints found than requested')             # <<<<<<<<<<<<<<
  * 
  *     return cpts
  */
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 118, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 121, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_Raise(__pyx_t_2, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __PYX_ERR(0, 118, __pyx_L1_error)
+      __PYX_ERR(0, 121, __pyx_L1_error)
 
-      /* "tombo/_c_helper.pyx":117
+      /* "tombo/_c_helper.pyx":120
  *                 cand_pos - min_base_obs + 1, cand_pos + min_base_obs))
  *         cand_idx += 1
  *         if cand_idx >= num_cands:             # <<<<<<<<<<<<<<
@@ -4524,7 +4597,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
     }
   }
 
-  /* "tombo/_c_helper.pyx":120
+  /* "tombo/_c_helper.pyx":123
  *             raise NotImplementedError('Fewer changepoints found than requested')
  * 
  *     return cpts             # <<<<<<<<<<<<<<
@@ -4536,7 +4609,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   __pyx_r = ((PyObject *)__pyx_v_cpts);
   goto __pyx_L0;
 
-  /* "tombo/_c_helper.pyx":89
+  /* "tombo/_c_helper.pyx":92
  *     return clipped_signal
  * 
  * def c_valid_cpts_w_cap(             # <<<<<<<<<<<<<<
@@ -4581,7 +4654,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_8c_valid_cpts_w_cap(CYTHON_UNUSED Py
   return __pyx_r;
 }
 
-/* "tombo/_c_helper.pyx":122
+/* "tombo/_c_helper.pyx":125
  *     return cpts
  * 
  * def c_valid_cpts(             # <<<<<<<<<<<<<<
@@ -4628,17 +4701,17 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_11c_valid_cpts(PyObject *__pyx_self,
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_min_base_obs)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_valid_cpts", 1, 3, 3, 1); __PYX_ERR(0, 122, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_valid_cpts", 1, 3, 3, 1); __PYX_ERR(0, 125, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_running_stat_width)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_valid_cpts", 1, 3, 3, 2); __PYX_ERR(0, 122, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_valid_cpts", 1, 3, 3, 2); __PYX_ERR(0, 125, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_valid_cpts") < 0)) __PYX_ERR(0, 122, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_valid_cpts") < 0)) __PYX_ERR(0, 125, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
       goto __pyx_L5_argtuple_error;
@@ -4648,18 +4721,18 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_11c_valid_cpts(PyObject *__pyx_self,
       values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
     }
     __pyx_v_raw_signal = ((PyArrayObject *)values[0]);
-    __pyx_v_min_base_obs = __Pyx_PyInt_As_npy_int64(values[1]); if (unlikely((__pyx_v_min_base_obs == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 123, __pyx_L3_error)
-    __pyx_v_running_stat_width = __Pyx_PyInt_As_npy_int64(values[2]); if (unlikely((__pyx_v_running_stat_width == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 124, __pyx_L3_error)
+    __pyx_v_min_base_obs = __Pyx_PyInt_As_npy_int64(values[1]); if (unlikely((__pyx_v_min_base_obs == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 126, __pyx_L3_error)
+    __pyx_v_running_stat_width = __Pyx_PyInt_As_npy_int64(values[2]); if (unlikely((__pyx_v_running_stat_width == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 127, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("c_valid_cpts", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 122, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("c_valid_cpts", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 125, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("tombo._c_helper.c_valid_cpts", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_raw_signal), __pyx_ptype_5numpy_ndarray, 1, "raw_signal", 0))) __PYX_ERR(0, 123, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_raw_signal), __pyx_ptype_5numpy_ndarray, 1, "raw_signal", 0))) __PYX_ERR(0, 126, __pyx_L1_error)
   __pyx_r = __pyx_pf_5tombo_9_c_helper_10c_valid_cpts(__pyx_self, __pyx_v_raw_signal, __pyx_v_min_base_obs, __pyx_v_running_stat_width);
 
   /* function exit code */
@@ -4721,41 +4794,41 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
   __pyx_pybuffernd_raw_signal.rcbuffer = &__pyx_pybuffer_raw_signal;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_raw_signal.rcbuffer->pybuffer, (PyObject*)__pyx_v_raw_signal, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 122, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_raw_signal.rcbuffer->pybuffer, (PyObject*)__pyx_v_raw_signal, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 125, __pyx_L1_error)
   }
   __pyx_pybuffernd_raw_signal.diminfo[0].strides = __pyx_pybuffernd_raw_signal.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_raw_signal.diminfo[0].shape = __pyx_pybuffernd_raw_signal.rcbuffer->pybuffer.shape[0];
 
-  /* "tombo/_c_helper.pyx":125
+  /* "tombo/_c_helper.pyx":128
  *         np.ndarray[DTYPE_t] raw_signal, DTYPE_INT_t min_base_obs,
  *         DTYPE_INT_t running_stat_width):
  *     cdef np.ndarray[DTYPE_t] raw_cumsum = np.cumsum(             # <<<<<<<<<<<<<<
  *         np.concatenate([[0.0], raw_signal]))
  *     # get difference between all neighboring running_stat_width regions
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 125, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 128, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_cumsum); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 125, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_cumsum); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 128, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":126
+  /* "tombo/_c_helper.pyx":129
  *         DTYPE_INT_t running_stat_width):
  *     cdef np.ndarray[DTYPE_t] raw_cumsum = np.cumsum(
  *         np.concatenate([[0.0], raw_signal]))             # <<<<<<<<<<<<<<
  *     # get difference between all neighboring running_stat_width regions
  *     cdef np.ndarray[DTYPE_INT_t] candidate_poss = np.argsort(np.abs(
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 126, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 129, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_concatenate); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 126, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_concatenate); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 129, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 126, __pyx_L1_error)
+  __pyx_t_4 = PyList_New(1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 129, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_INCREF(__pyx_float_0_0);
   __Pyx_GIVEREF(__pyx_float_0_0);
   PyList_SET_ITEM(__pyx_t_4, 0, __pyx_float_0_0);
-  __pyx_t_6 = PyList_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 126, __pyx_L1_error)
+  __pyx_t_6 = PyList_New(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 129, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_GIVEREF(__pyx_t_4);
   PyList_SET_ITEM(__pyx_t_6, 0, __pyx_t_4);
@@ -4776,7 +4849,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
   __pyx_t_2 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_4, __pyx_t_6) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_6);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 126, __pyx_L1_error)
+  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 129, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __pyx_t_5 = NULL;
@@ -4792,24 +4865,24 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
   __pyx_t_1 = (__pyx_t_5) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_5, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2);
   __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 125, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 128, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "tombo/_c_helper.pyx":125
+  /* "tombo/_c_helper.pyx":128
  *         np.ndarray[DTYPE_t] raw_signal, DTYPE_INT_t min_base_obs,
  *         DTYPE_INT_t running_stat_width):
  *     cdef np.ndarray[DTYPE_t] raw_cumsum = np.cumsum(             # <<<<<<<<<<<<<<
  *         np.concatenate([[0.0], raw_signal]))
  *     # get difference between all neighboring running_stat_width regions
  */
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 125, __pyx_L1_error)
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 128, __pyx_L1_error)
   __pyx_t_7 = ((PyArrayObject *)__pyx_t_1);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_raw_cumsum.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_raw_cumsum = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_raw_cumsum.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 125, __pyx_L1_error)
+      __PYX_ERR(0, 128, __pyx_L1_error)
     } else {__pyx_pybuffernd_raw_cumsum.diminfo[0].strides = __pyx_pybuffernd_raw_cumsum.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_raw_cumsum.diminfo[0].shape = __pyx_pybuffernd_raw_cumsum.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -4817,98 +4890,98 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
   __pyx_v_raw_cumsum = ((PyArrayObject *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "tombo/_c_helper.pyx":128
+  /* "tombo/_c_helper.pyx":131
  *         np.concatenate([[0.0], raw_signal]))
  *     # get difference between all neighboring running_stat_width regions
  *     cdef np.ndarray[DTYPE_INT_t] candidate_poss = np.argsort(np.abs(             # <<<<<<<<<<<<<<
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -
  *         raw_cumsum[:-2*running_stat_width] -
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 131, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_argsort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_argsort); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 131, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_6, __pyx_n_s_np); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 131, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_abs); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 128, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_6, __pyx_n_s_abs); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 131, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-  /* "tombo/_c_helper.pyx":129
+  /* "tombo/_c_helper.pyx":132
  *     # get difference between all neighboring running_stat_width regions
  *     cdef np.ndarray[DTYPE_INT_t] candidate_poss = np.argsort(np.abs(
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -             # <<<<<<<<<<<<<<
  *         raw_cumsum[:-2*running_stat_width] -
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]
  */
-  __pyx_t_6 = __Pyx_PyInt_From_npy_int64(__pyx_v_running_stat_width); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyInt_From_npy_int64(__pyx_v_running_stat_width); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 132, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_8 = __Pyx_PyInt_From_npy_int64((-__pyx_v_running_stat_width)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyInt_From_npy_int64((-__pyx_v_running_stat_width)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 132, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_9 = PySlice_New(__pyx_t_6, __pyx_t_8, Py_None); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __pyx_t_9 = PySlice_New(__pyx_t_6, __pyx_t_8, Py_None); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 132, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_raw_cumsum), __pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_raw_cumsum), __pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 132, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  __pyx_t_9 = PyNumber_Multiply(__pyx_int_2, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __pyx_t_9 = PyNumber_Multiply(__pyx_int_2, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 132, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-  /* "tombo/_c_helper.pyx":130
+  /* "tombo/_c_helper.pyx":133
  *     cdef np.ndarray[DTYPE_INT_t] candidate_poss = np.argsort(np.abs(
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -
  *         raw_cumsum[:-2*running_stat_width] -             # <<<<<<<<<<<<<<
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]
  * 
  */
-  __pyx_t_8 = __Pyx_PyInt_From_npy_int64((-2LL * __pyx_v_running_stat_width)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 130, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyInt_From_npy_int64((-2LL * __pyx_v_running_stat_width)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 133, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_8, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 130, __pyx_L1_error)
+  __pyx_t_6 = PySlice_New(Py_None, __pyx_t_8, Py_None); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 133, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_raw_cumsum), __pyx_t_6); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 130, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_raw_cumsum), __pyx_t_6); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 133, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-  /* "tombo/_c_helper.pyx":129
+  /* "tombo/_c_helper.pyx":132
  *     # get difference between all neighboring running_stat_width regions
  *     cdef np.ndarray[DTYPE_INT_t] candidate_poss = np.argsort(np.abs(
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -             # <<<<<<<<<<<<<<
  *         raw_cumsum[:-2*running_stat_width] -
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]
  */
-  __pyx_t_6 = PyNumber_Subtract(__pyx_t_9, __pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 129, __pyx_L1_error)
+  __pyx_t_6 = PyNumber_Subtract(__pyx_t_9, __pyx_t_8); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 132, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
 
-  /* "tombo/_c_helper.pyx":131
+  /* "tombo/_c_helper.pyx":134
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -
  *         raw_cumsum[:-2*running_stat_width] -
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]             # <<<<<<<<<<<<<<
  * 
  *     cpts = [candidate_poss[0]]
  */
-  __pyx_t_8 = __Pyx_PyInt_From_npy_int64((2 * __pyx_v_running_stat_width)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyInt_From_npy_int64((2 * __pyx_v_running_stat_width)); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 134, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
-  __pyx_t_9 = PySlice_New(__pyx_t_8, Py_None, Py_None); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_t_9 = PySlice_New(__pyx_t_8, Py_None, Py_None); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 134, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-  __pyx_t_8 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_raw_cumsum), __pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_t_8 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_raw_cumsum), __pyx_t_9); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 134, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-  /* "tombo/_c_helper.pyx":130
+  /* "tombo/_c_helper.pyx":133
  *     cdef np.ndarray[DTYPE_INT_t] candidate_poss = np.argsort(np.abs(
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -
  *         raw_cumsum[:-2*running_stat_width] -             # <<<<<<<<<<<<<<
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]
  * 
  */
-  __pyx_t_9 = PyNumber_Subtract(__pyx_t_6, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 130, __pyx_L1_error)
+  __pyx_t_9 = PyNumber_Subtract(__pyx_t_6, __pyx_t_8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 133, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
@@ -4925,7 +4998,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
   __pyx_t_2 = (__pyx_t_8) ? __Pyx_PyObject_Call2Args(__pyx_t_4, __pyx_t_8, __pyx_t_9) : __Pyx_PyObject_CallOneArg(__pyx_t_4, __pyx_t_9);
   __Pyx_XDECREF(__pyx_t_8); __pyx_t_8 = 0;
   __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 131, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_t_4 = NULL;
@@ -4941,21 +5014,21 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
   __pyx_t_3 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_4, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_2);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 128, __pyx_L1_error)
+  if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 131, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "tombo/_c_helper.pyx":131
+  /* "tombo/_c_helper.pyx":134
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -
  *         raw_cumsum[:-2*running_stat_width] -
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]             # <<<<<<<<<<<<<<
  * 
  *     cpts = [candidate_poss[0]]
  */
-  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_astype); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_astype); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 134, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_DTYPE_INT); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_DTYPE_INT); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 134, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_2 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_5))) {
@@ -4970,19 +5043,19 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_5, __pyx_t_2, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_5, __pyx_t_3);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 131, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
-  __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_t_1, __pyx_slice_); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 131, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyObject_GetItem(__pyx_t_1, __pyx_slice_); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 134, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 131, __pyx_L1_error)
+  if (!(likely(((__pyx_t_5) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_5, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 134, __pyx_L1_error)
   __pyx_t_10 = ((PyArrayObject *)__pyx_t_5);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer, (PyObject*)__pyx_t_10, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_candidate_poss = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 128, __pyx_L1_error)
+      __PYX_ERR(0, 131, __pyx_L1_error)
     } else {__pyx_pybuffernd_candidate_poss.diminfo[0].strides = __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_candidate_poss.diminfo[0].shape = __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -4990,7 +5063,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
   __pyx_v_candidate_poss = ((PyArrayObject *)__pyx_t_5);
   __pyx_t_5 = 0;
 
-  /* "tombo/_c_helper.pyx":133
+  /* "tombo/_c_helper.pyx":136
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]
  * 
  *     cpts = [candidate_poss[0]]             # <<<<<<<<<<<<<<
@@ -5005,11 +5078,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
   } else if (unlikely(__pyx_t_11 >= __pyx_pybuffernd_candidate_poss.diminfo[0].shape)) __pyx_t_12 = 0;
   if (unlikely(__pyx_t_12 != -1)) {
     __Pyx_RaiseBufferIndexError(__pyx_t_12);
-    __PYX_ERR(0, 133, __pyx_L1_error)
+    __PYX_ERR(0, 136, __pyx_L1_error)
   }
-  __pyx_t_5 = __Pyx_PyInt_From_npy_int64((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_candidate_poss.diminfo[0].strides))); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 133, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_From_npy_int64((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf, __pyx_t_11, __pyx_pybuffernd_candidate_poss.diminfo[0].strides))); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 136, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
-  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 133, __pyx_L1_error)
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_5);
   PyList_SET_ITEM(__pyx_t_1, 0, __pyx_t_5);
@@ -5017,34 +5090,34 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
   __pyx_v_cpts = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "tombo/_c_helper.pyx":134
+  /* "tombo/_c_helper.pyx":137
  * 
  *     cpts = [candidate_poss[0]]
  *     blacklist_pos = set()             # <<<<<<<<<<<<<<
  *     cdef DTYPE_INT_t pos
  *     for pos in candidate_poss[1:]:
  */
-  __pyx_t_1 = PySet_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 134, __pyx_L1_error)
+  __pyx_t_1 = PySet_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_v_blacklist_pos = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "tombo/_c_helper.pyx":136
+  /* "tombo/_c_helper.pyx":139
  *     blacklist_pos = set()
  *     cdef DTYPE_INT_t pos
  *     for pos in candidate_poss[1:]:             # <<<<<<<<<<<<<<
  *         if pos not in blacklist_pos:
  *             cpts.append(pos)
  */
-  __pyx_t_1 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_candidate_poss), __pyx_slice__3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_candidate_poss), __pyx_slice__3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   if (likely(PyList_CheckExact(__pyx_t_1)) || PyTuple_CheckExact(__pyx_t_1)) {
     __pyx_t_5 = __pyx_t_1; __Pyx_INCREF(__pyx_t_5); __pyx_t_13 = 0;
     __pyx_t_14 = NULL;
   } else {
-    __pyx_t_13 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 136, __pyx_L1_error)
+    __pyx_t_13 = -1; __pyx_t_5 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 139, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_5);
-    __pyx_t_14 = Py_TYPE(__pyx_t_5)->tp_iternext; if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 136, __pyx_L1_error)
+    __pyx_t_14 = Py_TYPE(__pyx_t_5)->tp_iternext; if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 139, __pyx_L1_error)
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   for (;;) {
@@ -5052,17 +5125,17 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
       if (likely(PyList_CheckExact(__pyx_t_5))) {
         if (__pyx_t_13 >= PyList_GET_SIZE(__pyx_t_5)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_13); __Pyx_INCREF(__pyx_t_1); __pyx_t_13++; if (unlikely(0 < 0)) __PYX_ERR(0, 136, __pyx_L1_error)
+        __pyx_t_1 = PyList_GET_ITEM(__pyx_t_5, __pyx_t_13); __Pyx_INCREF(__pyx_t_1); __pyx_t_13++; if (unlikely(0 < 0)) __PYX_ERR(0, 139, __pyx_L1_error)
         #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_5, __pyx_t_13); __pyx_t_13++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_5, __pyx_t_13); __pyx_t_13++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         #endif
       } else {
         if (__pyx_t_13 >= PyTuple_GET_SIZE(__pyx_t_5)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_13); __Pyx_INCREF(__pyx_t_1); __pyx_t_13++; if (unlikely(0 < 0)) __PYX_ERR(0, 136, __pyx_L1_error)
+        __pyx_t_1 = PyTuple_GET_ITEM(__pyx_t_5, __pyx_t_13); __Pyx_INCREF(__pyx_t_1); __pyx_t_13++; if (unlikely(0 < 0)) __PYX_ERR(0, 139, __pyx_L1_error)
         #else
-        __pyx_t_1 = PySequence_ITEM(__pyx_t_5, __pyx_t_13); __pyx_t_13++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 136, __pyx_L1_error)
+        __pyx_t_1 = PySequence_ITEM(__pyx_t_5, __pyx_t_13); __pyx_t_13++; if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 139, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_1);
         #endif
       }
@@ -5072,62 +5145,62 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 136, __pyx_L1_error)
+          else __PYX_ERR(0, 139, __pyx_L1_error)
         }
         break;
       }
       __Pyx_GOTREF(__pyx_t_1);
     }
-    __pyx_t_15 = __Pyx_PyInt_As_npy_int64(__pyx_t_1); if (unlikely((__pyx_t_15 == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 136, __pyx_L1_error)
+    __pyx_t_15 = __Pyx_PyInt_As_npy_int64(__pyx_t_1); if (unlikely((__pyx_t_15 == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 139, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_v_pos = __pyx_t_15;
 
-    /* "tombo/_c_helper.pyx":137
+    /* "tombo/_c_helper.pyx":140
  *     cdef DTYPE_INT_t pos
  *     for pos in candidate_poss[1:]:
  *         if pos not in blacklist_pos:             # <<<<<<<<<<<<<<
  *             cpts.append(pos)
  *             blacklist_pos.update(range(
  */
-    __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__pyx_v_pos); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 137, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__pyx_v_pos); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_16 = (__Pyx_PySet_ContainsTF(__pyx_t_1, __pyx_v_blacklist_pos, Py_NE)); if (unlikely(__pyx_t_16 < 0)) __PYX_ERR(0, 137, __pyx_L1_error)
+    __pyx_t_16 = (__Pyx_PySet_ContainsTF(__pyx_t_1, __pyx_v_blacklist_pos, Py_NE)); if (unlikely(__pyx_t_16 < 0)) __PYX_ERR(0, 140, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_t_17 = (__pyx_t_16 != 0);
     if (__pyx_t_17) {
 
-      /* "tombo/_c_helper.pyx":138
+      /* "tombo/_c_helper.pyx":141
  *     for pos in candidate_poss[1:]:
  *         if pos not in blacklist_pos:
  *             cpts.append(pos)             # <<<<<<<<<<<<<<
  *             blacklist_pos.update(range(
  *                 pos-min_base_obs+1, pos+min_base_obs+1))
  */
-      __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__pyx_v_pos); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 138, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__pyx_v_pos); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 141, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_18 = __Pyx_PyList_Append(__pyx_v_cpts, __pyx_t_1); if (unlikely(__pyx_t_18 == ((int)-1))) __PYX_ERR(0, 138, __pyx_L1_error)
+      __pyx_t_18 = __Pyx_PyList_Append(__pyx_v_cpts, __pyx_t_1); if (unlikely(__pyx_t_18 == ((int)-1))) __PYX_ERR(0, 141, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-      /* "tombo/_c_helper.pyx":140
+      /* "tombo/_c_helper.pyx":143
  *             cpts.append(pos)
  *             blacklist_pos.update(range(
  *                 pos-min_base_obs+1, pos+min_base_obs+1))             # <<<<<<<<<<<<<<
  * 
  *     return np.array(cpts) + running_stat_width
  */
-      __pyx_t_1 = __Pyx_PyInt_From_npy_int64(((__pyx_v_pos - __pyx_v_min_base_obs) + 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 140, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyInt_From_npy_int64(((__pyx_v_pos - __pyx_v_min_base_obs) + 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 143, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_3 = __Pyx_PyInt_From_npy_int64(((__pyx_v_pos + __pyx_v_min_base_obs) + 1)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 140, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyInt_From_npy_int64(((__pyx_v_pos + __pyx_v_min_base_obs) + 1)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 143, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
 
-      /* "tombo/_c_helper.pyx":139
+      /* "tombo/_c_helper.pyx":142
  *         if pos not in blacklist_pos:
  *             cpts.append(pos)
  *             blacklist_pos.update(range(             # <<<<<<<<<<<<<<
  *                 pos-min_base_obs+1, pos+min_base_obs+1))
  * 
  */
-      __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 139, __pyx_L1_error)
+      __pyx_t_2 = PyTuple_New(2); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 142, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_GIVEREF(__pyx_t_1);
       PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
@@ -5135,15 +5208,15 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
       PyTuple_SET_ITEM(__pyx_t_2, 1, __pyx_t_3);
       __pyx_t_1 = 0;
       __pyx_t_3 = 0;
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 139, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 142, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-      __pyx_t_2 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PySet_Type_update, __pyx_v_blacklist_pos, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 139, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PySet_Type_update, __pyx_v_blacklist_pos, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 142, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-      /* "tombo/_c_helper.pyx":137
+      /* "tombo/_c_helper.pyx":140
  *     cdef DTYPE_INT_t pos
  *     for pos in candidate_poss[1:]:
  *         if pos not in blacklist_pos:             # <<<<<<<<<<<<<<
@@ -5152,7 +5225,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
  */
     }
 
-    /* "tombo/_c_helper.pyx":136
+    /* "tombo/_c_helper.pyx":139
  *     blacklist_pos = set()
  *     cdef DTYPE_INT_t pos
  *     for pos in candidate_poss[1:]:             # <<<<<<<<<<<<<<
@@ -5162,7 +5235,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
   }
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
 
-  /* "tombo/_c_helper.pyx":142
+  /* "tombo/_c_helper.pyx":145
  *                 pos-min_base_obs+1, pos+min_base_obs+1))
  * 
  *     return np.array(cpts) + running_stat_width             # <<<<<<<<<<<<<<
@@ -5170,9 +5243,9 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
  * def c_valid_cpts_w_cap_t_test(
  */
   __Pyx_XDECREF(__pyx_r);
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 145, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_array); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_array); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 145, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -5187,12 +5260,12 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
   }
   __pyx_t_5 = (__pyx_t_2) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_2, __pyx_v_cpts) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_v_cpts);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 142, __pyx_L1_error)
+  if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 145, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_5);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyInt_From_npy_int64(__pyx_v_running_stat_width); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_npy_int64(__pyx_v_running_stat_width); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 145, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = PyNumber_Add(__pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_t_2 = PyNumber_Add(__pyx_t_5, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 145, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
@@ -5200,7 +5273,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
   __pyx_t_2 = 0;
   goto __pyx_L0;
 
-  /* "tombo/_c_helper.pyx":122
+  /* "tombo/_c_helper.pyx":125
  *     return cpts
  * 
  * def c_valid_cpts(             # <<<<<<<<<<<<<<
@@ -5243,7 +5316,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_10c_valid_cpts(CYTHON_UNUSED PyObjec
   return __pyx_r;
 }
 
-/* "tombo/_c_helper.pyx":144
+/* "tombo/_c_helper.pyx":147
  *     return np.array(cpts) + running_stat_width
  * 
  * def c_valid_cpts_w_cap_t_test(             # <<<<<<<<<<<<<<
@@ -5293,23 +5366,23 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_13c_valid_cpts_w_cap_t_test(PyObject
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_min_base_obs)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap_t_test", 1, 4, 4, 1); __PYX_ERR(0, 144, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap_t_test", 1, 4, 4, 1); __PYX_ERR(0, 147, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_running_stat_width)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap_t_test", 1, 4, 4, 2); __PYX_ERR(0, 144, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap_t_test", 1, 4, 4, 2); __PYX_ERR(0, 147, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_num_cpts)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap_t_test", 1, 4, 4, 3); __PYX_ERR(0, 144, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap_t_test", 1, 4, 4, 3); __PYX_ERR(0, 147, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_valid_cpts_w_cap_t_test") < 0)) __PYX_ERR(0, 144, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_valid_cpts_w_cap_t_test") < 0)) __PYX_ERR(0, 147, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -5320,19 +5393,19 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_13c_valid_cpts_w_cap_t_test(PyObject
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
     __pyx_v_raw_signal = ((PyArrayObject *)values[0]);
-    __pyx_v_min_base_obs = __Pyx_PyInt_As_npy_int64(values[1]); if (unlikely((__pyx_v_min_base_obs == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 145, __pyx_L3_error)
-    __pyx_v_running_stat_width = __Pyx_PyInt_As_npy_int64(values[2]); if (unlikely((__pyx_v_running_stat_width == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 146, __pyx_L3_error)
-    __pyx_v_num_cpts = __Pyx_PyInt_As_npy_int64(values[3]); if (unlikely((__pyx_v_num_cpts == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 146, __pyx_L3_error)
+    __pyx_v_min_base_obs = __Pyx_PyInt_As_npy_int64(values[1]); if (unlikely((__pyx_v_min_base_obs == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 148, __pyx_L3_error)
+    __pyx_v_running_stat_width = __Pyx_PyInt_As_npy_int64(values[2]); if (unlikely((__pyx_v_running_stat_width == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 149, __pyx_L3_error)
+    __pyx_v_num_cpts = __Pyx_PyInt_As_npy_int64(values[3]); if (unlikely((__pyx_v_num_cpts == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 149, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap_t_test", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 144, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("c_valid_cpts_w_cap_t_test", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 147, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("tombo._c_helper.c_valid_cpts_w_cap_t_test", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_raw_signal), __pyx_ptype_5numpy_ndarray, 1, "raw_signal", 0))) __PYX_ERR(0, 145, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_raw_signal), __pyx_ptype_5numpy_ndarray, 1, "raw_signal", 0))) __PYX_ERR(0, 148, __pyx_L1_error)
   __pyx_r = __pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(__pyx_self, __pyx_v_raw_signal, __pyx_v_min_base_obs, __pyx_v_running_stat_width, __pyx_v_num_cpts);
 
   /* function exit code */
@@ -5413,11 +5486,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
   __pyx_pybuffernd_raw_signal.rcbuffer = &__pyx_pybuffer_raw_signal;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_raw_signal.rcbuffer->pybuffer, (PyObject*)__pyx_v_raw_signal, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 144, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_raw_signal.rcbuffer->pybuffer, (PyObject*)__pyx_v_raw_signal, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 147, __pyx_L1_error)
   }
   __pyx_pybuffernd_raw_signal.diminfo[0].strides = __pyx_pybuffernd_raw_signal.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_raw_signal.diminfo[0].shape = __pyx_pybuffernd_raw_signal.rcbuffer->pybuffer.shape[0];
 
-  /* "tombo/_c_helper.pyx":149
+  /* "tombo/_c_helper.pyx":152
  *     cdef DTYPE_INT_t pos, idx
  *     cdef DTYPE_t pos_diff, m1, m2, var1, var2
  *     cdef DTYPE_INT_t num_cands = raw_signal.shape[0] - (running_stat_width * 2)             # <<<<<<<<<<<<<<
@@ -5426,43 +5499,43 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
  */
   __pyx_v_num_cands = ((__pyx_v_raw_signal->dimensions[0]) - (__pyx_v_running_stat_width * 2));
 
-  /* "tombo/_c_helper.pyx":152
+  /* "tombo/_c_helper.pyx":155
  *     # note these will not actually be t-scores, but will be a monotonic transform
  *     # so the rank order will be the same
  *     cdef np.ndarray[DTYPE_t] t_scores = np.empty(num_cands, dtype=DTYPE)             # <<<<<<<<<<<<<<
  *     for pos in range(num_cands):
  *         # compute means
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__pyx_v_num_cands); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__pyx_v_num_cands); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
   __pyx_t_1 = 0;
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 152, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 152, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 155, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 152, __pyx_L1_error)
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 155, __pyx_L1_error)
   __pyx_t_5 = ((PyArrayObject *)__pyx_t_4);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_t_scores.rcbuffer->pybuffer, (PyObject*)__pyx_t_5, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_t_scores = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_t_scores.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 152, __pyx_L1_error)
+      __PYX_ERR(0, 155, __pyx_L1_error)
     } else {__pyx_pybuffernd_t_scores.diminfo[0].strides = __pyx_pybuffernd_t_scores.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_t_scores.diminfo[0].shape = __pyx_pybuffernd_t_scores.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -5470,7 +5543,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
   __pyx_v_t_scores = ((PyArrayObject *)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "tombo/_c_helper.pyx":153
+  /* "tombo/_c_helper.pyx":156
  *     # so the rank order will be the same
  *     cdef np.ndarray[DTYPE_t] t_scores = np.empty(num_cands, dtype=DTYPE)
  *     for pos in range(num_cands):             # <<<<<<<<<<<<<<
@@ -5482,7 +5555,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
   for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
     __pyx_v_pos = __pyx_t_8;
 
-    /* "tombo/_c_helper.pyx":155
+    /* "tombo/_c_helper.pyx":158
  *     for pos in range(num_cands):
  *         # compute means
  *         m1 = 0             # <<<<<<<<<<<<<<
@@ -5491,7 +5564,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
  */
     __pyx_v_m1 = 0.0;
 
-    /* "tombo/_c_helper.pyx":156
+    /* "tombo/_c_helper.pyx":159
  *         # compute means
  *         m1 = 0
  *         for idx in range(running_stat_width):             # <<<<<<<<<<<<<<
@@ -5503,7 +5576,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
     for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
       __pyx_v_idx = __pyx_t_11;
 
-      /* "tombo/_c_helper.pyx":157
+      /* "tombo/_c_helper.pyx":160
  *         m1 = 0
  *         for idx in range(running_stat_width):
  *             m1 += raw_signal[pos + idx]             # <<<<<<<<<<<<<<
@@ -5518,12 +5591,12 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       } else if (unlikely(__pyx_t_12 >= __pyx_pybuffernd_raw_signal.diminfo[0].shape)) __pyx_t_13 = 0;
       if (unlikely(__pyx_t_13 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_13);
-        __PYX_ERR(0, 157, __pyx_L1_error)
+        __PYX_ERR(0, 160, __pyx_L1_error)
       }
       __pyx_v_m1 = (__pyx_v_m1 + (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_raw_signal.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_raw_signal.diminfo[0].strides)));
     }
 
-    /* "tombo/_c_helper.pyx":158
+    /* "tombo/_c_helper.pyx":161
  *         for idx in range(running_stat_width):
  *             m1 += raw_signal[pos + idx]
  *         m1 /= running_stat_width             # <<<<<<<<<<<<<<
@@ -5532,11 +5605,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
  */
     if (unlikely(__pyx_v_running_stat_width == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 158, __pyx_L1_error)
+      __PYX_ERR(0, 161, __pyx_L1_error)
     }
     __pyx_v_m1 = (__pyx_v_m1 / __pyx_v_running_stat_width);
 
-    /* "tombo/_c_helper.pyx":159
+    /* "tombo/_c_helper.pyx":162
  *             m1 += raw_signal[pos + idx]
  *         m1 /= running_stat_width
  *         m2 = 0             # <<<<<<<<<<<<<<
@@ -5545,7 +5618,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
  */
     __pyx_v_m2 = 0.0;
 
-    /* "tombo/_c_helper.pyx":160
+    /* "tombo/_c_helper.pyx":163
  *         m1 /= running_stat_width
  *         m2 = 0
  *         for idx in range(running_stat_width):             # <<<<<<<<<<<<<<
@@ -5557,7 +5630,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
     for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
       __pyx_v_idx = __pyx_t_11;
 
-      /* "tombo/_c_helper.pyx":161
+      /* "tombo/_c_helper.pyx":164
  *         m2 = 0
  *         for idx in range(running_stat_width):
  *             m2 += raw_signal[pos + running_stat_width + idx]             # <<<<<<<<<<<<<<
@@ -5572,12 +5645,12 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       } else if (unlikely(__pyx_t_12 >= __pyx_pybuffernd_raw_signal.diminfo[0].shape)) __pyx_t_13 = 0;
       if (unlikely(__pyx_t_13 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_13);
-        __PYX_ERR(0, 161, __pyx_L1_error)
+        __PYX_ERR(0, 164, __pyx_L1_error)
       }
       __pyx_v_m2 = (__pyx_v_m2 + (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_raw_signal.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_raw_signal.diminfo[0].strides)));
     }
 
-    /* "tombo/_c_helper.pyx":162
+    /* "tombo/_c_helper.pyx":165
  *         for idx in range(running_stat_width):
  *             m2 += raw_signal[pos + running_stat_width + idx]
  *         m2 /= running_stat_width             # <<<<<<<<<<<<<<
@@ -5586,11 +5659,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
  */
     if (unlikely(__pyx_v_running_stat_width == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 162, __pyx_L1_error)
+      __PYX_ERR(0, 165, __pyx_L1_error)
     }
     __pyx_v_m2 = (__pyx_v_m2 / __pyx_v_running_stat_width);
 
-    /* "tombo/_c_helper.pyx":165
+    /* "tombo/_c_helper.pyx":168
  * 
  *         # compute sum of variances
  *         var1 = 0             # <<<<<<<<<<<<<<
@@ -5599,7 +5672,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
  */
     __pyx_v_var1 = 0.0;
 
-    /* "tombo/_c_helper.pyx":166
+    /* "tombo/_c_helper.pyx":169
  *         # compute sum of variances
  *         var1 = 0
  *         for idx in range(running_stat_width):             # <<<<<<<<<<<<<<
@@ -5611,7 +5684,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
     for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
       __pyx_v_idx = __pyx_t_11;
 
-      /* "tombo/_c_helper.pyx":167
+      /* "tombo/_c_helper.pyx":170
  *         var1 = 0
  *         for idx in range(running_stat_width):
  *             pos_diff = raw_signal[pos + idx] - m1             # <<<<<<<<<<<<<<
@@ -5626,11 +5699,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       } else if (unlikely(__pyx_t_12 >= __pyx_pybuffernd_raw_signal.diminfo[0].shape)) __pyx_t_13 = 0;
       if (unlikely(__pyx_t_13 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_13);
-        __PYX_ERR(0, 167, __pyx_L1_error)
+        __PYX_ERR(0, 170, __pyx_L1_error)
       }
       __pyx_v_pos_diff = ((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_raw_signal.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_raw_signal.diminfo[0].strides)) - __pyx_v_m1);
 
-      /* "tombo/_c_helper.pyx":168
+      /* "tombo/_c_helper.pyx":171
  *         for idx in range(running_stat_width):
  *             pos_diff = raw_signal[pos + idx] - m1
  *             var1 += pos_diff * pos_diff             # <<<<<<<<<<<<<<
@@ -5640,7 +5713,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       __pyx_v_var1 = (__pyx_v_var1 + (__pyx_v_pos_diff * __pyx_v_pos_diff));
     }
 
-    /* "tombo/_c_helper.pyx":169
+    /* "tombo/_c_helper.pyx":172
  *             pos_diff = raw_signal[pos + idx] - m1
  *             var1 += pos_diff * pos_diff
  *         var2 = 0             # <<<<<<<<<<<<<<
@@ -5649,7 +5722,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
  */
     __pyx_v_var2 = 0.0;
 
-    /* "tombo/_c_helper.pyx":170
+    /* "tombo/_c_helper.pyx":173
  *             var1 += pos_diff * pos_diff
  *         var2 = 0
  *         for idx in range(running_stat_width):             # <<<<<<<<<<<<<<
@@ -5661,7 +5734,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
     for (__pyx_t_11 = 0; __pyx_t_11 < __pyx_t_10; __pyx_t_11+=1) {
       __pyx_v_idx = __pyx_t_11;
 
-      /* "tombo/_c_helper.pyx":171
+      /* "tombo/_c_helper.pyx":174
  *         var2 = 0
  *         for idx in range(running_stat_width):
  *             pos_diff = raw_signal[pos + running_stat_width + idx] - m2             # <<<<<<<<<<<<<<
@@ -5676,11 +5749,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       } else if (unlikely(__pyx_t_12 >= __pyx_pybuffernd_raw_signal.diminfo[0].shape)) __pyx_t_13 = 0;
       if (unlikely(__pyx_t_13 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_13);
-        __PYX_ERR(0, 171, __pyx_L1_error)
+        __PYX_ERR(0, 174, __pyx_L1_error)
       }
       __pyx_v_pos_diff = ((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_raw_signal.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_raw_signal.diminfo[0].strides)) - __pyx_v_m2);
 
-      /* "tombo/_c_helper.pyx":172
+      /* "tombo/_c_helper.pyx":175
  *         for idx in range(running_stat_width):
  *             pos_diff = raw_signal[pos + running_stat_width + idx] - m2
  *             var2 += pos_diff * pos_diff             # <<<<<<<<<<<<<<
@@ -5690,7 +5763,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       __pyx_v_var2 = (__pyx_v_var2 + (__pyx_v_pos_diff * __pyx_v_pos_diff));
     }
 
-    /* "tombo/_c_helper.pyx":174
+    /* "tombo/_c_helper.pyx":177
  *             var2 += pos_diff * pos_diff
  * 
  *         if var1 + var2 == 0:             # <<<<<<<<<<<<<<
@@ -5700,7 +5773,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
     __pyx_t_14 = (((__pyx_v_var1 + __pyx_v_var2) == 0.0) != 0);
     if (__pyx_t_14) {
 
-      /* "tombo/_c_helper.pyx":175
+      /* "tombo/_c_helper.pyx":178
  * 
  *         if var1 + var2 == 0:
  *             t_scores[pos] = 0.0             # <<<<<<<<<<<<<<
@@ -5715,11 +5788,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       } else if (unlikely(__pyx_t_9 >= __pyx_pybuffernd_t_scores.diminfo[0].shape)) __pyx_t_13 = 0;
       if (unlikely(__pyx_t_13 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_13);
-        __PYX_ERR(0, 175, __pyx_L1_error)
+        __PYX_ERR(0, 178, __pyx_L1_error)
       }
       *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_t_scores.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_t_scores.diminfo[0].strides) = 0.0;
 
-      /* "tombo/_c_helper.pyx":174
+      /* "tombo/_c_helper.pyx":177
  *             var2 += pos_diff * pos_diff
  * 
  *         if var1 + var2 == 0:             # <<<<<<<<<<<<<<
@@ -5729,7 +5802,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       goto __pyx_L13;
     }
 
-    /* "tombo/_c_helper.pyx":176
+    /* "tombo/_c_helper.pyx":179
  *         if var1 + var2 == 0:
  *             t_scores[pos] = 0.0
  *         elif m1 > m2:             # <<<<<<<<<<<<<<
@@ -5739,7 +5812,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
     __pyx_t_14 = ((__pyx_v_m1 > __pyx_v_m2) != 0);
     if (__pyx_t_14) {
 
-      /* "tombo/_c_helper.pyx":177
+      /* "tombo/_c_helper.pyx":180
  *             t_scores[pos] = 0.0
  *         elif m1 > m2:
  *             t_scores[pos] = (m1 - m2) / sqrt(var1 + var2)             # <<<<<<<<<<<<<<
@@ -5750,7 +5823,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       __pyx_t_16 = sqrt((__pyx_v_var1 + __pyx_v_var2));
       if (unlikely(__pyx_t_16 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 177, __pyx_L1_error)
+        __PYX_ERR(0, 180, __pyx_L1_error)
       }
       __pyx_t_9 = __pyx_v_pos;
       __pyx_t_13 = -1;
@@ -5760,11 +5833,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       } else if (unlikely(__pyx_t_9 >= __pyx_pybuffernd_t_scores.diminfo[0].shape)) __pyx_t_13 = 0;
       if (unlikely(__pyx_t_13 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_13);
-        __PYX_ERR(0, 177, __pyx_L1_error)
+        __PYX_ERR(0, 180, __pyx_L1_error)
       }
       *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_t_scores.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_t_scores.diminfo[0].strides) = (__pyx_t_15 / __pyx_t_16);
 
-      /* "tombo/_c_helper.pyx":176
+      /* "tombo/_c_helper.pyx":179
  *         if var1 + var2 == 0:
  *             t_scores[pos] = 0.0
  *         elif m1 > m2:             # <<<<<<<<<<<<<<
@@ -5774,7 +5847,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       goto __pyx_L13;
     }
 
-    /* "tombo/_c_helper.pyx":179
+    /* "tombo/_c_helper.pyx":182
  *             t_scores[pos] = (m1 - m2) / sqrt(var1 + var2)
  *         else:
  *             t_scores[pos] = (m2 - m1) / sqrt(var1 + var2)             # <<<<<<<<<<<<<<
@@ -5786,7 +5859,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       __pyx_t_16 = sqrt((__pyx_v_var1 + __pyx_v_var2));
       if (unlikely(__pyx_t_16 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 179, __pyx_L1_error)
+        __PYX_ERR(0, 182, __pyx_L1_error)
       }
       __pyx_t_9 = __pyx_v_pos;
       __pyx_t_13 = -1;
@@ -5796,27 +5869,27 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       } else if (unlikely(__pyx_t_9 >= __pyx_pybuffernd_t_scores.diminfo[0].shape)) __pyx_t_13 = 0;
       if (unlikely(__pyx_t_13 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_13);
-        __PYX_ERR(0, 179, __pyx_L1_error)
+        __PYX_ERR(0, 182, __pyx_L1_error)
       }
       *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_t_scores.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_t_scores.diminfo[0].strides) = (__pyx_t_15 / __pyx_t_16);
     }
     __pyx_L13:;
   }
 
-  /* "tombo/_c_helper.pyx":181
+  /* "tombo/_c_helper.pyx":184
  *             t_scores[pos] = (m2 - m1) / sqrt(var1 + var2)
  * 
  *     cdef np.ndarray[DTYPE_INT_t] candidate_poss = np.argsort(             # <<<<<<<<<<<<<<
  *         t_scores).astype(DTYPE_INT)[::-1]
  * 
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 181, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 184, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_argsort); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 181, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_argsort); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 184, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "tombo/_c_helper.pyx":182
+  /* "tombo/_c_helper.pyx":185
  * 
  *     cdef np.ndarray[DTYPE_INT_t] candidate_poss = np.argsort(
  *         t_scores).astype(DTYPE_INT)[::-1]             # <<<<<<<<<<<<<<
@@ -5835,13 +5908,13 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
   }
   __pyx_t_1 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, ((PyObject *)__pyx_v_t_scores)) : __Pyx_PyObject_CallOneArg(__pyx_t_2, ((PyObject *)__pyx_v_t_scores));
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 181, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 184, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_astype); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 182, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_astype); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 185, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_DTYPE_INT); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 182, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_DTYPE_INT); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 185, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_t_3 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_2))) {
@@ -5856,19 +5929,19 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
   __pyx_t_4 = (__pyx_t_3) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_3, __pyx_t_1) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_1);
   __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 182, __pyx_L1_error)
+  if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 185, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_t_4, __pyx_slice_); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 182, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetItem(__pyx_t_4, __pyx_slice_); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 185, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 182, __pyx_L1_error)
+  if (!(likely(((__pyx_t_2) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_2, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 185, __pyx_L1_error)
   __pyx_t_17 = ((PyArrayObject *)__pyx_t_2);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer, (PyObject*)__pyx_t_17, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_candidate_poss = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 181, __pyx_L1_error)
+      __PYX_ERR(0, 184, __pyx_L1_error)
     } else {__pyx_pybuffernd_candidate_poss.diminfo[0].strides = __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_candidate_poss.diminfo[0].shape = __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -5876,43 +5949,43 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
   __pyx_v_candidate_poss = ((PyArrayObject *)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":184
+  /* "tombo/_c_helper.pyx":187
  *         t_scores).astype(DTYPE_INT)[::-1]
  * 
  *     cdef np.ndarray[DTYPE_INT_t] cpts = np.empty(num_cpts, dtype=DTYPE_INT)             # <<<<<<<<<<<<<<
  *     cpts[0] = candidate_poss[0] + running_stat_width
  *     blacklist_pos = set(range(
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 187, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_empty); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 187, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyInt_From_npy_int64(__pyx_v_num_cpts); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_npy_int64(__pyx_v_num_cpts); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 187, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 187, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_2);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2);
   __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 187, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_DTYPE_INT); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_DTYPE_INT); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 187, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 184, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_n_s_dtype, __pyx_t_3) < 0) __PYX_ERR(0, 187, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 184, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_Call(__pyx_t_4, __pyx_t_1, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 187, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 184, __pyx_L1_error)
+  if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 187, __pyx_L1_error)
   __pyx_t_18 = ((PyArrayObject *)__pyx_t_3);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_cpts.rcbuffer->pybuffer, (PyObject*)__pyx_t_18, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_cpts = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_cpts.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 184, __pyx_L1_error)
+      __PYX_ERR(0, 187, __pyx_L1_error)
     } else {__pyx_pybuffernd_cpts.diminfo[0].strides = __pyx_pybuffernd_cpts.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_cpts.diminfo[0].shape = __pyx_pybuffernd_cpts.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -5920,7 +5993,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
   __pyx_v_cpts = ((PyArrayObject *)__pyx_t_3);
   __pyx_t_3 = 0;
 
-  /* "tombo/_c_helper.pyx":185
+  /* "tombo/_c_helper.pyx":188
  * 
  *     cdef np.ndarray[DTYPE_INT_t] cpts = np.empty(num_cpts, dtype=DTYPE_INT)
  *     cpts[0] = candidate_poss[0] + running_stat_width             # <<<<<<<<<<<<<<
@@ -5935,7 +6008,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
   } else if (unlikely(__pyx_t_19 >= __pyx_pybuffernd_candidate_poss.diminfo[0].shape)) __pyx_t_13 = 0;
   if (unlikely(__pyx_t_13 != -1)) {
     __Pyx_RaiseBufferIndexError(__pyx_t_13);
-    __PYX_ERR(0, 185, __pyx_L1_error)
+    __PYX_ERR(0, 188, __pyx_L1_error)
   }
   __pyx_t_20 = 0;
   __pyx_t_13 = -1;
@@ -5945,11 +6018,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
   } else if (unlikely(__pyx_t_20 >= __pyx_pybuffernd_cpts.diminfo[0].shape)) __pyx_t_13 = 0;
   if (unlikely(__pyx_t_13 != -1)) {
     __Pyx_RaiseBufferIndexError(__pyx_t_13);
-    __PYX_ERR(0, 185, __pyx_L1_error)
+    __PYX_ERR(0, 188, __pyx_L1_error)
   }
   *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_cpts.rcbuffer->pybuffer.buf, __pyx_t_20, __pyx_pybuffernd_cpts.diminfo[0].strides) = ((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf, __pyx_t_19, __pyx_pybuffernd_candidate_poss.diminfo[0].strides)) + __pyx_v_running_stat_width);
 
-  /* "tombo/_c_helper.pyx":187
+  /* "tombo/_c_helper.pyx":190
  *     cpts[0] = candidate_poss[0] + running_stat_width
  *     blacklist_pos = set(range(
  *         candidate_poss[0] - min_base_obs + 1, candidate_poss[0] + min_base_obs))             # <<<<<<<<<<<<<<
@@ -5964,9 +6037,9 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
   } else if (unlikely(__pyx_t_19 >= __pyx_pybuffernd_candidate_poss.diminfo[0].shape)) __pyx_t_13 = 0;
   if (unlikely(__pyx_t_13 != -1)) {
     __Pyx_RaiseBufferIndexError(__pyx_t_13);
-    __PYX_ERR(0, 187, __pyx_L1_error)
+    __PYX_ERR(0, 190, __pyx_L1_error)
   }
-  __pyx_t_3 = __Pyx_PyInt_From_npy_int64((((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf, __pyx_t_19, __pyx_pybuffernd_candidate_poss.diminfo[0].strides)) - __pyx_v_min_base_obs) + 1)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_npy_int64((((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf, __pyx_t_19, __pyx_pybuffernd_candidate_poss.diminfo[0].strides)) - __pyx_v_min_base_obs) + 1)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 190, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_19 = 0;
   __pyx_t_13 = -1;
@@ -5976,19 +6049,19 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
   } else if (unlikely(__pyx_t_19 >= __pyx_pybuffernd_candidate_poss.diminfo[0].shape)) __pyx_t_13 = 0;
   if (unlikely(__pyx_t_13 != -1)) {
     __Pyx_RaiseBufferIndexError(__pyx_t_13);
-    __PYX_ERR(0, 187, __pyx_L1_error)
+    __PYX_ERR(0, 190, __pyx_L1_error)
   }
-  __pyx_t_2 = __Pyx_PyInt_From_npy_int64(((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf, __pyx_t_19, __pyx_pybuffernd_candidate_poss.diminfo[0].strides)) + __pyx_v_min_base_obs)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 187, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_npy_int64(((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf, __pyx_t_19, __pyx_pybuffernd_candidate_poss.diminfo[0].strides)) + __pyx_v_min_base_obs)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 190, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
 
-  /* "tombo/_c_helper.pyx":186
+  /* "tombo/_c_helper.pyx":189
  *     cdef np.ndarray[DTYPE_INT_t] cpts = np.empty(num_cpts, dtype=DTYPE_INT)
  *     cpts[0] = candidate_poss[0] + running_stat_width
  *     blacklist_pos = set(range(             # <<<<<<<<<<<<<<
  *         candidate_poss[0] - min_base_obs + 1, candidate_poss[0] + min_base_obs))
  *     cdef DTYPE_INT_t cand_pos
  */
-  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 189, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_GIVEREF(__pyx_t_3);
   PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_3);
@@ -5996,16 +6069,16 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
   PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_2);
   __pyx_t_3 = 0;
   __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_1, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 189, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PySet_New(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 186, __pyx_L1_error)
+  __pyx_t_1 = PySet_New(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 189, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_v_blacklist_pos = ((PyObject*)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "tombo/_c_helper.pyx":189
+  /* "tombo/_c_helper.pyx":192
  *         candidate_poss[0] - min_base_obs + 1, candidate_poss[0] + min_base_obs))
  *     cdef DTYPE_INT_t cand_pos
  *     cdef DTYPE_INT_t cand_idx = 1             # <<<<<<<<<<<<<<
@@ -6014,7 +6087,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
  */
   __pyx_v_cand_idx = 1;
 
-  /* "tombo/_c_helper.pyx":190
+  /* "tombo/_c_helper.pyx":193
  *     cdef DTYPE_INT_t cand_pos
  *     cdef DTYPE_INT_t cand_idx = 1
  *     cdef DTYPE_INT_t added_cpts = 1             # <<<<<<<<<<<<<<
@@ -6023,7 +6096,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
  */
   __pyx_v_added_cpts = 1;
 
-  /* "tombo/_c_helper.pyx":191
+  /* "tombo/_c_helper.pyx":194
  *     cdef DTYPE_INT_t cand_idx = 1
  *     cdef DTYPE_INT_t added_cpts = 1
  *     while added_cpts < num_cpts:             # <<<<<<<<<<<<<<
@@ -6034,7 +6107,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
     __pyx_t_14 = ((__pyx_v_added_cpts < __pyx_v_num_cpts) != 0);
     if (!__pyx_t_14) break;
 
-    /* "tombo/_c_helper.pyx":192
+    /* "tombo/_c_helper.pyx":195
  *     cdef DTYPE_INT_t added_cpts = 1
  *     while added_cpts < num_cpts:
  *         cand_pos = candidate_poss[cand_idx]             # <<<<<<<<<<<<<<
@@ -6049,25 +6122,25 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
     } else if (unlikely(__pyx_t_6 >= __pyx_pybuffernd_candidate_poss.diminfo[0].shape)) __pyx_t_13 = 0;
     if (unlikely(__pyx_t_13 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_13);
-      __PYX_ERR(0, 192, __pyx_L1_error)
+      __PYX_ERR(0, 195, __pyx_L1_error)
     }
     __pyx_v_cand_pos = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_candidate_poss.rcbuffer->pybuffer.buf, __pyx_t_6, __pyx_pybuffernd_candidate_poss.diminfo[0].strides));
 
-    /* "tombo/_c_helper.pyx":193
+    /* "tombo/_c_helper.pyx":196
  *     while added_cpts < num_cpts:
  *         cand_pos = candidate_poss[cand_idx]
  *         if cand_pos not in blacklist_pos:             # <<<<<<<<<<<<<<
  *             cpts[added_cpts] = cand_pos + running_stat_width
  *             added_cpts += 1
  */
-    __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__pyx_v_cand_pos); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 193, __pyx_L1_error)
+    __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__pyx_v_cand_pos); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 196, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_14 = (__Pyx_PySet_ContainsTF(__pyx_t_1, __pyx_v_blacklist_pos, Py_NE)); if (unlikely(__pyx_t_14 < 0)) __PYX_ERR(0, 193, __pyx_L1_error)
+    __pyx_t_14 = (__Pyx_PySet_ContainsTF(__pyx_t_1, __pyx_v_blacklist_pos, Py_NE)); if (unlikely(__pyx_t_14 < 0)) __PYX_ERR(0, 196, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
     __pyx_t_21 = (__pyx_t_14 != 0);
     if (__pyx_t_21) {
 
-      /* "tombo/_c_helper.pyx":194
+      /* "tombo/_c_helper.pyx":197
  *         cand_pos = candidate_poss[cand_idx]
  *         if cand_pos not in blacklist_pos:
  *             cpts[added_cpts] = cand_pos + running_stat_width             # <<<<<<<<<<<<<<
@@ -6082,11 +6155,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       } else if (unlikely(__pyx_t_6 >= __pyx_pybuffernd_cpts.diminfo[0].shape)) __pyx_t_13 = 0;
       if (unlikely(__pyx_t_13 != -1)) {
         __Pyx_RaiseBufferIndexError(__pyx_t_13);
-        __PYX_ERR(0, 194, __pyx_L1_error)
+        __PYX_ERR(0, 197, __pyx_L1_error)
       }
       *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_cpts.rcbuffer->pybuffer.buf, __pyx_t_6, __pyx_pybuffernd_cpts.diminfo[0].strides) = (__pyx_v_cand_pos + __pyx_v_running_stat_width);
 
-      /* "tombo/_c_helper.pyx":195
+      /* "tombo/_c_helper.pyx":198
  *         if cand_pos not in blacklist_pos:
  *             cpts[added_cpts] = cand_pos + running_stat_width
  *             added_cpts += 1             # <<<<<<<<<<<<<<
@@ -6095,26 +6168,26 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
  */
       __pyx_v_added_cpts = (__pyx_v_added_cpts + 1);
 
-      /* "tombo/_c_helper.pyx":197
+      /* "tombo/_c_helper.pyx":200
  *             added_cpts += 1
  *             blacklist_pos.update(range(
  *                 cand_pos - min_base_obs + 1, cand_pos + min_base_obs))             # <<<<<<<<<<<<<<
  *         cand_idx += 1
  *         if cand_idx >= num_cands:
  */
-      __pyx_t_1 = __Pyx_PyInt_From_npy_int64(((__pyx_v_cand_pos - __pyx_v_min_base_obs) + 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 197, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyInt_From_npy_int64(((__pyx_v_cand_pos - __pyx_v_min_base_obs) + 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 200, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_2 = __Pyx_PyInt_From_npy_int64((__pyx_v_cand_pos + __pyx_v_min_base_obs)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 197, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyInt_From_npy_int64((__pyx_v_cand_pos + __pyx_v_min_base_obs)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 200, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
 
-      /* "tombo/_c_helper.pyx":196
+      /* "tombo/_c_helper.pyx":199
  *             cpts[added_cpts] = cand_pos + running_stat_width
  *             added_cpts += 1
  *             blacklist_pos.update(range(             # <<<<<<<<<<<<<<
  *                 cand_pos - min_base_obs + 1, cand_pos + min_base_obs))
  *         cand_idx += 1
  */
-      __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 196, __pyx_L1_error)
+      __pyx_t_3 = PyTuple_New(2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 199, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_GIVEREF(__pyx_t_1);
       PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
@@ -6122,15 +6195,15 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
       PyTuple_SET_ITEM(__pyx_t_3, 1, __pyx_t_2);
       __pyx_t_1 = 0;
       __pyx_t_2 = 0;
-      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 196, __pyx_L1_error)
+      __pyx_t_2 = __Pyx_PyObject_Call(__pyx_builtin_range, __pyx_t_3, NULL); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 199, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_3 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PySet_Type_update, __pyx_v_blacklist_pos, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 196, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_CallUnboundCMethod1(&__pyx_umethod_PySet_Type_update, __pyx_v_blacklist_pos, __pyx_t_2); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 199, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-      /* "tombo/_c_helper.pyx":193
+      /* "tombo/_c_helper.pyx":196
  *     while added_cpts < num_cpts:
  *         cand_pos = candidate_poss[cand_idx]
  *         if cand_pos not in blacklist_pos:             # <<<<<<<<<<<<<<
@@ -6139,7 +6212,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
  */
     }
 
-    /* "tombo/_c_helper.pyx":198
+    /* "tombo/_c_helper.pyx":201
  *             blacklist_pos.update(range(
  *                 cand_pos - min_base_obs + 1, cand_pos + min_base_obs))
  *         cand_idx += 1             # <<<<<<<<<<<<<<
@@ -6148,7 +6221,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
  */
     __pyx_v_cand_idx = (__pyx_v_cand_idx + 1);
 
-    /* "tombo/_c_helper.pyx":199
+    /* "tombo/_c_helper.pyx":202
  *                 cand_pos - min_base_obs + 1, cand_pos + min_base_obs))
  *         cand_idx += 1
  *         if cand_idx >= num_cands:             # <<<<<<<<<<<<<<
@@ -6158,20 +6231,20 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
     __pyx_t_21 = ((__pyx_v_cand_idx >= __pyx_v_num_cands) != 0);
     if (unlikely(__pyx_t_21)) {
 
-      /* "tombo/_c_helper.pyx":200
+      /* "tombo/_c_helper.pyx":203
  *         cand_idx += 1
  *         if cand_idx >= num_cands:
  *             raise NotImplementedError('Fewer changepoints found than requested')             # <<<<<<<<<<<<<<
  * 
  *     return cpts
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 200, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_NotImplementedError, __pyx_tuple__2, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 203, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(0, 200, __pyx_L1_error)
+      __PYX_ERR(0, 203, __pyx_L1_error)
 
-      /* "tombo/_c_helper.pyx":199
+      /* "tombo/_c_helper.pyx":202
  *                 cand_pos - min_base_obs + 1, cand_pos + min_base_obs))
  *         cand_idx += 1
  *         if cand_idx >= num_cands:             # <<<<<<<<<<<<<<
@@ -6181,7 +6254,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
     }
   }
 
-  /* "tombo/_c_helper.pyx":202
+  /* "tombo/_c_helper.pyx":205
  *             raise NotImplementedError('Fewer changepoints found than requested')
  * 
  *     return cpts             # <<<<<<<<<<<<<<
@@ -6193,7 +6266,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
   __pyx_r = ((PyObject *)__pyx_v_cpts);
   goto __pyx_L0;
 
-  /* "tombo/_c_helper.pyx":144
+  /* "tombo/_c_helper.pyx":147
  *     return np.array(cpts) + running_stat_width
  * 
  * def c_valid_cpts_w_cap_t_test(             # <<<<<<<<<<<<<<
@@ -6234,7 +6307,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_12c_valid_cpts_w_cap_t_test(CYTHON_U
   return __pyx_r;
 }
 
-/* "tombo/_c_helper.pyx":206
+/* "tombo/_c_helper.pyx":209
  * @cython.wraparound(False)
  * @cython.boundscheck(False)
  * cdef DTYPE_INT_t _c_searchsorted(             # <<<<<<<<<<<<<<
@@ -6262,11 +6335,11 @@ static __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_f_5tombo_9_c_helper__c_search
   __pyx_pybuffernd_sorted_arr.rcbuffer = &__pyx_pybuffer_sorted_arr;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer, (PyObject*)__pyx_v_sorted_arr, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT16_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 206, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer, (PyObject*)__pyx_v_sorted_arr, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT16_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 209, __pyx_L1_error)
   }
   __pyx_pybuffernd_sorted_arr.diminfo[0].strides = __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sorted_arr.diminfo[0].shape = __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.shape[0];
 
-  /* "tombo/_c_helper.pyx":209
+  /* "tombo/_c_helper.pyx":212
  *     np.ndarray[DTYPE_INT16_t] sorted_arr, DTYPE_INT16_t value):
  *     cdef DTYPE_INT_t low, mid, high
  *     low = 0             # <<<<<<<<<<<<<<
@@ -6275,7 +6348,7 @@ static __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_f_5tombo_9_c_helper__c_search
  */
   __pyx_v_low = 0;
 
-  /* "tombo/_c_helper.pyx":210
+  /* "tombo/_c_helper.pyx":213
  *     cdef DTYPE_INT_t low, mid, high
  *     low = 0
  *     high = sorted_arr.shape[0] - 1             # <<<<<<<<<<<<<<
@@ -6284,7 +6357,7 @@ static __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_f_5tombo_9_c_helper__c_search
  */
   __pyx_v_high = ((__pyx_v_sorted_arr->dimensions[0]) - 1);
 
-  /* "tombo/_c_helper.pyx":211
+  /* "tombo/_c_helper.pyx":214
  *     low = 0
  *     high = sorted_arr.shape[0] - 1
  *     while (low <= high):             # <<<<<<<<<<<<<<
@@ -6295,7 +6368,7 @@ static __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_f_5tombo_9_c_helper__c_search
     __pyx_t_1 = ((__pyx_v_low <= __pyx_v_high) != 0);
     if (!__pyx_t_1) break;
 
-    /* "tombo/_c_helper.pyx":212
+    /* "tombo/_c_helper.pyx":215
  *     high = sorted_arr.shape[0] - 1
  *     while (low <= high):
  *         mid = (low + high) / 2             # <<<<<<<<<<<<<<
@@ -6304,7 +6377,7 @@ static __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_f_5tombo_9_c_helper__c_search
  */
     __pyx_v_mid = __Pyx_div___pyx_t_5tombo_9_c_helper_DTYPE_INT_t((__pyx_v_low + __pyx_v_high), 2);
 
-    /* "tombo/_c_helper.pyx":213
+    /* "tombo/_c_helper.pyx":216
  *     while (low <= high):
  *         mid = (low + high) / 2
  *         if (sorted_arr[mid] >= value):             # <<<<<<<<<<<<<<
@@ -6315,7 +6388,7 @@ static __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_f_5tombo_9_c_helper__c_search
     __pyx_t_1 = (((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.buf, __pyx_t_2, __pyx_pybuffernd_sorted_arr.diminfo[0].strides)) >= __pyx_v_value) != 0);
     if (__pyx_t_1) {
 
-      /* "tombo/_c_helper.pyx":214
+      /* "tombo/_c_helper.pyx":217
  *         mid = (low + high) / 2
  *         if (sorted_arr[mid] >= value):
  *             high = mid - 1             # <<<<<<<<<<<<<<
@@ -6324,7 +6397,7 @@ static __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_f_5tombo_9_c_helper__c_search
  */
       __pyx_v_high = (__pyx_v_mid - 1);
 
-      /* "tombo/_c_helper.pyx":213
+      /* "tombo/_c_helper.pyx":216
  *     while (low <= high):
  *         mid = (low + high) / 2
  *         if (sorted_arr[mid] >= value):             # <<<<<<<<<<<<<<
@@ -6334,7 +6407,7 @@ static __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_f_5tombo_9_c_helper__c_search
       goto __pyx_L5;
     }
 
-    /* "tombo/_c_helper.pyx":216
+    /* "tombo/_c_helper.pyx":219
  *             high = mid - 1
  *         else:
  *             low = mid + 1             # <<<<<<<<<<<<<<
@@ -6347,7 +6420,7 @@ static __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_f_5tombo_9_c_helper__c_search
     __pyx_L5:;
   }
 
-  /* "tombo/_c_helper.pyx":217
+  /* "tombo/_c_helper.pyx":220
  *         else:
  *             low = mid + 1
  *     return low             # <<<<<<<<<<<<<<
@@ -6357,7 +6430,7 @@ static __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_f_5tombo_9_c_helper__c_search
   __pyx_r = __pyx_v_low;
   goto __pyx_L0;
 
-  /* "tombo/_c_helper.pyx":206
+  /* "tombo/_c_helper.pyx":209
  * @cython.wraparound(False)
  * @cython.boundscheck(False)
  * cdef DTYPE_INT_t _c_searchsorted(             # <<<<<<<<<<<<<<
@@ -6383,7 +6456,7 @@ static __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_f_5tombo_9_c_helper__c_search
   return __pyx_r;
 }
 
-/* "tombo/_c_helper.pyx":221
+/* "tombo/_c_helper.pyx":224
  * @cython.wraparound(False)
  * @cython.boundscheck(False)
  * def c_compute_running_pctl_diffs(             # <<<<<<<<<<<<<<
@@ -6433,23 +6506,23 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_15c_compute_running_pctl_diffs(PyObj
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_window_size)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_compute_running_pctl_diffs", 1, 4, 4, 1); __PYX_ERR(0, 221, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_compute_running_pctl_diffs", 1, 4, 4, 1); __PYX_ERR(0, 224, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_lower_pctl)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_compute_running_pctl_diffs", 1, 4, 4, 2); __PYX_ERR(0, 221, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_compute_running_pctl_diffs", 1, 4, 4, 2); __PYX_ERR(0, 224, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_upper_pctl)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_compute_running_pctl_diffs", 1, 4, 4, 3); __PYX_ERR(0, 221, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_compute_running_pctl_diffs", 1, 4, 4, 3); __PYX_ERR(0, 224, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_compute_running_pctl_diffs") < 0)) __PYX_ERR(0, 221, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_compute_running_pctl_diffs") < 0)) __PYX_ERR(0, 224, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -6460,19 +6533,19 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_15c_compute_running_pctl_diffs(PyObj
       values[3] = PyTuple_GET_ITEM(__pyx_args, 3);
     }
     __pyx_v_arr = ((PyArrayObject *)values[0]);
-    __pyx_v_window_size = __Pyx_PyInt_As_npy_int64(values[1]); if (unlikely((__pyx_v_window_size == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 222, __pyx_L3_error)
-    __pyx_v_lower_pctl = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_lower_pctl == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 223, __pyx_L3_error)
-    __pyx_v_upper_pctl = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_upper_pctl == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 223, __pyx_L3_error)
+    __pyx_v_window_size = __Pyx_PyInt_As_npy_int64(values[1]); if (unlikely((__pyx_v_window_size == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 225, __pyx_L3_error)
+    __pyx_v_lower_pctl = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_lower_pctl == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 226, __pyx_L3_error)
+    __pyx_v_upper_pctl = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_upper_pctl == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 226, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("c_compute_running_pctl_diffs", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 221, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("c_compute_running_pctl_diffs", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 224, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("tombo._c_helper.c_compute_running_pctl_diffs", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_arr), __pyx_ptype_5numpy_ndarray, 1, "arr", 0))) __PYX_ERR(0, 222, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_arr), __pyx_ptype_5numpy_ndarray, 1, "arr", 0))) __PYX_ERR(0, 225, __pyx_L1_error)
   __pyx_r = __pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(__pyx_self, __pyx_v_arr, __pyx_v_window_size, __pyx_v_lower_pctl, __pyx_v_upper_pctl);
 
   /* function exit code */
@@ -6547,31 +6620,31 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
   __pyx_pybuffernd_arr.rcbuffer = &__pyx_pybuffer_arr;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_arr.rcbuffer->pybuffer, (PyObject*)__pyx_v_arr, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT16_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 221, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_arr.rcbuffer->pybuffer, (PyObject*)__pyx_v_arr, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT16_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 224, __pyx_L1_error)
   }
   __pyx_pybuffernd_arr.diminfo[0].strides = __pyx_pybuffernd_arr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_arr.diminfo[0].shape = __pyx_pybuffernd_arr.rcbuffer->pybuffer.shape[0];
 
-  /* "tombo/_c_helper.pyx":224
+  /* "tombo/_c_helper.pyx":227
  *         np.ndarray[DTYPE_INT16_t] arr, DTYPE_INT_t window_size,
  *         DTYPE_t lower_pctl, DTYPE_t upper_pctl):
  *     cdef DTYPE_INT_t lower_pctl_index = np.int32(             # <<<<<<<<<<<<<<
  *         (window_size - 1) * lower_pctl / 100.0)
  *     cdef DTYPE_INT_t upper_pctl_index = np.int32(
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 224, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 227, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 224, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_int32); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 227, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":225
+  /* "tombo/_c_helper.pyx":228
  *         DTYPE_t lower_pctl, DTYPE_t upper_pctl):
  *     cdef DTYPE_INT_t lower_pctl_index = np.int32(
  *         (window_size - 1) * lower_pctl / 100.0)             # <<<<<<<<<<<<<<
  *     cdef DTYPE_INT_t upper_pctl_index = np.int32(
  *         (window_size - 1) * upper_pctl / 100.0)
  */
-  __pyx_t_2 = PyFloat_FromDouble((((__pyx_v_window_size - 1) * __pyx_v_lower_pctl) / 100.0)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 225, __pyx_L1_error)
+  __pyx_t_2 = PyFloat_FromDouble((((__pyx_v_window_size - 1) * __pyx_v_lower_pctl) / 100.0)); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 228, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __pyx_t_4 = NULL;
   if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_3))) {
@@ -6586,42 +6659,42 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
   __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_3, __pyx_t_4, __pyx_t_2) : __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 224, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 227, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "tombo/_c_helper.pyx":224
+  /* "tombo/_c_helper.pyx":227
  *         np.ndarray[DTYPE_INT16_t] arr, DTYPE_INT_t window_size,
  *         DTYPE_t lower_pctl, DTYPE_t upper_pctl):
  *     cdef DTYPE_INT_t lower_pctl_index = np.int32(             # <<<<<<<<<<<<<<
  *         (window_size - 1) * lower_pctl / 100.0)
  *     cdef DTYPE_INT_t upper_pctl_index = np.int32(
  */
-  __pyx_t_5 = __Pyx_PyInt_As_npy_int64(__pyx_t_1); if (unlikely((__pyx_t_5 == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 224, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_As_npy_int64(__pyx_t_1); if (unlikely((__pyx_t_5 == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 227, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_lower_pctl_index = __pyx_t_5;
 
-  /* "tombo/_c_helper.pyx":226
+  /* "tombo/_c_helper.pyx":229
  *     cdef DTYPE_INT_t lower_pctl_index = np.int32(
  *         (window_size - 1) * lower_pctl / 100.0)
  *     cdef DTYPE_INT_t upper_pctl_index = np.int32(             # <<<<<<<<<<<<<<
  *         (window_size - 1) * upper_pctl / 100.0)
  * 
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 226, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_3, __pyx_n_s_np); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 229, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 226, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_3, __pyx_n_s_int32); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 229, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
 
-  /* "tombo/_c_helper.pyx":227
+  /* "tombo/_c_helper.pyx":230
  *         (window_size - 1) * lower_pctl / 100.0)
  *     cdef DTYPE_INT_t upper_pctl_index = np.int32(
  *         (window_size - 1) * upper_pctl / 100.0)             # <<<<<<<<<<<<<<
  * 
  *     # store values in rolling circle fashion that are within the current
  */
-  __pyx_t_3 = PyFloat_FromDouble((((__pyx_v_window_size - 1) * __pyx_v_upper_pctl) / 100.0)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 227, __pyx_L1_error)
+  __pyx_t_3 = PyFloat_FromDouble((((__pyx_v_window_size - 1) * __pyx_v_upper_pctl) / 100.0)); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 230, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_4 = NULL;
   if (CYTHON_UNPACK_METHODS && unlikely(PyMethod_Check(__pyx_t_2))) {
@@ -6636,22 +6709,22 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
   __pyx_t_1 = (__pyx_t_4) ? __Pyx_PyObject_Call2Args(__pyx_t_2, __pyx_t_4, __pyx_t_3) : __Pyx_PyObject_CallOneArg(__pyx_t_2, __pyx_t_3);
   __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 226, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 229, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":226
+  /* "tombo/_c_helper.pyx":229
  *     cdef DTYPE_INT_t lower_pctl_index = np.int32(
  *         (window_size - 1) * lower_pctl / 100.0)
  *     cdef DTYPE_INT_t upper_pctl_index = np.int32(             # <<<<<<<<<<<<<<
  *         (window_size - 1) * upper_pctl / 100.0)
  * 
  */
-  __pyx_t_5 = __Pyx_PyInt_As_npy_int64(__pyx_t_1); if (unlikely((__pyx_t_5 == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 226, __pyx_L1_error)
+  __pyx_t_5 = __Pyx_PyInt_As_npy_int64(__pyx_t_1); if (unlikely((__pyx_t_5 == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 229, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __pyx_v_upper_pctl_index = __pyx_t_5;
 
-  /* "tombo/_c_helper.pyx":232
+  /* "tombo/_c_helper.pyx":235
  *     # window in order to get the value to be removed. the curr_index
  *     # indicates the current start position within the rolling array
  *     cdef DTYPE_INT_t curr_index = 0             # <<<<<<<<<<<<<<
@@ -6660,22 +6733,22 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
  */
   __pyx_v_curr_index = 0;
 
-  /* "tombo/_c_helper.pyx":233
+  /* "tombo/_c_helper.pyx":236
  *     # indicates the current start position within the rolling array
  *     cdef DTYPE_INT_t curr_index = 0
  *     cdef np.ndarray[DTYPE_INT16_t] rolling_arr = arr[:window_size].copy()             # <<<<<<<<<<<<<<
  *     # sorted array to be maintained at each iteration
  *     cdef np.ndarray[DTYPE_INT16_t] sorted_arr = rolling_arr.copy()
  */
-  __pyx_t_2 = __Pyx_PyInt_From_npy_int64(__pyx_v_window_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyInt_From_npy_int64(__pyx_v_window_size); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 236, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_3 = PySlice_New(Py_None, __pyx_t_2, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_3 = PySlice_New(Py_None, __pyx_t_2, Py_None); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 236, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_arr), __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetItem(((PyObject *)__pyx_v_arr), __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 236, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 233, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 236, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __pyx_t_2 = NULL;
@@ -6690,16 +6763,16 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
   }
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 233, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 233, __pyx_L1_error)
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 236, __pyx_L1_error)
   __pyx_t_6 = ((PyArrayObject *)__pyx_t_1);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_rolling_arr.rcbuffer->pybuffer, (PyObject*)__pyx_t_6, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT16_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_rolling_arr = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_rolling_arr.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 233, __pyx_L1_error)
+      __PYX_ERR(0, 236, __pyx_L1_error)
     } else {__pyx_pybuffernd_rolling_arr.diminfo[0].strides = __pyx_pybuffernd_rolling_arr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_rolling_arr.diminfo[0].shape = __pyx_pybuffernd_rolling_arr.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -6707,14 +6780,14 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
   __pyx_v_rolling_arr = ((PyArrayObject *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "tombo/_c_helper.pyx":235
+  /* "tombo/_c_helper.pyx":238
  *     cdef np.ndarray[DTYPE_INT16_t] rolling_arr = arr[:window_size].copy()
  *     # sorted array to be maintained at each iteration
  *     cdef np.ndarray[DTYPE_INT16_t] sorted_arr = rolling_arr.copy()             # <<<<<<<<<<<<<<
  *     sorted_arr.sort()
  * 
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_rolling_arr), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 235, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_rolling_arr), __pyx_n_s_copy); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 238, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_2 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -6728,16 +6801,16 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
   }
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 235, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 238, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 235, __pyx_L1_error)
+  if (!(likely(((__pyx_t_1) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_1, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 238, __pyx_L1_error)
   __pyx_t_7 = ((PyArrayObject *)__pyx_t_1);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer, (PyObject*)__pyx_t_7, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT16_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_sorted_arr = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 235, __pyx_L1_error)
+      __PYX_ERR(0, 238, __pyx_L1_error)
     } else {__pyx_pybuffernd_sorted_arr.diminfo[0].strides = __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_sorted_arr.diminfo[0].shape = __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -6745,14 +6818,14 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
   __pyx_v_sorted_arr = ((PyArrayObject *)__pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "tombo/_c_helper.pyx":236
+  /* "tombo/_c_helper.pyx":239
  *     # sorted array to be maintained at each iteration
  *     cdef np.ndarray[DTYPE_INT16_t] sorted_arr = rolling_arr.copy()
  *     sorted_arr.sort()             # <<<<<<<<<<<<<<
  * 
  *     cdef np.ndarray[DTYPE_INT16_t] running_pctl_diffs = np.empty(
  */
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_sorted_arr), __pyx_n_s_sort); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 236, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_sorted_arr), __pyx_n_s_sort); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 239, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __pyx_t_2 = NULL;
   if (CYTHON_UNPACK_METHODS && likely(PyMethod_Check(__pyx_t_3))) {
@@ -6766,80 +6839,80 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
   }
   __pyx_t_1 = (__pyx_t_2) ? __Pyx_PyObject_CallOneArg(__pyx_t_3, __pyx_t_2) : __Pyx_PyObject_CallNoArg(__pyx_t_3);
   __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 236, __pyx_L1_error)
+  if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 239, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "tombo/_c_helper.pyx":238
+  /* "tombo/_c_helper.pyx":241
  *     sorted_arr.sort()
  * 
  *     cdef np.ndarray[DTYPE_INT16_t] running_pctl_diffs = np.empty(             # <<<<<<<<<<<<<<
  *         arr.shape[0] - window_size + 1, dtype=DTYPE_INT16)
  *     running_pctl_diffs[:] = np.NAN
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 241, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 241, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "tombo/_c_helper.pyx":239
+  /* "tombo/_c_helper.pyx":242
  * 
  *     cdef np.ndarray[DTYPE_INT16_t] running_pctl_diffs = np.empty(
  *         arr.shape[0] - window_size + 1, dtype=DTYPE_INT16)             # <<<<<<<<<<<<<<
  *     running_pctl_diffs[:] = np.NAN
  *     running_pctl_diffs[0] = (sorted_arr[upper_pctl_index] -
  */
-  __pyx_t_1 = __Pyx_PyInt_From_npy_int64((((__pyx_v_arr->dimensions[0]) - __pyx_v_window_size) + 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 239, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_npy_int64((((__pyx_v_arr->dimensions[0]) - __pyx_v_window_size) + 1)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 242, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
 
-  /* "tombo/_c_helper.pyx":238
+  /* "tombo/_c_helper.pyx":241
  *     sorted_arr.sort()
  * 
  *     cdef np.ndarray[DTYPE_INT16_t] running_pctl_diffs = np.empty(             # <<<<<<<<<<<<<<
  *         arr.shape[0] - window_size + 1, dtype=DTYPE_INT16)
  *     running_pctl_diffs[:] = np.NAN
  */
-  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __pyx_t_2 = PyTuple_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 241, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_2, 0, __pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "tombo/_c_helper.pyx":239
+  /* "tombo/_c_helper.pyx":242
  * 
  *     cdef np.ndarray[DTYPE_INT16_t] running_pctl_diffs = np.empty(
  *         arr.shape[0] - window_size + 1, dtype=DTYPE_INT16)             # <<<<<<<<<<<<<<
  *     running_pctl_diffs[:] = np.NAN
  *     running_pctl_diffs[0] = (sorted_arr[upper_pctl_index] -
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 239, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 242, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE_INT16); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 239, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE_INT16); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 242, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 239, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 242, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "tombo/_c_helper.pyx":238
+  /* "tombo/_c_helper.pyx":241
  *     sorted_arr.sort()
  * 
  *     cdef np.ndarray[DTYPE_INT16_t] running_pctl_diffs = np.empty(             # <<<<<<<<<<<<<<
  *         arr.shape[0] - window_size + 1, dtype=DTYPE_INT16)
  *     running_pctl_diffs[:] = np.NAN
  */
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 238, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_3, __pyx_t_2, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 241, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 238, __pyx_L1_error)
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 241, __pyx_L1_error)
   __pyx_t_8 = ((PyArrayObject *)__pyx_t_4);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_running_pctl_diffs.rcbuffer->pybuffer, (PyObject*)__pyx_t_8, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT16_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_running_pctl_diffs = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_running_pctl_diffs.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 238, __pyx_L1_error)
+      __PYX_ERR(0, 241, __pyx_L1_error)
     } else {__pyx_pybuffernd_running_pctl_diffs.diminfo[0].strides = __pyx_pybuffernd_running_pctl_diffs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_running_pctl_diffs.diminfo[0].shape = __pyx_pybuffernd_running_pctl_diffs.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -6847,22 +6920,22 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
   __pyx_v_running_pctl_diffs = ((PyArrayObject *)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "tombo/_c_helper.pyx":240
+  /* "tombo/_c_helper.pyx":243
  *     cdef np.ndarray[DTYPE_INT16_t] running_pctl_diffs = np.empty(
  *         arr.shape[0] - window_size + 1, dtype=DTYPE_INT16)
  *     running_pctl_diffs[:] = np.NAN             # <<<<<<<<<<<<<<
  *     running_pctl_diffs[0] = (sorted_arr[upper_pctl_index] -
  *                              sorted_arr[lower_pctl_index])
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_np); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 243, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_NAN); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_n_s_NAN); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 243, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-  if (unlikely(PyObject_SetItem(((PyObject *)__pyx_v_running_pctl_diffs), __pyx_slice__4, __pyx_t_1) < 0)) __PYX_ERR(0, 240, __pyx_L1_error)
+  if (unlikely(PyObject_SetItem(((PyObject *)__pyx_v_running_pctl_diffs), __pyx_slice__4, __pyx_t_1) < 0)) __PYX_ERR(0, 243, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "tombo/_c_helper.pyx":241
+  /* "tombo/_c_helper.pyx":244
  *         arr.shape[0] - window_size + 1, dtype=DTYPE_INT16)
  *     running_pctl_diffs[:] = np.NAN
  *     running_pctl_diffs[0] = (sorted_arr[upper_pctl_index] -             # <<<<<<<<<<<<<<
@@ -6871,7 +6944,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
  */
   __pyx_t_5 = __pyx_v_upper_pctl_index;
 
-  /* "tombo/_c_helper.pyx":242
+  /* "tombo/_c_helper.pyx":245
  *     running_pctl_diffs[:] = np.NAN
  *     running_pctl_diffs[0] = (sorted_arr[upper_pctl_index] -
  *                              sorted_arr[lower_pctl_index])             # <<<<<<<<<<<<<<
@@ -6880,7 +6953,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
  */
   __pyx_t_9 = __pyx_v_lower_pctl_index;
 
-  /* "tombo/_c_helper.pyx":241
+  /* "tombo/_c_helper.pyx":244
  *         arr.shape[0] - window_size + 1, dtype=DTYPE_INT16)
  *     running_pctl_diffs[:] = np.NAN
  *     running_pctl_diffs[0] = (sorted_arr[upper_pctl_index] -             # <<<<<<<<<<<<<<
@@ -6890,7 +6963,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
   __pyx_t_10 = 0;
   *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_running_pctl_diffs.rcbuffer->pybuffer.buf, __pyx_t_10, __pyx_pybuffernd_running_pctl_diffs.diminfo[0].strides) = ((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.buf, __pyx_t_5, __pyx_pybuffernd_sorted_arr.diminfo[0].strides)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.buf, __pyx_t_9, __pyx_pybuffernd_sorted_arr.diminfo[0].strides)));
 
-  /* "tombo/_c_helper.pyx":246
+  /* "tombo/_c_helper.pyx":249
  *     cdef DTYPE_INT16_t pop_val, push_val
  *     cdef DTYPE_INT_t i, pop_index, push_index, arr_i, rolling_i
  *     for arr_i in range(window_size, arr.shape[0]):             # <<<<<<<<<<<<<<
@@ -6902,7 +6975,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
   for (__pyx_t_9 = __pyx_v_window_size; __pyx_t_9 < __pyx_t_12; __pyx_t_9+=1) {
     __pyx_v_arr_i = __pyx_t_9;
 
-    /* "tombo/_c_helper.pyx":247
+    /* "tombo/_c_helper.pyx":250
  *     cdef DTYPE_INT_t i, pop_index, push_index, arr_i, rolling_i
  *     for arr_i in range(window_size, arr.shape[0]):
  *         push_val = arr[arr_i]             # <<<<<<<<<<<<<<
@@ -6912,7 +6985,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
     __pyx_t_5 = __pyx_v_arr_i;
     __pyx_v_push_val = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_arr.rcbuffer->pybuffer.buf, __pyx_t_5, __pyx_pybuffernd_arr.diminfo[0].strides));
 
-    /* "tombo/_c_helper.pyx":249
+    /* "tombo/_c_helper.pyx":252
  *         push_val = arr[arr_i]
  *         # get value to be removed from running array
  *         rolling_i = curr_index % window_size             # <<<<<<<<<<<<<<
@@ -6921,11 +6994,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
  */
     if (unlikely(__pyx_v_window_size == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
-      __PYX_ERR(0, 249, __pyx_L1_error)
+      __PYX_ERR(0, 252, __pyx_L1_error)
     }
     __pyx_v_rolling_i = __Pyx_mod___pyx_t_5tombo_9_c_helper_DTYPE_INT_t(__pyx_v_curr_index, __pyx_v_window_size);
 
-    /* "tombo/_c_helper.pyx":250
+    /* "tombo/_c_helper.pyx":253
  *         # get value to be removed from running array
  *         rolling_i = curr_index % window_size
  *         pop_val = rolling_arr[rolling_i]             # <<<<<<<<<<<<<<
@@ -6935,7 +7008,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
     __pyx_t_5 = __pyx_v_rolling_i;
     __pyx_v_pop_val = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_rolling_arr.rcbuffer->pybuffer.buf, __pyx_t_5, __pyx_pybuffernd_rolling_arr.diminfo[0].strides));
 
-    /* "tombo/_c_helper.pyx":252
+    /* "tombo/_c_helper.pyx":255
  *         pop_val = rolling_arr[rolling_i]
  *         # if pop and push values are equal skip to pclt diff comp
  *         if pop_val != push_val:             # <<<<<<<<<<<<<<
@@ -6945,7 +7018,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
     __pyx_t_13 = ((__pyx_v_pop_val != __pyx_v_push_val) != 0);
     if (__pyx_t_13) {
 
-      /* "tombo/_c_helper.pyx":254
+      /* "tombo/_c_helper.pyx":257
  *         if pop_val != push_val:
  *             # find indices for push and pop in sorted array
  *             pop_index = _c_searchsorted(sorted_arr, pop_val)             # <<<<<<<<<<<<<<
@@ -6954,7 +7027,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
  */
       __pyx_v_pop_index = __pyx_f_5tombo_9_c_helper__c_searchsorted(((PyArrayObject *)__pyx_v_sorted_arr), __pyx_v_pop_val);
 
-      /* "tombo/_c_helper.pyx":255
+      /* "tombo/_c_helper.pyx":258
  *             # find indices for push and pop in sorted array
  *             pop_index = _c_searchsorted(sorted_arr, pop_val)
  *             push_index = _c_searchsorted(sorted_arr, push_val)             # <<<<<<<<<<<<<<
@@ -6963,7 +7036,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
  */
       __pyx_v_push_index = __pyx_f_5tombo_9_c_helper__c_searchsorted(((PyArrayObject *)__pyx_v_sorted_arr), __pyx_v_push_val);
 
-      /* "tombo/_c_helper.pyx":258
+      /* "tombo/_c_helper.pyx":261
  *             # shift apporiate values within the sorted array and
  *             # add push value
  *             if pop_index == push_index:             # <<<<<<<<<<<<<<
@@ -6973,7 +7046,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
       __pyx_t_13 = ((__pyx_v_pop_index == __pyx_v_push_index) != 0);
       if (__pyx_t_13) {
 
-        /* "tombo/_c_helper.pyx":259
+        /* "tombo/_c_helper.pyx":262
  *             # add push value
  *             if pop_index == push_index:
  *                 sorted_arr[push_index] = push_val             # <<<<<<<<<<<<<<
@@ -6983,7 +7056,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
         __pyx_t_5 = __pyx_v_push_index;
         *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.buf, __pyx_t_5, __pyx_pybuffernd_sorted_arr.diminfo[0].strides) = __pyx_v_push_val;
 
-        /* "tombo/_c_helper.pyx":258
+        /* "tombo/_c_helper.pyx":261
  *             # shift apporiate values within the sorted array and
  *             # add push value
  *             if pop_index == push_index:             # <<<<<<<<<<<<<<
@@ -6993,7 +7066,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
         goto __pyx_L6;
       }
 
-      /* "tombo/_c_helper.pyx":260
+      /* "tombo/_c_helper.pyx":263
  *             if pop_index == push_index:
  *                 sorted_arr[push_index] = push_val
  *             elif pop_index > push_index:             # <<<<<<<<<<<<<<
@@ -7003,7 +7076,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
       __pyx_t_13 = ((__pyx_v_pop_index > __pyx_v_push_index) != 0);
       if (__pyx_t_13) {
 
-        /* "tombo/_c_helper.pyx":261
+        /* "tombo/_c_helper.pyx":264
  *                 sorted_arr[push_index] = push_val
  *             elif pop_index > push_index:
  *                 for i in reversed(range(push_index, pop_index)):             # <<<<<<<<<<<<<<
@@ -7015,7 +7088,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
         for (__pyx_t_15 = __pyx_v_pop_index-1; __pyx_t_15 >= __pyx_t_14; __pyx_t_15-=1) {
           __pyx_v_i = __pyx_t_15;
 
-          /* "tombo/_c_helper.pyx":262
+          /* "tombo/_c_helper.pyx":265
  *             elif pop_index > push_index:
  *                 for i in reversed(range(push_index, pop_index)):
  *                     sorted_arr[i + 1] = sorted_arr[i]             # <<<<<<<<<<<<<<
@@ -7027,7 +7100,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
           *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.buf, __pyx_t_17, __pyx_pybuffernd_sorted_arr.diminfo[0].strides) = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.buf, __pyx_t_16, __pyx_pybuffernd_sorted_arr.diminfo[0].strides));
         }
 
-        /* "tombo/_c_helper.pyx":263
+        /* "tombo/_c_helper.pyx":266
  *                 for i in reversed(range(push_index, pop_index)):
  *                     sorted_arr[i + 1] = sorted_arr[i]
  *                 sorted_arr[push_index] = push_val             # <<<<<<<<<<<<<<
@@ -7037,7 +7110,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
         __pyx_t_5 = __pyx_v_push_index;
         *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.buf, __pyx_t_5, __pyx_pybuffernd_sorted_arr.diminfo[0].strides) = __pyx_v_push_val;
 
-        /* "tombo/_c_helper.pyx":260
+        /* "tombo/_c_helper.pyx":263
  *             if pop_index == push_index:
  *                 sorted_arr[push_index] = push_val
  *             elif pop_index > push_index:             # <<<<<<<<<<<<<<
@@ -7047,7 +7120,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
         goto __pyx_L6;
       }
 
-      /* "tombo/_c_helper.pyx":265
+      /* "tombo/_c_helper.pyx":268
  *                 sorted_arr[push_index] = push_val
  *             else:
  *                 for i in range(pop_index, push_index - 1):             # <<<<<<<<<<<<<<
@@ -7060,7 +7133,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
         for (__pyx_t_15 = __pyx_v_pop_index; __pyx_t_15 < __pyx_t_14; __pyx_t_15+=1) {
           __pyx_v_i = __pyx_t_15;
 
-          /* "tombo/_c_helper.pyx":266
+          /* "tombo/_c_helper.pyx":269
  *             else:
  *                 for i in range(pop_index, push_index - 1):
  *                     sorted_arr[i] = sorted_arr[i + 1]             # <<<<<<<<<<<<<<
@@ -7072,7 +7145,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
           *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.buf, __pyx_t_17, __pyx_pybuffernd_sorted_arr.diminfo[0].strides) = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.buf, __pyx_t_16, __pyx_pybuffernd_sorted_arr.diminfo[0].strides));
         }
 
-        /* "tombo/_c_helper.pyx":267
+        /* "tombo/_c_helper.pyx":270
  *                 for i in range(pop_index, push_index - 1):
  *                     sorted_arr[i] = sorted_arr[i + 1]
  *                 sorted_arr[push_index - 1] = push_val             # <<<<<<<<<<<<<<
@@ -7084,7 +7157,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
       }
       __pyx_L6:;
 
-      /* "tombo/_c_helper.pyx":269
+      /* "tombo/_c_helper.pyx":272
  *                 sorted_arr[push_index - 1] = push_val
  *             # replace pop value with push value in rolling array
  *             rolling_arr[rolling_i] = push_val             # <<<<<<<<<<<<<<
@@ -7094,7 +7167,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
       __pyx_t_5 = __pyx_v_rolling_i;
       *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_rolling_arr.rcbuffer->pybuffer.buf, __pyx_t_5, __pyx_pybuffernd_rolling_arr.diminfo[0].strides) = __pyx_v_push_val;
 
-      /* "tombo/_c_helper.pyx":252
+      /* "tombo/_c_helper.pyx":255
  *         pop_val = rolling_arr[rolling_i]
  *         # if pop and push values are equal skip to pclt diff comp
  *         if pop_val != push_val:             # <<<<<<<<<<<<<<
@@ -7103,7 +7176,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
  */
     }
 
-    /* "tombo/_c_helper.pyx":271
+    /* "tombo/_c_helper.pyx":274
  *             rolling_arr[rolling_i] = push_val
  * 
  *         curr_index += 1             # <<<<<<<<<<<<<<
@@ -7112,7 +7185,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
  */
     __pyx_v_curr_index = (__pyx_v_curr_index + 1);
 
-    /* "tombo/_c_helper.pyx":272
+    /* "tombo/_c_helper.pyx":275
  * 
  *         curr_index += 1
  *         running_pctl_diffs[curr_index] = (sorted_arr[upper_pctl_index] -             # <<<<<<<<<<<<<<
@@ -7121,7 +7194,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
  */
     __pyx_t_5 = __pyx_v_upper_pctl_index;
 
-    /* "tombo/_c_helper.pyx":273
+    /* "tombo/_c_helper.pyx":276
  *         curr_index += 1
  *         running_pctl_diffs[curr_index] = (sorted_arr[upper_pctl_index] -
  *                                           sorted_arr[lower_pctl_index])             # <<<<<<<<<<<<<<
@@ -7130,7 +7203,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
  */
     __pyx_t_14 = __pyx_v_lower_pctl_index;
 
-    /* "tombo/_c_helper.pyx":272
+    /* "tombo/_c_helper.pyx":275
  * 
  *         curr_index += 1
  *         running_pctl_diffs[curr_index] = (sorted_arr[upper_pctl_index] -             # <<<<<<<<<<<<<<
@@ -7141,7 +7214,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
     *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_running_pctl_diffs.rcbuffer->pybuffer.buf, __pyx_t_15, __pyx_pybuffernd_running_pctl_diffs.diminfo[0].strides) = ((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.buf, __pyx_t_5, __pyx_pybuffernd_sorted_arr.diminfo[0].strides)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT16_t *, __pyx_pybuffernd_sorted_arr.rcbuffer->pybuffer.buf, __pyx_t_14, __pyx_pybuffernd_sorted_arr.diminfo[0].strides)));
   }
 
-  /* "tombo/_c_helper.pyx":275
+  /* "tombo/_c_helper.pyx":278
  *                                           sorted_arr[lower_pctl_index])
  * 
  *     return running_pctl_diffs             # <<<<<<<<<<<<<<
@@ -7153,7 +7226,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
   __pyx_r = ((PyObject *)__pyx_v_running_pctl_diffs);
   goto __pyx_L0;
 
-  /* "tombo/_c_helper.pyx":221
+  /* "tombo/_c_helper.pyx":224
  * @cython.wraparound(False)
  * @cython.boundscheck(False)
  * def c_compute_running_pctl_diffs(             # <<<<<<<<<<<<<<
@@ -7193,7 +7266,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_14c_compute_running_pctl_diffs(CYTHO
   return __pyx_r;
 }
 
-/* "tombo/_c_helper.pyx":277
+/* "tombo/_c_helper.pyx":280
  *     return running_pctl_diffs
  * 
  * def c_calc_llh_ratio(             # <<<<<<<<<<<<<<
@@ -7246,29 +7319,29 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_17c_calc_llh_ratio(PyObject *__pyx_s
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_reg_ref_means)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio", 1, 5, 5, 1); __PYX_ERR(0, 277, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio", 1, 5, 5, 1); __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_reg_alt_means)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio", 1, 5, 5, 2); __PYX_ERR(0, 277, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio", 1, 5, 5, 2); __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_reg_ref_vars)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio", 1, 5, 5, 3); __PYX_ERR(0, 277, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio", 1, 5, 5, 3); __PYX_ERR(0, 280, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_reg_alt_vars)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio", 1, 5, 5, 4); __PYX_ERR(0, 277, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio", 1, 5, 5, 4); __PYX_ERR(0, 280, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_calc_llh_ratio") < 0)) __PYX_ERR(0, 277, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_calc_llh_ratio") < 0)) __PYX_ERR(0, 280, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 5) {
       goto __pyx_L5_argtuple_error;
@@ -7287,17 +7360,17 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_17c_calc_llh_ratio(PyObject *__pyx_s
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 277, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio", 1, 5, 5, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 280, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("tombo._c_helper.c_calc_llh_ratio", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_means), __pyx_ptype_5numpy_ndarray, 1, "reg_means", 0))) __PYX_ERR(0, 278, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_ref_means), __pyx_ptype_5numpy_ndarray, 1, "reg_ref_means", 0))) __PYX_ERR(0, 279, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_alt_means), __pyx_ptype_5numpy_ndarray, 1, "reg_alt_means", 0))) __PYX_ERR(0, 279, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_ref_vars), __pyx_ptype_5numpy_ndarray, 1, "reg_ref_vars", 0))) __PYX_ERR(0, 280, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_alt_vars), __pyx_ptype_5numpy_ndarray, 1, "reg_alt_vars", 0))) __PYX_ERR(0, 280, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_means), __pyx_ptype_5numpy_ndarray, 1, "reg_means", 0))) __PYX_ERR(0, 281, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_ref_means), __pyx_ptype_5numpy_ndarray, 1, "reg_ref_means", 0))) __PYX_ERR(0, 282, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_alt_means), __pyx_ptype_5numpy_ndarray, 1, "reg_alt_means", 0))) __PYX_ERR(0, 282, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_ref_vars), __pyx_ptype_5numpy_ndarray, 1, "reg_ref_vars", 0))) __PYX_ERR(0, 283, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_alt_vars), __pyx_ptype_5numpy_ndarray, 1, "reg_alt_vars", 0))) __PYX_ERR(0, 283, __pyx_L1_error)
   __pyx_r = __pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(__pyx_self, __pyx_v_reg_means, __pyx_v_reg_ref_means, __pyx_v_reg_alt_means, __pyx_v_reg_ref_vars, __pyx_v_reg_alt_vars);
 
   /* function exit code */
@@ -7369,31 +7442,31 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
   __pyx_pybuffernd_reg_alt_vars.rcbuffer = &__pyx_pybuffer_reg_alt_vars;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 277, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 280, __pyx_L1_error)
   }
   __pyx_pybuffernd_reg_means.diminfo[0].strides = __pyx_pybuffernd_reg_means.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_reg_means.diminfo[0].shape = __pyx_pybuffernd_reg_means.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_ref_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 277, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_ref_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 280, __pyx_L1_error)
   }
   __pyx_pybuffernd_reg_ref_means.diminfo[0].strides = __pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_reg_ref_means.diminfo[0].shape = __pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_alt_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 277, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_alt_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 280, __pyx_L1_error)
   }
   __pyx_pybuffernd_reg_alt_means.diminfo[0].strides = __pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_reg_alt_means.diminfo[0].shape = __pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_ref_vars.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_ref_vars, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 277, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_ref_vars.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_ref_vars, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 280, __pyx_L1_error)
   }
   __pyx_pybuffernd_reg_ref_vars.diminfo[0].strides = __pyx_pybuffernd_reg_ref_vars.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_reg_ref_vars.diminfo[0].shape = __pyx_pybuffernd_reg_ref_vars.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_alt_vars.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_alt_vars, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 277, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_alt_vars.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_alt_vars, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 280, __pyx_L1_error)
   }
   __pyx_pybuffernd_reg_alt_vars.diminfo[0].strides = __pyx_pybuffernd_reg_alt_vars.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_reg_alt_vars.diminfo[0].shape = __pyx_pybuffernd_reg_alt_vars.rcbuffer->pybuffer.shape[0];
 
-  /* "tombo/_c_helper.pyx":282
+  /* "tombo/_c_helper.pyx":285
  *         np.ndarray[DTYPE_t] reg_ref_vars, np.ndarray[DTYPE_t] reg_alt_vars):
  *     cdef DTYPE_t ref_z_sum, ref_log_var_sum, alt_z_sum, alt_log_var_sum
  *     ref_z_sum, ref_log_var_sum, alt_z_sum, alt_log_var_sum = 0.0, 0.0 ,0.0 ,0.0             # <<<<<<<<<<<<<<
@@ -7409,7 +7482,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
   __pyx_v_alt_z_sum = __pyx_t_3;
   __pyx_v_alt_log_var_sum = __pyx_t_4;
 
-  /* "tombo/_c_helper.pyx":285
+  /* "tombo/_c_helper.pyx":288
  *     cdef DTYPE_t ref_diff, alt_diff, log_lh_ratio
  *     cdef DTYPE_INT_t idx
  *     for idx in range(reg_means.shape[0]):             # <<<<<<<<<<<<<<
@@ -7421,7 +7494,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
   for (__pyx_t_7 = 0; __pyx_t_7 < __pyx_t_6; __pyx_t_7+=1) {
     __pyx_v_idx = __pyx_t_7;
 
-    /* "tombo/_c_helper.pyx":286
+    /* "tombo/_c_helper.pyx":289
  *     cdef DTYPE_INT_t idx
  *     for idx in range(reg_means.shape[0]):
  *         ref_diff = reg_means[idx] - reg_ref_means[idx]             # <<<<<<<<<<<<<<
@@ -7436,7 +7509,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
     } else if (unlikely(__pyx_t_8 >= __pyx_pybuffernd_reg_means.diminfo[0].shape)) __pyx_t_9 = 0;
     if (unlikely(__pyx_t_9 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_9);
-      __PYX_ERR(0, 286, __pyx_L1_error)
+      __PYX_ERR(0, 289, __pyx_L1_error)
     }
     __pyx_t_10 = __pyx_v_idx;
     __pyx_t_9 = -1;
@@ -7446,11 +7519,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
     } else if (unlikely(__pyx_t_10 >= __pyx_pybuffernd_reg_ref_means.diminfo[0].shape)) __pyx_t_9 = 0;
     if (unlikely(__pyx_t_9 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_9);
-      __PYX_ERR(0, 286, __pyx_L1_error)
+      __PYX_ERR(0, 289, __pyx_L1_error)
     }
     __pyx_v_ref_diff = ((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_reg_means.rcbuffer->pybuffer.buf, __pyx_t_8, __pyx_pybuffernd_reg_means.diminfo[0].strides)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer.buf, __pyx_t_10, __pyx_pybuffernd_reg_ref_means.diminfo[0].strides)));
 
-    /* "tombo/_c_helper.pyx":287
+    /* "tombo/_c_helper.pyx":290
  *     for idx in range(reg_means.shape[0]):
  *         ref_diff = reg_means[idx] - reg_ref_means[idx]
  *         ref_z_sum += (ref_diff * ref_diff) / reg_ref_vars[idx]             # <<<<<<<<<<<<<<
@@ -7466,16 +7539,16 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
     } else if (unlikely(__pyx_t_10 >= __pyx_pybuffernd_reg_ref_vars.diminfo[0].shape)) __pyx_t_9 = 0;
     if (unlikely(__pyx_t_9 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_9);
-      __PYX_ERR(0, 287, __pyx_L1_error)
+      __PYX_ERR(0, 290, __pyx_L1_error)
     }
     __pyx_t_12 = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_reg_ref_vars.rcbuffer->pybuffer.buf, __pyx_t_10, __pyx_pybuffernd_reg_ref_vars.diminfo[0].strides));
     if (unlikely(__pyx_t_12 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 287, __pyx_L1_error)
+      __PYX_ERR(0, 290, __pyx_L1_error)
     }
     __pyx_v_ref_z_sum = (__pyx_v_ref_z_sum + (__pyx_t_11 / __pyx_t_12));
 
-    /* "tombo/_c_helper.pyx":288
+    /* "tombo/_c_helper.pyx":291
  *         ref_diff = reg_means[idx] - reg_ref_means[idx]
  *         ref_z_sum += (ref_diff * ref_diff) / reg_ref_vars[idx]
  *         ref_log_var_sum += log(reg_ref_vars[idx])             # <<<<<<<<<<<<<<
@@ -7490,11 +7563,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
     } else if (unlikely(__pyx_t_10 >= __pyx_pybuffernd_reg_ref_vars.diminfo[0].shape)) __pyx_t_9 = 0;
     if (unlikely(__pyx_t_9 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_9);
-      __PYX_ERR(0, 288, __pyx_L1_error)
+      __PYX_ERR(0, 291, __pyx_L1_error)
     }
     __pyx_v_ref_log_var_sum = (__pyx_v_ref_log_var_sum + log((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_reg_ref_vars.rcbuffer->pybuffer.buf, __pyx_t_10, __pyx_pybuffernd_reg_ref_vars.diminfo[0].strides))));
 
-    /* "tombo/_c_helper.pyx":290
+    /* "tombo/_c_helper.pyx":293
  *         ref_log_var_sum += log(reg_ref_vars[idx])
  * 
  *         alt_diff = reg_means[idx] - reg_alt_means[idx]             # <<<<<<<<<<<<<<
@@ -7509,7 +7582,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
     } else if (unlikely(__pyx_t_10 >= __pyx_pybuffernd_reg_means.diminfo[0].shape)) __pyx_t_9 = 0;
     if (unlikely(__pyx_t_9 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_9);
-      __PYX_ERR(0, 290, __pyx_L1_error)
+      __PYX_ERR(0, 293, __pyx_L1_error)
     }
     __pyx_t_8 = __pyx_v_idx;
     __pyx_t_9 = -1;
@@ -7519,11 +7592,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
     } else if (unlikely(__pyx_t_8 >= __pyx_pybuffernd_reg_alt_means.diminfo[0].shape)) __pyx_t_9 = 0;
     if (unlikely(__pyx_t_9 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_9);
-      __PYX_ERR(0, 290, __pyx_L1_error)
+      __PYX_ERR(0, 293, __pyx_L1_error)
     }
     __pyx_v_alt_diff = ((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_reg_means.rcbuffer->pybuffer.buf, __pyx_t_10, __pyx_pybuffernd_reg_means.diminfo[0].strides)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer.buf, __pyx_t_8, __pyx_pybuffernd_reg_alt_means.diminfo[0].strides)));
 
-    /* "tombo/_c_helper.pyx":291
+    /* "tombo/_c_helper.pyx":294
  * 
  *         alt_diff = reg_means[idx] - reg_alt_means[idx]
  *         alt_z_sum += (alt_diff * alt_diff) / reg_alt_vars[idx]             # <<<<<<<<<<<<<<
@@ -7539,16 +7612,16 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
     } else if (unlikely(__pyx_t_8 >= __pyx_pybuffernd_reg_alt_vars.diminfo[0].shape)) __pyx_t_9 = 0;
     if (unlikely(__pyx_t_9 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_9);
-      __PYX_ERR(0, 291, __pyx_L1_error)
+      __PYX_ERR(0, 294, __pyx_L1_error)
     }
     __pyx_t_11 = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_reg_alt_vars.rcbuffer->pybuffer.buf, __pyx_t_8, __pyx_pybuffernd_reg_alt_vars.diminfo[0].strides));
     if (unlikely(__pyx_t_11 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 291, __pyx_L1_error)
+      __PYX_ERR(0, 294, __pyx_L1_error)
     }
     __pyx_v_alt_z_sum = (__pyx_v_alt_z_sum + (__pyx_t_12 / __pyx_t_11));
 
-    /* "tombo/_c_helper.pyx":292
+    /* "tombo/_c_helper.pyx":295
  *         alt_diff = reg_means[idx] - reg_alt_means[idx]
  *         alt_z_sum += (alt_diff * alt_diff) / reg_alt_vars[idx]
  *         alt_log_var_sum += log(reg_alt_vars[idx])             # <<<<<<<<<<<<<<
@@ -7563,12 +7636,12 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
     } else if (unlikely(__pyx_t_8 >= __pyx_pybuffernd_reg_alt_vars.diminfo[0].shape)) __pyx_t_9 = 0;
     if (unlikely(__pyx_t_9 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_9);
-      __PYX_ERR(0, 292, __pyx_L1_error)
+      __PYX_ERR(0, 295, __pyx_L1_error)
     }
     __pyx_v_alt_log_var_sum = (__pyx_v_alt_log_var_sum + log((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_reg_alt_vars.rcbuffer->pybuffer.buf, __pyx_t_8, __pyx_pybuffernd_reg_alt_vars.diminfo[0].strides))));
   }
 
-  /* "tombo/_c_helper.pyx":294
+  /* "tombo/_c_helper.pyx":297
  *         alt_log_var_sum += log(reg_alt_vars[idx])
  * 
  *     log_lh_ratio = alt_z_sum + alt_log_var_sum - ref_z_sum - ref_log_var_sum             # <<<<<<<<<<<<<<
@@ -7577,7 +7650,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
  */
   __pyx_v_log_lh_ratio = (((__pyx_v_alt_z_sum + __pyx_v_alt_log_var_sum) - __pyx_v_ref_z_sum) - __pyx_v_ref_log_var_sum);
 
-  /* "tombo/_c_helper.pyx":296
+  /* "tombo/_c_helper.pyx":299
  *     log_lh_ratio = alt_z_sum + alt_log_var_sum - ref_z_sum - ref_log_var_sum
  * 
  *     return log_lh_ratio             # <<<<<<<<<<<<<<
@@ -7585,13 +7658,13 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
  * def c_calc_llh_ratio_const_var(
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_13 = PyFloat_FromDouble(__pyx_v_log_lh_ratio); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 296, __pyx_L1_error)
+  __pyx_t_13 = PyFloat_FromDouble(__pyx_v_log_lh_ratio); if (unlikely(!__pyx_t_13)) __PYX_ERR(0, 299, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_13);
   __pyx_r = __pyx_t_13;
   __pyx_t_13 = 0;
   goto __pyx_L0;
 
-  /* "tombo/_c_helper.pyx":277
+  /* "tombo/_c_helper.pyx":280
  *     return running_pctl_diffs
  * 
  * def c_calc_llh_ratio(             # <<<<<<<<<<<<<<
@@ -7627,7 +7700,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_16c_calc_llh_ratio(CYTHON_UNUSED PyO
   return __pyx_r;
 }
 
-/* "tombo/_c_helper.pyx":298
+/* "tombo/_c_helper.pyx":301
  *     return log_lh_ratio
  * 
  * def c_calc_llh_ratio_const_var(             # <<<<<<<<<<<<<<
@@ -7677,23 +7750,23 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_19c_calc_llh_ratio_const_var(PyObjec
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_reg_ref_means)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio_const_var", 1, 4, 4, 1); __PYX_ERR(0, 298, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio_const_var", 1, 4, 4, 1); __PYX_ERR(0, 301, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_reg_alt_means)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio_const_var", 1, 4, 4, 2); __PYX_ERR(0, 298, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio_const_var", 1, 4, 4, 2); __PYX_ERR(0, 301, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_const_var)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio_const_var", 1, 4, 4, 3); __PYX_ERR(0, 298, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio_const_var", 1, 4, 4, 3); __PYX_ERR(0, 301, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_calc_llh_ratio_const_var") < 0)) __PYX_ERR(0, 298, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_calc_llh_ratio_const_var") < 0)) __PYX_ERR(0, 301, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 4) {
       goto __pyx_L5_argtuple_error;
@@ -7706,19 +7779,19 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_19c_calc_llh_ratio_const_var(PyObjec
     __pyx_v_reg_means = ((PyArrayObject *)values[0]);
     __pyx_v_reg_ref_means = ((PyArrayObject *)values[1]);
     __pyx_v_reg_alt_means = ((PyArrayObject *)values[2]);
-    __pyx_v_const_var = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_const_var == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 300, __pyx_L3_error)
+    __pyx_v_const_var = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_const_var == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 303, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio_const_var", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 298, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("c_calc_llh_ratio_const_var", 1, 4, 4, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 301, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("tombo._c_helper.c_calc_llh_ratio_const_var", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_means), __pyx_ptype_5numpy_ndarray, 1, "reg_means", 0))) __PYX_ERR(0, 299, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_ref_means), __pyx_ptype_5numpy_ndarray, 1, "reg_ref_means", 0))) __PYX_ERR(0, 299, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_alt_means), __pyx_ptype_5numpy_ndarray, 1, "reg_alt_means", 0))) __PYX_ERR(0, 300, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_means), __pyx_ptype_5numpy_ndarray, 1, "reg_means", 0))) __PYX_ERR(0, 302, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_ref_means), __pyx_ptype_5numpy_ndarray, 1, "reg_ref_means", 0))) __PYX_ERR(0, 302, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_alt_means), __pyx_ptype_5numpy_ndarray, 1, "reg_alt_means", 0))) __PYX_ERR(0, 303, __pyx_L1_error)
   __pyx_r = __pyx_pf_5tombo_9_c_helper_18c_calc_llh_ratio_const_var(__pyx_self, __pyx_v_reg_means, __pyx_v_reg_ref_means, __pyx_v_reg_alt_means, __pyx_v_const_var);
 
   /* function exit code */
@@ -7769,21 +7842,21 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_18c_calc_llh_ratio_const_var(CYTHON_
   __pyx_pybuffernd_reg_alt_means.rcbuffer = &__pyx_pybuffer_reg_alt_means;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 298, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 301, __pyx_L1_error)
   }
   __pyx_pybuffernd_reg_means.diminfo[0].strides = __pyx_pybuffernd_reg_means.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_reg_means.diminfo[0].shape = __pyx_pybuffernd_reg_means.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_ref_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 298, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_ref_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 301, __pyx_L1_error)
   }
   __pyx_pybuffernd_reg_ref_means.diminfo[0].strides = __pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_reg_ref_means.diminfo[0].shape = __pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_alt_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 298, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_alt_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 301, __pyx_L1_error)
   }
   __pyx_pybuffernd_reg_alt_means.diminfo[0].strides = __pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_reg_alt_means.diminfo[0].shape = __pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer.shape[0];
 
-  /* "tombo/_c_helper.pyx":301
+  /* "tombo/_c_helper.pyx":304
  *         np.ndarray[DTYPE_t] reg_means, np.ndarray[DTYPE_t] reg_ref_means,
  *         np.ndarray[DTYPE_t] reg_alt_means, DTYPE_t const_var):
  *     cdef DTYPE_t running_llhr = 0.0             # <<<<<<<<<<<<<<
@@ -7792,7 +7865,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_18c_calc_llh_ratio_const_var(CYTHON_
  */
   __pyx_v_running_llhr = 0.0;
 
-  /* "tombo/_c_helper.pyx":304
+  /* "tombo/_c_helper.pyx":307
  *     cdef DTYPE_t ref_diff, alt_diff, obs_mean
  *     cdef DTYPE_INT_t idx
  *     for idx in range(reg_means.shape[0]):             # <<<<<<<<<<<<<<
@@ -7804,7 +7877,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_18c_calc_llh_ratio_const_var(CYTHON_
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_idx = __pyx_t_3;
 
-    /* "tombo/_c_helper.pyx":305
+    /* "tombo/_c_helper.pyx":308
  *     cdef DTYPE_INT_t idx
  *     for idx in range(reg_means.shape[0]):
  *         obs_mean = reg_means[idx]             # <<<<<<<<<<<<<<
@@ -7819,11 +7892,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_18c_calc_llh_ratio_const_var(CYTHON_
     } else if (unlikely(__pyx_t_4 >= __pyx_pybuffernd_reg_means.diminfo[0].shape)) __pyx_t_5 = 0;
     if (unlikely(__pyx_t_5 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_5);
-      __PYX_ERR(0, 305, __pyx_L1_error)
+      __PYX_ERR(0, 308, __pyx_L1_error)
     }
     __pyx_v_obs_mean = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_reg_means.rcbuffer->pybuffer.buf, __pyx_t_4, __pyx_pybuffernd_reg_means.diminfo[0].strides));
 
-    /* "tombo/_c_helper.pyx":306
+    /* "tombo/_c_helper.pyx":309
  *     for idx in range(reg_means.shape[0]):
  *         obs_mean = reg_means[idx]
  *         ref_diff = obs_mean - reg_ref_means[idx]             # <<<<<<<<<<<<<<
@@ -7838,11 +7911,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_18c_calc_llh_ratio_const_var(CYTHON_
     } else if (unlikely(__pyx_t_4 >= __pyx_pybuffernd_reg_ref_means.diminfo[0].shape)) __pyx_t_5 = 0;
     if (unlikely(__pyx_t_5 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_5);
-      __PYX_ERR(0, 306, __pyx_L1_error)
+      __PYX_ERR(0, 309, __pyx_L1_error)
     }
     __pyx_v_ref_diff = (__pyx_v_obs_mean - (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer.buf, __pyx_t_4, __pyx_pybuffernd_reg_ref_means.diminfo[0].strides)));
 
-    /* "tombo/_c_helper.pyx":307
+    /* "tombo/_c_helper.pyx":310
  *         obs_mean = reg_means[idx]
  *         ref_diff = obs_mean - reg_ref_means[idx]
  *         alt_diff = obs_mean - reg_alt_means[idx]             # <<<<<<<<<<<<<<
@@ -7857,11 +7930,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_18c_calc_llh_ratio_const_var(CYTHON_
     } else if (unlikely(__pyx_t_4 >= __pyx_pybuffernd_reg_alt_means.diminfo[0].shape)) __pyx_t_5 = 0;
     if (unlikely(__pyx_t_5 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_5);
-      __PYX_ERR(0, 307, __pyx_L1_error)
+      __PYX_ERR(0, 310, __pyx_L1_error)
     }
     __pyx_v_alt_diff = (__pyx_v_obs_mean - (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer.buf, __pyx_t_4, __pyx_pybuffernd_reg_alt_means.diminfo[0].strides)));
 
-    /* "tombo/_c_helper.pyx":308
+    /* "tombo/_c_helper.pyx":311
  *         ref_diff = obs_mean - reg_ref_means[idx]
  *         alt_diff = obs_mean - reg_alt_means[idx]
  *         running_llhr += ((alt_diff * alt_diff) -             # <<<<<<<<<<<<<<
@@ -7870,7 +7943,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_18c_calc_llh_ratio_const_var(CYTHON_
  */
     __pyx_t_6 = ((__pyx_v_alt_diff * __pyx_v_alt_diff) - (__pyx_v_ref_diff * __pyx_v_ref_diff));
 
-    /* "tombo/_c_helper.pyx":309
+    /* "tombo/_c_helper.pyx":312
  *         alt_diff = obs_mean - reg_alt_means[idx]
  *         running_llhr += ((alt_diff * alt_diff) -
  *                          (ref_diff * ref_diff)) / const_var             # <<<<<<<<<<<<<<
@@ -7879,10 +7952,10 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_18c_calc_llh_ratio_const_var(CYTHON_
  */
     if (unlikely(__pyx_v_const_var == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 309, __pyx_L1_error)
+      __PYX_ERR(0, 312, __pyx_L1_error)
     }
 
-    /* "tombo/_c_helper.pyx":308
+    /* "tombo/_c_helper.pyx":311
  *         ref_diff = obs_mean - reg_ref_means[idx]
  *         alt_diff = obs_mean - reg_alt_means[idx]
  *         running_llhr += ((alt_diff * alt_diff) -             # <<<<<<<<<<<<<<
@@ -7892,7 +7965,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_18c_calc_llh_ratio_const_var(CYTHON_
     __pyx_v_running_llhr = (__pyx_v_running_llhr + (__pyx_t_6 / __pyx_v_const_var));
   }
 
-  /* "tombo/_c_helper.pyx":311
+  /* "tombo/_c_helper.pyx":314
  *                          (ref_diff * ref_diff)) / const_var
  * 
  *     return running_llhr             # <<<<<<<<<<<<<<
@@ -7900,13 +7973,13 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_18c_calc_llh_ratio_const_var(CYTHON_
  * def c_calc_scaled_llh_ratio_const_var(
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_running_llhr); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 311, __pyx_L1_error)
+  __pyx_t_7 = PyFloat_FromDouble(__pyx_v_running_llhr); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 314, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_7);
   __pyx_r = __pyx_t_7;
   __pyx_t_7 = 0;
   goto __pyx_L0;
 
-  /* "tombo/_c_helper.pyx":298
+  /* "tombo/_c_helper.pyx":301
  *     return log_lh_ratio
  * 
  * def c_calc_llh_ratio_const_var(             # <<<<<<<<<<<<<<
@@ -7938,7 +8011,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_18c_calc_llh_ratio_const_var(CYTHON_
   return __pyx_r;
 }
 
-/* "tombo/_c_helper.pyx":313
+/* "tombo/_c_helper.pyx":316
  *     return running_llhr
  * 
  * def c_calc_scaled_llh_ratio_const_var(             # <<<<<<<<<<<<<<
@@ -7997,41 +8070,41 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_21c_calc_scaled_llh_ratio_const_var(
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_reg_ref_means)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_calc_scaled_llh_ratio_const_var", 1, 7, 7, 1); __PYX_ERR(0, 313, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_calc_scaled_llh_ratio_const_var", 1, 7, 7, 1); __PYX_ERR(0, 316, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
         if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_reg_alt_means)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_calc_scaled_llh_ratio_const_var", 1, 7, 7, 2); __PYX_ERR(0, 313, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_calc_scaled_llh_ratio_const_var", 1, 7, 7, 2); __PYX_ERR(0, 316, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  3:
         if (likely((values[3] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_const_var)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_calc_scaled_llh_ratio_const_var", 1, 7, 7, 3); __PYX_ERR(0, 313, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_calc_scaled_llh_ratio_const_var", 1, 7, 7, 3); __PYX_ERR(0, 316, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  4:
         if (likely((values[4] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_scale_factor)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_calc_scaled_llh_ratio_const_var", 1, 7, 7, 4); __PYX_ERR(0, 313, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_calc_scaled_llh_ratio_const_var", 1, 7, 7, 4); __PYX_ERR(0, 316, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  5:
         if (likely((values[5] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_density_height_factor)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_calc_scaled_llh_ratio_const_var", 1, 7, 7, 5); __PYX_ERR(0, 313, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_calc_scaled_llh_ratio_const_var", 1, 7, 7, 5); __PYX_ERR(0, 316, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  6:
         if (likely((values[6] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_density_height_power)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_calc_scaled_llh_ratio_const_var", 1, 7, 7, 6); __PYX_ERR(0, 313, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_calc_scaled_llh_ratio_const_var", 1, 7, 7, 6); __PYX_ERR(0, 316, __pyx_L3_error)
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_calc_scaled_llh_ratio_const_var") < 0)) __PYX_ERR(0, 313, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_calc_scaled_llh_ratio_const_var") < 0)) __PYX_ERR(0, 316, __pyx_L3_error)
       }
     } else if (PyTuple_GET_SIZE(__pyx_args) != 7) {
       goto __pyx_L5_argtuple_error;
@@ -8047,22 +8120,22 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_21c_calc_scaled_llh_ratio_const_var(
     __pyx_v_reg_means = ((PyArrayObject *)values[0]);
     __pyx_v_reg_ref_means = ((PyArrayObject *)values[1]);
     __pyx_v_reg_alt_means = ((PyArrayObject *)values[2]);
-    __pyx_v_const_var = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_const_var == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 315, __pyx_L3_error)
-    __pyx_v_scale_factor = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_scale_factor == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 316, __pyx_L3_error)
-    __pyx_v_density_height_factor = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_density_height_factor == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 316, __pyx_L3_error)
-    __pyx_v_density_height_power = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_density_height_power == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 317, __pyx_L3_error)
+    __pyx_v_const_var = __pyx_PyFloat_AsDouble(values[3]); if (unlikely((__pyx_v_const_var == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 318, __pyx_L3_error)
+    __pyx_v_scale_factor = __pyx_PyFloat_AsDouble(values[4]); if (unlikely((__pyx_v_scale_factor == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 319, __pyx_L3_error)
+    __pyx_v_density_height_factor = __pyx_PyFloat_AsDouble(values[5]); if (unlikely((__pyx_v_density_height_factor == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 319, __pyx_L3_error)
+    __pyx_v_density_height_power = __pyx_PyFloat_AsDouble(values[6]); if (unlikely((__pyx_v_density_height_power == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 320, __pyx_L3_error)
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("c_calc_scaled_llh_ratio_const_var", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 313, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("c_calc_scaled_llh_ratio_const_var", 1, 7, 7, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 316, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("tombo._c_helper.c_calc_scaled_llh_ratio_const_var", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_means), __pyx_ptype_5numpy_ndarray, 1, "reg_means", 0))) __PYX_ERR(0, 314, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_ref_means), __pyx_ptype_5numpy_ndarray, 1, "reg_ref_means", 0))) __PYX_ERR(0, 314, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_alt_means), __pyx_ptype_5numpy_ndarray, 1, "reg_alt_means", 0))) __PYX_ERR(0, 315, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_means), __pyx_ptype_5numpy_ndarray, 1, "reg_means", 0))) __PYX_ERR(0, 317, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_ref_means), __pyx_ptype_5numpy_ndarray, 1, "reg_ref_means", 0))) __PYX_ERR(0, 317, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_reg_alt_means), __pyx_ptype_5numpy_ndarray, 1, "reg_alt_means", 0))) __PYX_ERR(0, 318, __pyx_L1_error)
   __pyx_r = __pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(__pyx_self, __pyx_v_reg_means, __pyx_v_reg_ref_means, __pyx_v_reg_alt_means, __pyx_v_const_var, __pyx_v_scale_factor, __pyx_v_density_height_factor, __pyx_v_density_height_power);
 
   /* function exit code */
@@ -8122,21 +8195,21 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
   __pyx_pybuffernd_reg_alt_means.rcbuffer = &__pyx_pybuffer_reg_alt_means;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 313, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 316, __pyx_L1_error)
   }
   __pyx_pybuffernd_reg_means.diminfo[0].strides = __pyx_pybuffernd_reg_means.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_reg_means.diminfo[0].shape = __pyx_pybuffernd_reg_means.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_ref_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 313, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_ref_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 316, __pyx_L1_error)
   }
   __pyx_pybuffernd_reg_ref_means.diminfo[0].strides = __pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_reg_ref_means.diminfo[0].shape = __pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_alt_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 313, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_reg_alt_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 316, __pyx_L1_error)
   }
   __pyx_pybuffernd_reg_alt_means.diminfo[0].strides = __pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_reg_alt_means.diminfo[0].shape = __pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer.shape[0];
 
-  /* "tombo/_c_helper.pyx":333
+  /* "tombo/_c_helper.pyx":336
  *         to the score.
  *     """
  *     cdef DTYPE_t running_scaled_lhr = 0.0             # <<<<<<<<<<<<<<
@@ -8145,7 +8218,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
  */
   __pyx_v_running_scaled_lhr = 0.0;
 
-  /* "tombo/_c_helper.pyx":337
+  /* "tombo/_c_helper.pyx":340
  *         obs_mean, means_diff
  *     cdef DTYPE_INT_t idx
  *     for idx in range(reg_means.shape[0]):             # <<<<<<<<<<<<<<
@@ -8157,7 +8230,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
   for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
     __pyx_v_idx = __pyx_t_3;
 
-    /* "tombo/_c_helper.pyx":338
+    /* "tombo/_c_helper.pyx":341
  *     cdef DTYPE_INT_t idx
  *     for idx in range(reg_means.shape[0]):
  *         ref_mean = reg_ref_means[idx]             # <<<<<<<<<<<<<<
@@ -8172,11 +8245,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
     } else if (unlikely(__pyx_t_4 >= __pyx_pybuffernd_reg_ref_means.diminfo[0].shape)) __pyx_t_5 = 0;
     if (unlikely(__pyx_t_5 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_5);
-      __PYX_ERR(0, 338, __pyx_L1_error)
+      __PYX_ERR(0, 341, __pyx_L1_error)
     }
     __pyx_v_ref_mean = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_reg_ref_means.rcbuffer->pybuffer.buf, __pyx_t_4, __pyx_pybuffernd_reg_ref_means.diminfo[0].strides));
 
-    /* "tombo/_c_helper.pyx":339
+    /* "tombo/_c_helper.pyx":342
  *     for idx in range(reg_means.shape[0]):
  *         ref_mean = reg_ref_means[idx]
  *         alt_mean = reg_alt_means[idx]             # <<<<<<<<<<<<<<
@@ -8191,11 +8264,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
     } else if (unlikely(__pyx_t_4 >= __pyx_pybuffernd_reg_alt_means.diminfo[0].shape)) __pyx_t_5 = 0;
     if (unlikely(__pyx_t_5 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_5);
-      __PYX_ERR(0, 339, __pyx_L1_error)
+      __PYX_ERR(0, 342, __pyx_L1_error)
     }
     __pyx_v_alt_mean = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_reg_alt_means.rcbuffer->pybuffer.buf, __pyx_t_4, __pyx_pybuffernd_reg_alt_means.diminfo[0].strides));
 
-    /* "tombo/_c_helper.pyx":340
+    /* "tombo/_c_helper.pyx":343
  *         ref_mean = reg_ref_means[idx]
  *         alt_mean = reg_alt_means[idx]
  *         if ref_mean == alt_mean:             # <<<<<<<<<<<<<<
@@ -8205,7 +8278,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
     __pyx_t_6 = ((__pyx_v_ref_mean == __pyx_v_alt_mean) != 0);
     if (__pyx_t_6) {
 
-      /* "tombo/_c_helper.pyx":341
+      /* "tombo/_c_helper.pyx":344
  *         alt_mean = reg_alt_means[idx]
  *         if ref_mean == alt_mean:
  *             continue             # <<<<<<<<<<<<<<
@@ -8214,7 +8287,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
  */
       goto __pyx_L3_continue;
 
-      /* "tombo/_c_helper.pyx":340
+      /* "tombo/_c_helper.pyx":343
  *         ref_mean = reg_ref_means[idx]
  *         alt_mean = reg_alt_means[idx]
  *         if ref_mean == alt_mean:             # <<<<<<<<<<<<<<
@@ -8223,7 +8296,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
  */
     }
 
-    /* "tombo/_c_helper.pyx":342
+    /* "tombo/_c_helper.pyx":345
  *         if ref_mean == alt_mean:
  *             continue
  *         obs_mean = reg_means[idx]             # <<<<<<<<<<<<<<
@@ -8238,23 +8311,23 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
     } else if (unlikely(__pyx_t_4 >= __pyx_pybuffernd_reg_means.diminfo[0].shape)) __pyx_t_5 = 0;
     if (unlikely(__pyx_t_5 != -1)) {
       __Pyx_RaiseBufferIndexError(__pyx_t_5);
-      __PYX_ERR(0, 342, __pyx_L1_error)
+      __PYX_ERR(0, 345, __pyx_L1_error)
     }
     __pyx_v_obs_mean = (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_reg_means.rcbuffer->pybuffer.buf, __pyx_t_4, __pyx_pybuffernd_reg_means.diminfo[0].strides));
 
-    /* "tombo/_c_helper.pyx":343
+    /* "tombo/_c_helper.pyx":346
  *             continue
  *         obs_mean = reg_means[idx]
  *         scale_mean = (alt_mean + ref_mean) / 2             # <<<<<<<<<<<<<<
  * 
  *         ref_diff = obs_mean - ref_mean
  */
-    __pyx_t_7 = PyFloat_FromDouble(((__pyx_v_alt_mean + __pyx_v_ref_mean) / 2.0)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 343, __pyx_L1_error)
+    __pyx_t_7 = PyFloat_FromDouble(((__pyx_v_alt_mean + __pyx_v_ref_mean) / 2.0)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 346, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_XDECREF_SET(__pyx_v_scale_mean, __pyx_t_7);
     __pyx_t_7 = 0;
 
-    /* "tombo/_c_helper.pyx":345
+    /* "tombo/_c_helper.pyx":348
  *         scale_mean = (alt_mean + ref_mean) / 2
  * 
  *         ref_diff = obs_mean - ref_mean             # <<<<<<<<<<<<<<
@@ -8263,7 +8336,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
  */
     __pyx_v_ref_diff = (__pyx_v_obs_mean - __pyx_v_ref_mean);
 
-    /* "tombo/_c_helper.pyx":346
+    /* "tombo/_c_helper.pyx":349
  * 
  *         ref_diff = obs_mean - ref_mean
  *         alt_diff = obs_mean - alt_mean             # <<<<<<<<<<<<<<
@@ -8272,23 +8345,23 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
  */
     __pyx_v_alt_diff = (__pyx_v_obs_mean - __pyx_v_alt_mean);
 
-    /* "tombo/_c_helper.pyx":347
+    /* "tombo/_c_helper.pyx":350
  *         ref_diff = obs_mean - ref_mean
  *         alt_diff = obs_mean - alt_mean
  *         scale_diff = obs_mean - scale_mean             # <<<<<<<<<<<<<<
  *         means_diff = alt_mean - ref_mean
  *         if means_diff < 0:
  */
-    __pyx_t_7 = PyFloat_FromDouble(__pyx_v_obs_mean); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 347, __pyx_L1_error)
+    __pyx_t_7 = PyFloat_FromDouble(__pyx_v_obs_mean); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 350, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
-    __pyx_t_8 = PyNumber_Subtract(__pyx_t_7, __pyx_v_scale_mean); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 347, __pyx_L1_error)
+    __pyx_t_8 = PyNumber_Subtract(__pyx_t_7, __pyx_v_scale_mean); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 350, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-    __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_t_8); if (unlikely((__pyx_t_9 == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 347, __pyx_L1_error)
+    __pyx_t_9 = __pyx_PyFloat_AsDouble(__pyx_t_8); if (unlikely((__pyx_t_9 == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 350, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
     __pyx_v_scale_diff = __pyx_t_9;
 
-    /* "tombo/_c_helper.pyx":348
+    /* "tombo/_c_helper.pyx":351
  *         alt_diff = obs_mean - alt_mean
  *         scale_diff = obs_mean - scale_mean
  *         means_diff = alt_mean - ref_mean             # <<<<<<<<<<<<<<
@@ -8297,7 +8370,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
  */
     __pyx_v_means_diff = (__pyx_v_alt_mean - __pyx_v_ref_mean);
 
-    /* "tombo/_c_helper.pyx":349
+    /* "tombo/_c_helper.pyx":352
  *         scale_diff = obs_mean - scale_mean
  *         means_diff = alt_mean - ref_mean
  *         if means_diff < 0:             # <<<<<<<<<<<<<<
@@ -8307,7 +8380,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
     __pyx_t_6 = ((__pyx_v_means_diff < 0.0) != 0);
     if (__pyx_t_6) {
 
-      /* "tombo/_c_helper.pyx":350
+      /* "tombo/_c_helper.pyx":353
  *         means_diff = alt_mean - ref_mean
  *         if means_diff < 0:
  *             means_diff = means_diff * -1             # <<<<<<<<<<<<<<
@@ -8316,7 +8389,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
  */
       __pyx_v_means_diff = (__pyx_v_means_diff * -1.0);
 
-      /* "tombo/_c_helper.pyx":349
+      /* "tombo/_c_helper.pyx":352
  *         scale_diff = obs_mean - scale_mean
  *         means_diff = alt_mean - ref_mean
  *         if means_diff < 0:             # <<<<<<<<<<<<<<
@@ -8325,7 +8398,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
  */
     }
 
-    /* "tombo/_c_helper.pyx":353
+    /* "tombo/_c_helper.pyx":356
  * 
  *         running_scaled_lhr += exp(
  *             -(scale_diff * scale_diff) / (scale_factor * const_var)) * (             # <<<<<<<<<<<<<<
@@ -8336,10 +8409,10 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
     __pyx_t_10 = (__pyx_v_scale_factor * __pyx_v_const_var);
     if (unlikely(__pyx_t_10 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 353, __pyx_L1_error)
+      __PYX_ERR(0, 356, __pyx_L1_error)
     }
 
-    /* "tombo/_c_helper.pyx":354
+    /* "tombo/_c_helper.pyx":357
  *         running_scaled_lhr += exp(
  *             -(scale_diff * scale_diff) / (scale_factor * const_var)) * (
  *                 (alt_diff * alt_diff) - (ref_diff * ref_diff)) / (             # <<<<<<<<<<<<<<
@@ -8348,7 +8421,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
  */
     __pyx_t_11 = (exp((__pyx_t_9 / __pyx_t_10)) * ((__pyx_v_alt_diff * __pyx_v_alt_diff) - (__pyx_v_ref_diff * __pyx_v_ref_diff)));
 
-    /* "tombo/_c_helper.pyx":355
+    /* "tombo/_c_helper.pyx":358
  *             -(scale_diff * scale_diff) / (scale_factor * const_var)) * (
  *                 (alt_diff * alt_diff) - (ref_diff * ref_diff)) / (
  *                     const_var * (means_diff ** density_height_power) *             # <<<<<<<<<<<<<<
@@ -8357,7 +8430,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
  */
     __pyx_t_10 = ((__pyx_v_const_var * pow(__pyx_v_means_diff, __pyx_v_density_height_power)) * __pyx_v_density_height_factor);
 
-    /* "tombo/_c_helper.pyx":354
+    /* "tombo/_c_helper.pyx":357
  *         running_scaled_lhr += exp(
  *             -(scale_diff * scale_diff) / (scale_factor * const_var)) * (
  *                 (alt_diff * alt_diff) - (ref_diff * ref_diff)) / (             # <<<<<<<<<<<<<<
@@ -8366,10 +8439,10 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
  */
     if (unlikely(__pyx_t_10 == 0)) {
       PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-      __PYX_ERR(0, 354, __pyx_L1_error)
+      __PYX_ERR(0, 357, __pyx_L1_error)
     }
 
-    /* "tombo/_c_helper.pyx":352
+    /* "tombo/_c_helper.pyx":355
  *             means_diff = means_diff * -1
  * 
  *         running_scaled_lhr += exp(             # <<<<<<<<<<<<<<
@@ -8380,7 +8453,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
     __pyx_L3_continue:;
   }
 
-  /* "tombo/_c_helper.pyx":358
+  /* "tombo/_c_helper.pyx":361
  *                     density_height_factor)
  * 
  *     return running_scaled_lhr             # <<<<<<<<<<<<<<
@@ -8388,13 +8461,13 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
  * @cython.wraparound(False)
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_8 = PyFloat_FromDouble(__pyx_v_running_scaled_lhr); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 358, __pyx_L1_error)
+  __pyx_t_8 = PyFloat_FromDouble(__pyx_v_running_scaled_lhr); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 361, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_8);
   __pyx_r = __pyx_t_8;
   __pyx_t_8 = 0;
   goto __pyx_L0;
 
-  /* "tombo/_c_helper.pyx":313
+  /* "tombo/_c_helper.pyx":316
  *     return running_llhr
  * 
  * def c_calc_scaled_llh_ratio_const_var(             # <<<<<<<<<<<<<<
@@ -8428,7 +8501,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_20c_calc_scaled_llh_ratio_const_var(
   return __pyx_r;
 }
 
-/* "tombo/_c_helper.pyx":362
+/* "tombo/_c_helper.pyx":365
  * @cython.wraparound(False)
  * @cython.boundscheck(False)
  * def c_compute_slopes(             # <<<<<<<<<<<<<<
@@ -8475,7 +8548,7 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_23c_compute_slopes(PyObject *__pyx_s
         case  1:
         if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_r_model_means)) != 0)) kw_args--;
         else {
-          __Pyx_RaiseArgtupleInvalid("c_compute_slopes", 0, 2, 3, 1); __PYX_ERR(0, 362, __pyx_L3_error)
+          __Pyx_RaiseArgtupleInvalid("c_compute_slopes", 0, 2, 3, 1); __PYX_ERR(0, 365, __pyx_L3_error)
         }
         CYTHON_FALLTHROUGH;
         case  2:
@@ -8485,7 +8558,7 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_23c_compute_slopes(PyObject *__pyx_s
         }
       }
       if (unlikely(kw_args > 0)) {
-        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_compute_slopes") < 0)) __PYX_ERR(0, 362, __pyx_L3_error)
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_compute_slopes") < 0)) __PYX_ERR(0, 365, __pyx_L3_error)
       }
     } else {
       switch (PyTuple_GET_SIZE(__pyx_args)) {
@@ -8500,21 +8573,21 @@ static PyObject *__pyx_pw_5tombo_9_c_helper_23c_compute_slopes(PyObject *__pyx_s
     __pyx_v_r_event_means = ((PyArrayObject *)values[0]);
     __pyx_v_r_model_means = ((PyArrayObject *)values[1]);
     if (values[2]) {
-      __pyx_v_max_slope = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_max_slope == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 364, __pyx_L3_error)
+      __pyx_v_max_slope = __pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_max_slope == ((npy_float64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 367, __pyx_L3_error)
     } else {
       __pyx_v_max_slope = ((__pyx_t_5tombo_9_c_helper_DTYPE_t)1000.0);
     }
   }
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("c_compute_slopes", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 362, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("c_compute_slopes", 0, 2, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 365, __pyx_L3_error)
   __pyx_L3_error:;
   __Pyx_AddTraceback("tombo._c_helper.c_compute_slopes", __pyx_clineno, __pyx_lineno, __pyx_filename);
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_r_event_means), __pyx_ptype_5numpy_ndarray, 1, "r_event_means", 0))) __PYX_ERR(0, 363, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_r_model_means), __pyx_ptype_5numpy_ndarray, 1, "r_model_means", 0))) __PYX_ERR(0, 363, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_r_event_means), __pyx_ptype_5numpy_ndarray, 1, "r_event_means", 0))) __PYX_ERR(0, 366, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_r_model_means), __pyx_ptype_5numpy_ndarray, 1, "r_model_means", 0))) __PYX_ERR(0, 366, __pyx_L1_error)
   __pyx_r = __pyx_pf_5tombo_9_c_helper_22c_compute_slopes(__pyx_self, __pyx_v_r_event_means, __pyx_v_r_model_means, __pyx_v_max_slope);
 
   /* function exit code */
@@ -8574,16 +8647,16 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
   __pyx_pybuffernd_r_model_means.rcbuffer = &__pyx_pybuffer_r_model_means;
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_r_event_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_r_event_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 362, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_r_event_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_r_event_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 365, __pyx_L1_error)
   }
   __pyx_pybuffernd_r_event_means.diminfo[0].strides = __pyx_pybuffernd_r_event_means.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_r_event_means.diminfo[0].shape = __pyx_pybuffernd_r_event_means.rcbuffer->pybuffer.shape[0];
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
-    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_r_model_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_r_model_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 362, __pyx_L1_error)
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_r_model_means.rcbuffer->pybuffer, (PyObject*)__pyx_v_r_model_means, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 365, __pyx_L1_error)
   }
   __pyx_pybuffernd_r_model_means.diminfo[0].strides = __pyx_pybuffernd_r_model_means.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_r_model_means.diminfo[0].shape = __pyx_pybuffernd_r_model_means.rcbuffer->pybuffer.shape[0];
 
-  /* "tombo/_c_helper.pyx":366
+  /* "tombo/_c_helper.pyx":369
  *         DTYPE_t max_slope=1000.0):
  *     cdef DTYPE_INT_t s_i, i, j, n_events
  *     n_events = r_event_means.shape[0]             # <<<<<<<<<<<<<<
@@ -8592,7 +8665,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
  */
   __pyx_v_n_events = (__pyx_v_r_event_means->dimensions[0]);
 
-  /* "tombo/_c_helper.pyx":367
+  /* "tombo/_c_helper.pyx":370
  *     cdef DTYPE_INT_t s_i, i, j, n_events
  *     n_events = r_event_means.shape[0]
  *     assert r_model_means.shape[0] == n_events             # <<<<<<<<<<<<<<
@@ -8603,80 +8676,80 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
   if (unlikely(!Py_OptimizeFlag)) {
     if (unlikely(!(((__pyx_v_r_model_means->dimensions[0]) == __pyx_v_n_events) != 0))) {
       PyErr_SetNone(PyExc_AssertionError);
-      __PYX_ERR(0, 367, __pyx_L1_error)
+      __PYX_ERR(0, 370, __pyx_L1_error)
     }
   }
   #endif
 
-  /* "tombo/_c_helper.pyx":368
+  /* "tombo/_c_helper.pyx":371
  *     n_events = r_event_means.shape[0]
  *     assert r_model_means.shape[0] == n_events
  *     cdef np.ndarray[DTYPE_t] slopes = np.empty(             # <<<<<<<<<<<<<<
  *         (n_events * (n_events - 1) / 2), dtype=DTYPE)
  *     for s_i, (i, j) in enumerate(combinations(range(n_events), 2)):
  */
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 368, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_np); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 371, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 368, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_n_s_empty); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 371, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "tombo/_c_helper.pyx":369
+  /* "tombo/_c_helper.pyx":372
  *     assert r_model_means.shape[0] == n_events
  *     cdef np.ndarray[DTYPE_t] slopes = np.empty(
  *         (n_events * (n_events - 1) / 2), dtype=DTYPE)             # <<<<<<<<<<<<<<
  *     for s_i, (i, j) in enumerate(combinations(range(n_events), 2)):
  *         if r_event_means[i] == r_event_means[j]:
  */
-  __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__Pyx_div___pyx_t_5tombo_9_c_helper_DTYPE_INT_t((__pyx_v_n_events * (__pyx_v_n_events - 1)), 2)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyInt_From_npy_int64(__Pyx_div___pyx_t_5tombo_9_c_helper_DTYPE_INT_t((__pyx_v_n_events * (__pyx_v_n_events - 1)), 2)); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 372, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
 
-  /* "tombo/_c_helper.pyx":368
+  /* "tombo/_c_helper.pyx":371
  *     n_events = r_event_means.shape[0]
  *     assert r_model_means.shape[0] == n_events
  *     cdef np.ndarray[DTYPE_t] slopes = np.empty(             # <<<<<<<<<<<<<<
  *         (n_events * (n_events - 1) / 2), dtype=DTYPE)
  *     for s_i, (i, j) in enumerate(combinations(range(n_events), 2)):
  */
-  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 368, __pyx_L1_error)
+  __pyx_t_3 = PyTuple_New(1); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 371, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
   __Pyx_GIVEREF(__pyx_t_1);
   PyTuple_SET_ITEM(__pyx_t_3, 0, __pyx_t_1);
   __pyx_t_1 = 0;
 
-  /* "tombo/_c_helper.pyx":369
+  /* "tombo/_c_helper.pyx":372
  *     assert r_model_means.shape[0] == n_events
  *     cdef np.ndarray[DTYPE_t] slopes = np.empty(
  *         (n_events * (n_events - 1) / 2), dtype=DTYPE)             # <<<<<<<<<<<<<<
  *     for s_i, (i, j) in enumerate(combinations(range(n_events), 2)):
  *         if r_event_means[i] == r_event_means[j]:
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __pyx_t_1 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 372, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 369, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_n_s_DTYPE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 372, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 369, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_1, __pyx_n_s_dtype, __pyx_t_4) < 0) __PYX_ERR(0, 372, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "tombo/_c_helper.pyx":368
+  /* "tombo/_c_helper.pyx":371
  *     n_events = r_event_means.shape[0]
  *     assert r_model_means.shape[0] == n_events
  *     cdef np.ndarray[DTYPE_t] slopes = np.empty(             # <<<<<<<<<<<<<<
  *         (n_events * (n_events - 1) / 2), dtype=DTYPE)
  *     for s_i, (i, j) in enumerate(combinations(range(n_events), 2)):
  */
-  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 368, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_2, __pyx_t_3, __pyx_t_1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 371, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 368, __pyx_L1_error)
+  if (!(likely(((__pyx_t_4) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_4, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 371, __pyx_L1_error)
   __pyx_t_5 = ((PyArrayObject *)__pyx_t_4);
   {
     __Pyx_BufFmt_StackElem __pyx_stack[1];
     if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_slopes.rcbuffer->pybuffer, (PyObject*)__pyx_t_5, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
       __pyx_v_slopes = ((PyArrayObject *)Py_None); __Pyx_INCREF(Py_None); __pyx_pybuffernd_slopes.rcbuffer->pybuffer.buf = NULL;
-      __PYX_ERR(0, 368, __pyx_L1_error)
+      __PYX_ERR(0, 371, __pyx_L1_error)
     } else {__pyx_pybuffernd_slopes.diminfo[0].strides = __pyx_pybuffernd_slopes.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_slopes.diminfo[0].shape = __pyx_pybuffernd_slopes.rcbuffer->pybuffer.shape[0];
     }
   }
@@ -8684,7 +8757,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
   __pyx_v_slopes = ((PyArrayObject *)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "tombo/_c_helper.pyx":370
+  /* "tombo/_c_helper.pyx":373
  *     cdef np.ndarray[DTYPE_t] slopes = np.empty(
  *         (n_events * (n_events - 1) / 2), dtype=DTYPE)
  *     for s_i, (i, j) in enumerate(combinations(range(n_events), 2)):             # <<<<<<<<<<<<<<
@@ -8692,11 +8765,11 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
  *             slopes[s_i] = max_slope
  */
   __pyx_t_6 = 0;
-  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_combinations); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_n_s_combinations); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 373, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
-  __pyx_t_3 = __Pyx_PyInt_From_npy_int64(__pyx_v_n_events); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __pyx_t_3 = __Pyx_PyInt_From_npy_int64(__pyx_v_n_events); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 373, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_3);
-  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 370, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyObject_CallOneArg(__pyx_builtin_range, __pyx_t_3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 373, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
   __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
   __pyx_t_3 = NULL;
@@ -8714,7 +8787,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
   #if CYTHON_FAST_PYCALL
   if (PyFunction_Check(__pyx_t_1)) {
     PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_t_2, __pyx_int_2};
-    __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 370, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 373, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
@@ -8723,14 +8796,14 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
   #if CYTHON_FAST_PYCCALL
   if (__Pyx_PyFastCFunction_Check(__pyx_t_1)) {
     PyObject *__pyx_temp[3] = {__pyx_t_3, __pyx_t_2, __pyx_int_2};
-    __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 370, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyCFunction_FastCall(__pyx_t_1, __pyx_temp+1-__pyx_t_7, 2+__pyx_t_7); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 373, __pyx_L1_error)
     __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   } else
   #endif
   {
-    __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 370, __pyx_L1_error)
+    __pyx_t_8 = PyTuple_New(2+__pyx_t_7); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 373, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_8);
     if (__pyx_t_3) {
       __Pyx_GIVEREF(__pyx_t_3); PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_3); __pyx_t_3 = NULL;
@@ -8741,7 +8814,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
     __Pyx_GIVEREF(__pyx_int_2);
     PyTuple_SET_ITEM(__pyx_t_8, 1+__pyx_t_7, __pyx_int_2);
     __pyx_t_2 = 0;
-    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 370, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyObject_Call(__pyx_t_1, __pyx_t_8, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 373, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
   }
@@ -8750,9 +8823,9 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
     __pyx_t_1 = __pyx_t_4; __Pyx_INCREF(__pyx_t_1); __pyx_t_9 = 0;
     __pyx_t_10 = NULL;
   } else {
-    __pyx_t_9 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 370, __pyx_L1_error)
+    __pyx_t_9 = -1; __pyx_t_1 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 373, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_1);
-    __pyx_t_10 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 370, __pyx_L1_error)
+    __pyx_t_10 = Py_TYPE(__pyx_t_1)->tp_iternext; if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 373, __pyx_L1_error)
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   for (;;) {
@@ -8760,17 +8833,17 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
       if (likely(PyList_CheckExact(__pyx_t_1))) {
         if (__pyx_t_9 >= PyList_GET_SIZE(__pyx_t_1)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_9); __Pyx_INCREF(__pyx_t_4); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 370, __pyx_L1_error)
+        __pyx_t_4 = PyList_GET_ITEM(__pyx_t_1, __pyx_t_9); __Pyx_INCREF(__pyx_t_4); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 373, __pyx_L1_error)
         #else
-        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 370, __pyx_L1_error)
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 373, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         #endif
       } else {
         if (__pyx_t_9 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
         #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_9); __Pyx_INCREF(__pyx_t_4); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 370, __pyx_L1_error)
+        __pyx_t_4 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_9); __Pyx_INCREF(__pyx_t_4); __pyx_t_9++; if (unlikely(0 < 0)) __PYX_ERR(0, 373, __pyx_L1_error)
         #else
-        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 370, __pyx_L1_error)
+        __pyx_t_4 = PySequence_ITEM(__pyx_t_1, __pyx_t_9); __pyx_t_9++; if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 373, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         #endif
       }
@@ -8780,7 +8853,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
         PyObject* exc_type = PyErr_Occurred();
         if (exc_type) {
           if (likely(__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) PyErr_Clear();
-          else __PYX_ERR(0, 370, __pyx_L1_error)
+          else __PYX_ERR(0, 373, __pyx_L1_error)
         }
         break;
       }
@@ -8792,7 +8865,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
       if (unlikely(size != 2)) {
         if (size > 2) __Pyx_RaiseTooManyValuesError(2);
         else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-        __PYX_ERR(0, 370, __pyx_L1_error)
+        __PYX_ERR(0, 373, __pyx_L1_error)
       }
       #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
       if (likely(PyTuple_CheckExact(sequence))) {
@@ -8805,15 +8878,15 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
       __Pyx_INCREF(__pyx_t_8);
       __Pyx_INCREF(__pyx_t_2);
       #else
-      __pyx_t_8 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __pyx_t_8 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 373, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_8);
-      __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __pyx_t_2 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 373, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_2);
       #endif
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
     } else {
       Py_ssize_t index = -1;
-      __pyx_t_3 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 370, __pyx_L1_error)
+      __pyx_t_3 = PyObject_GetIter(__pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 373, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       __pyx_t_11 = Py_TYPE(__pyx_t_3)->tp_iternext;
@@ -8821,7 +8894,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
       __Pyx_GOTREF(__pyx_t_8);
       index = 1; __pyx_t_2 = __pyx_t_11(__pyx_t_3); if (unlikely(!__pyx_t_2)) goto __pyx_L5_unpacking_failed;
       __Pyx_GOTREF(__pyx_t_2);
-      if (__Pyx_IternextUnpackEndCheck(__pyx_t_11(__pyx_t_3), 2) < 0) __PYX_ERR(0, 370, __pyx_L1_error)
+      if (__Pyx_IternextUnpackEndCheck(__pyx_t_11(__pyx_t_3), 2) < 0) __PYX_ERR(0, 373, __pyx_L1_error)
       __pyx_t_11 = NULL;
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       goto __pyx_L6_unpacking_done;
@@ -8829,19 +8902,19 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       __pyx_t_11 = NULL;
       if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
-      __PYX_ERR(0, 370, __pyx_L1_error)
+      __PYX_ERR(0, 373, __pyx_L1_error)
       __pyx_L6_unpacking_done:;
     }
-    __pyx_t_12 = __Pyx_PyInt_As_npy_int64(__pyx_t_8); if (unlikely((__pyx_t_12 == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 370, __pyx_L1_error)
+    __pyx_t_12 = __Pyx_PyInt_As_npy_int64(__pyx_t_8); if (unlikely((__pyx_t_12 == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 373, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-    __pyx_t_13 = __Pyx_PyInt_As_npy_int64(__pyx_t_2); if (unlikely((__pyx_t_13 == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 370, __pyx_L1_error)
+    __pyx_t_13 = __Pyx_PyInt_As_npy_int64(__pyx_t_2); if (unlikely((__pyx_t_13 == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 373, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
     __pyx_v_i = __pyx_t_12;
     __pyx_v_j = __pyx_t_13;
     __pyx_v_s_i = __pyx_t_6;
     __pyx_t_6 = (__pyx_t_6 + 1);
 
-    /* "tombo/_c_helper.pyx":371
+    /* "tombo/_c_helper.pyx":374
  *         (n_events * (n_events - 1) / 2), dtype=DTYPE)
  *     for s_i, (i, j) in enumerate(combinations(range(n_events), 2)):
  *         if r_event_means[i] == r_event_means[j]:             # <<<<<<<<<<<<<<
@@ -8853,7 +8926,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
     __pyx_t_14 = (((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_r_event_means.rcbuffer->pybuffer.buf, __pyx_t_13, __pyx_pybuffernd_r_event_means.diminfo[0].strides)) == (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_r_event_means.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_r_event_means.diminfo[0].strides))) != 0);
     if (__pyx_t_14) {
 
-      /* "tombo/_c_helper.pyx":372
+      /* "tombo/_c_helper.pyx":375
  *     for s_i, (i, j) in enumerate(combinations(range(n_events), 2)):
  *         if r_event_means[i] == r_event_means[j]:
  *             slopes[s_i] = max_slope             # <<<<<<<<<<<<<<
@@ -8863,7 +8936,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
       __pyx_t_12 = __pyx_v_s_i;
       *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_slopes.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_slopes.diminfo[0].strides) = __pyx_v_max_slope;
 
-      /* "tombo/_c_helper.pyx":371
+      /* "tombo/_c_helper.pyx":374
  *         (n_events * (n_events - 1) / 2), dtype=DTYPE)
  *     for s_i, (i, j) in enumerate(combinations(range(n_events), 2)):
  *         if r_event_means[i] == r_event_means[j]:             # <<<<<<<<<<<<<<
@@ -8873,7 +8946,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
       goto __pyx_L7;
     }
 
-    /* "tombo/_c_helper.pyx":375
+    /* "tombo/_c_helper.pyx":378
  *         else:
  *             slopes[s_i] = (
  *                 r_model_means[i] - r_model_means[j]) / (             # <<<<<<<<<<<<<<
@@ -8885,17 +8958,18 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
       __pyx_t_13 = __pyx_v_j;
       __pyx_t_15 = ((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_r_model_means.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_r_model_means.diminfo[0].strides)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_r_model_means.rcbuffer->pybuffer.buf, __pyx_t_13, __pyx_pybuffernd_r_model_means.diminfo[0].strides)));
 
-      /* "tombo/_c_helper.pyx":376
+      /* "tombo/_c_helper.pyx":379
  *             slopes[s_i] = (
  *                 r_model_means[i] - r_model_means[j]) / (
  *                     r_event_means[i] - r_event_means[j])             # <<<<<<<<<<<<<<
  *     return slopes
+ * 
  */
       __pyx_t_13 = __pyx_v_i;
       __pyx_t_12 = __pyx_v_j;
       __pyx_t_16 = ((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_r_event_means.rcbuffer->pybuffer.buf, __pyx_t_13, __pyx_pybuffernd_r_event_means.diminfo[0].strides)) - (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_t *, __pyx_pybuffernd_r_event_means.rcbuffer->pybuffer.buf, __pyx_t_12, __pyx_pybuffernd_r_event_means.diminfo[0].strides)));
 
-      /* "tombo/_c_helper.pyx":375
+      /* "tombo/_c_helper.pyx":378
  *         else:
  *             slopes[s_i] = (
  *                 r_model_means[i] - r_model_means[j]) / (             # <<<<<<<<<<<<<<
@@ -8904,10 +8978,10 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
  */
       if (unlikely(__pyx_t_16 == 0)) {
         PyErr_SetString(PyExc_ZeroDivisionError, "float division");
-        __PYX_ERR(0, 375, __pyx_L1_error)
+        __PYX_ERR(0, 378, __pyx_L1_error)
       }
 
-      /* "tombo/_c_helper.pyx":374
+      /* "tombo/_c_helper.pyx":377
  *             slopes[s_i] = max_slope
  *         else:
  *             slopes[s_i] = (             # <<<<<<<<<<<<<<
@@ -8919,7 +8993,7 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
     }
     __pyx_L7:;
 
-    /* "tombo/_c_helper.pyx":370
+    /* "tombo/_c_helper.pyx":373
  *     cdef np.ndarray[DTYPE_t] slopes = np.empty(
  *         (n_events * (n_events - 1) / 2), dtype=DTYPE)
  *     for s_i, (i, j) in enumerate(combinations(range(n_events), 2)):             # <<<<<<<<<<<<<<
@@ -8929,17 +9003,19 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "tombo/_c_helper.pyx":377
+  /* "tombo/_c_helper.pyx":380
  *                 r_model_means[i] - r_model_means[j]) / (
  *                     r_event_means[i] - r_event_means[j])
  *     return slopes             # <<<<<<<<<<<<<<
+ * 
+ * @cython.wraparound(False)
  */
   __Pyx_XDECREF(__pyx_r);
   __Pyx_INCREF(((PyObject *)__pyx_v_slopes));
   __pyx_r = ((PyObject *)__pyx_v_slopes);
   goto __pyx_L0;
 
-  /* "tombo/_c_helper.pyx":362
+  /* "tombo/_c_helper.pyx":365
  * @cython.wraparound(False)
  * @cython.boundscheck(False)
  * def c_compute_slopes(             # <<<<<<<<<<<<<<
@@ -8976,8 +9052,1961 @@ static PyObject *__pyx_pf_5tombo_9_c_helper_22c_compute_slopes(CYTHON_UNUSED PyO
   return __pyx_r;
 }
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":742
- * ctypedef npy_cdouble     complex_t
+/* "tombo/_c_helper.pyx":384
+ * @cython.wraparound(False)
+ * @cython.boundscheck(False)
+ * def c_extend_ambig_indel(             # <<<<<<<<<<<<<<
+ *         np.ndarray[DTYPE_UINT8_t] indel_seq not None,
+ *         np.ndarray[DTYPE_UINT8_t] before_seq not None,
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5tombo_9_c_helper_25c_extend_ambig_indel(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5tombo_9_c_helper_24c_extend_ambig_indel[] = "c_extend_ambig_indel(ndarray indel_seq, ndarray before_seq, ndarray after_seq)\n\n    Extend an indel through sequence where its placement is ambiguous.\n    Returns number of bases (negative) to extend upstream and downstream.\n    ";
+static PyMethodDef __pyx_mdef_5tombo_9_c_helper_25c_extend_ambig_indel = {"c_extend_ambig_indel", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5tombo_9_c_helper_25c_extend_ambig_indel, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5tombo_9_c_helper_24c_extend_ambig_indel};
+static PyObject *__pyx_pw_5tombo_9_c_helper_25c_extend_ambig_indel(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_indel_seq = 0;
+  PyArrayObject *__pyx_v_before_seq = 0;
+  PyArrayObject *__pyx_v_after_seq = 0;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("c_extend_ambig_indel (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_indel_seq,&__pyx_n_s_before_seq,&__pyx_n_s_after_seq,0};
+    PyObject* values[3] = {0,0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  3: values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+        CYTHON_FALLTHROUGH;
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_indel_seq)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_before_seq)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("c_extend_ambig_indel", 1, 3, 3, 1); __PYX_ERR(0, 384, __pyx_L3_error)
+        }
+        CYTHON_FALLTHROUGH;
+        case  2:
+        if (likely((values[2] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_after_seq)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("c_extend_ambig_indel", 1, 3, 3, 2); __PYX_ERR(0, 384, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_extend_ambig_indel") < 0)) __PYX_ERR(0, 384, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 3) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+      values[2] = PyTuple_GET_ITEM(__pyx_args, 2);
+    }
+    __pyx_v_indel_seq = ((PyArrayObject *)values[0]);
+    __pyx_v_before_seq = ((PyArrayObject *)values[1]);
+    __pyx_v_after_seq = ((PyArrayObject *)values[2]);
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("c_extend_ambig_indel", 1, 3, 3, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 384, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("tombo._c_helper.c_extend_ambig_indel", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_indel_seq), __pyx_ptype_5numpy_ndarray, 0, "indel_seq", 0))) __PYX_ERR(0, 385, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_before_seq), __pyx_ptype_5numpy_ndarray, 0, "before_seq", 0))) __PYX_ERR(0, 386, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_after_seq), __pyx_ptype_5numpy_ndarray, 0, "after_seq", 0))) __PYX_ERR(0, 387, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5tombo_9_c_helper_24c_extend_ambig_indel(__pyx_self, __pyx_v_indel_seq, __pyx_v_before_seq, __pyx_v_after_seq);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5tombo_9_c_helper_24c_extend_ambig_indel(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_indel_seq, PyArrayObject *__pyx_v_before_seq, PyArrayObject *__pyx_v_after_seq) {
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_indel_len;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_before_len;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_after_len;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_up;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_down;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_after_seq;
+  __Pyx_Buffer __pyx_pybuffer_after_seq;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_before_seq;
+  __Pyx_Buffer __pyx_pybuffer_before_seq;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_indel_seq;
+  __Pyx_Buffer __pyx_pybuffer_indel_seq;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_t_3;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_t_4;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("c_extend_ambig_indel", 0);
+  __pyx_pybuffer_indel_seq.pybuffer.buf = NULL;
+  __pyx_pybuffer_indel_seq.refcount = 0;
+  __pyx_pybuffernd_indel_seq.data = NULL;
+  __pyx_pybuffernd_indel_seq.rcbuffer = &__pyx_pybuffer_indel_seq;
+  __pyx_pybuffer_before_seq.pybuffer.buf = NULL;
+  __pyx_pybuffer_before_seq.refcount = 0;
+  __pyx_pybuffernd_before_seq.data = NULL;
+  __pyx_pybuffernd_before_seq.rcbuffer = &__pyx_pybuffer_before_seq;
+  __pyx_pybuffer_after_seq.pybuffer.buf = NULL;
+  __pyx_pybuffer_after_seq.refcount = 0;
+  __pyx_pybuffernd_after_seq.data = NULL;
+  __pyx_pybuffernd_after_seq.rcbuffer = &__pyx_pybuffer_after_seq;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_indel_seq.rcbuffer->pybuffer, (PyObject*)__pyx_v_indel_seq, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 384, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_indel_seq.diminfo[0].strides = __pyx_pybuffernd_indel_seq.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_indel_seq.diminfo[0].shape = __pyx_pybuffernd_indel_seq.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_before_seq.rcbuffer->pybuffer, (PyObject*)__pyx_v_before_seq, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 384, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_before_seq.diminfo[0].strides = __pyx_pybuffernd_before_seq.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_before_seq.diminfo[0].shape = __pyx_pybuffernd_before_seq.rcbuffer->pybuffer.shape[0];
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_after_seq.rcbuffer->pybuffer, (PyObject*)__pyx_v_after_seq, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 384, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_after_seq.diminfo[0].strides = __pyx_pybuffernd_after_seq.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_after_seq.diminfo[0].shape = __pyx_pybuffernd_after_seq.rcbuffer->pybuffer.shape[0];
+
+  /* "tombo/_c_helper.pyx":392
+ *     Returns number of bases (negative) to extend upstream and downstream.
+ *     """
+ *     cdef DTYPE_INT_t indel_len = indel_seq.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef DTYPE_INT_t before_len = before_seq.shape[0]
+ *     cdef DTYPE_INT_t after_len = after_seq.shape[0]
+ */
+  __pyx_v_indel_len = (__pyx_v_indel_seq->dimensions[0]);
+
+  /* "tombo/_c_helper.pyx":393
+ *     """
+ *     cdef DTYPE_INT_t indel_len = indel_seq.shape[0]
+ *     cdef DTYPE_INT_t before_len = before_seq.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef DTYPE_INT_t after_len = after_seq.shape[0]
+ *     cdef DTYPE_INT_t up = -1
+ */
+  __pyx_v_before_len = (__pyx_v_before_seq->dimensions[0]);
+
+  /* "tombo/_c_helper.pyx":394
+ *     cdef DTYPE_INT_t indel_len = indel_seq.shape[0]
+ *     cdef DTYPE_INT_t before_len = before_seq.shape[0]
+ *     cdef DTYPE_INT_t after_len = after_seq.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef DTYPE_INT_t up = -1
+ *     cdef DTYPE_INT_t down = 0
+ */
+  __pyx_v_after_len = (__pyx_v_after_seq->dimensions[0]);
+
+  /* "tombo/_c_helper.pyx":395
+ *     cdef DTYPE_INT_t before_len = before_seq.shape[0]
+ *     cdef DTYPE_INT_t after_len = after_seq.shape[0]
+ *     cdef DTYPE_INT_t up = -1             # <<<<<<<<<<<<<<
+ *     cdef DTYPE_INT_t down = 0
+ *     # only extend up to one position before beginning or end
+ */
+  __pyx_v_up = -1LL;
+
+  /* "tombo/_c_helper.pyx":396
+ *     cdef DTYPE_INT_t after_len = after_seq.shape[0]
+ *     cdef DTYPE_INT_t up = -1
+ *     cdef DTYPE_INT_t down = 0             # <<<<<<<<<<<<<<
+ *     # only extend up to one position before beginning or end
+ *     # as a one base pad is added outside of indel
+ */
+  __pyx_v_down = 0;
+
+  /* "tombo/_c_helper.pyx":399
+ *     # only extend up to one position before beginning or end
+ *     # as a one base pad is added outside of indel
+ *     while (down < after_len - 1 and             # <<<<<<<<<<<<<<
+ *            indel_seq[down % indel_len] == after_seq[down]):
+ *         down += 1
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_down < (__pyx_v_after_len - 1)) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+
+    /* "tombo/_c_helper.pyx":400
+ *     # as a one base pad is added outside of indel
+ *     while (down < after_len - 1 and
+ *            indel_seq[down % indel_len] == after_seq[down]):             # <<<<<<<<<<<<<<
+ *         down += 1
+ *     while (-up <= before_len - 1 and
+ */
+    if (unlikely(__pyx_v_indel_len == 0)) {
+      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+      __PYX_ERR(0, 400, __pyx_L1_error)
+    }
+    __pyx_t_3 = __Pyx_mod___pyx_t_5tombo_9_c_helper_DTYPE_INT_t(__pyx_v_down, __pyx_v_indel_len);
+    __pyx_t_4 = __pyx_v_down;
+    __pyx_t_2 = (((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t *, __pyx_pybuffernd_indel_seq.rcbuffer->pybuffer.buf, __pyx_t_3, __pyx_pybuffernd_indel_seq.diminfo[0].strides)) == (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t *, __pyx_pybuffernd_after_seq.rcbuffer->pybuffer.buf, __pyx_t_4, __pyx_pybuffernd_after_seq.diminfo[0].strides))) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L5_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "tombo/_c_helper.pyx":401
+ *     while (down < after_len - 1 and
+ *            indel_seq[down % indel_len] == after_seq[down]):
+ *         down += 1             # <<<<<<<<<<<<<<
+ *     while (-up <= before_len - 1 and
+ *            indel_seq[indel_len - 1 - ((-up - 1) % indel_len)] ==
+ */
+    __pyx_v_down = (__pyx_v_down + 1);
+  }
+
+  /* "tombo/_c_helper.pyx":402
+ *            indel_seq[down % indel_len] == after_seq[down]):
+ *         down += 1
+ *     while (-up <= before_len - 1 and             # <<<<<<<<<<<<<<
+ *            indel_seq[indel_len - 1 - ((-up - 1) % indel_len)] ==
+ *            before_seq[before_len + up]):
+ */
+  while (1) {
+    __pyx_t_2 = (((-__pyx_v_up) <= (__pyx_v_before_len - 1)) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L9_bool_binop_done;
+    }
+
+    /* "tombo/_c_helper.pyx":403
+ *         down += 1
+ *     while (-up <= before_len - 1 and
+ *            indel_seq[indel_len - 1 - ((-up - 1) % indel_len)] ==             # <<<<<<<<<<<<<<
+ *            before_seq[before_len + up]):
+ *         up -= 1
+ */
+    __pyx_t_4 = ((-__pyx_v_up) - 1);
+    if (unlikely(__pyx_v_indel_len == 0)) {
+      PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+      __PYX_ERR(0, 403, __pyx_L1_error)
+    }
+    __pyx_t_3 = ((__pyx_v_indel_len - 1) - __Pyx_mod___pyx_t_5tombo_9_c_helper_DTYPE_INT_t(__pyx_t_4, __pyx_v_indel_len));
+
+    /* "tombo/_c_helper.pyx":404
+ *     while (-up <= before_len - 1 and
+ *            indel_seq[indel_len - 1 - ((-up - 1) % indel_len)] ==
+ *            before_seq[before_len + up]):             # <<<<<<<<<<<<<<
+ *         up -= 1
+ *     return up, down
+ */
+    __pyx_t_5 = (__pyx_v_before_len + __pyx_v_up);
+
+    /* "tombo/_c_helper.pyx":403
+ *         down += 1
+ *     while (-up <= before_len - 1 and
+ *            indel_seq[indel_len - 1 - ((-up - 1) % indel_len)] ==             # <<<<<<<<<<<<<<
+ *            before_seq[before_len + up]):
+ *         up -= 1
+ */
+    __pyx_t_2 = (((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t *, __pyx_pybuffernd_indel_seq.rcbuffer->pybuffer.buf, __pyx_t_3, __pyx_pybuffernd_indel_seq.diminfo[0].strides)) == (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t *, __pyx_pybuffernd_before_seq.rcbuffer->pybuffer.buf, __pyx_t_5, __pyx_pybuffernd_before_seq.diminfo[0].strides))) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L9_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "tombo/_c_helper.pyx":405
+ *            indel_seq[indel_len - 1 - ((-up - 1) % indel_len)] ==
+ *            before_seq[before_len + up]):
+ *         up -= 1             # <<<<<<<<<<<<<<
+ *     return up, down
+ * 
+ */
+    __pyx_v_up = (__pyx_v_up - 1);
+  }
+
+  /* "tombo/_c_helper.pyx":406
+ *            before_seq[before_len + up]):
+ *         up -= 1
+ *     return up, down             # <<<<<<<<<<<<<<
+ * 
+ * @cython.wraparound(False)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_6 = __Pyx_PyInt_From_npy_int64(__pyx_v_up); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 406, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyInt_From_npy_int64(__pyx_v_down); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 406, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = PyTuple_New(2); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 406, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_6);
+  PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_6);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_7);
+  __pyx_t_6 = 0;
+  __pyx_t_7 = 0;
+  __pyx_r = __pyx_t_8;
+  __pyx_t_8 = 0;
+  goto __pyx_L0;
+
+  /* "tombo/_c_helper.pyx":384
+ * @cython.wraparound(False)
+ * @cython.boundscheck(False)
+ * def c_extend_ambig_indel(             # <<<<<<<<<<<<<<
+ *         np.ndarray[DTYPE_UINT8_t] indel_seq not None,
+ *         np.ndarray[DTYPE_UINT8_t] before_seq not None,
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_after_seq.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_before_seq.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_indel_seq.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("tombo._c_helper.c_extend_ambig_indel", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_after_seq.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_before_seq.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_indel_seq.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "tombo/_c_helper.pyx":410
+ * @cython.wraparound(False)
+ * @cython.boundscheck(False)
+ * def c_validate_segs(             # <<<<<<<<<<<<<<
+ *         np.ndarray[DTYPE_INT_t] segs not None, DTYPE_INT_t sig_len):
+ *     """
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5tombo_9_c_helper_27c_validate_segs(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static char __pyx_doc_5tombo_9_c_helper_26c_validate_segs[] = "c_validate_segs(ndarray segs, DTYPE_INT_t sig_len)\n\n    Check segments in a single pass. Returns 0 for valid segments, 1 for\n    zero length (or decreasing) segments, 2 for a negative start and 3 for\n    an end past the signal length.\n    ";
+static PyMethodDef __pyx_mdef_5tombo_9_c_helper_27c_validate_segs = {"c_validate_segs", (PyCFunction)(void*)(PyCFunctionWithKeywords)__pyx_pw_5tombo_9_c_helper_27c_validate_segs, METH_VARARGS|METH_KEYWORDS, __pyx_doc_5tombo_9_c_helper_26c_validate_segs};
+static PyObject *__pyx_pw_5tombo_9_c_helper_27c_validate_segs(PyObject *__pyx_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyArrayObject *__pyx_v_segs = 0;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_sig_len;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("c_validate_segs (wrapper)", 0);
+  {
+    static PyObject **__pyx_pyargnames[] = {&__pyx_n_s_segs,&__pyx_n_s_sig_len,0};
+    PyObject* values[2] = {0,0};
+    if (unlikely(__pyx_kwds)) {
+      Py_ssize_t kw_args;
+      const Py_ssize_t pos_args = PyTuple_GET_SIZE(__pyx_args);
+      switch (pos_args) {
+        case  2: values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+        CYTHON_FALLTHROUGH;
+        case  1: values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      kw_args = PyDict_Size(__pyx_kwds);
+      switch (pos_args) {
+        case  0:
+        if (likely((values[0] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_segs)) != 0)) kw_args--;
+        else goto __pyx_L5_argtuple_error;
+        CYTHON_FALLTHROUGH;
+        case  1:
+        if (likely((values[1] = __Pyx_PyDict_GetItemStr(__pyx_kwds, __pyx_n_s_sig_len)) != 0)) kw_args--;
+        else {
+          __Pyx_RaiseArgtupleInvalid("c_validate_segs", 1, 2, 2, 1); __PYX_ERR(0, 410, __pyx_L3_error)
+        }
+      }
+      if (unlikely(kw_args > 0)) {
+        if (unlikely(__Pyx_ParseOptionalKeywords(__pyx_kwds, __pyx_pyargnames, 0, values, pos_args, "c_validate_segs") < 0)) __PYX_ERR(0, 410, __pyx_L3_error)
+      }
+    } else if (PyTuple_GET_SIZE(__pyx_args) != 2) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = PyTuple_GET_ITEM(__pyx_args, 0);
+      values[1] = PyTuple_GET_ITEM(__pyx_args, 1);
+    }
+    __pyx_v_segs = ((PyArrayObject *)values[0]);
+    __pyx_v_sig_len = __Pyx_PyInt_As_npy_int64(values[1]); if (unlikely((__pyx_v_sig_len == ((npy_int64)-1)) && PyErr_Occurred())) __PYX_ERR(0, 411, __pyx_L3_error)
+  }
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("c_validate_segs", 1, 2, 2, PyTuple_GET_SIZE(__pyx_args)); __PYX_ERR(0, 410, __pyx_L3_error)
+  __pyx_L3_error:;
+  __Pyx_AddTraceback("tombo._c_helper.c_validate_segs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_segs), __pyx_ptype_5numpy_ndarray, 0, "segs", 0))) __PYX_ERR(0, 411, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5tombo_9_c_helper_26c_validate_segs(__pyx_self, __pyx_v_segs, __pyx_v_sig_len);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5tombo_9_c_helper_26c_validate_segs(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_segs, __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_sig_len) {
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_idx;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_n_segs;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_segs;
+  __Pyx_Buffer __pyx_pybuffer_segs;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_t_2;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_t_3;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_t_4;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_t_5;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("c_validate_segs", 0);
+  __pyx_pybuffer_segs.pybuffer.buf = NULL;
+  __pyx_pybuffer_segs.refcount = 0;
+  __pyx_pybuffernd_segs.data = NULL;
+  __pyx_pybuffernd_segs.rcbuffer = &__pyx_pybuffer_segs;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_segs.rcbuffer->pybuffer, (PyObject*)__pyx_v_segs, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 410, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_segs.diminfo[0].strides = __pyx_pybuffernd_segs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_segs.diminfo[0].shape = __pyx_pybuffernd_segs.rcbuffer->pybuffer.shape[0];
+
+  /* "tombo/_c_helper.pyx":418
+ *     """
+ *     cdef DTYPE_INT_t idx
+ *     cdef DTYPE_INT_t n_segs = segs.shape[0]             # <<<<<<<<<<<<<<
+ *     if n_segs == 0:
+ *         return 0
+ */
+  __pyx_v_n_segs = (__pyx_v_segs->dimensions[0]);
+
+  /* "tombo/_c_helper.pyx":419
+ *     cdef DTYPE_INT_t idx
+ *     cdef DTYPE_INT_t n_segs = segs.shape[0]
+ *     if n_segs == 0:             # <<<<<<<<<<<<<<
+ *         return 0
+ *     for idx in range(1, n_segs):
+ */
+  __pyx_t_1 = ((__pyx_v_n_segs == 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "tombo/_c_helper.pyx":420
+ *     cdef DTYPE_INT_t n_segs = segs.shape[0]
+ *     if n_segs == 0:
+ *         return 0             # <<<<<<<<<<<<<<
+ *     for idx in range(1, n_segs):
+ *         if segs[idx] <= segs[idx - 1]:
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_0);
+    __pyx_r = __pyx_int_0;
+    goto __pyx_L0;
+
+    /* "tombo/_c_helper.pyx":419
+ *     cdef DTYPE_INT_t idx
+ *     cdef DTYPE_INT_t n_segs = segs.shape[0]
+ *     if n_segs == 0:             # <<<<<<<<<<<<<<
+ *         return 0
+ *     for idx in range(1, n_segs):
+ */
+  }
+
+  /* "tombo/_c_helper.pyx":421
+ *     if n_segs == 0:
+ *         return 0
+ *     for idx in range(1, n_segs):             # <<<<<<<<<<<<<<
+ *         if segs[idx] <= segs[idx - 1]:
+ *             return 1
+ */
+  __pyx_t_2 = __pyx_v_n_segs;
+  __pyx_t_3 = __pyx_t_2;
+  for (__pyx_t_4 = 1; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_idx = __pyx_t_4;
+
+    /* "tombo/_c_helper.pyx":422
+ *         return 0
+ *     for idx in range(1, n_segs):
+ *         if segs[idx] <= segs[idx - 1]:             # <<<<<<<<<<<<<<
+ *             return 1
+ *     if segs[0] < 0:
+ */
+    __pyx_t_5 = __pyx_v_idx;
+    __pyx_t_6 = (__pyx_v_idx - 1);
+    __pyx_t_1 = (((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_segs.rcbuffer->pybuffer.buf, __pyx_t_5, __pyx_pybuffernd_segs.diminfo[0].strides)) <= (*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_segs.rcbuffer->pybuffer.buf, __pyx_t_6, __pyx_pybuffernd_segs.diminfo[0].strides))) != 0);
+    if (__pyx_t_1) {
+
+      /* "tombo/_c_helper.pyx":423
+ *     for idx in range(1, n_segs):
+ *         if segs[idx] <= segs[idx - 1]:
+ *             return 1             # <<<<<<<<<<<<<<
+ *     if segs[0] < 0:
+ *         return 2
+ */
+      __Pyx_XDECREF(__pyx_r);
+      __Pyx_INCREF(__pyx_int_1);
+      __pyx_r = __pyx_int_1;
+      goto __pyx_L0;
+
+      /* "tombo/_c_helper.pyx":422
+ *         return 0
+ *     for idx in range(1, n_segs):
+ *         if segs[idx] <= segs[idx - 1]:             # <<<<<<<<<<<<<<
+ *             return 1
+ *     if segs[0] < 0:
+ */
+    }
+  }
+
+  /* "tombo/_c_helper.pyx":424
+ *         if segs[idx] <= segs[idx - 1]:
+ *             return 1
+ *     if segs[0] < 0:             # <<<<<<<<<<<<<<
+ *         return 2
+ *     if segs[n_segs - 1] > sig_len:
+ */
+  __pyx_t_7 = 0;
+  __pyx_t_1 = (((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_segs.rcbuffer->pybuffer.buf, __pyx_t_7, __pyx_pybuffernd_segs.diminfo[0].strides)) < 0) != 0);
+  if (__pyx_t_1) {
+
+    /* "tombo/_c_helper.pyx":425
+ *             return 1
+ *     if segs[0] < 0:
+ *         return 2             # <<<<<<<<<<<<<<
+ *     if segs[n_segs - 1] > sig_len:
+ *         return 3
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_2);
+    __pyx_r = __pyx_int_2;
+    goto __pyx_L0;
+
+    /* "tombo/_c_helper.pyx":424
+ *         if segs[idx] <= segs[idx - 1]:
+ *             return 1
+ *     if segs[0] < 0:             # <<<<<<<<<<<<<<
+ *         return 2
+ *     if segs[n_segs - 1] > sig_len:
+ */
+  }
+
+  /* "tombo/_c_helper.pyx":426
+ *     if segs[0] < 0:
+ *         return 2
+ *     if segs[n_segs - 1] > sig_len:             # <<<<<<<<<<<<<<
+ *         return 3
+ *     return 0
+ */
+  __pyx_t_2 = (__pyx_v_n_segs - 1);
+  __pyx_t_1 = (((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_segs.rcbuffer->pybuffer.buf, __pyx_t_2, __pyx_pybuffernd_segs.diminfo[0].strides)) > __pyx_v_sig_len) != 0);
+  if (__pyx_t_1) {
+
+    /* "tombo/_c_helper.pyx":427
+ *         return 2
+ *     if segs[n_segs - 1] > sig_len:
+ *         return 3             # <<<<<<<<<<<<<<
+ *     return 0
+ * 
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __Pyx_INCREF(__pyx_int_3);
+    __pyx_r = __pyx_int_3;
+    goto __pyx_L0;
+
+    /* "tombo/_c_helper.pyx":426
+ *     if segs[0] < 0:
+ *         return 2
+ *     if segs[n_segs - 1] > sig_len:             # <<<<<<<<<<<<<<
+ *         return 3
+ *     return 0
+ */
+  }
+
+  /* "tombo/_c_helper.pyx":428
+ *     if segs[n_segs - 1] > sig_len:
+ *         return 3
+ *     return 0             # <<<<<<<<<<<<<<
+ * 
+ * @cython.wraparound(False)
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_int_0);
+  __pyx_r = __pyx_int_0;
+  goto __pyx_L0;
+
+  /* "tombo/_c_helper.pyx":410
+ * @cython.wraparound(False)
+ * @cython.boundscheck(False)
+ * def c_validate_segs(             # <<<<<<<<<<<<<<
+ *         np.ndarray[DTYPE_INT_t] segs not None, DTYPE_INT_t sig_len):
+ *     """
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_segs.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("tombo._c_helper.c_validate_segs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_segs.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "tombo/_c_helper.pyx":432
+ * @cython.wraparound(False)
+ * @cython.boundscheck(False)
+ * def c_stay_state_keep_idxs(np.ndarray[DTYPE_UINT8_t] moves not None):             # <<<<<<<<<<<<<<
+ *     """
+ *     Get indices of event starts to keep after clipping stay states from the
+ */
+
+/* Python wrapper */
+static PyObject *__pyx_pw_5tombo_9_c_helper_29c_stay_state_keep_idxs(PyObject *__pyx_self, PyObject *__pyx_v_moves); /*proto*/
+static char __pyx_doc_5tombo_9_c_helper_28c_stay_state_keep_idxs[] = "c_stay_state_keep_idxs(ndarray moves)\n\n    Get indices of event starts to keep after clipping stay states from the\n    start and end of a read and removing internal stay states. Basecalls are\n    kept at all but the last index. Returns None if the read is composed\n    entirely of stay states.\n    ";
+static PyMethodDef __pyx_mdef_5tombo_9_c_helper_29c_stay_state_keep_idxs = {"c_stay_state_keep_idxs", (PyCFunction)__pyx_pw_5tombo_9_c_helper_29c_stay_state_keep_idxs, METH_O, __pyx_doc_5tombo_9_c_helper_28c_stay_state_keep_idxs};
+static PyObject *__pyx_pw_5tombo_9_c_helper_29c_stay_state_keep_idxs(PyObject *__pyx_self, PyObject *__pyx_v_moves) {
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("c_stay_state_keep_idxs (wrapper)", 0);
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_moves), __pyx_ptype_5numpy_ndarray, 0, "moves", 0))) __PYX_ERR(0, 432, __pyx_L1_error)
+  __pyx_r = __pyx_pf_5tombo_9_c_helper_28c_stay_state_keep_idxs(__pyx_self, ((PyArrayObject *)__pyx_v_moves));
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_5tombo_9_c_helper_28c_stay_state_keep_idxs(CYTHON_UNUSED PyObject *__pyx_self, PyArrayObject *__pyx_v_moves) {
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_idx;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_k_idx;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_n_moves;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_start_clip;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_end_pos;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_v_n_keep;
+  PyArrayObject *__pyx_v_keep_idxs = 0;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_keep_idxs;
+  __Pyx_Buffer __pyx_pybuffer_keep_idxs;
+  __Pyx_LocalBuf_ND __pyx_pybuffernd_moves;
+  __Pyx_Buffer __pyx_pybuffer_moves;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_t_3;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_t_4;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_t_5;
+  __pyx_t_5tombo_9_c_helper_DTYPE_INT_t __pyx_t_6;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  PyObject *__pyx_t_10 = NULL;
+  PyArrayObject *__pyx_t_11 = NULL;
+  int __pyx_t_12;
+  PyObject *__pyx_t_13 = NULL;
+  PyObject *__pyx_t_14 = NULL;
+  PyObject *__pyx_t_15 = NULL;
+  Py_ssize_t __pyx_t_16;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("c_stay_state_keep_idxs", 0);
+  __pyx_pybuffer_keep_idxs.pybuffer.buf = NULL;
+  __pyx_pybuffer_keep_idxs.refcount = 0;
+  __pyx_pybuffernd_keep_idxs.data = NULL;
+  __pyx_pybuffernd_keep_idxs.rcbuffer = &__pyx_pybuffer_keep_idxs;
+  __pyx_pybuffer_moves.pybuffer.buf = NULL;
+  __pyx_pybuffer_moves.refcount = 0;
+  __pyx_pybuffernd_moves.data = NULL;
+  __pyx_pybuffernd_moves.rcbuffer = &__pyx_pybuffer_moves;
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_moves.rcbuffer->pybuffer, (PyObject*)__pyx_v_moves, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t, PyBUF_FORMAT| PyBUF_STRIDES, 1, 0, __pyx_stack) == -1)) __PYX_ERR(0, 432, __pyx_L1_error)
+  }
+  __pyx_pybuffernd_moves.diminfo[0].strides = __pyx_pybuffernd_moves.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_moves.diminfo[0].shape = __pyx_pybuffernd_moves.rcbuffer->pybuffer.shape[0];
+
+  /* "tombo/_c_helper.pyx":440
+ *     """
+ *     cdef DTYPE_INT_t idx, k_idx
+ *     cdef DTYPE_INT_t n_moves = moves.shape[0]             # <<<<<<<<<<<<<<
+ *     cdef DTYPE_INT_t start_clip = 0
+ *     cdef DTYPE_INT_t end_pos = n_moves
+ */
+  __pyx_v_n_moves = (__pyx_v_moves->dimensions[0]);
+
+  /* "tombo/_c_helper.pyx":441
+ *     cdef DTYPE_INT_t idx, k_idx
+ *     cdef DTYPE_INT_t n_moves = moves.shape[0]
+ *     cdef DTYPE_INT_t start_clip = 0             # <<<<<<<<<<<<<<
+ *     cdef DTYPE_INT_t end_pos = n_moves
+ *     cdef DTYPE_INT_t n_keep = 2
+ */
+  __pyx_v_start_clip = 0;
+
+  /* "tombo/_c_helper.pyx":442
+ *     cdef DTYPE_INT_t n_moves = moves.shape[0]
+ *     cdef DTYPE_INT_t start_clip = 0
+ *     cdef DTYPE_INT_t end_pos = n_moves             # <<<<<<<<<<<<<<
+ *     cdef DTYPE_INT_t n_keep = 2
+ *     cdef np.ndarray[DTYPE_INT_t] keep_idxs
+ */
+  __pyx_v_end_pos = __pyx_v_n_moves;
+
+  /* "tombo/_c_helper.pyx":443
+ *     cdef DTYPE_INT_t start_clip = 0
+ *     cdef DTYPE_INT_t end_pos = n_moves
+ *     cdef DTYPE_INT_t n_keep = 2             # <<<<<<<<<<<<<<
+ *     cdef np.ndarray[DTYPE_INT_t] keep_idxs
+ *     while start_clip < n_moves and moves[start_clip] == 0:
+ */
+  __pyx_v_n_keep = 2;
+
+  /* "tombo/_c_helper.pyx":445
+ *     cdef DTYPE_INT_t n_keep = 2
+ *     cdef np.ndarray[DTYPE_INT_t] keep_idxs
+ *     while start_clip < n_moves and moves[start_clip] == 0:             # <<<<<<<<<<<<<<
+ *         start_clip += 1
+ *     if start_clip == n_moves or (
+ */
+  while (1) {
+    __pyx_t_2 = ((__pyx_v_start_clip < __pyx_v_n_moves) != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L5_bool_binop_done;
+    }
+    __pyx_t_3 = __pyx_v_start_clip;
+    __pyx_t_2 = (((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t *, __pyx_pybuffernd_moves.rcbuffer->pybuffer.buf, __pyx_t_3, __pyx_pybuffernd_moves.diminfo[0].strides)) == 0) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L5_bool_binop_done:;
+    if (!__pyx_t_1) break;
+
+    /* "tombo/_c_helper.pyx":446
+ *     cdef np.ndarray[DTYPE_INT_t] keep_idxs
+ *     while start_clip < n_moves and moves[start_clip] == 0:
+ *         start_clip += 1             # <<<<<<<<<<<<<<
+ *     if start_clip == n_moves or (
+ *             start_clip > 0 and start_clip >= n_moves - 1):
+ */
+    __pyx_v_start_clip = (__pyx_v_start_clip + 1);
+  }
+
+  /* "tombo/_c_helper.pyx":447
+ *     while start_clip < n_moves and moves[start_clip] == 0:
+ *         start_clip += 1
+ *     if start_clip == n_moves or (             # <<<<<<<<<<<<<<
+ *             start_clip > 0 and start_clip >= n_moves - 1):
+ *         return None
+ */
+  __pyx_t_2 = ((__pyx_v_start_clip == __pyx_v_n_moves) != 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+
+  /* "tombo/_c_helper.pyx":448
+ *         start_clip += 1
+ *     if start_clip == n_moves or (
+ *             start_clip > 0 and start_clip >= n_moves - 1):             # <<<<<<<<<<<<<<
+ *         return None
+ *     while moves[end_pos - 1] == 0:
+ */
+  __pyx_t_2 = ((__pyx_v_start_clip > 0) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L8_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_start_clip >= (__pyx_v_n_moves - 1)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L8_bool_binop_done:;
+
+  /* "tombo/_c_helper.pyx":447
+ *     while start_clip < n_moves and moves[start_clip] == 0:
+ *         start_clip += 1
+ *     if start_clip == n_moves or (             # <<<<<<<<<<<<<<
+ *             start_clip > 0 and start_clip >= n_moves - 1):
+ *         return None
+ */
+  if (__pyx_t_1) {
+
+    /* "tombo/_c_helper.pyx":449
+ *     if start_clip == n_moves or (
+ *             start_clip > 0 and start_clip >= n_moves - 1):
+ *         return None             # <<<<<<<<<<<<<<
+ *     while moves[end_pos - 1] == 0:
+ *         end_pos -= 1
+ */
+    __Pyx_XDECREF(__pyx_r);
+    __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+    goto __pyx_L0;
+
+    /* "tombo/_c_helper.pyx":447
+ *     while start_clip < n_moves and moves[start_clip] == 0:
+ *         start_clip += 1
+ *     if start_clip == n_moves or (             # <<<<<<<<<<<<<<
+ *             start_clip > 0 and start_clip >= n_moves - 1):
+ *         return None
+ */
+  }
+
+  /* "tombo/_c_helper.pyx":450
+ *             start_clip > 0 and start_clip >= n_moves - 1):
+ *         return None
+ *     while moves[end_pos - 1] == 0:             # <<<<<<<<<<<<<<
+ *         end_pos -= 1
+ *     for idx in range(start_clip, end_pos):
+ */
+  while (1) {
+    __pyx_t_3 = (__pyx_v_end_pos - 1);
+    __pyx_t_1 = (((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t *, __pyx_pybuffernd_moves.rcbuffer->pybuffer.buf, __pyx_t_3, __pyx_pybuffernd_moves.diminfo[0].strides)) == 0) != 0);
+    if (!__pyx_t_1) break;
+
+    /* "tombo/_c_helper.pyx":451
+ *         return None
+ *     while moves[end_pos - 1] == 0:
+ *         end_pos -= 1             # <<<<<<<<<<<<<<
+ *     for idx in range(start_clip, end_pos):
+ *         if moves[idx] != 0:
+ */
+    __pyx_v_end_pos = (__pyx_v_end_pos - 1);
+  }
+
+  /* "tombo/_c_helper.pyx":452
+ *     while moves[end_pos - 1] == 0:
+ *         end_pos -= 1
+ *     for idx in range(start_clip, end_pos):             # <<<<<<<<<<<<<<
+ *         if moves[idx] != 0:
+ *             n_keep += 1
+ */
+  __pyx_t_3 = __pyx_v_end_pos;
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = __pyx_v_start_clip; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_idx = __pyx_t_5;
+
+    /* "tombo/_c_helper.pyx":453
+ *         end_pos -= 1
+ *     for idx in range(start_clip, end_pos):
+ *         if moves[idx] != 0:             # <<<<<<<<<<<<<<
+ *             n_keep += 1
+ *     keep_idxs = np.empty(n_keep, dtype=DTYPE_INT)
+ */
+    __pyx_t_6 = __pyx_v_idx;
+    __pyx_t_1 = (((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t *, __pyx_pybuffernd_moves.rcbuffer->pybuffer.buf, __pyx_t_6, __pyx_pybuffernd_moves.diminfo[0].strides)) != 0) != 0);
+    if (__pyx_t_1) {
+
+      /* "tombo/_c_helper.pyx":454
+ *     for idx in range(start_clip, end_pos):
+ *         if moves[idx] != 0:
+ *             n_keep += 1             # <<<<<<<<<<<<<<
+ *     keep_idxs = np.empty(n_keep, dtype=DTYPE_INT)
+ *     keep_idxs[0] = start_clip
+ */
+      __pyx_v_n_keep = (__pyx_v_n_keep + 1);
+
+      /* "tombo/_c_helper.pyx":453
+ *         end_pos -= 1
+ *     for idx in range(start_clip, end_pos):
+ *         if moves[idx] != 0:             # <<<<<<<<<<<<<<
+ *             n_keep += 1
+ *     keep_idxs = np.empty(n_keep, dtype=DTYPE_INT)
+ */
+    }
+  }
+
+  /* "tombo/_c_helper.pyx":455
+ *         if moves[idx] != 0:
+ *             n_keep += 1
+ *     keep_idxs = np.empty(n_keep, dtype=DTYPE_INT)             # <<<<<<<<<<<<<<
+ *     keep_idxs[0] = start_clip
+ *     k_idx = 1
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_7, __pyx_n_s_np); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 455, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = __Pyx_PyObject_GetAttrStr(__pyx_t_7, __pyx_n_s_empty); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 455, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyInt_From_npy_int64(__pyx_v_n_keep); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 455, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_9 = PyTuple_New(1); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 455, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_GIVEREF(__pyx_t_7);
+  PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7);
+  __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyDict_NewPresized(1); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 455, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __Pyx_GetModuleGlobalName(__pyx_t_10, __pyx_n_s_DTYPE_INT); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 455, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  if (PyDict_SetItem(__pyx_t_7, __pyx_n_s_dtype, __pyx_t_10) < 0) __PYX_ERR(0, 455, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
+  __pyx_t_10 = __Pyx_PyObject_Call(__pyx_t_8, __pyx_t_9, __pyx_t_7); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 455, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_10);
+  __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+  if (!(likely(((__pyx_t_10) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_10, __pyx_ptype_5numpy_ndarray))))) __PYX_ERR(0, 455, __pyx_L1_error)
+  __pyx_t_11 = ((PyArrayObject *)__pyx_t_10);
+  {
+    __Pyx_BufFmt_StackElem __pyx_stack[1];
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_keep_idxs.rcbuffer->pybuffer);
+    __pyx_t_12 = __Pyx_GetBufferAndValidate(&__pyx_pybuffernd_keep_idxs.rcbuffer->pybuffer, (PyObject*)__pyx_t_11, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack);
+    if (unlikely(__pyx_t_12 < 0)) {
+      PyErr_Fetch(&__pyx_t_13, &__pyx_t_14, &__pyx_t_15);
+      if (unlikely(__Pyx_GetBufferAndValidate(&__pyx_pybuffernd_keep_idxs.rcbuffer->pybuffer, (PyObject*)__pyx_v_keep_idxs, &__Pyx_TypeInfo_nn___pyx_t_5tombo_9_c_helper_DTYPE_INT_t, PyBUF_FORMAT| PyBUF_STRIDES| PyBUF_WRITABLE, 1, 0, __pyx_stack) == -1)) {
+        Py_XDECREF(__pyx_t_13); Py_XDECREF(__pyx_t_14); Py_XDECREF(__pyx_t_15);
+        __Pyx_RaiseBufferFallbackError();
+      } else {
+        PyErr_Restore(__pyx_t_13, __pyx_t_14, __pyx_t_15);
+      }
+      __pyx_t_13 = __pyx_t_14 = __pyx_t_15 = 0;
+    }
+    __pyx_pybuffernd_keep_idxs.diminfo[0].strides = __pyx_pybuffernd_keep_idxs.rcbuffer->pybuffer.strides[0]; __pyx_pybuffernd_keep_idxs.diminfo[0].shape = __pyx_pybuffernd_keep_idxs.rcbuffer->pybuffer.shape[0];
+    if (unlikely(__pyx_t_12 < 0)) __PYX_ERR(0, 455, __pyx_L1_error)
+  }
+  __pyx_t_11 = 0;
+  __pyx_v_keep_idxs = ((PyArrayObject *)__pyx_t_10);
+  __pyx_t_10 = 0;
+
+  /* "tombo/_c_helper.pyx":456
+ *             n_keep += 1
+ *     keep_idxs = np.empty(n_keep, dtype=DTYPE_INT)
+ *     keep_idxs[0] = start_clip             # <<<<<<<<<<<<<<
+ *     k_idx = 1
+ *     for idx in range(start_clip, end_pos):
+ */
+  __pyx_t_16 = 0;
+  *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_keep_idxs.rcbuffer->pybuffer.buf, __pyx_t_16, __pyx_pybuffernd_keep_idxs.diminfo[0].strides) = __pyx_v_start_clip;
+
+  /* "tombo/_c_helper.pyx":457
+ *     keep_idxs = np.empty(n_keep, dtype=DTYPE_INT)
+ *     keep_idxs[0] = start_clip
+ *     k_idx = 1             # <<<<<<<<<<<<<<
+ *     for idx in range(start_clip, end_pos):
+ *         if moves[idx] != 0:
+ */
+  __pyx_v_k_idx = 1;
+
+  /* "tombo/_c_helper.pyx":458
+ *     keep_idxs[0] = start_clip
+ *     k_idx = 1
+ *     for idx in range(start_clip, end_pos):             # <<<<<<<<<<<<<<
+ *         if moves[idx] != 0:
+ *             keep_idxs[k_idx] = idx + 1
+ */
+  __pyx_t_3 = __pyx_v_end_pos;
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = __pyx_v_start_clip; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_idx = __pyx_t_5;
+
+    /* "tombo/_c_helper.pyx":459
+ *     k_idx = 1
+ *     for idx in range(start_clip, end_pos):
+ *         if moves[idx] != 0:             # <<<<<<<<<<<<<<
+ *             keep_idxs[k_idx] = idx + 1
+ *             k_idx += 1
+ */
+    __pyx_t_6 = __pyx_v_idx;
+    __pyx_t_1 = (((*__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_UINT8_t *, __pyx_pybuffernd_moves.rcbuffer->pybuffer.buf, __pyx_t_6, __pyx_pybuffernd_moves.diminfo[0].strides)) != 0) != 0);
+    if (__pyx_t_1) {
+
+      /* "tombo/_c_helper.pyx":460
+ *     for idx in range(start_clip, end_pos):
+ *         if moves[idx] != 0:
+ *             keep_idxs[k_idx] = idx + 1             # <<<<<<<<<<<<<<
+ *             k_idx += 1
+ *     keep_idxs[k_idx] = end_pos + 1
+ */
+      __pyx_t_6 = __pyx_v_k_idx;
+      *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_keep_idxs.rcbuffer->pybuffer.buf, __pyx_t_6, __pyx_pybuffernd_keep_idxs.diminfo[0].strides) = (__pyx_v_idx + 1);
+
+      /* "tombo/_c_helper.pyx":461
+ *         if moves[idx] != 0:
+ *             keep_idxs[k_idx] = idx + 1
+ *             k_idx += 1             # <<<<<<<<<<<<<<
+ *     keep_idxs[k_idx] = end_pos + 1
+ *     return keep_idxs
+ */
+      __pyx_v_k_idx = (__pyx_v_k_idx + 1);
+
+      /* "tombo/_c_helper.pyx":459
+ *     k_idx = 1
+ *     for idx in range(start_clip, end_pos):
+ *         if moves[idx] != 0:             # <<<<<<<<<<<<<<
+ *             keep_idxs[k_idx] = idx + 1
+ *             k_idx += 1
+ */
+    }
+  }
+
+  /* "tombo/_c_helper.pyx":462
+ *             keep_idxs[k_idx] = idx + 1
+ *             k_idx += 1
+ *     keep_idxs[k_idx] = end_pos + 1             # <<<<<<<<<<<<<<
+ *     return keep_idxs
+ */
+  __pyx_t_3 = __pyx_v_k_idx;
+  *__Pyx_BufPtrStrided1d(__pyx_t_5tombo_9_c_helper_DTYPE_INT_t *, __pyx_pybuffernd_keep_idxs.rcbuffer->pybuffer.buf, __pyx_t_3, __pyx_pybuffernd_keep_idxs.diminfo[0].strides) = (__pyx_v_end_pos + 1);
+
+  /* "tombo/_c_helper.pyx":463
+ *             k_idx += 1
+ *     keep_idxs[k_idx] = end_pos + 1
+ *     return keep_idxs             # <<<<<<<<<<<<<<
+ */
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(((PyObject *)__pyx_v_keep_idxs));
+  __pyx_r = ((PyObject *)__pyx_v_keep_idxs);
+  goto __pyx_L0;
+
+  /* "tombo/_c_helper.pyx":432
+ * @cython.wraparound(False)
+ * @cython.boundscheck(False)
+ * def c_stay_state_keep_idxs(np.ndarray[DTYPE_UINT8_t] moves not None):             # <<<<<<<<<<<<<<
+ *     """
+ *     Get indices of event starts to keep after clipping stay states from the
+ */
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_XDECREF(__pyx_t_10);
+  { PyObject *__pyx_type, *__pyx_value, *__pyx_tb;
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&__pyx_type, &__pyx_value, &__pyx_tb);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_keep_idxs.rcbuffer->pybuffer);
+    __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_moves.rcbuffer->pybuffer);
+  __Pyx_ErrRestore(__pyx_type, __pyx_value, __pyx_tb);}
+  __Pyx_AddTraceback("tombo._c_helper.c_stay_state_keep_idxs", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  goto __pyx_L2;
+  __pyx_L0:;
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_keep_idxs.rcbuffer->pybuffer);
+  __Pyx_SafeReleaseBuffer(&__pyx_pybuffernd_moves.rcbuffer->pybuffer);
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_keep_idxs);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":258
+ *         # experimental exception made for __getbuffer__ and __releasebuffer__
+ *         # -- the details of this may change.
+ *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
+ *             # This implementation of getbuffer is geared towards Cython
+ *             # requirements, and does not yet fulfill the PEP.
+ */
+
+/* Python wrapper */
+static CYTHON_UNUSED int __pyx_pw_5numpy_7ndarray_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags); /*proto*/
+static CYTHON_UNUSED int __pyx_pw_5numpy_7ndarray_1__getbuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__getbuffer__ (wrapper)", 0);
+  __pyx_r = __pyx_pf_5numpy_7ndarray___getbuffer__(((PyArrayObject *)__pyx_v_self), ((Py_buffer *)__pyx_v_info), ((int)__pyx_v_flags));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_5numpy_7ndarray___getbuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info, int __pyx_v_flags) {
+  int __pyx_v_i;
+  int __pyx_v_ndim;
+  int __pyx_v_endian_detector;
+  int __pyx_v_little_endian;
+  int __pyx_v_t;
+  char *__pyx_v_f;
+  PyArray_Descr *__pyx_v_descr = 0;
+  int __pyx_v_offset;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  PyArray_Descr *__pyx_t_7;
+  PyObject *__pyx_t_8 = NULL;
+  char *__pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  if (__pyx_v_info == NULL) {
+    PyErr_SetString(PyExc_BufferError, "PyObject_GetBuffer: view==NULL argument is obsolete");
+    return -1;
+  }
+  __Pyx_RefNannySetupContext("__getbuffer__", 0);
+  __pyx_v_info->obj = Py_None; __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(__pyx_v_info->obj);
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":265
+ * 
+ *             cdef int i, ndim
+ *             cdef int endian_detector = 1             # <<<<<<<<<<<<<<
+ *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
+ * 
+ */
+  __pyx_v_endian_detector = 1;
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":266
+ *             cdef int i, ndim
+ *             cdef int endian_detector = 1
+ *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
+ * 
+ *             ndim = PyArray_NDIM(self)
+ */
+  __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":268
+ *             cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)
+ * 
+ *             ndim = PyArray_NDIM(self)             # <<<<<<<<<<<<<<
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ */
+  __pyx_v_ndim = PyArray_NDIM(__pyx_v_self);
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":270
+ *             ndim = PyArray_NDIM(self)
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ */
+  __pyx_t_2 = (((__pyx_v_flags & PyBUF_C_CONTIGUOUS) == PyBUF_C_CONTIGUOUS) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":271
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):             # <<<<<<<<<<<<<<
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ */
+  __pyx_t_2 = ((!(PyArray_CHKFLAGS(__pyx_v_self, NPY_ARRAY_C_CONTIGUOUS) != 0)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":270
+ *             ndim = PyArray_NDIM(self)
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ */
+  if (unlikely(__pyx_t_1)) {
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":272
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 272, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(1, 272, __pyx_L1_error)
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":270
+ *             ndim = PyArray_NDIM(self)
+ * 
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ */
+  }
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":274
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ */
+  __pyx_t_2 = (((__pyx_v_flags & PyBUF_F_CONTIGUOUS) == PyBUF_F_CONTIGUOUS) != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L7_bool_binop_done;
+  }
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":275
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):             # <<<<<<<<<<<<<<
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ * 
+ */
+  __pyx_t_2 = ((!(PyArray_CHKFLAGS(__pyx_v_self, NPY_ARRAY_F_CONTIGUOUS) != 0)) != 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L7_bool_binop_done:;
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":274
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ */
+  if (unlikely(__pyx_t_1)) {
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":276
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
+ * 
+ *             info.buf = PyArray_DATA(self)
+ */
+    __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 276, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_3);
+    __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+    __PYX_ERR(1, 276, __pyx_L1_error)
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":274
+ *                 raise ValueError(u"ndarray is not C contiguous")
+ * 
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)             # <<<<<<<<<<<<<<
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ */
+  }
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":278
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")
+ * 
+ *             info.buf = PyArray_DATA(self)             # <<<<<<<<<<<<<<
+ *             info.ndim = ndim
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ */
+  __pyx_v_info->buf = PyArray_DATA(__pyx_v_self);
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":279
+ * 
+ *             info.buf = PyArray_DATA(self)
+ *             info.ndim = ndim             # <<<<<<<<<<<<<<
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ *                 # Allocate new buffer for strides and shape info.
+ */
+  __pyx_v_info->ndim = __pyx_v_ndim;
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":280
+ *             info.buf = PyArray_DATA(self)
+ *             info.ndim = ndim
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
+ *                 # Allocate new buffer for strides and shape info.
+ *                 # This is allocated as one block, strides first.
+ */
+  __pyx_t_1 = (((sizeof(npy_intp)) != (sizeof(Py_ssize_t))) != 0);
+  if (__pyx_t_1) {
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":283
+ *                 # Allocate new buffer for strides and shape info.
+ *                 # This is allocated as one block, strides first.
+ *                 info.strides = <Py_ssize_t*>PyObject_Malloc(sizeof(Py_ssize_t) * 2 * <size_t>ndim)             # <<<<<<<<<<<<<<
+ *                 info.shape = info.strides + ndim
+ *                 for i in range(ndim):
+ */
+    __pyx_v_info->strides = ((Py_ssize_t *)PyObject_Malloc((((sizeof(Py_ssize_t)) * 2) * ((size_t)__pyx_v_ndim))));
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":284
+ *                 # This is allocated as one block, strides first.
+ *                 info.strides = <Py_ssize_t*>PyObject_Malloc(sizeof(Py_ssize_t) * 2 * <size_t>ndim)
+ *                 info.shape = info.strides + ndim             # <<<<<<<<<<<<<<
+ *                 for i in range(ndim):
+ *                     info.strides[i] = PyArray_STRIDES(self)[i]
+ */
+    __pyx_v_info->shape = (__pyx_v_info->strides + __pyx_v_ndim);
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":285
+ *                 info.strides = <Py_ssize_t*>PyObject_Malloc(sizeof(Py_ssize_t) * 2 * <size_t>ndim)
+ *                 info.shape = info.strides + ndim
+ *                 for i in range(ndim):             # <<<<<<<<<<<<<<
+ *                     info.strides[i] = PyArray_STRIDES(self)[i]
+ *                     info.shape[i] = PyArray_DIMS(self)[i]
+ */
+    __pyx_t_4 = __pyx_v_ndim;
+    __pyx_t_5 = __pyx_t_4;
+    for (__pyx_t_6 = 0; __pyx_t_6 < __pyx_t_5; __pyx_t_6+=1) {
+      __pyx_v_i = __pyx_t_6;
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":286
+ *                 info.shape = info.strides + ndim
+ *                 for i in range(ndim):
+ *                     info.strides[i] = PyArray_STRIDES(self)[i]             # <<<<<<<<<<<<<<
+ *                     info.shape[i] = PyArray_DIMS(self)[i]
+ *             else:
+ */
+      (__pyx_v_info->strides[__pyx_v_i]) = (PyArray_STRIDES(__pyx_v_self)[__pyx_v_i]);
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":287
+ *                 for i in range(ndim):
+ *                     info.strides[i] = PyArray_STRIDES(self)[i]
+ *                     info.shape[i] = PyArray_DIMS(self)[i]             # <<<<<<<<<<<<<<
+ *             else:
+ *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
+ */
+      (__pyx_v_info->shape[__pyx_v_i]) = (PyArray_DIMS(__pyx_v_self)[__pyx_v_i]);
+    }
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":280
+ *             info.buf = PyArray_DATA(self)
+ *             info.ndim = ndim
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
+ *                 # Allocate new buffer for strides and shape info.
+ *                 # This is allocated as one block, strides first.
+ */
+    goto __pyx_L9;
+  }
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":289
+ *                     info.shape[i] = PyArray_DIMS(self)[i]
+ *             else:
+ *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)             # <<<<<<<<<<<<<<
+ *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
+ *             info.suboffsets = NULL
+ */
+  /*else*/ {
+    __pyx_v_info->strides = ((Py_ssize_t *)PyArray_STRIDES(__pyx_v_self));
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":290
+ *             else:
+ *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
+ *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)             # <<<<<<<<<<<<<<
+ *             info.suboffsets = NULL
+ *             info.itemsize = PyArray_ITEMSIZE(self)
+ */
+    __pyx_v_info->shape = ((Py_ssize_t *)PyArray_DIMS(__pyx_v_self));
+  }
+  __pyx_L9:;
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":291
+ *                 info.strides = <Py_ssize_t*>PyArray_STRIDES(self)
+ *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
+ *             info.suboffsets = NULL             # <<<<<<<<<<<<<<
+ *             info.itemsize = PyArray_ITEMSIZE(self)
+ *             info.readonly = not PyArray_ISWRITEABLE(self)
+ */
+  __pyx_v_info->suboffsets = NULL;
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":292
+ *                 info.shape = <Py_ssize_t*>PyArray_DIMS(self)
+ *             info.suboffsets = NULL
+ *             info.itemsize = PyArray_ITEMSIZE(self)             # <<<<<<<<<<<<<<
+ *             info.readonly = not PyArray_ISWRITEABLE(self)
+ * 
+ */
+  __pyx_v_info->itemsize = PyArray_ITEMSIZE(__pyx_v_self);
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":293
+ *             info.suboffsets = NULL
+ *             info.itemsize = PyArray_ITEMSIZE(self)
+ *             info.readonly = not PyArray_ISWRITEABLE(self)             # <<<<<<<<<<<<<<
+ * 
+ *             cdef int t
+ */
+  __pyx_v_info->readonly = (!(PyArray_ISWRITEABLE(__pyx_v_self) != 0));
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":296
+ * 
+ *             cdef int t
+ *             cdef char* f = NULL             # <<<<<<<<<<<<<<
+ *             cdef dtype descr = <dtype>PyArray_DESCR(self)
+ *             cdef int offset
+ */
+  __pyx_v_f = NULL;
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":297
+ *             cdef int t
+ *             cdef char* f = NULL
+ *             cdef dtype descr = <dtype>PyArray_DESCR(self)             # <<<<<<<<<<<<<<
+ *             cdef int offset
+ * 
+ */
+  __pyx_t_7 = PyArray_DESCR(__pyx_v_self);
+  __pyx_t_3 = ((PyObject *)__pyx_t_7);
+  __Pyx_INCREF(__pyx_t_3);
+  __pyx_v_descr = ((PyArray_Descr *)__pyx_t_3);
+  __pyx_t_3 = 0;
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":300
+ *             cdef int offset
+ * 
+ *             info.obj = self             # <<<<<<<<<<<<<<
+ * 
+ *             if not PyDataType_HASFIELDS(descr):
+ */
+  __Pyx_INCREF(((PyObject *)__pyx_v_self));
+  __Pyx_GIVEREF(((PyObject *)__pyx_v_self));
+  __Pyx_GOTREF(__pyx_v_info->obj);
+  __Pyx_DECREF(__pyx_v_info->obj);
+  __pyx_v_info->obj = ((PyObject *)__pyx_v_self);
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":302
+ *             info.obj = self
+ * 
+ *             if not PyDataType_HASFIELDS(descr):             # <<<<<<<<<<<<<<
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or
+ */
+  __pyx_t_1 = ((!(PyDataType_HASFIELDS(__pyx_v_descr) != 0)) != 0);
+  if (__pyx_t_1) {
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":303
+ * 
+ *             if not PyDataType_HASFIELDS(descr):
+ *                 t = descr.type_num             # <<<<<<<<<<<<<<
+ *                 if ((descr.byteorder == c'>' and little_endian) or
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ */
+    __pyx_t_4 = __pyx_v_descr->type_num;
+    __pyx_v_t = __pyx_t_4;
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":304
+ *             if not PyDataType_HASFIELDS(descr):
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")
+ */
+    __pyx_t_2 = ((__pyx_v_descr->byteorder == '>') != 0);
+    if (!__pyx_t_2) {
+      goto __pyx_L15_next_or;
+    } else {
+    }
+    __pyx_t_2 = (__pyx_v_little_endian != 0);
+    if (!__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L14_bool_binop_done;
+    }
+    __pyx_L15_next_or:;
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":305
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or
+ *                     (descr.byteorder == c'<' and not little_endian)):             # <<<<<<<<<<<<<<
+ *                     raise ValueError(u"Non-native byte order not supported")
+ *                 if   t == NPY_BYTE:        f = "b"
+ */
+    __pyx_t_2 = ((__pyx_v_descr->byteorder == '<') != 0);
+    if (__pyx_t_2) {
+    } else {
+      __pyx_t_1 = __pyx_t_2;
+      goto __pyx_L14_bool_binop_done;
+    }
+    __pyx_t_2 = ((!(__pyx_v_little_endian != 0)) != 0);
+    __pyx_t_1 = __pyx_t_2;
+    __pyx_L14_bool_binop_done:;
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":304
+ *             if not PyDataType_HASFIELDS(descr):
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")
+ */
+    if (unlikely(__pyx_t_1)) {
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":306
+ *                 if ((descr.byteorder == c'>' and little_endian) or
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
+ *                 if   t == NPY_BYTE:        f = "b"
+ *                 elif t == NPY_UBYTE:       f = "B"
+ */
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 306, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(1, 306, __pyx_L1_error)
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":304
+ *             if not PyDataType_HASFIELDS(descr):
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")
+ */
+    }
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":307
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")
+ *                 if   t == NPY_BYTE:        f = "b"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_UBYTE:       f = "B"
+ *                 elif t == NPY_SHORT:       f = "h"
+ */
+    switch (__pyx_v_t) {
+      case NPY_BYTE:
+      __pyx_v_f = ((char *)"b");
+      break;
+      case NPY_UBYTE:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":308
+ *                     raise ValueError(u"Non-native byte order not supported")
+ *                 if   t == NPY_BYTE:        f = "b"
+ *                 elif t == NPY_UBYTE:       f = "B"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_SHORT:       f = "h"
+ *                 elif t == NPY_USHORT:      f = "H"
+ */
+      __pyx_v_f = ((char *)"B");
+      break;
+      case NPY_SHORT:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":309
+ *                 if   t == NPY_BYTE:        f = "b"
+ *                 elif t == NPY_UBYTE:       f = "B"
+ *                 elif t == NPY_SHORT:       f = "h"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_USHORT:      f = "H"
+ *                 elif t == NPY_INT:         f = "i"
+ */
+      __pyx_v_f = ((char *)"h");
+      break;
+      case NPY_USHORT:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":310
+ *                 elif t == NPY_UBYTE:       f = "B"
+ *                 elif t == NPY_SHORT:       f = "h"
+ *                 elif t == NPY_USHORT:      f = "H"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_INT:         f = "i"
+ *                 elif t == NPY_UINT:        f = "I"
+ */
+      __pyx_v_f = ((char *)"H");
+      break;
+      case NPY_INT:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":311
+ *                 elif t == NPY_SHORT:       f = "h"
+ *                 elif t == NPY_USHORT:      f = "H"
+ *                 elif t == NPY_INT:         f = "i"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_UINT:        f = "I"
+ *                 elif t == NPY_LONG:        f = "l"
+ */
+      __pyx_v_f = ((char *)"i");
+      break;
+      case NPY_UINT:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":312
+ *                 elif t == NPY_USHORT:      f = "H"
+ *                 elif t == NPY_INT:         f = "i"
+ *                 elif t == NPY_UINT:        f = "I"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_LONG:        f = "l"
+ *                 elif t == NPY_ULONG:       f = "L"
+ */
+      __pyx_v_f = ((char *)"I");
+      break;
+      case NPY_LONG:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":313
+ *                 elif t == NPY_INT:         f = "i"
+ *                 elif t == NPY_UINT:        f = "I"
+ *                 elif t == NPY_LONG:        f = "l"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_ULONG:       f = "L"
+ *                 elif t == NPY_LONGLONG:    f = "q"
+ */
+      __pyx_v_f = ((char *)"l");
+      break;
+      case NPY_ULONG:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":314
+ *                 elif t == NPY_UINT:        f = "I"
+ *                 elif t == NPY_LONG:        f = "l"
+ *                 elif t == NPY_ULONG:       f = "L"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_LONGLONG:    f = "q"
+ *                 elif t == NPY_ULONGLONG:   f = "Q"
+ */
+      __pyx_v_f = ((char *)"L");
+      break;
+      case NPY_LONGLONG:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":315
+ *                 elif t == NPY_LONG:        f = "l"
+ *                 elif t == NPY_ULONG:       f = "L"
+ *                 elif t == NPY_LONGLONG:    f = "q"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_ULONGLONG:   f = "Q"
+ *                 elif t == NPY_FLOAT:       f = "f"
+ */
+      __pyx_v_f = ((char *)"q");
+      break;
+      case NPY_ULONGLONG:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":316
+ *                 elif t == NPY_ULONG:       f = "L"
+ *                 elif t == NPY_LONGLONG:    f = "q"
+ *                 elif t == NPY_ULONGLONG:   f = "Q"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_FLOAT:       f = "f"
+ *                 elif t == NPY_DOUBLE:      f = "d"
+ */
+      __pyx_v_f = ((char *)"Q");
+      break;
+      case NPY_FLOAT:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":317
+ *                 elif t == NPY_LONGLONG:    f = "q"
+ *                 elif t == NPY_ULONGLONG:   f = "Q"
+ *                 elif t == NPY_FLOAT:       f = "f"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_DOUBLE:      f = "d"
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"
+ */
+      __pyx_v_f = ((char *)"f");
+      break;
+      case NPY_DOUBLE:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":318
+ *                 elif t == NPY_ULONGLONG:   f = "Q"
+ *                 elif t == NPY_FLOAT:       f = "f"
+ *                 elif t == NPY_DOUBLE:      f = "d"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"
+ *                 elif t == NPY_CFLOAT:      f = "Zf"
+ */
+      __pyx_v_f = ((char *)"d");
+      break;
+      case NPY_LONGDOUBLE:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":319
+ *                 elif t == NPY_FLOAT:       f = "f"
+ *                 elif t == NPY_DOUBLE:      f = "d"
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_CFLOAT:      f = "Zf"
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"
+ */
+      __pyx_v_f = ((char *)"g");
+      break;
+      case NPY_CFLOAT:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":320
+ *                 elif t == NPY_DOUBLE:      f = "d"
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"
+ *                 elif t == NPY_CFLOAT:      f = "Zf"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"
+ *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
+ */
+      __pyx_v_f = ((char *)"Zf");
+      break;
+      case NPY_CDOUBLE:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":321
+ *                 elif t == NPY_LONGDOUBLE:  f = "g"
+ *                 elif t == NPY_CFLOAT:      f = "Zf"
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
+ *                 elif t == NPY_OBJECT:      f = "O"
+ */
+      __pyx_v_f = ((char *)"Zd");
+      break;
+      case NPY_CLONGDOUBLE:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":322
+ *                 elif t == NPY_CFLOAT:      f = "Zf"
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"
+ *                 elif t == NPY_CLONGDOUBLE: f = "Zg"             # <<<<<<<<<<<<<<
+ *                 elif t == NPY_OBJECT:      f = "O"
+ *                 else:
+ */
+      __pyx_v_f = ((char *)"Zg");
+      break;
+      case NPY_OBJECT:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":323
+ *                 elif t == NPY_CDOUBLE:     f = "Zd"
+ *                 elif t == NPY_CLONGDOUBLE: f = "Zg"
+ *                 elif t == NPY_OBJECT:      f = "O"             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
+ */
+      __pyx_v_f = ((char *)"O");
+      break;
+      default:
+
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":325
+ *                 elif t == NPY_OBJECT:      f = "O"
+ *                 else:
+ *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
+ *                 info.format = f
+ *                 return
+ */
+      __pyx_t_3 = __Pyx_PyInt_From_int(__pyx_v_t); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 325, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_8 = PyUnicode_Format(__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_t_3); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 325, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_8);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_3 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_8); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 325, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+      __Pyx_Raise(__pyx_t_3, 0, 0, 0);
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __PYX_ERR(1, 325, __pyx_L1_error)
+      break;
+    }
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":326
+ *                 else:
+ *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
+ *                 info.format = f             # <<<<<<<<<<<<<<
+ *                 return
+ *             else:
+ */
+    __pyx_v_info->format = __pyx_v_f;
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":327
+ *                     raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
+ *                 info.format = f
+ *                 return             # <<<<<<<<<<<<<<
+ *             else:
+ *                 info.format = <char*>PyObject_Malloc(_buffer_format_string_len)
+ */
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":302
+ *             info.obj = self
+ * 
+ *             if not PyDataType_HASFIELDS(descr):             # <<<<<<<<<<<<<<
+ *                 t = descr.type_num
+ *                 if ((descr.byteorder == c'>' and little_endian) or
+ */
+  }
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":329
+ *                 return
+ *             else:
+ *                 info.format = <char*>PyObject_Malloc(_buffer_format_string_len)             # <<<<<<<<<<<<<<
+ *                 info.format[0] = c'^' # Native data types, manual alignment
+ *                 offset = 0
+ */
+  /*else*/ {
+    __pyx_v_info->format = ((char *)PyObject_Malloc(0xFF));
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":330
+ *             else:
+ *                 info.format = <char*>PyObject_Malloc(_buffer_format_string_len)
+ *                 info.format[0] = c'^' # Native data types, manual alignment             # <<<<<<<<<<<<<<
+ *                 offset = 0
+ *                 f = _util_dtypestring(descr, info.format + 1,
+ */
+    (__pyx_v_info->format[0]) = '^';
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":331
+ *                 info.format = <char*>PyObject_Malloc(_buffer_format_string_len)
+ *                 info.format[0] = c'^' # Native data types, manual alignment
+ *                 offset = 0             # <<<<<<<<<<<<<<
+ *                 f = _util_dtypestring(descr, info.format + 1,
+ *                                       info.format + _buffer_format_string_len,
+ */
+    __pyx_v_offset = 0;
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":332
+ *                 info.format[0] = c'^' # Native data types, manual alignment
+ *                 offset = 0
+ *                 f = _util_dtypestring(descr, info.format + 1,             # <<<<<<<<<<<<<<
+ *                                       info.format + _buffer_format_string_len,
+ *                                       &offset)
+ */
+    __pyx_t_9 = __pyx_f_5numpy__util_dtypestring(__pyx_v_descr, (__pyx_v_info->format + 1), (__pyx_v_info->format + 0xFF), (&__pyx_v_offset)); if (unlikely(__pyx_t_9 == ((char *)NULL))) __PYX_ERR(1, 332, __pyx_L1_error)
+    __pyx_v_f = __pyx_t_9;
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":335
+ *                                       info.format + _buffer_format_string_len,
+ *                                       &offset)
+ *                 f[0] = c'\0' # Terminate format string             # <<<<<<<<<<<<<<
+ * 
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):
+ */
+    (__pyx_v_f[0]) = '\x00';
+  }
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":258
+ *         # experimental exception made for __getbuffer__ and __releasebuffer__
+ *         # -- the details of this may change.
+ *         def __getbuffer__(ndarray self, Py_buffer* info, int flags):             # <<<<<<<<<<<<<<
+ *             # This implementation of getbuffer is geared towards Cython
+ *             # requirements, and does not yet fulfill the PEP.
+ */
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_AddTraceback("numpy.ndarray.__getbuffer__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  if (__pyx_v_info->obj != NULL) {
+    __Pyx_GOTREF(__pyx_v_info->obj);
+    __Pyx_DECREF(__pyx_v_info->obj); __pyx_v_info->obj = 0;
+  }
+  goto __pyx_L2;
+  __pyx_L0:;
+  if (__pyx_v_info->obj == Py_None) {
+    __Pyx_GOTREF(__pyx_v_info->obj);
+    __Pyx_DECREF(__pyx_v_info->obj); __pyx_v_info->obj = 0;
+  }
+  __pyx_L2:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_descr);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":337
+ *                 f[0] = c'\0' # Terminate format string
+ * 
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
+ *             if PyArray_HASFIELDS(self):
+ *                 PyObject_Free(info.format)
+ */
+
+/* Python wrapper */
+static CYTHON_UNUSED void __pyx_pw_5numpy_7ndarray_3__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info); /*proto*/
+static CYTHON_UNUSED void __pyx_pw_5numpy_7ndarray_3__releasebuffer__(PyObject *__pyx_v_self, Py_buffer *__pyx_v_info) {
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__releasebuffer__ (wrapper)", 0);
+  __pyx_pf_5numpy_7ndarray_2__releasebuffer__(((PyArrayObject *)__pyx_v_self), ((Py_buffer *)__pyx_v_info));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_5numpy_7ndarray_2__releasebuffer__(PyArrayObject *__pyx_v_self, Py_buffer *__pyx_v_info) {
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  __Pyx_RefNannySetupContext("__releasebuffer__", 0);
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":338
+ * 
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):
+ *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
+ *                 PyObject_Free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ */
+  __pyx_t_1 = (PyArray_HASFIELDS(__pyx_v_self) != 0);
+  if (__pyx_t_1) {
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":339
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):
+ *             if PyArray_HASFIELDS(self):
+ *                 PyObject_Free(info.format)             # <<<<<<<<<<<<<<
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ *                 PyObject_Free(info.strides)
+ */
+    PyObject_Free(__pyx_v_info->format);
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":338
+ * 
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):
+ *             if PyArray_HASFIELDS(self):             # <<<<<<<<<<<<<<
+ *                 PyObject_Free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ */
+  }
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":340
+ *             if PyArray_HASFIELDS(self):
+ *                 PyObject_Free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
+ *                 PyObject_Free(info.strides)
+ *                 # info.shape was stored after info.strides in the same block
+ */
+  __pyx_t_1 = (((sizeof(npy_intp)) != (sizeof(Py_ssize_t))) != 0);
+  if (__pyx_t_1) {
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":341
+ *                 PyObject_Free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):
+ *                 PyObject_Free(info.strides)             # <<<<<<<<<<<<<<
+ *                 # info.shape was stored after info.strides in the same block
+ * 
+ */
+    PyObject_Free(__pyx_v_info->strides);
+
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":340
+ *             if PyArray_HASFIELDS(self):
+ *                 PyObject_Free(info.format)
+ *             if sizeof(npy_intp) != sizeof(Py_ssize_t):             # <<<<<<<<<<<<<<
+ *                 PyObject_Free(info.strides)
+ *                 # info.shape was stored after info.strides in the same block
+ */
+  }
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":337
+ *                 f[0] = c'\0' # Terminate format string
+ * 
+ *         def __releasebuffer__(ndarray self, Py_buffer* info):             # <<<<<<<<<<<<<<
+ *             if PyArray_HASFIELDS(self):
+ *                 PyObject_Free(info.format)
+ */
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":820
+ * ctypedef npy_cdouble     complex_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
  *     return PyArray_MultiIterNew(1, <void*>a)
@@ -8993,7 +11022,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew1", 0);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":743
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":821
  * 
  * cdef inline object PyArray_MultiIterNew1(a):
  *     return PyArray_MultiIterNew(1, <void*>a)             # <<<<<<<<<<<<<<
@@ -9001,13 +11030,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
  * cdef inline object PyArray_MultiIterNew2(a, b):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 743, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(1, ((void *)__pyx_v_a)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 821, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":742
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":820
  * ctypedef npy_cdouble     complex_t
  * 
  * cdef inline object PyArray_MultiIterNew1(a):             # <<<<<<<<<<<<<<
@@ -9026,7 +11055,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew1(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":745
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":823
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -9043,7 +11072,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew2", 0);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":746
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":824
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)             # <<<<<<<<<<<<<<
@@ -9051,13 +11080,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 746, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(2, ((void *)__pyx_v_a), ((void *)__pyx_v_b)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 824, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":745
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":823
  *     return PyArray_MultiIterNew(1, <void*>a)
  * 
  * cdef inline object PyArray_MultiIterNew2(a, b):             # <<<<<<<<<<<<<<
@@ -9076,7 +11105,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew2(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":748
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":826
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -9093,7 +11122,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew3", 0);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":749
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":827
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)             # <<<<<<<<<<<<<<
@@ -9101,13 +11130,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 749, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(3, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 827, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":748
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":826
  *     return PyArray_MultiIterNew(2, <void*>a, <void*>b)
  * 
  * cdef inline object PyArray_MultiIterNew3(a, b, c):             # <<<<<<<<<<<<<<
@@ -9126,7 +11155,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew3(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":751
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":829
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -9143,7 +11172,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew4", 0);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":752
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":830
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)             # <<<<<<<<<<<<<<
@@ -9151,13 +11180,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 752, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(4, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 830, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":751
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":829
  *     return PyArray_MultiIterNew(3, <void*>a, <void*>b, <void*> c)
  * 
  * cdef inline object PyArray_MultiIterNew4(a, b, c, d):             # <<<<<<<<<<<<<<
@@ -9176,7 +11205,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew4(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":754
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":832
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -9193,7 +11222,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("PyArray_MultiIterNew5", 0);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":755
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":833
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)             # <<<<<<<<<<<<<<
@@ -9201,13 +11230,13 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  */
   __Pyx_XDECREF(__pyx_r);
-  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 755, __pyx_L1_error)
+  __pyx_t_1 = PyArray_MultiIterNew(5, ((void *)__pyx_v_a), ((void *)__pyx_v_b), ((void *)__pyx_v_c), ((void *)__pyx_v_d), ((void *)__pyx_v_e)); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 833, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_r = __pyx_t_1;
   __pyx_t_1 = 0;
   goto __pyx_L0;
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":754
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":832
  *     return PyArray_MultiIterNew(4, <void*>a, <void*>b, <void*>c, <void*> d)
  * 
  * cdef inline object PyArray_MultiIterNew5(a, b, c, d, e):             # <<<<<<<<<<<<<<
@@ -9226,7 +11255,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyArray_MultiIterNew5(PyObject *__
   return __pyx_r;
 }
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":757
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":835
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
@@ -9240,7 +11269,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("PyDataType_SHAPE", 0);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":758
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":836
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
@@ -9250,7 +11279,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   __pyx_t_1 = (PyDataType_HASSUBARRAY(__pyx_v_d) != 0);
   if (__pyx_t_1) {
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":759
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":837
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):
  *         return <tuple>d.subarray.shape             # <<<<<<<<<<<<<<
@@ -9262,7 +11291,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
     __pyx_r = ((PyObject*)__pyx_v_d->subarray->shape);
     goto __pyx_L0;
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":758
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":836
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):
  *     if PyDataType_HASSUBARRAY(d):             # <<<<<<<<<<<<<<
@@ -9271,7 +11300,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
  */
   }
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":761
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":839
  *         return <tuple>d.subarray.shape
  *     else:
  *         return ()             # <<<<<<<<<<<<<<
@@ -9285,7 +11314,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
     goto __pyx_L0;
   }
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":757
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":835
  *     return PyArray_MultiIterNew(5, <void*>a, <void*>b, <void*>c, <void*> d, <void*> e)
  * 
  * cdef inline tuple PyDataType_SHAPE(dtype d):             # <<<<<<<<<<<<<<
@@ -9300,7 +11329,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_PyDataType_SHAPE(PyArray_Descr *__
   return __pyx_r;
 }
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":763
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":841
  *         return ()
  * 
  * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
@@ -9332,7 +11361,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("_util_dtypestring", 0);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":768
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":846
  * 
  *     cdef dtype child
  *     cdef int endian_detector = 1             # <<<<<<<<<<<<<<
@@ -9341,7 +11370,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_endian_detector = 1;
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":769
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":847
  *     cdef dtype child
  *     cdef int endian_detector = 1
  *     cdef bint little_endian = ((<char*>&endian_detector)[0] != 0)             # <<<<<<<<<<<<<<
@@ -9350,7 +11379,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   __pyx_v_little_endian = ((((char *)(&__pyx_v_endian_detector))[0]) != 0);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":772
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":850
  *     cdef tuple fields
  * 
  *     for childname in descr.names:             # <<<<<<<<<<<<<<
@@ -9359,21 +11388,21 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
   if (unlikely(__pyx_v_descr->names == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-    __PYX_ERR(1, 772, __pyx_L1_error)
+    __PYX_ERR(1, 850, __pyx_L1_error)
   }
   __pyx_t_1 = __pyx_v_descr->names; __Pyx_INCREF(__pyx_t_1); __pyx_t_2 = 0;
   for (;;) {
     if (__pyx_t_2 >= PyTuple_GET_SIZE(__pyx_t_1)) break;
     #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-    __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(1, 772, __pyx_L1_error)
+    __pyx_t_3 = PyTuple_GET_ITEM(__pyx_t_1, __pyx_t_2); __Pyx_INCREF(__pyx_t_3); __pyx_t_2++; if (unlikely(0 < 0)) __PYX_ERR(1, 850, __pyx_L1_error)
     #else
-    __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 772, __pyx_L1_error)
+    __pyx_t_3 = PySequence_ITEM(__pyx_t_1, __pyx_t_2); __pyx_t_2++; if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 850, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     #endif
     __Pyx_XDECREF_SET(__pyx_v_childname, __pyx_t_3);
     __pyx_t_3 = 0;
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":773
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":851
  * 
  *     for childname in descr.names:
  *         fields = descr.fields[childname]             # <<<<<<<<<<<<<<
@@ -9382,15 +11411,15 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     if (unlikely(__pyx_v_descr->fields == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-      __PYX_ERR(1, 773, __pyx_L1_error)
+      __PYX_ERR(1, 851, __pyx_L1_error)
     }
-    __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_descr->fields, __pyx_v_childname); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 773, __pyx_L1_error)
+    __pyx_t_3 = __Pyx_PyDict_GetItem(__pyx_v_descr->fields, __pyx_v_childname); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 851, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
-    if (!(likely(PyTuple_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_t_3)->tp_name), 0))) __PYX_ERR(1, 773, __pyx_L1_error)
+    if (!(likely(PyTuple_CheckExact(__pyx_t_3))||((__pyx_t_3) == Py_None)||(PyErr_Format(PyExc_TypeError, "Expected %.16s, got %.200s", "tuple", Py_TYPE(__pyx_t_3)->tp_name), 0))) __PYX_ERR(1, 851, __pyx_L1_error)
     __Pyx_XDECREF_SET(__pyx_v_fields, ((PyObject*)__pyx_t_3));
     __pyx_t_3 = 0;
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":774
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":852
  *     for childname in descr.names:
  *         fields = descr.fields[childname]
  *         child, new_offset = fields             # <<<<<<<<<<<<<<
@@ -9403,7 +11432,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       if (unlikely(size != 2)) {
         if (size > 2) __Pyx_RaiseTooManyValuesError(2);
         else if (size >= 0) __Pyx_RaiseNeedMoreValuesError(size);
-        __PYX_ERR(1, 774, __pyx_L1_error)
+        __PYX_ERR(1, 852, __pyx_L1_error)
       }
       #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
       __pyx_t_3 = PyTuple_GET_ITEM(sequence, 0); 
@@ -9411,51 +11440,51 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __Pyx_INCREF(__pyx_t_3);
       __Pyx_INCREF(__pyx_t_4);
       #else
-      __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 774, __pyx_L1_error)
+      __pyx_t_3 = PySequence_ITEM(sequence, 0); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 852, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 774, __pyx_L1_error)
+      __pyx_t_4 = PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 852, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       #endif
     } else {
-      __Pyx_RaiseNoneNotIterableError(); __PYX_ERR(1, 774, __pyx_L1_error)
+      __Pyx_RaiseNoneNotIterableError(); __PYX_ERR(1, 852, __pyx_L1_error)
     }
-    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_dtype))))) __PYX_ERR(1, 774, __pyx_L1_error)
+    if (!(likely(((__pyx_t_3) == Py_None) || likely(__Pyx_TypeTest(__pyx_t_3, __pyx_ptype_5numpy_dtype))))) __PYX_ERR(1, 852, __pyx_L1_error)
     __Pyx_XDECREF_SET(__pyx_v_child, ((PyArray_Descr *)__pyx_t_3));
     __pyx_t_3 = 0;
     __Pyx_XDECREF_SET(__pyx_v_new_offset, __pyx_t_4);
     __pyx_t_4 = 0;
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":776
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":854
  *         child, new_offset = fields
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  */
-    __pyx_t_4 = __Pyx_PyInt_From_int((__pyx_v_offset[0])); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 776, __pyx_L1_error)
+    __pyx_t_4 = __Pyx_PyInt_From_int((__pyx_v_offset[0])); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 854, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_3 = PyNumber_Subtract(__pyx_v_new_offset, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 776, __pyx_L1_error)
+    __pyx_t_3 = PyNumber_Subtract(__pyx_v_new_offset, __pyx_t_4); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 854, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_3);
     __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-    __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 776, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyInt_As_int(__pyx_t_3); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 854, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
     __pyx_t_6 = ((((__pyx_v_end - __pyx_v_f) - ((int)__pyx_t_5)) < 15) != 0);
     if (unlikely(__pyx_t_6)) {
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":777
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":855
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__5, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 777, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 855, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(1, 777, __pyx_L1_error)
+      __PYX_ERR(1, 855, __pyx_L1_error)
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":776
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":854
  *         child, new_offset = fields
  * 
  *         if (end - f) - <int>(new_offset - offset[0]) < 15:             # <<<<<<<<<<<<<<
@@ -9464,7 +11493,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     }
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":779
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":857
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -9484,7 +11513,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     }
     __pyx_L8_next_or:;
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":780
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":858
  * 
  *         if ((child.byteorder == c'>' and little_endian) or
  *             (child.byteorder == c'<' and not little_endian)):             # <<<<<<<<<<<<<<
@@ -9501,7 +11530,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = __pyx_t_7;
     __pyx_L7_bool_binop_done:;
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":779
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":857
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -9510,20 +11539,20 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     if (unlikely(__pyx_t_6)) {
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":781
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":859
  *         if ((child.byteorder == c'>' and little_endian) or
  *             (child.byteorder == c'<' and not little_endian)):
  *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
  *             # One could encode it in the format string and have Cython
  *             # complain instead, BUT: < and > in format strings also imply
  */
-      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__6, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 781, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyObject_Call(__pyx_builtin_ValueError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 859, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
       __Pyx_Raise(__pyx_t_3, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __PYX_ERR(1, 781, __pyx_L1_error)
+      __PYX_ERR(1, 859, __pyx_L1_error)
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":779
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":857
  *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")
  * 
  *         if ((child.byteorder == c'>' and little_endian) or             # <<<<<<<<<<<<<<
@@ -9532,7 +11561,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
     }
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":791
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":869
  * 
  *         # Output padding bytes
  *         while offset[0] < new_offset:             # <<<<<<<<<<<<<<
@@ -9540,15 +11569,15 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  *             f += 1
  */
     while (1) {
-      __pyx_t_3 = __Pyx_PyInt_From_int((__pyx_v_offset[0])); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 791, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyInt_From_int((__pyx_v_offset[0])); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 869, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_t_3, __pyx_v_new_offset, Py_LT); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 791, __pyx_L1_error)
+      __pyx_t_4 = PyObject_RichCompare(__pyx_t_3, __pyx_v_new_offset, Py_LT); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 869, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 791, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 869, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (!__pyx_t_6) break;
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":792
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":870
  *         # Output padding bytes
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte             # <<<<<<<<<<<<<<
@@ -9557,7 +11586,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       (__pyx_v_f[0]) = 0x78;
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":793
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":871
  *         while offset[0] < new_offset:
  *             f[0] = 120 # "x"; pad byte
  *             f += 1             # <<<<<<<<<<<<<<
@@ -9566,7 +11595,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_v_f = (__pyx_v_f + 1);
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":794
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":872
  *             f[0] = 120 # "x"; pad byte
  *             f += 1
  *             offset[0] += 1             # <<<<<<<<<<<<<<
@@ -9577,7 +11606,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       (__pyx_v_offset[__pyx_t_8]) = ((__pyx_v_offset[__pyx_t_8]) + 1);
     }
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":796
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":874
  *             offset[0] += 1
  * 
  *         offset[0] += child.itemsize             # <<<<<<<<<<<<<<
@@ -9587,7 +11616,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_8 = 0;
     (__pyx_v_offset[__pyx_t_8]) = ((__pyx_v_offset[__pyx_t_8]) + __pyx_v_child->elsize);
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":798
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":876
  *         offset[0] += child.itemsize
  * 
  *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
@@ -9597,19 +11626,19 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
     __pyx_t_6 = ((!(PyDataType_HASFIELDS(__pyx_v_child) != 0)) != 0);
     if (__pyx_t_6) {
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":799
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":877
  * 
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num             # <<<<<<<<<<<<<<
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")
  */
-      __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_child->type_num); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 799, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyInt_From_int(__pyx_v_child->type_num); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 877, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
       __Pyx_XDECREF_SET(__pyx_v_t, __pyx_t_4);
       __pyx_t_4 = 0;
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":800
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":878
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num
  *             if end - f < 5:             # <<<<<<<<<<<<<<
@@ -9619,20 +11648,20 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       __pyx_t_6 = (((__pyx_v_end - __pyx_v_f) < 5) != 0);
       if (unlikely(__pyx_t_6)) {
 
-        /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":801
+        /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":879
  *             t = child.type_num
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__7, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 801, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyObject_Call(__pyx_builtin_RuntimeError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 879, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_Raise(__pyx_t_4, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __PYX_ERR(1, 801, __pyx_L1_error)
+        __PYX_ERR(1, 879, __pyx_L1_error)
 
-        /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":800
+        /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":878
  *         if not PyDataType_HASFIELDS(child):
  *             t = child.type_num
  *             if end - f < 5:             # <<<<<<<<<<<<<<
@@ -9641,252 +11670,252 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":804
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":882
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"             # <<<<<<<<<<<<<<
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  */
-      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_BYTE); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 804, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_BYTE); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 882, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 804, __pyx_L1_error)
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 882, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 804, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 882, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 98;
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":805
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":883
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"             # <<<<<<<<<<<<<<
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  */
-      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_UBYTE); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 805, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_UBYTE); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 883, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 805, __pyx_L1_error)
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 883, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 805, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 883, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 66;
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":806
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":884
  *             if   t == NPY_BYTE:        f[0] =  98 #"b"
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"             # <<<<<<<<<<<<<<
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  */
-      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_SHORT); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 806, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_SHORT); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 884, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 806, __pyx_L1_error)
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 884, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 806, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 884, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 0x68;
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":807
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":885
  *             elif t == NPY_UBYTE:       f[0] =  66 #"B"
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"             # <<<<<<<<<<<<<<
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  */
-      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_USHORT); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 807, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_USHORT); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 885, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 807, __pyx_L1_error)
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 885, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 807, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 885, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 72;
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":808
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":886
  *             elif t == NPY_SHORT:       f[0] = 104 #"h"
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"             # <<<<<<<<<<<<<<
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  */
-      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_INT); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 808, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_INT); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 886, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 808, __pyx_L1_error)
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 886, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 808, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 886, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 0x69;
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":809
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":887
  *             elif t == NPY_USHORT:      f[0] =  72 #"H"
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"             # <<<<<<<<<<<<<<
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  */
-      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_UINT); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 809, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_UINT); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 887, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 809, __pyx_L1_error)
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 887, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 809, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 887, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 73;
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":810
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":888
  *             elif t == NPY_INT:         f[0] = 105 #"i"
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"             # <<<<<<<<<<<<<<
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  */
-      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_LONG); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 810, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_LONG); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 888, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 810, __pyx_L1_error)
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 888, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 810, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 888, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 0x6C;
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":811
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":889
  *             elif t == NPY_UINT:        f[0] =  73 #"I"
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"             # <<<<<<<<<<<<<<
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  */
-      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_ULONG); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 811, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_ULONG); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 889, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 811, __pyx_L1_error)
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 889, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 811, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 889, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 76;
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":812
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":890
  *             elif t == NPY_LONG:        f[0] = 108 #"l"
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"             # <<<<<<<<<<<<<<
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  */
-      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_LONGLONG); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 812, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_LONGLONG); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 890, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 812, __pyx_L1_error)
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 890, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 812, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 890, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 0x71;
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":813
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":891
  *             elif t == NPY_ULONG:       f[0] = 76  #"L"
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"             # <<<<<<<<<<<<<<
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  */
-      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_ULONGLONG); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 813, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_ULONGLONG); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 891, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 813, __pyx_L1_error)
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 891, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 813, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 891, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 81;
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":814
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":892
  *             elif t == NPY_LONGLONG:    f[0] = 113 #"q"
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"             # <<<<<<<<<<<<<<
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  */
-      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_FLOAT); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 814, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_FLOAT); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 892, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 814, __pyx_L1_error)
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 892, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 814, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 892, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 0x66;
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":815
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":893
  *             elif t == NPY_ULONGLONG:   f[0] = 81  #"Q"
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"             # <<<<<<<<<<<<<<
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  */
-      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_DOUBLE); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 815, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_DOUBLE); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 893, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 815, __pyx_L1_error)
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 893, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 815, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 893, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 0x64;
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":816
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":894
  *             elif t == NPY_FLOAT:       f[0] = 102 #"f"
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"             # <<<<<<<<<<<<<<
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  */
-      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_LONGDOUBLE); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 816, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_LONGDOUBLE); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 894, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 816, __pyx_L1_error)
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 894, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 816, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 894, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 0x67;
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":817
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":895
  *             elif t == NPY_DOUBLE:      f[0] = 100 #"d"
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf             # <<<<<<<<<<<<<<
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
  */
-      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_CFLOAT); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 817, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_CFLOAT); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 895, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 817, __pyx_L1_error)
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 895, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 817, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 895, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 90;
@@ -9895,18 +11924,18 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":818
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":896
  *             elif t == NPY_LONGDOUBLE:  f[0] = 103 #"g"
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd             # <<<<<<<<<<<<<<
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
  */
-      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_CDOUBLE); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 818, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_CDOUBLE); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 896, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 818, __pyx_L1_error)
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 896, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 818, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 896, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 90;
@@ -9915,18 +11944,18 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":819
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":897
  *             elif t == NPY_CFLOAT:      f[0] = 90; f[1] = 102; f += 1 # Zf
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg             # <<<<<<<<<<<<<<
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
  *             else:
  */
-      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_CLONGDOUBLE); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 819, __pyx_L1_error)
+      __pyx_t_3 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_CLONGDOUBLE); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 897, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_3);
-      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 819, __pyx_L1_error)
+      __pyx_t_4 = PyObject_RichCompare(__pyx_v_t, __pyx_t_3, Py_EQ); __Pyx_XGOTREF(__pyx_t_4); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 897, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 819, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_4); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 897, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
       if (__pyx_t_6) {
         (__pyx_v_f[0]) = 90;
@@ -9935,25 +11964,25 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":820
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":898
  *             elif t == NPY_CDOUBLE:     f[0] = 90; f[1] = 100; f += 1 # Zd
  *             elif t == NPY_CLONGDOUBLE: f[0] = 90; f[1] = 103; f += 1 # Zg
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"             # <<<<<<<<<<<<<<
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  */
-      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_OBJECT); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 820, __pyx_L1_error)
+      __pyx_t_4 = __Pyx_PyInt_From_enum__NPY_TYPES(NPY_OBJECT); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 898, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 820, __pyx_L1_error)
+      __pyx_t_3 = PyObject_RichCompare(__pyx_v_t, __pyx_t_4, Py_EQ); __Pyx_XGOTREF(__pyx_t_3); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 898, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 820, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyObject_IsTrue(__pyx_t_3); if (unlikely(__pyx_t_6 < 0)) __PYX_ERR(1, 898, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (likely(__pyx_t_6)) {
         (__pyx_v_f[0]) = 79;
         goto __pyx_L15;
       }
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":822
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":900
  *             elif t == NPY_OBJECT:      f[0] = 79 #"O"
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)             # <<<<<<<<<<<<<<
@@ -9961,18 +11990,18 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  *         else:
  */
       /*else*/ {
-        __pyx_t_3 = __Pyx_PyUnicode_FormatSafe(__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_v_t); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 822, __pyx_L1_error)
+        __pyx_t_3 = __Pyx_PyUnicode_FormatSafe(__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_v_t); if (unlikely(!__pyx_t_3)) __PYX_ERR(1, 900, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_3);
-        __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 822, __pyx_L1_error)
+        __pyx_t_4 = __Pyx_PyObject_CallOneArg(__pyx_builtin_ValueError, __pyx_t_3); if (unlikely(!__pyx_t_4)) __PYX_ERR(1, 900, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_4);
         __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
         __Pyx_Raise(__pyx_t_4, 0, 0, 0);
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __PYX_ERR(1, 822, __pyx_L1_error)
+        __PYX_ERR(1, 900, __pyx_L1_error)
       }
       __pyx_L15:;
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":823
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":901
  *             else:
  *                 raise ValueError(u"unknown dtype code in numpy.pxd (%d)" % t)
  *             f += 1             # <<<<<<<<<<<<<<
@@ -9981,7 +12010,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  */
       __pyx_v_f = (__pyx_v_f + 1);
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":798
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":876
  *         offset[0] += child.itemsize
  * 
  *         if not PyDataType_HASFIELDS(child):             # <<<<<<<<<<<<<<
@@ -9991,7 +12020,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
       goto __pyx_L13;
     }
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":827
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":905
  *             # Cython ignores struct boundary information ("T{...}"),
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)             # <<<<<<<<<<<<<<
@@ -9999,12 +12028,12 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
  * 
  */
     /*else*/ {
-      __pyx_t_9 = __pyx_f_5numpy__util_dtypestring(__pyx_v_child, __pyx_v_f, __pyx_v_end, __pyx_v_offset); if (unlikely(__pyx_t_9 == ((char *)NULL))) __PYX_ERR(1, 827, __pyx_L1_error)
+      __pyx_t_9 = __pyx_f_5numpy__util_dtypestring(__pyx_v_child, __pyx_v_f, __pyx_v_end, __pyx_v_offset); if (unlikely(__pyx_t_9 == ((char *)NULL))) __PYX_ERR(1, 905, __pyx_L1_error)
       __pyx_v_f = __pyx_t_9;
     }
     __pyx_L13:;
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":772
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":850
  *     cdef tuple fields
  * 
  *     for childname in descr.names:             # <<<<<<<<<<<<<<
@@ -10014,7 +12043,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   }
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":828
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":906
  *             # so don't output it
  *             f = _util_dtypestring(child, f, end, offset)
  *     return f             # <<<<<<<<<<<<<<
@@ -10024,7 +12053,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   __pyx_r = __pyx_v_f;
   goto __pyx_L0;
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":763
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":841
  *         return ()
  * 
  * cdef inline char* _util_dtypestring(dtype descr, char* f, char* end, int* offset) except NULL:             # <<<<<<<<<<<<<<
@@ -10049,7 +12078,7 @@ static CYTHON_INLINE char *__pyx_f_5numpy__util_dtypestring(PyArray_Descr *__pyx
   return __pyx_r;
 }
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":943
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1021
  *     int _import_umath() except -1
  * 
  * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
@@ -10061,7 +12090,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("set_array_base", 0);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":944
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1022
  * 
  * cdef inline void set_array_base(ndarray arr, object base):
  *     Py_INCREF(base) # important to do this before stealing the reference below!             # <<<<<<<<<<<<<<
@@ -10070,7 +12099,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   Py_INCREF(__pyx_v_base);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":945
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1023
  * cdef inline void set_array_base(ndarray arr, object base):
  *     Py_INCREF(base) # important to do this before stealing the reference below!
  *     PyArray_SetBaseObject(arr, base)             # <<<<<<<<<<<<<<
@@ -10079,7 +12108,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
  */
   (void)(PyArray_SetBaseObject(__pyx_v_arr, __pyx_v_base));
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":943
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1021
  *     int _import_umath() except -1
  * 
  * cdef inline void set_array_base(ndarray arr, object base):             # <<<<<<<<<<<<<<
@@ -10091,7 +12120,7 @@ static CYTHON_INLINE void __pyx_f_5numpy_set_array_base(PyArrayObject *__pyx_v_a
   __Pyx_RefNannyFinishContext();
 }
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":947
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1025
  *     PyArray_SetBaseObject(arr, base)
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -10106,7 +12135,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   int __pyx_t_1;
   __Pyx_RefNannySetupContext("get_array_base", 0);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":948
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1026
  * 
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)             # <<<<<<<<<<<<<<
@@ -10115,7 +12144,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
  */
   __pyx_v_base = PyArray_BASE(__pyx_v_arr);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":949
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1027
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)
  *     if base is NULL:             # <<<<<<<<<<<<<<
@@ -10125,7 +12154,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_t_1 = ((__pyx_v_base == NULL) != 0);
   if (__pyx_t_1) {
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":950
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1028
  *     base = PyArray_BASE(arr)
  *     if base is NULL:
  *         return None             # <<<<<<<<<<<<<<
@@ -10136,7 +12165,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":949
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1027
  * cdef inline object get_array_base(ndarray arr):
  *     base = PyArray_BASE(arr)
  *     if base is NULL:             # <<<<<<<<<<<<<<
@@ -10145,7 +12174,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
  */
   }
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":951
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1029
  *     if base is NULL:
  *         return None
  *     return <object>base             # <<<<<<<<<<<<<<
@@ -10157,7 +12186,7 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   __pyx_r = ((PyObject *)__pyx_v_base);
   goto __pyx_L0;
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":947
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1025
  *     PyArray_SetBaseObject(arr, base)
  * 
  * cdef inline object get_array_base(ndarray arr):             # <<<<<<<<<<<<<<
@@ -10172,12 +12201,12 @@ static CYTHON_INLINE PyObject *__pyx_f_5numpy_get_array_base(PyArrayObject *__py
   return __pyx_r;
 }
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":955
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1033
  * # Versions of the import_* functions which are more suitable for
  * # Cython code.
  * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
  *     try:
- *         __pyx_import_array()
+ *         _import_array()
  */
 
 static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
@@ -10196,11 +12225,11 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_array", 0);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":956
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1034
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
- *         __pyx_import_array()
+ *         _import_array()
  *     except Exception:
  */
   {
@@ -10212,20 +12241,20 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":957
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1035
  * cdef inline int import_array() except -1:
  *     try:
- *         __pyx_import_array()             # <<<<<<<<<<<<<<
+ *         _import_array()             # <<<<<<<<<<<<<<
  *     except Exception:
  *         raise ImportError("numpy.core.multiarray failed to import")
  */
-      __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 957, __pyx_L3_error)
+      __pyx_t_4 = _import_array(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 1035, __pyx_L3_error)
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":956
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1034
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
- *         __pyx_import_array()
+ *         _import_array()
  *     except Exception:
  */
     }
@@ -10235,9 +12264,9 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":958
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1036
  *     try:
- *         __pyx_import_array()
+ *         _import_array()
  *     except Exception:             # <<<<<<<<<<<<<<
  *         raise ImportError("numpy.core.multiarray failed to import")
  * 
@@ -10245,32 +12274,32 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
     if (__pyx_t_4) {
       __Pyx_AddTraceback("numpy.import_array", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 958, __pyx_L5_except_error)
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 1036, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GOTREF(__pyx_t_7);
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":959
- *         __pyx_import_array()
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1037
+ *         _import_array()
  *     except Exception:
  *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_umath() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__8, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 959, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__10, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1037, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(1, 959, __pyx_L5_except_error)
+      __PYX_ERR(1, 1037, __pyx_L5_except_error)
     }
     goto __pyx_L5_except_error;
     __pyx_L5_except_error:;
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":956
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1034
  * # Cython code.
  * cdef inline int import_array() except -1:
  *     try:             # <<<<<<<<<<<<<<
- *         __pyx_import_array()
+ *         _import_array()
  *     except Exception:
  */
     __Pyx_XGIVEREF(__pyx_t_1);
@@ -10281,12 +12310,12 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":955
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1033
  * # Versions of the import_* functions which are more suitable for
  * # Cython code.
  * cdef inline int import_array() except -1:             # <<<<<<<<<<<<<<
  *     try:
- *         __pyx_import_array()
+ *         _import_array()
  */
 
   /* function exit code */
@@ -10304,7 +12333,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_array(void) {
   return __pyx_r;
 }
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":961
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1039
  *         raise ImportError("numpy.core.multiarray failed to import")
  * 
  * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
@@ -10328,7 +12357,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_umath", 0);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":962
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1040
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -10344,16 +12373,16 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":963
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1041
  * cdef inline int import_umath() except -1:
  *     try:
  *         _import_umath()             # <<<<<<<<<<<<<<
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")
  */
-      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 963, __pyx_L3_error)
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 1041, __pyx_L3_error)
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":962
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1040
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -10367,7 +12396,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":964
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1042
  *     try:
  *         _import_umath()
  *     except Exception:             # <<<<<<<<<<<<<<
@@ -10377,28 +12406,28 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
     if (__pyx_t_4) {
       __Pyx_AddTraceback("numpy.import_umath", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 964, __pyx_L5_except_error)
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 1042, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GOTREF(__pyx_t_7);
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":965
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1043
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_ufunc() except -1:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 965, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1043, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(1, 965, __pyx_L5_except_error)
+      __PYX_ERR(1, 1043, __pyx_L5_except_error)
     }
     goto __pyx_L5_except_error;
     __pyx_L5_except_error:;
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":962
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1040
  * 
  * cdef inline int import_umath() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -10413,7 +12442,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":961
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1039
  *         raise ImportError("numpy.core.multiarray failed to import")
  * 
  * cdef inline int import_umath() except -1:             # <<<<<<<<<<<<<<
@@ -10436,7 +12465,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_umath(void) {
   return __pyx_r;
 }
 
-/* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":967
+/* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1045
  *         raise ImportError("numpy.core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -10460,7 +12489,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("import_ufunc", 0);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":968
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1046
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -10476,16 +12505,16 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __Pyx_XGOTREF(__pyx_t_3);
     /*try:*/ {
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":969
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1047
  * cdef inline int import_ufunc() except -1:
  *     try:
  *         _import_umath()             # <<<<<<<<<<<<<<
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")
  */
-      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 969, __pyx_L3_error)
+      __pyx_t_4 = _import_umath(); if (unlikely(__pyx_t_4 == ((int)-1))) __PYX_ERR(1, 1047, __pyx_L3_error)
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":968
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1046
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -10499,38 +12528,35 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     goto __pyx_L8_try_end;
     __pyx_L3_error:;
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":970
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1048
  *     try:
  *         _import_umath()
  *     except Exception:             # <<<<<<<<<<<<<<
  *         raise ImportError("numpy.core.umath failed to import")
- * 
  */
     __pyx_t_4 = __Pyx_PyErr_ExceptionMatches(((PyObject *)(&((PyTypeObject*)PyExc_Exception)[0])));
     if (__pyx_t_4) {
       __Pyx_AddTraceback("numpy.import_ufunc", __pyx_clineno, __pyx_lineno, __pyx_filename);
-      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 970, __pyx_L5_except_error)
+      if (__Pyx_GetException(&__pyx_t_5, &__pyx_t_6, &__pyx_t_7) < 0) __PYX_ERR(1, 1048, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_5);
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_GOTREF(__pyx_t_7);
 
-      /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":971
+      /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1049
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
- * 
- * cdef extern from *:
  */
-      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__9, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 971, __pyx_L5_except_error)
+      __pyx_t_8 = __Pyx_PyObject_Call(__pyx_builtin_ImportError, __pyx_tuple__11, NULL); if (unlikely(!__pyx_t_8)) __PYX_ERR(1, 1049, __pyx_L5_except_error)
       __Pyx_GOTREF(__pyx_t_8);
       __Pyx_Raise(__pyx_t_8, 0, 0, 0);
       __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
-      __PYX_ERR(1, 971, __pyx_L5_except_error)
+      __PYX_ERR(1, 1049, __pyx_L5_except_error)
     }
     goto __pyx_L5_except_error;
     __pyx_L5_except_error:;
 
-    /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":968
+    /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1046
  * 
  * cdef inline int import_ufunc() except -1:
  *     try:             # <<<<<<<<<<<<<<
@@ -10545,7 +12571,7 @@ static CYTHON_INLINE int __pyx_f_5numpy_import_ufunc(void) {
     __pyx_L8_try_end:;
   }
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":967
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1045
  *         raise ImportError("numpy.core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -10617,6 +12643,7 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_DTYPE, __pyx_k_DTYPE, sizeof(__pyx_k_DTYPE), 0, 0, 1, 1},
   {&__pyx_n_s_DTYPE_INT, __pyx_k_DTYPE_INT, sizeof(__pyx_k_DTYPE_INT), 0, 0, 1, 1},
   {&__pyx_n_s_DTYPE_INT16, __pyx_k_DTYPE_INT16, sizeof(__pyx_k_DTYPE_INT16), 0, 0, 1, 1},
+  {&__pyx_n_s_DTYPE_UINT8, __pyx_k_DTYPE_UINT8, sizeof(__pyx_k_DTYPE_UINT8), 0, 0, 1, 1},
   {&__pyx_kp_s_Fewer_changepoints_found_than_re, __pyx_k_Fewer_changepoints_found_than_re, sizeof(__pyx_k_Fewer_changepoints_found_than_re), 0, 0, 1, 0},
   {&__pyx_kp_u_Format_string_allocated_too_shor, __pyx_k_Format_string_allocated_too_shor, sizeof(__pyx_k_Format_string_allocated_too_shor), 0, 1, 0, 0},
   {&__pyx_kp_u_Format_string_allocated_too_shor_2, __pyx_k_Format_string_allocated_too_shor_2, sizeof(__pyx_k_Format_string_allocated_too_shor_2), 0, 1, 0, 0},
@@ -10628,6 +12655,8 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_ValueError, __pyx_k_ValueError, sizeof(__pyx_k_ValueError), 0, 0, 1, 1},
   {&__pyx_n_s_abs, __pyx_k_abs, sizeof(__pyx_k_abs), 0, 0, 1, 1},
   {&__pyx_n_s_added_cpts, __pyx_k_added_cpts, sizeof(__pyx_k_added_cpts), 0, 0, 1, 1},
+  {&__pyx_n_s_after_len, __pyx_k_after_len, sizeof(__pyx_k_after_len), 0, 0, 1, 1},
+  {&__pyx_n_s_after_seq, __pyx_k_after_seq, sizeof(__pyx_k_after_seq), 0, 0, 1, 1},
   {&__pyx_n_s_alt_diff, __pyx_k_alt_diff, sizeof(__pyx_k_alt_diff), 0, 0, 1, 1},
   {&__pyx_n_s_alt_log_var_sum, __pyx_k_alt_log_var_sum, sizeof(__pyx_k_alt_log_var_sum), 0, 0, 1, 1},
   {&__pyx_n_s_alt_mean, __pyx_k_alt_mean, sizeof(__pyx_k_alt_mean), 0, 0, 1, 1},
@@ -10637,6 +12666,8 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_arr_i, __pyx_k_arr_i, sizeof(__pyx_k_arr_i), 0, 0, 1, 1},
   {&__pyx_n_s_array, __pyx_k_array, sizeof(__pyx_k_array), 0, 0, 1, 1},
   {&__pyx_n_s_astype, __pyx_k_astype, sizeof(__pyx_k_astype), 0, 0, 1, 1},
+  {&__pyx_n_s_before_len, __pyx_k_before_len, sizeof(__pyx_k_before_len), 0, 0, 1, 1},
+  {&__pyx_n_s_before_seq, __pyx_k_before_seq, sizeof(__pyx_k_before_seq), 0, 0, 1, 1},
   {&__pyx_n_s_blacklist_pos, __pyx_k_blacklist_pos, sizeof(__pyx_k_blacklist_pos), 0, 0, 1, 1},
   {&__pyx_n_s_c_apply_outlier_thresh, __pyx_k_c_apply_outlier_thresh, sizeof(__pyx_k_c_apply_outlier_thresh), 0, 0, 1, 1},
   {&__pyx_n_s_c_calc_llh_ratio, __pyx_k_c_calc_llh_ratio, sizeof(__pyx_k_c_calc_llh_ratio), 0, 0, 1, 1},
@@ -10644,12 +12675,15 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_c_calc_scaled_llh_ratio_const_va, __pyx_k_c_calc_scaled_llh_ratio_const_va, sizeof(__pyx_k_c_calc_scaled_llh_ratio_const_va), 0, 0, 1, 1},
   {&__pyx_n_s_c_compute_running_pctl_diffs, __pyx_k_c_compute_running_pctl_diffs, sizeof(__pyx_k_c_compute_running_pctl_diffs), 0, 0, 1, 1},
   {&__pyx_n_s_c_compute_slopes, __pyx_k_c_compute_slopes, sizeof(__pyx_k_c_compute_slopes), 0, 0, 1, 1},
+  {&__pyx_n_s_c_extend_ambig_indel, __pyx_k_c_extend_ambig_indel, sizeof(__pyx_k_c_extend_ambig_indel), 0, 0, 1, 1},
   {&__pyx_n_s_c_mean_std, __pyx_k_c_mean_std, sizeof(__pyx_k_c_mean_std), 0, 0, 1, 1},
   {&__pyx_n_s_c_new_mean_stds, __pyx_k_c_new_mean_stds, sizeof(__pyx_k_c_new_mean_stds), 0, 0, 1, 1},
   {&__pyx_n_s_c_new_means, __pyx_k_c_new_means, sizeof(__pyx_k_c_new_means), 0, 0, 1, 1},
+  {&__pyx_n_s_c_stay_state_keep_idxs, __pyx_k_c_stay_state_keep_idxs, sizeof(__pyx_k_c_stay_state_keep_idxs), 0, 0, 1, 1},
   {&__pyx_n_s_c_valid_cpts, __pyx_k_c_valid_cpts, sizeof(__pyx_k_c_valid_cpts), 0, 0, 1, 1},
   {&__pyx_n_s_c_valid_cpts_w_cap, __pyx_k_c_valid_cpts_w_cap, sizeof(__pyx_k_c_valid_cpts_w_cap), 0, 0, 1, 1},
   {&__pyx_n_s_c_valid_cpts_w_cap_t_test, __pyx_k_c_valid_cpts_w_cap_t_test, sizeof(__pyx_k_c_valid_cpts_w_cap_t_test), 0, 0, 1, 1},
+  {&__pyx_n_s_c_validate_segs, __pyx_k_c_validate_segs, sizeof(__pyx_k_c_validate_segs), 0, 0, 1, 1},
   {&__pyx_n_s_cand_idx, __pyx_k_cand_idx, sizeof(__pyx_k_cand_idx), 0, 0, 1, 1},
   {&__pyx_n_s_cand_pos, __pyx_k_cand_pos, sizeof(__pyx_k_cand_pos), 0, 0, 1, 1},
   {&__pyx_n_s_candidate_poss, __pyx_k_candidate_poss, sizeof(__pyx_k_candidate_poss), 0, 0, 1, 1},
@@ -10666,18 +12700,24 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_curr_var, __pyx_k_curr_var, sizeof(__pyx_k_curr_var), 0, 0, 1, 1},
   {&__pyx_n_s_density_height_factor, __pyx_k_density_height_factor, sizeof(__pyx_k_density_height_factor), 0, 0, 1, 1},
   {&__pyx_n_s_density_height_power, __pyx_k_density_height_power, sizeof(__pyx_k_density_height_power), 0, 0, 1, 1},
+  {&__pyx_n_s_down, __pyx_k_down, sizeof(__pyx_k_down), 0, 0, 1, 1},
   {&__pyx_n_s_dtype, __pyx_k_dtype, sizeof(__pyx_k_dtype), 0, 0, 1, 1},
   {&__pyx_n_s_empty, __pyx_k_empty, sizeof(__pyx_k_empty), 0, 0, 1, 1},
+  {&__pyx_n_s_end_pos, __pyx_k_end_pos, sizeof(__pyx_k_end_pos), 0, 0, 1, 1},
   {&__pyx_n_s_enumerate, __pyx_k_enumerate, sizeof(__pyx_k_enumerate), 0, 0, 1, 1},
   {&__pyx_n_s_float64, __pyx_k_float64, sizeof(__pyx_k_float64), 0, 0, 1, 1},
   {&__pyx_n_s_i, __pyx_k_i, sizeof(__pyx_k_i), 0, 0, 1, 1},
   {&__pyx_n_s_idx, __pyx_k_idx, sizeof(__pyx_k_idx), 0, 0, 1, 1},
   {&__pyx_n_s_import, __pyx_k_import, sizeof(__pyx_k_import), 0, 0, 1, 1},
+  {&__pyx_n_s_indel_len, __pyx_k_indel_len, sizeof(__pyx_k_indel_len), 0, 0, 1, 1},
+  {&__pyx_n_s_indel_seq, __pyx_k_indel_seq, sizeof(__pyx_k_indel_seq), 0, 0, 1, 1},
   {&__pyx_n_s_int16, __pyx_k_int16, sizeof(__pyx_k_int16), 0, 0, 1, 1},
   {&__pyx_n_s_int32, __pyx_k_int32, sizeof(__pyx_k_int32), 0, 0, 1, 1},
   {&__pyx_n_s_int64, __pyx_k_int64, sizeof(__pyx_k_int64), 0, 0, 1, 1},
   {&__pyx_n_s_itertools, __pyx_k_itertools, sizeof(__pyx_k_itertools), 0, 0, 1, 1},
   {&__pyx_n_s_j, __pyx_k_j, sizeof(__pyx_k_j), 0, 0, 1, 1},
+  {&__pyx_n_s_k_idx, __pyx_k_k_idx, sizeof(__pyx_k_k_idx), 0, 0, 1, 1},
+  {&__pyx_n_s_keep_idxs, __pyx_k_keep_idxs, sizeof(__pyx_k_keep_idxs), 0, 0, 1, 1},
   {&__pyx_n_s_log_lh_ratio, __pyx_k_log_lh_ratio, sizeof(__pyx_k_log_lh_ratio), 0, 0, 1, 1},
   {&__pyx_n_s_lower_lim, __pyx_k_lower_lim, sizeof(__pyx_k_lower_lim), 0, 0, 1, 1},
   {&__pyx_n_s_lower_pctl, __pyx_k_lower_pctl, sizeof(__pyx_k_lower_pctl), 0, 0, 1, 1},
@@ -10689,9 +12729,14 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_means_arr, __pyx_k_means_arr, sizeof(__pyx_k_means_arr), 0, 0, 1, 1},
   {&__pyx_n_s_means_diff, __pyx_k_means_diff, sizeof(__pyx_k_means_diff), 0, 0, 1, 1},
   {&__pyx_n_s_min_base_obs, __pyx_k_min_base_obs, sizeof(__pyx_k_min_base_obs), 0, 0, 1, 1},
+  {&__pyx_n_s_moves, __pyx_k_moves, sizeof(__pyx_k_moves), 0, 0, 1, 1},
   {&__pyx_n_s_n_events, __pyx_k_n_events, sizeof(__pyx_k_n_events), 0, 0, 1, 1},
+  {&__pyx_n_s_n_keep, __pyx_k_n_keep, sizeof(__pyx_k_n_keep), 0, 0, 1, 1},
+  {&__pyx_n_s_n_moves, __pyx_k_n_moves, sizeof(__pyx_k_n_moves), 0, 0, 1, 1},
   {&__pyx_n_s_n_segs, __pyx_k_n_segs, sizeof(__pyx_k_n_segs), 0, 0, 1, 1},
   {&__pyx_n_s_name, __pyx_k_name, sizeof(__pyx_k_name), 0, 0, 1, 1},
+  {&__pyx_kp_u_ndarray_is_not_C_contiguous, __pyx_k_ndarray_is_not_C_contiguous, sizeof(__pyx_k_ndarray_is_not_C_contiguous), 0, 1, 0, 0},
+  {&__pyx_kp_u_ndarray_is_not_Fortran_contiguou, __pyx_k_ndarray_is_not_Fortran_contiguou, sizeof(__pyx_k_ndarray_is_not_Fortran_contiguou), 0, 1, 0, 0},
   {&__pyx_n_s_new_segs, __pyx_k_new_segs, sizeof(__pyx_k_new_segs), 0, 0, 1, 1},
   {&__pyx_n_s_norm_signal, __pyx_k_norm_signal, sizeof(__pyx_k_norm_signal), 0, 0, 1, 1},
   {&__pyx_n_s_np, __pyx_k_np, sizeof(__pyx_k_np), 0, 0, 1, 1},
@@ -10737,15 +12782,20 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {&__pyx_n_s_seg_idx, __pyx_k_seg_idx, sizeof(__pyx_k_seg_idx), 0, 0, 1, 1},
   {&__pyx_n_s_seg_len, __pyx_k_seg_len, sizeof(__pyx_k_seg_len), 0, 0, 1, 1},
   {&__pyx_n_s_seg_mean, __pyx_k_seg_mean, sizeof(__pyx_k_seg_mean), 0, 0, 1, 1},
+  {&__pyx_n_s_segs, __pyx_k_segs, sizeof(__pyx_k_segs), 0, 0, 1, 1},
+  {&__pyx_n_s_sig_len, __pyx_k_sig_len, sizeof(__pyx_k_sig_len), 0, 0, 1, 1},
   {&__pyx_n_s_slopes, __pyx_k_slopes, sizeof(__pyx_k_slopes), 0, 0, 1, 1},
   {&__pyx_n_s_sort, __pyx_k_sort, sizeof(__pyx_k_sort), 0, 0, 1, 1},
   {&__pyx_n_s_sorted_arr, __pyx_k_sorted_arr, sizeof(__pyx_k_sorted_arr), 0, 0, 1, 1},
+  {&__pyx_n_s_start_clip, __pyx_k_start_clip, sizeof(__pyx_k_start_clip), 0, 0, 1, 1},
   {&__pyx_n_s_stds_arr, __pyx_k_stds_arr, sizeof(__pyx_k_stds_arr), 0, 0, 1, 1},
   {&__pyx_n_s_t_scores, __pyx_k_t_scores, sizeof(__pyx_k_t_scores), 0, 0, 1, 1},
   {&__pyx_n_s_test, __pyx_k_test, sizeof(__pyx_k_test), 0, 0, 1, 1},
   {&__pyx_n_s_tombo__c_helper, __pyx_k_tombo__c_helper, sizeof(__pyx_k_tombo__c_helper), 0, 0, 1, 1},
   {&__pyx_kp_s_tombo__c_helper_pyx, __pyx_k_tombo__c_helper_pyx, sizeof(__pyx_k_tombo__c_helper_pyx), 0, 0, 1, 0},
+  {&__pyx_n_s_uint8, __pyx_k_uint8, sizeof(__pyx_k_uint8), 0, 0, 1, 1},
   {&__pyx_kp_u_unknown_dtype_code_in_numpy_pxd, __pyx_k_unknown_dtype_code_in_numpy_pxd, sizeof(__pyx_k_unknown_dtype_code_in_numpy_pxd), 0, 1, 0, 0},
+  {&__pyx_n_s_up, __pyx_k_up, sizeof(__pyx_k_up), 0, 0, 1, 1},
   {&__pyx_n_s_update, __pyx_k_update, sizeof(__pyx_k_update), 0, 0, 1, 1},
   {&__pyx_n_s_upper_lim, __pyx_k_upper_lim, sizeof(__pyx_k_upper_lim), 0, 0, 1, 1},
   {&__pyx_n_s_upper_pctl, __pyx_k_upper_pctl, sizeof(__pyx_k_upper_pctl), 0, 0, 1, 1},
@@ -10760,13 +12810,13 @@ static __Pyx_StringTabEntry __pyx_string_tab[] = {
   {0, 0, 0, 0, 0, 0, 0}
 };
 static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(void) {
-  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 30, __pyx_L1_error)
-  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 118, __pyx_L1_error)
-  __pyx_builtin_reversed = __Pyx_GetBuiltinName(__pyx_n_s_reversed); if (!__pyx_builtin_reversed) __PYX_ERR(0, 261, __pyx_L1_error)
-  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(0, 370, __pyx_L1_error)
-  __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(1, 777, __pyx_L1_error)
-  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(1, 781, __pyx_L1_error)
-  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(1, 959, __pyx_L1_error)
+  __pyx_builtin_range = __Pyx_GetBuiltinName(__pyx_n_s_range); if (!__pyx_builtin_range) __PYX_ERR(0, 33, __pyx_L1_error)
+  __pyx_builtin_NotImplementedError = __Pyx_GetBuiltinName(__pyx_n_s_NotImplementedError); if (!__pyx_builtin_NotImplementedError) __PYX_ERR(0, 121, __pyx_L1_error)
+  __pyx_builtin_reversed = __Pyx_GetBuiltinName(__pyx_n_s_reversed); if (!__pyx_builtin_reversed) __PYX_ERR(0, 264, __pyx_L1_error)
+  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_n_s_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(0, 373, __pyx_L1_error)
+  __pyx_builtin_ValueError = __Pyx_GetBuiltinName(__pyx_n_s_ValueError); if (!__pyx_builtin_ValueError) __PYX_ERR(1, 272, __pyx_L1_error)
+  __pyx_builtin_RuntimeError = __Pyx_GetBuiltinName(__pyx_n_s_RuntimeError); if (!__pyx_builtin_RuntimeError) __PYX_ERR(1, 855, __pyx_L1_error)
+  __pyx_builtin_ImportError = __Pyx_GetBuiltinName(__pyx_n_s_ImportError); if (!__pyx_builtin_ImportError) __PYX_ERR(1, 1037, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
   return -1;
@@ -10776,248 +12826,306 @@ static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(void) {
   __Pyx_RefNannyDeclarations
   __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
 
-  /* "tombo/_c_helper.pyx":98
+  /* "tombo/_c_helper.pyx":101
  *         (2 * raw_cumsum[running_stat_width:-running_stat_width]) -
  *         raw_cumsum[:-2*running_stat_width] -
  *         raw_cumsum[2*running_stat_width:])).astype(DTYPE_INT)[::-1]             # <<<<<<<<<<<<<<
  * 
  *     cdef np.ndarray[DTYPE_INT_t] cpts = np.empty(num_cpts, dtype=DTYPE_INT)
  */
-  __pyx_slice_ = PySlice_New(Py_None, Py_None, __pyx_int_neg_1); if (unlikely(!__pyx_slice_)) __PYX_ERR(0, 98, __pyx_L1_error)
+  __pyx_slice_ = PySlice_New(Py_None, Py_None, __pyx_int_neg_1); if (unlikely(!__pyx_slice_)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_slice_);
   __Pyx_GIVEREF(__pyx_slice_);
 
-  /* "tombo/_c_helper.pyx":118
+  /* "tombo/_c_helper.pyx":121
  *         cand_idx += 1
  *         if cand_idx >= num_cands:
  *             raise NotImplementedError('Fewer changepoints found than requested')             # <<<<<<<<<<<<<<
  * 
  *     return cpts
  */
-  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_Fewer_changepoints_found_than_re); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 118, __pyx_L1_error)
+  __pyx_tuple__2 = PyTuple_Pack(1, __pyx_kp_s_Fewer_changepoints_found_than_re); if (unlikely(!__pyx_tuple__2)) __PYX_ERR(0, 121, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__2);
   __Pyx_GIVEREF(__pyx_tuple__2);
 
-  /* "tombo/_c_helper.pyx":136
+  /* "tombo/_c_helper.pyx":139
  *     blacklist_pos = set()
  *     cdef DTYPE_INT_t pos
  *     for pos in candidate_poss[1:]:             # <<<<<<<<<<<<<<
  *         if pos not in blacklist_pos:
  *             cpts.append(pos)
  */
-  __pyx_slice__3 = PySlice_New(__pyx_int_1, Py_None, Py_None); if (unlikely(!__pyx_slice__3)) __PYX_ERR(0, 136, __pyx_L1_error)
+  __pyx_slice__3 = PySlice_New(__pyx_int_1, Py_None, Py_None); if (unlikely(!__pyx_slice__3)) __PYX_ERR(0, 139, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_slice__3);
   __Pyx_GIVEREF(__pyx_slice__3);
 
-  /* "tombo/_c_helper.pyx":240
+  /* "tombo/_c_helper.pyx":243
  *     cdef np.ndarray[DTYPE_INT16_t] running_pctl_diffs = np.empty(
  *         arr.shape[0] - window_size + 1, dtype=DTYPE_INT16)
  *     running_pctl_diffs[:] = np.NAN             # <<<<<<<<<<<<<<
  *     running_pctl_diffs[0] = (sorted_arr[upper_pctl_index] -
  *                              sorted_arr[lower_pctl_index])
  */
-  __pyx_slice__4 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__4)) __PYX_ERR(0, 240, __pyx_L1_error)
+  __pyx_slice__4 = PySlice_New(Py_None, Py_None, Py_None); if (unlikely(!__pyx_slice__4)) __PYX_ERR(0, 243, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_slice__4);
   __Pyx_GIVEREF(__pyx_slice__4);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":777
- * 
- *         if (end - f) - <int>(new_offset - offset[0]) < 15:
- *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":272
+ *             if ((flags & pybuf.PyBUF_C_CONTIGUOUS == pybuf.PyBUF_C_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_C_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not C contiguous")             # <<<<<<<<<<<<<<
  * 
- *         if ((child.byteorder == c'>' and little_endian) or
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
  */
-  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 777, __pyx_L1_error)
+  __pyx_tuple__5 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_C_contiguous); if (unlikely(!__pyx_tuple__5)) __PYX_ERR(1, 272, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__5);
   __Pyx_GIVEREF(__pyx_tuple__5);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":781
- *         if ((child.byteorder == c'>' and little_endian) or
- *             (child.byteorder == c'<' and not little_endian)):
- *             raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
- *             # One could encode it in the format string and have Cython
- *             # complain instead, BUT: < and > in format strings also imply
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":276
+ *             if ((flags & pybuf.PyBUF_F_CONTIGUOUS == pybuf.PyBUF_F_CONTIGUOUS)
+ *                 and not PyArray_CHKFLAGS(self, NPY_ARRAY_F_CONTIGUOUS)):
+ *                 raise ValueError(u"ndarray is not Fortran contiguous")             # <<<<<<<<<<<<<<
+ * 
+ *             info.buf = PyArray_DATA(self)
  */
-  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 781, __pyx_L1_error)
+  __pyx_tuple__6 = PyTuple_Pack(1, __pyx_kp_u_ndarray_is_not_Fortran_contiguou); if (unlikely(!__pyx_tuple__6)) __PYX_ERR(1, 276, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_tuple__6);
   __Pyx_GIVEREF(__pyx_tuple__6);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":801
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":306
+ *                 if ((descr.byteorder == c'>' and little_endian) or
+ *                     (descr.byteorder == c'<' and not little_endian)):
+ *                     raise ValueError(u"Non-native byte order not supported")             # <<<<<<<<<<<<<<
+ *                 if   t == NPY_BYTE:        f = "b"
+ *                 elif t == NPY_UBYTE:       f = "B"
+ */
+  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_Non_native_byte_order_not_suppor); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 306, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__7);
+  __Pyx_GIVEREF(__pyx_tuple__7);
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":855
+ * 
+ *         if (end - f) - <int>(new_offset - offset[0]) < 15:
+ *             raise RuntimeError(u"Format string allocated too short, see comment in numpy.pxd")             # <<<<<<<<<<<<<<
+ * 
+ *         if ((child.byteorder == c'>' and little_endian) or
+ */
+  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 855, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__8);
+  __Pyx_GIVEREF(__pyx_tuple__8);
+
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":879
  *             t = child.type_num
  *             if end - f < 5:
  *                 raise RuntimeError(u"Format string allocated too short.")             # <<<<<<<<<<<<<<
  * 
  *             # Until ticket #99 is fixed, use integers to avoid warnings
  */
-  __pyx_tuple__7 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__7)) __PYX_ERR(1, 801, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__7);
-  __Pyx_GIVEREF(__pyx_tuple__7);
+  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_u_Format_string_allocated_too_shor_2); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 879, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__9);
+  __Pyx_GIVEREF(__pyx_tuple__9);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":959
- *         __pyx_import_array()
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1037
+ *         _import_array()
  *     except Exception:
  *         raise ImportError("numpy.core.multiarray failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_umath() except -1:
  */
-  __pyx_tuple__8 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__8)) __PYX_ERR(1, 959, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__8);
-  __Pyx_GIVEREF(__pyx_tuple__8);
+  __pyx_tuple__10 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_multiarray_failed_to); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(1, 1037, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__10);
+  __Pyx_GIVEREF(__pyx_tuple__10);
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":965
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1043
  *         _import_umath()
  *     except Exception:
  *         raise ImportError("numpy.core.umath failed to import")             # <<<<<<<<<<<<<<
  * 
  * cdef inline int import_ufunc() except -1:
  */
-  __pyx_tuple__9 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__9)) __PYX_ERR(1, 965, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__9);
-  __Pyx_GIVEREF(__pyx_tuple__9);
+  __pyx_tuple__11 = PyTuple_Pack(1, __pyx_kp_s_numpy_core_umath_failed_to_impor); if (unlikely(!__pyx_tuple__11)) __PYX_ERR(1, 1043, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__11);
+  __Pyx_GIVEREF(__pyx_tuple__11);
 
-  /* "tombo/_c_helper.pyx":22
+  /* "tombo/_c_helper.pyx":25
  * from itertools import combinations
  * 
  * def c_mean_std(np.ndarray[DTYPE_t] values):             # <<<<<<<<<<<<<<
  *     """
  *     More efficient method to get both mean and standard deviation
  */
-  __pyx_tuple__10 = PyTuple_Pack(5, __pyx_n_s_values, __pyx_n_s_v_mean, __pyx_n_s_v_var, __pyx_n_s_idx, __pyx_n_s_v_len); if (unlikely(!__pyx_tuple__10)) __PYX_ERR(0, 22, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__10);
-  __Pyx_GIVEREF(__pyx_tuple__10);
-  __pyx_codeobj__11 = (PyObject*)__Pyx_PyCode_New(1, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__10, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_mean_std, 22, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__11)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __pyx_tuple__12 = PyTuple_Pack(5, __pyx_n_s_values, __pyx_n_s_v_mean, __pyx_n_s_v_var, __pyx_n_s_idx, __pyx_n_s_v_len); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__12);
+  __Pyx_GIVEREF(__pyx_tuple__12);
+  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(1, 0, 5, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_mean_std, 25, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 25, __pyx_L1_error)
 
-  /* "tombo/_c_helper.pyx":38
+  /* "tombo/_c_helper.pyx":41
  *     return v_mean, sqrt(v_var / v_len)
  * 
  * def c_new_mean_stds(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] norm_signal not None,
  *         np.ndarray[DTYPE_INT_t] new_segs not None):
  */
-  __pyx_tuple__12 = PyTuple_Pack(11, __pyx_n_s_norm_signal, __pyx_n_s_new_segs, __pyx_n_s_n_segs, __pyx_n_s_means_arr, __pyx_n_s_stds_arr, __pyx_n_s_curr_sum, __pyx_n_s_curr_var, __pyx_n_s_seg_mean, __pyx_n_s_idx, __pyx_n_s_seg_idx, __pyx_n_s_seg_len); if (unlikely(!__pyx_tuple__12)) __PYX_ERR(0, 38, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__12);
-  __Pyx_GIVEREF(__pyx_tuple__12);
-  __pyx_codeobj__13 = (PyObject*)__Pyx_PyCode_New(2, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__12, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_new_mean_stds, 38, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__13)) __PYX_ERR(0, 38, __pyx_L1_error)
+  __pyx_tuple__14 = PyTuple_Pack(11, __pyx_n_s_norm_signal, __pyx_n_s_new_segs, __pyx_n_s_n_segs, __pyx_n_s_means_arr, __pyx_n_s_stds_arr, __pyx_n_s_curr_sum, __pyx_n_s_curr_var, __pyx_n_s_seg_mean, __pyx_n_s_idx, __pyx_n_s_seg_idx, __pyx_n_s_seg_len); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 41, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__14);
+  __Pyx_GIVEREF(__pyx_tuple__14);
+  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(2, 0, 11, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__14, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_new_mean_stds, 41, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 41, __pyx_L1_error)
 
-  /* "tombo/_c_helper.pyx":59
+  /* "tombo/_c_helper.pyx":62
  *     return means_arr, stds_arr
  * 
  * def c_new_means(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] norm_signal not None,
  *         np.ndarray[DTYPE_INT_t] new_segs not None):
  */
-  __pyx_tuple__14 = PyTuple_Pack(7, __pyx_n_s_norm_signal, __pyx_n_s_new_segs, __pyx_n_s_n_segs, __pyx_n_s_means_arr, __pyx_n_s_curr_sum, __pyx_n_s_idx, __pyx_n_s_seg_idx); if (unlikely(!__pyx_tuple__14)) __PYX_ERR(0, 59, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__14);
-  __Pyx_GIVEREF(__pyx_tuple__14);
-  __pyx_codeobj__15 = (PyObject*)__Pyx_PyCode_New(2, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__14, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_new_means, 59, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__15)) __PYX_ERR(0, 59, __pyx_L1_error)
+  __pyx_tuple__16 = PyTuple_Pack(7, __pyx_n_s_norm_signal, __pyx_n_s_new_segs, __pyx_n_s_n_segs, __pyx_n_s_means_arr, __pyx_n_s_curr_sum, __pyx_n_s_idx, __pyx_n_s_seg_idx); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__16);
+  __Pyx_GIVEREF(__pyx_tuple__16);
+  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(2, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__16, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_new_means, 62, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 62, __pyx_L1_error)
 
-  /* "tombo/_c_helper.pyx":73
+  /* "tombo/_c_helper.pyx":76
  *     return means_arr
  * 
  * def c_apply_outlier_thresh(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] raw_signal, DTYPE_t lower_lim, DTYPE_t upper_lim):
  *     cdef DTYPE_INT_t raw_size = raw_signal.shape[0]
  */
-  __pyx_tuple__16 = PyTuple_Pack(7, __pyx_n_s_raw_signal, __pyx_n_s_lower_lim, __pyx_n_s_upper_lim, __pyx_n_s_raw_size, __pyx_n_s_clipped_signal, __pyx_n_s_pos, __pyx_n_s_pos_sig); if (unlikely(!__pyx_tuple__16)) __PYX_ERR(0, 73, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__16);
-  __Pyx_GIVEREF(__pyx_tuple__16);
-  __pyx_codeobj__17 = (PyObject*)__Pyx_PyCode_New(3, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__16, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_apply_outlier_thresh, 73, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__17)) __PYX_ERR(0, 73, __pyx_L1_error)
+  __pyx_tuple__18 = PyTuple_Pack(7, __pyx_n_s_raw_signal, __pyx_n_s_lower_lim, __pyx_n_s_upper_lim, __pyx_n_s_raw_size, __pyx_n_s_clipped_signal, __pyx_n_s_pos, __pyx_n_s_pos_sig); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__18);
+  __Pyx_GIVEREF(__pyx_tuple__18);
+  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(3, 0, 7, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_apply_outlier_thresh, 76, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 76, __pyx_L1_error)
 
-  /* "tombo/_c_helper.pyx":89
+  /* "tombo/_c_helper.pyx":92
  *     return clipped_signal
  * 
  * def c_valid_cpts_w_cap(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] raw_signal, DTYPE_INT_t min_base_obs,
  *         DTYPE_INT_t running_stat_width, DTYPE_INT_t num_cpts):
  */
-  __pyx_tuple__18 = PyTuple_Pack(12, __pyx_n_s_raw_signal, __pyx_n_s_min_base_obs, __pyx_n_s_running_stat_width, __pyx_n_s_num_cpts, __pyx_n_s_raw_cumsum, __pyx_n_s_candidate_poss, __pyx_n_s_cpts, __pyx_n_s_blacklist_pos, __pyx_n_s_cand_pos, __pyx_n_s_num_cands, __pyx_n_s_cand_idx, __pyx_n_s_added_cpts); if (unlikely(!__pyx_tuple__18)) __PYX_ERR(0, 89, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__18);
-  __Pyx_GIVEREF(__pyx_tuple__18);
-  __pyx_codeobj__19 = (PyObject*)__Pyx_PyCode_New(4, 0, 12, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__18, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_valid_cpts_w_cap, 89, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__19)) __PYX_ERR(0, 89, __pyx_L1_error)
+  __pyx_tuple__20 = PyTuple_Pack(12, __pyx_n_s_raw_signal, __pyx_n_s_min_base_obs, __pyx_n_s_running_stat_width, __pyx_n_s_num_cpts, __pyx_n_s_raw_cumsum, __pyx_n_s_candidate_poss, __pyx_n_s_cpts, __pyx_n_s_blacklist_pos, __pyx_n_s_cand_pos, __pyx_n_s_num_cands, __pyx_n_s_cand_idx, __pyx_n_s_added_cpts); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__20);
+  __Pyx_GIVEREF(__pyx_tuple__20);
+  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(4, 0, 12, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_valid_cpts_w_cap, 92, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 92, __pyx_L1_error)
 
-  /* "tombo/_c_helper.pyx":122
+  /* "tombo/_c_helper.pyx":125
  *     return cpts
  * 
  * def c_valid_cpts(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] raw_signal, DTYPE_INT_t min_base_obs,
  *         DTYPE_INT_t running_stat_width):
  */
-  __pyx_tuple__20 = PyTuple_Pack(8, __pyx_n_s_raw_signal, __pyx_n_s_min_base_obs, __pyx_n_s_running_stat_width, __pyx_n_s_raw_cumsum, __pyx_n_s_candidate_poss, __pyx_n_s_cpts, __pyx_n_s_blacklist_pos, __pyx_n_s_pos); if (unlikely(!__pyx_tuple__20)) __PYX_ERR(0, 122, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__20);
-  __Pyx_GIVEREF(__pyx_tuple__20);
-  __pyx_codeobj__21 = (PyObject*)__Pyx_PyCode_New(3, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__20, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_valid_cpts, 122, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__21)) __PYX_ERR(0, 122, __pyx_L1_error)
+  __pyx_tuple__22 = PyTuple_Pack(8, __pyx_n_s_raw_signal, __pyx_n_s_min_base_obs, __pyx_n_s_running_stat_width, __pyx_n_s_raw_cumsum, __pyx_n_s_candidate_poss, __pyx_n_s_cpts, __pyx_n_s_blacklist_pos, __pyx_n_s_pos); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 125, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__22);
+  __Pyx_GIVEREF(__pyx_tuple__22);
+  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(3, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_valid_cpts, 125, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 125, __pyx_L1_error)
 
-  /* "tombo/_c_helper.pyx":144
+  /* "tombo/_c_helper.pyx":147
  *     return np.array(cpts) + running_stat_width
  * 
  * def c_valid_cpts_w_cap_t_test(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] raw_signal, DTYPE_INT_t min_base_obs,
  *         DTYPE_INT_t running_stat_width, DTYPE_INT_t num_cpts):
  */
-  __pyx_tuple__22 = PyTuple_Pack(19, __pyx_n_s_raw_signal, __pyx_n_s_min_base_obs, __pyx_n_s_running_stat_width, __pyx_n_s_num_cpts, __pyx_n_s_pos, __pyx_n_s_idx, __pyx_n_s_pos_diff, __pyx_n_s_m1, __pyx_n_s_m2, __pyx_n_s_var1, __pyx_n_s_var2, __pyx_n_s_num_cands, __pyx_n_s_t_scores, __pyx_n_s_candidate_poss, __pyx_n_s_cpts, __pyx_n_s_blacklist_pos, __pyx_n_s_cand_pos, __pyx_n_s_cand_idx, __pyx_n_s_added_cpts); if (unlikely(!__pyx_tuple__22)) __PYX_ERR(0, 144, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__22);
-  __Pyx_GIVEREF(__pyx_tuple__22);
-  __pyx_codeobj__23 = (PyObject*)__Pyx_PyCode_New(4, 0, 19, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__22, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_valid_cpts_w_cap_t_test, 144, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__23)) __PYX_ERR(0, 144, __pyx_L1_error)
+  __pyx_tuple__24 = PyTuple_Pack(19, __pyx_n_s_raw_signal, __pyx_n_s_min_base_obs, __pyx_n_s_running_stat_width, __pyx_n_s_num_cpts, __pyx_n_s_pos, __pyx_n_s_idx, __pyx_n_s_pos_diff, __pyx_n_s_m1, __pyx_n_s_m2, __pyx_n_s_var1, __pyx_n_s_var2, __pyx_n_s_num_cands, __pyx_n_s_t_scores, __pyx_n_s_candidate_poss, __pyx_n_s_cpts, __pyx_n_s_blacklist_pos, __pyx_n_s_cand_pos, __pyx_n_s_cand_idx, __pyx_n_s_added_cpts); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 147, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__24);
+  __Pyx_GIVEREF(__pyx_tuple__24);
+  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(4, 0, 19, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_valid_cpts_w_cap_t_test, 147, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 147, __pyx_L1_error)
 
-  /* "tombo/_c_helper.pyx":221
+  /* "tombo/_c_helper.pyx":224
  * @cython.wraparound(False)
  * @cython.boundscheck(False)
  * def c_compute_running_pctl_diffs(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_INT16_t] arr, DTYPE_INT_t window_size,
  *         DTYPE_t lower_pctl, DTYPE_t upper_pctl):
  */
-  __pyx_tuple__24 = PyTuple_Pack(17, __pyx_n_s_arr, __pyx_n_s_window_size, __pyx_n_s_lower_pctl, __pyx_n_s_upper_pctl, __pyx_n_s_lower_pctl_index, __pyx_n_s_upper_pctl_index, __pyx_n_s_curr_index, __pyx_n_s_rolling_arr, __pyx_n_s_sorted_arr, __pyx_n_s_running_pctl_diffs, __pyx_n_s_pop_val, __pyx_n_s_push_val, __pyx_n_s_i, __pyx_n_s_pop_index, __pyx_n_s_push_index, __pyx_n_s_arr_i, __pyx_n_s_rolling_i); if (unlikely(!__pyx_tuple__24)) __PYX_ERR(0, 221, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__24);
-  __Pyx_GIVEREF(__pyx_tuple__24);
-  __pyx_codeobj__25 = (PyObject*)__Pyx_PyCode_New(4, 0, 17, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__24, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_compute_running_pctl_diffs, 221, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__25)) __PYX_ERR(0, 221, __pyx_L1_error)
+  __pyx_tuple__26 = PyTuple_Pack(17, __pyx_n_s_arr, __pyx_n_s_window_size, __pyx_n_s_lower_pctl, __pyx_n_s_upper_pctl, __pyx_n_s_lower_pctl_index, __pyx_n_s_upper_pctl_index, __pyx_n_s_curr_index, __pyx_n_s_rolling_arr, __pyx_n_s_sorted_arr, __pyx_n_s_running_pctl_diffs, __pyx_n_s_pop_val, __pyx_n_s_push_val, __pyx_n_s_i, __pyx_n_s_pop_index, __pyx_n_s_push_index, __pyx_n_s_arr_i, __pyx_n_s_rolling_i); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(0, 224, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__26);
+  __Pyx_GIVEREF(__pyx_tuple__26);
+  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(4, 0, 17, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__26, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_compute_running_pctl_diffs, 224, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(0, 224, __pyx_L1_error)
 
-  /* "tombo/_c_helper.pyx":277
+  /* "tombo/_c_helper.pyx":280
  *     return running_pctl_diffs
  * 
  * def c_calc_llh_ratio(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] reg_means,
  *         np.ndarray[DTYPE_t] reg_ref_means, np.ndarray[DTYPE_t] reg_alt_means,
  */
-  __pyx_tuple__26 = PyTuple_Pack(13, __pyx_n_s_reg_means, __pyx_n_s_reg_ref_means, __pyx_n_s_reg_alt_means, __pyx_n_s_reg_ref_vars, __pyx_n_s_reg_alt_vars, __pyx_n_s_ref_z_sum, __pyx_n_s_ref_log_var_sum, __pyx_n_s_alt_z_sum, __pyx_n_s_alt_log_var_sum, __pyx_n_s_ref_diff, __pyx_n_s_alt_diff, __pyx_n_s_log_lh_ratio, __pyx_n_s_idx); if (unlikely(!__pyx_tuple__26)) __PYX_ERR(0, 277, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__26);
-  __Pyx_GIVEREF(__pyx_tuple__26);
-  __pyx_codeobj__27 = (PyObject*)__Pyx_PyCode_New(5, 0, 13, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__26, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_calc_llh_ratio, 277, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__27)) __PYX_ERR(0, 277, __pyx_L1_error)
+  __pyx_tuple__28 = PyTuple_Pack(13, __pyx_n_s_reg_means, __pyx_n_s_reg_ref_means, __pyx_n_s_reg_alt_means, __pyx_n_s_reg_ref_vars, __pyx_n_s_reg_alt_vars, __pyx_n_s_ref_z_sum, __pyx_n_s_ref_log_var_sum, __pyx_n_s_alt_z_sum, __pyx_n_s_alt_log_var_sum, __pyx_n_s_ref_diff, __pyx_n_s_alt_diff, __pyx_n_s_log_lh_ratio, __pyx_n_s_idx); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__28);
+  __Pyx_GIVEREF(__pyx_tuple__28);
+  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(5, 0, 13, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_calc_llh_ratio, 280, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 280, __pyx_L1_error)
 
-  /* "tombo/_c_helper.pyx":298
+  /* "tombo/_c_helper.pyx":301
  *     return log_lh_ratio
  * 
  * def c_calc_llh_ratio_const_var(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] reg_means, np.ndarray[DTYPE_t] reg_ref_means,
  *         np.ndarray[DTYPE_t] reg_alt_means, DTYPE_t const_var):
  */
-  __pyx_tuple__28 = PyTuple_Pack(9, __pyx_n_s_reg_means, __pyx_n_s_reg_ref_means, __pyx_n_s_reg_alt_means, __pyx_n_s_const_var, __pyx_n_s_running_llhr, __pyx_n_s_ref_diff, __pyx_n_s_alt_diff, __pyx_n_s_obs_mean, __pyx_n_s_idx); if (unlikely(!__pyx_tuple__28)) __PYX_ERR(0, 298, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__28);
-  __Pyx_GIVEREF(__pyx_tuple__28);
-  __pyx_codeobj__29 = (PyObject*)__Pyx_PyCode_New(4, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__28, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_calc_llh_ratio_const_var, 298, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__29)) __PYX_ERR(0, 298, __pyx_L1_error)
+  __pyx_tuple__30 = PyTuple_Pack(9, __pyx_n_s_reg_means, __pyx_n_s_reg_ref_means, __pyx_n_s_reg_alt_means, __pyx_n_s_const_var, __pyx_n_s_running_llhr, __pyx_n_s_ref_diff, __pyx_n_s_alt_diff, __pyx_n_s_obs_mean, __pyx_n_s_idx); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 301, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__30);
+  __Pyx_GIVEREF(__pyx_tuple__30);
+  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(4, 0, 9, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_calc_llh_ratio_const_var, 301, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 301, __pyx_L1_error)
 
-  /* "tombo/_c_helper.pyx":313
+  /* "tombo/_c_helper.pyx":316
  *     return running_llhr
  * 
  * def c_calc_scaled_llh_ratio_const_var(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] reg_means, np.ndarray[DTYPE_t] reg_ref_means,
  *         np.ndarray[DTYPE_t] reg_alt_means, DTYPE_t const_var,
  */
-  __pyx_tuple__30 = PyTuple_Pack(17, __pyx_n_s_reg_means, __pyx_n_s_reg_ref_means, __pyx_n_s_reg_alt_means, __pyx_n_s_const_var, __pyx_n_s_scale_factor, __pyx_n_s_density_height_factor, __pyx_n_s_density_height_power, __pyx_n_s_running_scaled_lhr, __pyx_n_s_ref_diff, __pyx_n_s_alt_diff, __pyx_n_s_ref_mean, __pyx_n_s_alt_mean, __pyx_n_s_scale_diff, __pyx_n_s_obs_mean, __pyx_n_s_means_diff, __pyx_n_s_idx, __pyx_n_s_scale_mean); if (unlikely(!__pyx_tuple__30)) __PYX_ERR(0, 313, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__30);
-  __Pyx_GIVEREF(__pyx_tuple__30);
-  __pyx_codeobj__31 = (PyObject*)__Pyx_PyCode_New(7, 0, 17, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__30, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_calc_scaled_llh_ratio_const_va, 313, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__31)) __PYX_ERR(0, 313, __pyx_L1_error)
+  __pyx_tuple__32 = PyTuple_Pack(17, __pyx_n_s_reg_means, __pyx_n_s_reg_ref_means, __pyx_n_s_reg_alt_means, __pyx_n_s_const_var, __pyx_n_s_scale_factor, __pyx_n_s_density_height_factor, __pyx_n_s_density_height_power, __pyx_n_s_running_scaled_lhr, __pyx_n_s_ref_diff, __pyx_n_s_alt_diff, __pyx_n_s_ref_mean, __pyx_n_s_alt_mean, __pyx_n_s_scale_diff, __pyx_n_s_obs_mean, __pyx_n_s_means_diff, __pyx_n_s_idx, __pyx_n_s_scale_mean); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__32);
+  __Pyx_GIVEREF(__pyx_tuple__32);
+  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(7, 0, 17, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_calc_scaled_llh_ratio_const_va, 316, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 316, __pyx_L1_error)
 
-  /* "tombo/_c_helper.pyx":362
+  /* "tombo/_c_helper.pyx":365
  * @cython.wraparound(False)
  * @cython.boundscheck(False)
  * def c_compute_slopes(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] r_event_means, np.ndarray[DTYPE_t] r_model_means,
  *         DTYPE_t max_slope=1000.0):
  */
-  __pyx_tuple__32 = PyTuple_Pack(8, __pyx_n_s_r_event_means, __pyx_n_s_r_model_means, __pyx_n_s_max_slope, __pyx_n_s_s_i, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_n_events, __pyx_n_s_slopes); if (unlikely(!__pyx_tuple__32)) __PYX_ERR(0, 362, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_tuple__32);
-  __Pyx_GIVEREF(__pyx_tuple__32);
-  __pyx_codeobj__33 = (PyObject*)__Pyx_PyCode_New(3, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__32, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_compute_slopes, 362, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__33)) __PYX_ERR(0, 362, __pyx_L1_error)
+  __pyx_tuple__34 = PyTuple_Pack(8, __pyx_n_s_r_event_means, __pyx_n_s_r_model_means, __pyx_n_s_max_slope, __pyx_n_s_s_i, __pyx_n_s_i, __pyx_n_s_j, __pyx_n_s_n_events, __pyx_n_s_slopes); if (unlikely(!__pyx_tuple__34)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__34);
+  __Pyx_GIVEREF(__pyx_tuple__34);
+  __pyx_codeobj__35 = (PyObject*)__Pyx_PyCode_New(3, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__34, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_compute_slopes, 365, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__35)) __PYX_ERR(0, 365, __pyx_L1_error)
+
+  /* "tombo/_c_helper.pyx":384
+ * @cython.wraparound(False)
+ * @cython.boundscheck(False)
+ * def c_extend_ambig_indel(             # <<<<<<<<<<<<<<
+ *         np.ndarray[DTYPE_UINT8_t] indel_seq not None,
+ *         np.ndarray[DTYPE_UINT8_t] before_seq not None,
+ */
+  __pyx_tuple__36 = PyTuple_Pack(8, __pyx_n_s_indel_seq, __pyx_n_s_before_seq, __pyx_n_s_after_seq, __pyx_n_s_indel_len, __pyx_n_s_before_len, __pyx_n_s_after_len, __pyx_n_s_up, __pyx_n_s_down); if (unlikely(!__pyx_tuple__36)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__36);
+  __Pyx_GIVEREF(__pyx_tuple__36);
+  __pyx_codeobj__37 = (PyObject*)__Pyx_PyCode_New(3, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__36, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_extend_ambig_indel, 384, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__37)) __PYX_ERR(0, 384, __pyx_L1_error)
+
+  /* "tombo/_c_helper.pyx":410
+ * @cython.wraparound(False)
+ * @cython.boundscheck(False)
+ * def c_validate_segs(             # <<<<<<<<<<<<<<
+ *         np.ndarray[DTYPE_INT_t] segs not None, DTYPE_INT_t sig_len):
+ *     """
+ */
+  __pyx_tuple__38 = PyTuple_Pack(4, __pyx_n_s_segs, __pyx_n_s_sig_len, __pyx_n_s_idx, __pyx_n_s_n_segs); if (unlikely(!__pyx_tuple__38)) __PYX_ERR(0, 410, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__38);
+  __Pyx_GIVEREF(__pyx_tuple__38);
+  __pyx_codeobj__39 = (PyObject*)__Pyx_PyCode_New(2, 0, 4, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__38, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_validate_segs, 410, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__39)) __PYX_ERR(0, 410, __pyx_L1_error)
+
+  /* "tombo/_c_helper.pyx":432
+ * @cython.wraparound(False)
+ * @cython.boundscheck(False)
+ * def c_stay_state_keep_idxs(np.ndarray[DTYPE_UINT8_t] moves not None):             # <<<<<<<<<<<<<<
+ *     """
+ *     Get indices of event starts to keep after clipping stay states from the
+ */
+  __pyx_tuple__40 = PyTuple_Pack(8, __pyx_n_s_moves, __pyx_n_s_idx, __pyx_n_s_k_idx, __pyx_n_s_n_moves, __pyx_n_s_start_clip, __pyx_n_s_end_pos, __pyx_n_s_n_keep, __pyx_n_s_keep_idxs); if (unlikely(!__pyx_tuple__40)) __PYX_ERR(0, 432, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_tuple__40);
+  __Pyx_GIVEREF(__pyx_tuple__40);
+  __pyx_codeobj__41 = (PyObject*)__Pyx_PyCode_New(1, 0, 8, 0, CO_OPTIMIZED|CO_NEWLOCALS, __pyx_empty_bytes, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_tuple__40, __pyx_empty_tuple, __pyx_empty_tuple, __pyx_kp_s_tombo__c_helper_pyx, __pyx_n_s_c_stay_state_keep_idxs, 432, __pyx_empty_bytes); if (unlikely(!__pyx_codeobj__41)) __PYX_ERR(0, 432, __pyx_L1_error)
   __Pyx_RefNannyFinishContext();
   return 0;
   __pyx_L1_error:;
@@ -11029,8 +13137,10 @@ static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void) {
   __pyx_umethod_PySet_Type_update.type = (PyObject*)&PySet_Type;
   if (__Pyx_InitStrings(__pyx_string_tab) < 0) __PYX_ERR(0, 1, __pyx_L1_error);
   __pyx_float_0_0 = PyFloat_FromDouble(0.0); if (unlikely(!__pyx_float_0_0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_0 = PyInt_FromLong(0); if (unlikely(!__pyx_int_0)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_1 = PyInt_FromLong(1); if (unlikely(!__pyx_int_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_2 = PyInt_FromLong(2); if (unlikely(!__pyx_int_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_int_3 = PyInt_FromLong(3); if (unlikely(!__pyx_int_3)) __PYX_ERR(0, 1, __pyx_L1_error)
   __pyx_int_neg_1 = PyInt_FromLong(-1); if (unlikely(!__pyx_int_neg_1)) __PYX_ERR(0, 1, __pyx_L1_error)
   return 0;
   __pyx_L1_error:;
@@ -11096,18 +13206,18 @@ static int __Pyx_modinit_type_import_code(void) {
   __Pyx_ImportType_CheckSize_Warn);
    if (!__pyx_ptype_7cpython_4type_type) __PYX_ERR(2, 9, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-  __pyx_t_1 = PyImport_ImportModule("numpy"); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 207, __pyx_L1_error)
+  __pyx_t_1 = PyImport_ImportModule("numpy"); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 206, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_1);
   __pyx_ptype_5numpy_dtype = __Pyx_ImportType(__pyx_t_1, "numpy", "dtype", sizeof(PyArray_Descr), __Pyx_ImportType_CheckSize_Ignore);
-   if (!__pyx_ptype_5numpy_dtype) __PYX_ERR(1, 207, __pyx_L1_error)
+   if (!__pyx_ptype_5numpy_dtype) __PYX_ERR(1, 206, __pyx_L1_error)
   __pyx_ptype_5numpy_flatiter = __Pyx_ImportType(__pyx_t_1, "numpy", "flatiter", sizeof(PyArrayIterObject), __Pyx_ImportType_CheckSize_Ignore);
-   if (!__pyx_ptype_5numpy_flatiter) __PYX_ERR(1, 230, __pyx_L1_error)
+   if (!__pyx_ptype_5numpy_flatiter) __PYX_ERR(1, 229, __pyx_L1_error)
   __pyx_ptype_5numpy_broadcast = __Pyx_ImportType(__pyx_t_1, "numpy", "broadcast", sizeof(PyArrayMultiIterObject), __Pyx_ImportType_CheckSize_Ignore);
-   if (!__pyx_ptype_5numpy_broadcast) __PYX_ERR(1, 234, __pyx_L1_error)
+   if (!__pyx_ptype_5numpy_broadcast) __PYX_ERR(1, 233, __pyx_L1_error)
   __pyx_ptype_5numpy_ndarray = __Pyx_ImportType(__pyx_t_1, "numpy", "ndarray", sizeof(PyArrayObject), __Pyx_ImportType_CheckSize_Ignore);
-   if (!__pyx_ptype_5numpy_ndarray) __PYX_ERR(1, 246, __pyx_L1_error)
+   if (!__pyx_ptype_5numpy_ndarray) __PYX_ERR(1, 242, __pyx_L1_error)
   __pyx_ptype_5numpy_ufunc = __Pyx_ImportType(__pyx_t_1, "numpy", "ufunc", sizeof(PyUFuncObject), __Pyx_ImportType_CheckSize_Ignore);
-   if (!__pyx_ptype_5numpy_ufunc) __PYX_ERR(1, 839, __pyx_L1_error)
+   if (!__pyx_ptype_5numpy_ufunc) __PYX_ERR(1, 917, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
   __Pyx_RefNannyFinishContext();
   return 0;
@@ -11391,182 +13501,233 @@ if (!__Pyx_RefNanny) {
   if (PyDict_SetItem(__pyx_d, __pyx_n_s_DTYPE_INT16, __pyx_t_2) < 0) __PYX_ERR(0, 12, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":20
+  /* "tombo/_c_helper.pyx":15
+ * ctypedef np.int16_t DTYPE_INT16_t
+ * 
+ * DTYPE_UINT8 = np.uint8             # <<<<<<<<<<<<<<
+ * ctypedef np.uint8_t DTYPE_UINT8_t
+ * 
+ */
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_n_s_np); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 15, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_n_s_uint8); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 15, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_DTYPE_UINT8, __pyx_t_1) < 0) __PYX_ERR(0, 15, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "tombo/_c_helper.pyx":23
  *     double sqrt(double m)
  * 
  * from itertools import combinations             # <<<<<<<<<<<<<<
  * 
  * def c_mean_std(np.ndarray[DTYPE_t] values):
  */
-  __pyx_t_2 = PyList_New(1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 20, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_1 = PyList_New(1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
   __Pyx_INCREF(__pyx_n_s_combinations);
   __Pyx_GIVEREF(__pyx_n_s_combinations);
-  PyList_SET_ITEM(__pyx_t_2, 0, __pyx_n_s_combinations);
-  __pyx_t_1 = __Pyx_Import(__pyx_n_s_itertools, __pyx_t_2, -1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 20, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_t_2 = __Pyx_ImportFrom(__pyx_t_1, __pyx_n_s_combinations); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 20, __pyx_L1_error)
+  PyList_SET_ITEM(__pyx_t_1, 0, __pyx_n_s_combinations);
+  __pyx_t_2 = __Pyx_Import(__pyx_n_s_itertools, __pyx_t_1, -1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 23, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_combinations, __pyx_t_2) < 0) __PYX_ERR(0, 20, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
   __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __Pyx_ImportFrom(__pyx_t_2, __pyx_n_s_combinations); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_combinations, __pyx_t_1) < 0) __PYX_ERR(0, 23, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":22
+  /* "tombo/_c_helper.pyx":25
  * from itertools import combinations
  * 
  * def c_mean_std(np.ndarray[DTYPE_t] values):             # <<<<<<<<<<<<<<
  *     """
  *     More efficient method to get both mean and standard deviation
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_1c_mean_std, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 22, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_mean_std, __pyx_t_1) < 0) __PYX_ERR(0, 22, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_1c_mean_std, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_mean_std, __pyx_t_2) < 0) __PYX_ERR(0, 25, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":38
+  /* "tombo/_c_helper.pyx":41
  *     return v_mean, sqrt(v_var / v_len)
  * 
  * def c_new_mean_stds(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] norm_signal not None,
  *         np.ndarray[DTYPE_INT_t] new_segs not None):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_3c_new_mean_stds, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 38, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_new_mean_stds, __pyx_t_1) < 0) __PYX_ERR(0, 38, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_3c_new_mean_stds, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 41, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_new_mean_stds, __pyx_t_2) < 0) __PYX_ERR(0, 41, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":59
+  /* "tombo/_c_helper.pyx":62
  *     return means_arr, stds_arr
  * 
  * def c_new_means(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] norm_signal not None,
  *         np.ndarray[DTYPE_INT_t] new_segs not None):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_5c_new_means, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 59, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_new_means, __pyx_t_1) < 0) __PYX_ERR(0, 59, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_5c_new_means, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 62, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_new_means, __pyx_t_2) < 0) __PYX_ERR(0, 62, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":73
+  /* "tombo/_c_helper.pyx":76
  *     return means_arr
  * 
  * def c_apply_outlier_thresh(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] raw_signal, DTYPE_t lower_lim, DTYPE_t upper_lim):
  *     cdef DTYPE_INT_t raw_size = raw_signal.shape[0]
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_7c_apply_outlier_thresh, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 73, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_apply_outlier_thresh, __pyx_t_1) < 0) __PYX_ERR(0, 73, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_7c_apply_outlier_thresh, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_apply_outlier_thresh, __pyx_t_2) < 0) __PYX_ERR(0, 76, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":89
+  /* "tombo/_c_helper.pyx":92
  *     return clipped_signal
  * 
  * def c_valid_cpts_w_cap(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] raw_signal, DTYPE_INT_t min_base_obs,
  *         DTYPE_INT_t running_stat_width, DTYPE_INT_t num_cpts):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_9c_valid_cpts_w_cap, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 89, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_valid_cpts_w_cap, __pyx_t_1) < 0) __PYX_ERR(0, 89, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_9c_valid_cpts_w_cap, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_valid_cpts_w_cap, __pyx_t_2) < 0) __PYX_ERR(0, 92, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":122
+  /* "tombo/_c_helper.pyx":125
  *     return cpts
  * 
  * def c_valid_cpts(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] raw_signal, DTYPE_INT_t min_base_obs,
  *         DTYPE_INT_t running_stat_width):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_11c_valid_cpts, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 122, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_valid_cpts, __pyx_t_1) < 0) __PYX_ERR(0, 122, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_11c_valid_cpts, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 125, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_valid_cpts, __pyx_t_2) < 0) __PYX_ERR(0, 125, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":144
+  /* "tombo/_c_helper.pyx":147
  *     return np.array(cpts) + running_stat_width
  * 
  * def c_valid_cpts_w_cap_t_test(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] raw_signal, DTYPE_INT_t min_base_obs,
  *         DTYPE_INT_t running_stat_width, DTYPE_INT_t num_cpts):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_13c_valid_cpts_w_cap_t_test, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 144, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_valid_cpts_w_cap_t_test, __pyx_t_1) < 0) __PYX_ERR(0, 144, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_13c_valid_cpts_w_cap_t_test, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 147, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_valid_cpts_w_cap_t_test, __pyx_t_2) < 0) __PYX_ERR(0, 147, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":221
+  /* "tombo/_c_helper.pyx":224
  * @cython.wraparound(False)
  * @cython.boundscheck(False)
  * def c_compute_running_pctl_diffs(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_INT16_t] arr, DTYPE_INT_t window_size,
  *         DTYPE_t lower_pctl, DTYPE_t upper_pctl):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_15c_compute_running_pctl_diffs, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 221, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_compute_running_pctl_diffs, __pyx_t_1) < 0) __PYX_ERR(0, 221, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_15c_compute_running_pctl_diffs, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 224, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_compute_running_pctl_diffs, __pyx_t_2) < 0) __PYX_ERR(0, 224, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":277
+  /* "tombo/_c_helper.pyx":280
  *     return running_pctl_diffs
  * 
  * def c_calc_llh_ratio(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] reg_means,
  *         np.ndarray[DTYPE_t] reg_ref_means, np.ndarray[DTYPE_t] reg_alt_means,
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_17c_calc_llh_ratio, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_calc_llh_ratio, __pyx_t_1) < 0) __PYX_ERR(0, 277, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_17c_calc_llh_ratio, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 280, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_calc_llh_ratio, __pyx_t_2) < 0) __PYX_ERR(0, 280, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":298
+  /* "tombo/_c_helper.pyx":301
  *     return log_lh_ratio
  * 
  * def c_calc_llh_ratio_const_var(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] reg_means, np.ndarray[DTYPE_t] reg_ref_means,
  *         np.ndarray[DTYPE_t] reg_alt_means, DTYPE_t const_var):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_19c_calc_llh_ratio_const_var, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 298, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_calc_llh_ratio_const_var, __pyx_t_1) < 0) __PYX_ERR(0, 298, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_19c_calc_llh_ratio_const_var, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 301, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_calc_llh_ratio_const_var, __pyx_t_2) < 0) __PYX_ERR(0, 301, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":313
+  /* "tombo/_c_helper.pyx":316
  *     return running_llhr
  * 
  * def c_calc_scaled_llh_ratio_const_var(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] reg_means, np.ndarray[DTYPE_t] reg_ref_means,
  *         np.ndarray[DTYPE_t] reg_alt_means, DTYPE_t const_var,
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_21c_calc_scaled_llh_ratio_const_var, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 313, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_calc_scaled_llh_ratio_const_va, __pyx_t_1) < 0) __PYX_ERR(0, 313, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_21c_calc_scaled_llh_ratio_const_var, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_calc_scaled_llh_ratio_const_va, __pyx_t_2) < 0) __PYX_ERR(0, 316, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "tombo/_c_helper.pyx":362
+  /* "tombo/_c_helper.pyx":365
  * @cython.wraparound(False)
  * @cython.boundscheck(False)
  * def c_compute_slopes(             # <<<<<<<<<<<<<<
  *         np.ndarray[DTYPE_t] r_event_means, np.ndarray[DTYPE_t] r_model_means,
  *         DTYPE_t max_slope=1000.0):
  */
-  __pyx_t_1 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_23c_compute_slopes, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 362, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_compute_slopes, __pyx_t_1) < 0) __PYX_ERR(0, 362, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_23c_compute_slopes, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 365, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_compute_slopes, __pyx_t_2) < 0) __PYX_ERR(0, 365, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "tombo/_c_helper.pyx":384
+ * @cython.wraparound(False)
+ * @cython.boundscheck(False)
+ * def c_extend_ambig_indel(             # <<<<<<<<<<<<<<
+ *         np.ndarray[DTYPE_UINT8_t] indel_seq not None,
+ *         np.ndarray[DTYPE_UINT8_t] before_seq not None,
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_25c_extend_ambig_indel, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_extend_ambig_indel, __pyx_t_2) < 0) __PYX_ERR(0, 384, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "tombo/_c_helper.pyx":410
+ * @cython.wraparound(False)
+ * @cython.boundscheck(False)
+ * def c_validate_segs(             # <<<<<<<<<<<<<<
+ *         np.ndarray[DTYPE_INT_t] segs not None, DTYPE_INT_t sig_len):
+ *     """
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_27c_validate_segs, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 410, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_validate_segs, __pyx_t_2) < 0) __PYX_ERR(0, 410, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "tombo/_c_helper.pyx":432
+ * @cython.wraparound(False)
+ * @cython.boundscheck(False)
+ * def c_stay_state_keep_idxs(np.ndarray[DTYPE_UINT8_t] moves not None):             # <<<<<<<<<<<<<<
+ *     """
+ *     Get indices of event starts to keep after clipping stay states from the
+ */
+  __pyx_t_2 = PyCFunction_NewEx(&__pyx_mdef_5tombo_9_c_helper_29c_stay_state_keep_idxs, NULL, __pyx_n_s_tombo__c_helper); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 432, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_c_stay_state_keep_idxs, __pyx_t_2) < 0) __PYX_ERR(0, 432, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
   /* "tombo/_c_helper.pyx":1
  * cimport cython             # <<<<<<<<<<<<<<
  * 
  * import numpy as np
  */
-  __pyx_t_1 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_1);
-  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_1) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
-  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_d, __pyx_n_s_test, __pyx_t_2) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "../../../../../opt/miniconda3/envs/tombo/lib/python3.7/site-packages/numpy/__init__.pxd":967
+  /* "../../opt/cython/Cython/Includes/numpy/__init__.pxd":1045
  *         raise ImportError("numpy.core.umath failed to import")
  * 
  * cdef inline int import_ufunc() except -1:             # <<<<<<<<<<<<<<
@@ -13263,6 +15424,12 @@ static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
     return 0;
 }
 
+/* BufferFallbackError */
+  static void __Pyx_RaiseBufferFallbackError(void) {
+  PyErr_SetString(PyExc_ValueError,
+     "Buffer acquisition failed on assignment; and then reacquiring the old buffer failed too!");
+}
+
 /* DictGetItem */
   #if PY_MAJOR_VERSION >= 3 && !CYTHON_COMPILING_IN_PYPY
 static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
@@ -13819,6 +15986,7 @@ bad:
 #if PY_MAJOR_VERSION < 3
 static int __Pyx_GetBuffer(PyObject *obj, Py_buffer *view, int flags) {
     if (PyObject_CheckBuffer(obj)) return PyObject_GetBuffer(obj, view, flags);
+        if (__Pyx_TypeCheck(obj, __pyx_ptype_5numpy_ndarray)) return __pyx_pw_5numpy_7ndarray_1__getbuffer__(obj, view, flags);
     PyErr_Format(PyExc_TypeError, "'%.200s' does not have the buffer interface", Py_TYPE(obj)->tp_name);
     return -1;
 }
@@ -13830,6 +15998,7 @@ static void __Pyx_ReleaseBuffer(Py_buffer *view) {
         return;
     }
     if ((0)) {}
+        else if (__Pyx_TypeCheck(obj, __pyx_ptype_5numpy_ndarray)) __pyx_pw_5numpy_7ndarray_3__releasebuffer__(obj, view);
     view->obj = NULL;
     Py_DECREF(obj);
 }
@@ -12,6 +12,9 @@ ctypedef np.int64_t DTYPE_INT_t
 DTYPE_INT16 = np.int16
 ctypedef np.int16_t DTYPE_INT16_t
 
+DTYPE_UINT8 = np.uint8
+ctypedef np.uint8_t DTYPE_UINT8_t
+
 from libc.math cimport log, exp
 
 cdef extern from "math.h":
@@ -375,3 +378,86 @@ def c_compute_slopes(
                 r_model_means[i] - r_model_means[j]) / (
                     r_event_means[i] - r_event_means[j])
     return slopes
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def c_extend_ambig_indel(
+        np.ndarray[DTYPE_UINT8_t] indel_seq not None,
+        np.ndarray[DTYPE_UINT8_t] before_seq not None,
+        np.ndarray[DTYPE_UINT8_t] after_seq not None):
+    """
+    Extend an indel through sequence where its placement is ambiguous.
+    Returns number of bases (negative) to extend upstream and downstream.
+    """
+    cdef DTYPE_INT_t indel_len = indel_seq.shape[0]
+    cdef DTYPE_INT_t before_len = before_seq.shape[0]
+    cdef DTYPE_INT_t after_len = after_seq.shape[0]
+    cdef DTYPE_INT_t up = -1
+    cdef DTYPE_INT_t down = 0
+    # only extend up to one position before beginning or end
+    # as a one base pad is added outside of indel
+    while (down < after_len - 1 and
+           indel_seq[down % indel_len] == after_seq[down]):
+        down += 1
+    while (-up <= before_len - 1 and
+           indel_seq[indel_len - 1 - ((-up - 1) % indel_len)] ==
+           before_seq[before_len + up]):
+        up -= 1
+    return up, down
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def c_validate_segs(
+        np.ndarray[DTYPE_INT_t] segs not None, DTYPE_INT_t sig_len):
+    """
+    Check segments in a single pass. Returns 0 for valid segments, 1 for
+    zero length (or decreasing) segments, 2 for a negative start and 3 for
+    an end past the signal length.
+    """
+    cdef DTYPE_INT_t idx
+    cdef DTYPE_INT_t n_segs = segs.shape[0]
+    if n_segs == 0:
+        return 0
+    for idx in range(1, n_segs):
+        if segs[idx] <= segs[idx - 1]:
+            return 1
+    if segs[0] < 0:
+        return 2
+    if segs[n_segs - 1] > sig_len:
+        return 3
+    return 0
+
+@cython.wraparound(False)
+@cython.boundscheck(False)
+def c_stay_state_keep_idxs(np.ndarray[DTYPE_UINT8_t] moves not None):
+    """
+    Get indices of event starts to keep after clipping stay states from the
+    start and end of a read and removing internal stay states. Basecalls are
+    kept at all but the last index. Returns None if the read is composed
+    entirely of stay states.
+    """
+    cdef DTYPE_INT_t idx, k_idx
+    cdef DTYPE_INT_t n_moves = moves.shape[0]
+    cdef DTYPE_INT_t start_clip = 0
+    cdef DTYPE_INT_t end_pos = n_moves
+    cdef DTYPE_INT_t n_keep = 2
+    cdef np.ndarray[DTYPE_INT_t] keep_idxs
+    while start_clip < n_moves and moves[start_clip] == 0:
+        start_clip += 1
+    if start_clip == n_moves or (
+            start_clip > 0 and start_clip >= n_moves - 1):
+        return None
+    while moves[end_pos - 1] == 0:
+        end_pos -= 1
+    for idx in range(start_clip, end_pos):
+        if moves[idx] != 0:
+            n_keep += 1
+    keep_idxs = np.empty(n_keep, dtype=DTYPE_INT)
+    keep_idxs[0] = start_clip
+    k_idx = 1
+    for idx in range(start_clip, end_pos):
+        if moves[idx] != 0:
+            keep_idxs[k_idx] = idx + 1
+            k_idx += 1
+    keep_idxs[k_idx] = end_pos + 1
+    return keep_idxs
@@ -4,9 +4,9 @@ from builtins import int, range, dict, zip
 
 import os
 import io
-import re
 import sys
 import queue
+import threading
 
 # Future warning from cython in h5py
 import warnings
@@ -17,13 +17,17 @@ import numpy as np
 np.seterr(all='raise')
 import multiprocessing as mp
 
-from subprocess import call
-from time import sleep, time
-from itertools import repeat
+from subprocess import Popen, PIPE
+from time import time
 from operator import itemgetter
 from tempfile import NamedTemporaryFile
 from distutils.version import LooseVersion
-from collections import defaultdict, namedtuple, Counter
+from collections import defaultdict, namedtuple
+
+try:
+    import cPickle as pickle
+except:
+    import pickle
 
 if sys.version_info[0] > 2:
     unicode = str
@@ -33,6 +37,8 @@ from . import tombo_stats as ts
 from . import tombo_helper as th
 
 from ._default_parameters import SEG_PARAMS_TABLE, DNA_SAMP_TYPE, RNA_SAMP_TYPE
+from ._c_helper import (
+    c_extend_ambig_indel, c_validate_segs, c_stay_state_keep_idxs)
 
 
 VERBOSE = False
@@ -44,18 +50,50 @@ OPTIMIZE_ALIGN = False
 # reads to be resquiggled
 PROGRESS_INTERVAL = 100
 ALIGN_BATCH_MULTIPLIER = 5
+# number of files passed to a resquiggle process in each queue item
+RSQGL_BATCH_SIZE = 10
+QUEUE_TIMEOUT = 0.1
+
+# directory for temporary files (mapper input and output and resquiggle
+# worker index data). Set TOMBO_TMPDIR to a memory backed file system
+# (e.g. /dev/shm) to avoid writing these files to disk for each alignment batch
+MAPPER_TMP_DIR = os.environ.get('TOMBO_TMPDIR')
+# read filename for mappers reading from stdin (bwa mem and minimap2)
+STDIN_FN = '-'
 
 FN_SPACE_FILLER = '|||'
+FAST5_OPEN_ERROR = (
+    'Error opening file for re-squiggle. This should have ' +
+    'been caught during the alignment phase. Check that there ' +
+    'are no other tombo processes or processes accessing ' +
+    'these HDF5 files running simultaneously.')
 FASTA_NAME_JOINER = ':::'
+# error messages for c_validate_segs return codes
+SEGS_ERRORS = {
+    1:'New segments include zero length events.',
+    2:'New segments start with negative index.',
+    3:'New segments end past raw signal values.'}
 
 ALBACORE_TEXT = 'ONT Albacore Sequencing Software'
+# albacore versions where event formats changed (parsed once at import)
+ALBACORE_V1_0 = LooseVersion("1.0")
+ALBACORE_V2_0 = LooseVersion("2.0")
+ALBACORE_V2_1 = LooseVersion("2.1")
 
 indelStats = namedtuple('indelStats', ('start', 'end', 'diff'))
 indelGroupStats = namedtuple('indelGroupStats',
                              ('start', 'end', 'cpts', 'indels'))
 mapperData = namedtuple('mapperData', ('exe', 'type', 'index'))
+# parallel per-read lists for a batch of reads (read data fields in the order
+# returned from get_read_data after read_fn_sgs)
+batchReadsData = namedtuple('batchReadsData', (
+    'read_fn_sgs', 'read_starts', 'starts', 'basecalls', 'channel_infos',
+    'read_ids', 'fix_read_starts'))
 # set default index to None
 mapperData.__new__.__defaults__ = (None,)
+# dense pore model levels indexed by integer encoded k-mers
+modelLookup = namedtuple('modelLookup', (
+    'base_codes', 'kmer_width', 'place_values', 'means', 'inv_var'))
 
 M5_FIELDS = (
     'qName', 'qLength', 'qStart', 'qEnd', 'qStrand',
@@ -65,48 +103,105 @@ M5_FIELDS = (
 SAM_FIELDS = (
     'qName', 'flag', 'rName', 'pos', 'mapq',
     'cigar', 'rNext', 'pNext', 'tLen', 'seq', 'qual')
-CIGAR_PAT = re.compile('(\d+)([MIDNSHP=X])')
-GAP_PAT = re.compile('-+')
+M5_QNAME_IDX = M5_FIELDS.index('qName')
+M5_SCORE_IDX = M5_FIELDS.index('score')
+SAM_QNAME_IDX = SAM_FIELDS.index('qName')
+SAM_RNAME_IDX = SAM_FIELDS.index('rName')
+SAM_MAPQ_IDX = SAM_FIELDS.index('mapq')
+CIGAR_OPS = 'MIDNSHP=X'
+GAP_BASE = ord('-')
+# ASCII code complement lookup table matching th.COMP_BASES
+COMP_BASE_CODES = np.arange(256, dtype=np.uint8)
+COMP_BASE_CODES[list(th.COMP_BASES.keys())] = list(th.COMP_BASES.values())
 
 
 #################################################
 ########## Raw Signal Re-squiggle Code ##########
 #################################################
 
+def find_gap_runs(align_seq):
+    """Find start and (open interval) end positions of gap runs within an
+    alignment row encoded as ASCII codes.
+    """
+    gap_edges = np.diff(np.concatenate([
+        [0], (align_seq == GAP_BASE).view(np.int8), [0]]))
+    return np.flatnonzero(gap_edges == 1), np.flatnonzero(gap_edges == -1)
+
+def get_model_lookup(pore_model):
+    """Convert pore model dictionaries into dense arrays indexed by integer
+    encoded k-mers for vectorized per-event lookup.
+    """
+    kmers = list(pore_model.means.keys())
+    kmer_codes = np.frombuffer(''.join(kmers).encode(), dtype=np.uint8)
+    model_bases = np.unique(kmer_codes)
+    # ASCII code to base index lookup table (-1 for bases not in model)
+    base_codes = np.full(256, -1, dtype=np.int64)
+    base_codes[model_bases] = np.arange(model_bases.shape[0])
+    place_values = model_bases.shape[0] ** np.arange(
+        pore_model.kmer_width - 1, -1, -1, dtype=np.int64)
+    kmer_idx = base_codes[kmer_codes].reshape(
+        -1, pore_model.kmer_width).dot(place_values)
+
+    # levels for k-mers not in the model are left as NaN
+    num_kmers = model_bases.shape[0] ** pore_model.kmer_width
+    means, inv_var = np.full(num_kmers, np.NAN), np.full(num_kmers, np.NAN)
+    means[kmer_idx] = [pore_model.means[kmer] for kmer in kmers]
+    inv_var[kmer_idx] = [pore_model.inv_var[kmer] for kmer in kmers]
+
+    return modelLookup(base_codes, pore_model.kmer_width, place_values,
+                       means, inv_var)
+
+def get_event_model_levels(model_lookup, event_kmers):
+    """Look up expected levels and inverse variances for a fixed width bytes
+    array of event k-mers.
+    """
+    if event_kmers.dtype.itemsize != model_lookup.kmer_width:
+        raise th.TomboError('Invalid k-mer found in basecalled events.')
+    kmer_codes = model_lookup.base_codes[
+        np.ascontiguousarray(event_kmers).view(np.uint8)].reshape(
+            -1, model_lookup.kmer_width)
+    if (kmer_codes < 0).any():
+        raise th.TomboError('Invalid k-mer found in basecalled events.')
+    kmer_idx = kmer_codes.dot(model_lookup.place_values)
+    model_means = model_lookup.means[kmer_idx]
+    if np.isnan(model_means).any():
+        raise th.TomboError('Invalid k-mer found in basecalled events.')
+
+    return model_means, model_lookup.inv_var[kmer_idx]
+
 def get_indel_groups(
         alignVals, align_segs, raw_signal, min_obs_per_base,
         running_stat_width, timeout, num_cpts_limit):
     def get_all_indels():
-        # get genomic sequence for and between each indel
-        read_align = ''.join(map(itemgetter(0), alignVals))
-        genome_align = ''.join(map(itemgetter(1), alignVals))
-        genome_gaps = [(m.start(), m.end()) for m in
-                       GAP_PAT.finditer(genome_align)]
-        read_gaps = [(m.start(), m.end())
-                     for m in GAP_PAT.finditer(read_align)]
-        all_indel_locs = sorted(
-            genome_gaps + read_gaps +
-            [(0,0), (len(read_align), len(read_align))])
-        btwn_indel_seqs = [
-            genome_align[m_start:m_end] for m_start, m_end in
-            zip(map(itemgetter(1), all_indel_locs[:-1]),
-                map(itemgetter(0), all_indel_locs[1:]))]
+        read_align, genome_align = alignVals
+        align_len = read_align.shape[0]
+        genome_gap_starts, genome_gap_ends = find_gap_runs(genome_align)
+        read_gap_starts, read_gap_ends = find_gap_runs(read_align)
+        # sort indels (with empty indels padding the alignment ends) by
+        # start then end position
+        indel_starts = np.concatenate([
+            [0], genome_gap_starts, read_gap_starts, [align_len]])
+        indel_ends = np.concatenate([
+            [0], genome_gap_ends, read_gap_ends, [align_len]])
+        locs_order = np.lexsort((indel_ends, indel_starts))
+        indel_starts = indel_starts[locs_order]
+        indel_ends = indel_ends[locs_order]
         # is each indel an ins(ertion) or deletion
-        all_is_ins = [read_align[start:end].startswith('-')
-                      for start, end in all_indel_locs[1:-1]]
-        indel_seqs = [
-            genome_align[start:end]
-            if is_ins else read_align[start:end]
-            for is_ins, (start, end) in
-            zip(all_is_ins, all_indel_locs[1:-1])]
+        all_is_ins = read_align[indel_starts[1:-1]] == GAP_BASE
 
         # loop over indels along with sequence before and after in
         # order to check for ambiguous indels
         unambig_indels = []
-        curr_read_len = len(btwn_indel_seqs[0])
-        for indel_seq, before_seq, after_seq, is_ins in zip(
-                indel_seqs, btwn_indel_seqs[:-1], btwn_indel_seqs[1:],
-                all_is_ins):
+        curr_read_len = int(indel_starts[1])
+        for prev_end, start, end, next_start, is_ins in zip(
+                indel_ends[:-2].tolist(), indel_starts[1:-1].tolist(),
+                indel_ends[1:-1].tolist(), indel_starts[2:].tolist(),
+                all_is_ins.tolist()):
+            # genomic sequence for and between each indel
+            indel_seq = genome_align[start:end] if is_ins else \
+                        read_align[start:end]
+            before_seq = genome_align[prev_end:start]
+            after_seq = genome_align[end:next_start]
             indel_len = len(indel_seq)
             # if this is an insertion then don't include indel in
             # length to end of indel
@@ -119,21 +214,13 @@ def get_indel_groups(
             # indelStats(curr_read_len - 1, indel_end, indel_diff)
 
             # extend ambiguous indels
-            # only extend up to one position before beginning or end
-            # as a one base pad is added outside of indel
-            u, d = -1, 0
-            while(d < len(after_seq) - 1 and
-                  indel_seq[d%indel_len] == after_seq[d]):
-                d += 1
-            while(u * -1 <= len(before_seq) - 1 and
-                  indel_seq[(u%indel_len)-indel_len] == before_seq[u]):
-                u -= 1
+            u, d = c_extend_ambig_indel(indel_seq, before_seq, after_seq)
             unambig_indels.append(indelStats(
                 curr_read_len + u, indel_end + d, indel_diff))
 
             if not is_ins:
                 curr_read_len += indel_len
-            curr_read_len += len(after_seq)
+            curr_read_len += next_start - end
 
         return unambig_indels
 
@@ -214,12 +301,15 @@ def get_indel_groups(
         return []
     indel_groups = []
     curr_group = [all_indels[0],]
+    # running maximum end position of indels in the current group
+    curr_max_end = all_indels[0].end
     for indel in all_indels[1:]:
         if timeout is not None and time() - timeout_start > timeout:
             raise th.TomboError('Read took too long to re-segment.')
         # check if indel hits current group
-        if max(g_indel.end for g_indel in curr_group) >= indel.start:
+        if curr_max_end >= indel.start:
             curr_group.append(indel)
+            curr_max_end = max(curr_max_end, indel.end)
         else:
             (curr_start, curr_stop, num_cpts,
              curr_group) = extend_and_join(curr_group)
@@ -228,10 +318,13 @@ def get_indel_groups(
             # if the indel group still reaches the next indel
             if curr_stop >= indel.start:
                 curr_group.append(indel)
+                # group may have been joined with previous groups
+                curr_max_end = max(g_indel.end for g_indel in curr_group)
             else:
                 indel_groups.append(indelGroupStats(
                     curr_start, curr_stop, cpts, curr_group))
                 curr_group = [indel,]
+                curr_max_end = indel.end
 
     # handle the last indel group if it is not yet included
     if len(indel_groups) == 0 or \
@@ -260,14 +353,24 @@ def find_read_start(
         begin_read_starts.shape[0])
 
     # identify the offset which aligns the most signal and read changepoints
-    off_by_counts = Counter([
-        signal_cpts[np.abs(np.subtract(
-            signal_cpts, read_cpt)).argmin()] - read_cpt
-        for read_cpt in begin_read_starts]).most_common()
+    # find nearest (sorted) signal changepoint to each read changepoint
+    right_idx = np.minimum(np.searchsorted(
+        signal_cpts, begin_read_starts), signal_cpts.shape[0] - 1)
+    left_idx = np.maximum(right_idx - 1, 0)
+    left_cpts, right_cpts = signal_cpts[left_idx], signal_cpts[right_idx]
+    read_offsets = np.where(
+        np.abs(left_cpts - begin_read_starts) <=
+        np.abs(right_cpts - begin_read_starts),
+        left_cpts, right_cpts) - begin_read_starts
+    offset_idx = read_offsets - read_offsets.min()
+    offset_counts = np.bincount(offset_idx)
+    # break ties by the first occurrence along the read
+    best_offset = int(read_offsets[np.argmax(
+        offset_counts[offset_idx] == offset_counts.max())])
 
     # if signal starts are ahead of read starts
-    if off_by_counts[0][0] > 0:
-        offset = off_by_counts[0][0]
+    if best_offset > 0:
+        offset = best_offset
         # don't let identified offset push past the end of the read signal
         if (offset + norm_signal.shape[0] +
             read_start_rel_to_raw) >= signal_length:
@@ -275,34 +378,37 @@ def find_read_start(
                       norm_signal.shape[0])
         # add fake signal to the end of the read so the file does not have to
         # be queried again
-        norm_signal = np.concatenate([norm_signal[offset:],
-                                      [norm_signal[-1]] * offset])
+        shifted_signal = np.empty_like(norm_signal)
+        shifted_signal[:norm_signal.shape[0] - offset] = norm_signal[offset:]
+        shifted_signal[norm_signal.shape[0] - offset:] = norm_signal[-1]
+        norm_signal = shifted_signal
         read_start_rel_to_raw += offset
     # if signal starts are behind of read starts
-    elif off_by_counts[0][0] < 0:
-        offset = off_by_counts[0][0] * -1
+    elif best_offset < 0:
+        offset = best_offset * -1
         # don't let identified start push start below 0
         if offset > read_start_rel_to_raw:
             offset = read_start_rel_to_raw
-        # add fake signal to the end of the read so the file does not have to
-        # be queried again
-        norm_signal = np.concatenate([[norm_signal[0]] * offset,
-                                      norm_signal[:-offset]])
+        # add fake signal to the start of the read so the file does not have
+        # to be queried again
+        shifted_signal = np.empty_like(norm_signal)
+        shifted_signal[:offset] = norm_signal[0]
+        shifted_signal[offset:] = norm_signal[:norm_signal.shape[0] - offset]
+        norm_signal = shifted_signal
         read_start_rel_to_raw -= offset
 
     return norm_signal, read_start_rel_to_raw
 
 def resquiggle_read(
-        fast5_fn, read_start_rel_to_raw, starts_rel_to_read,
+        fast5_data, fast5_fn, read_start_rel_to_raw, starts_rel_to_read,
         norm_type, outlier_thresh, alignVals, fix_read_start,
         timeout, num_cpts_limit, genome_loc, read_info,
-        basecall_group, corr_grp, compute_sd, pore_model, obs_filter,
+        basecall_group, corr_grp, compute_sd, model_lookup, obs_filter,
         seg_params, in_place=True, skip_index=False):
     # errors should not happen here since these slotes were checked
     # in alignment function, but old zombie processes might cause
     # problems here
     try:
-        fast5_data = h5py.File(fast5_fn, 'r')
         channel_info = th.get_channel_info(fast5_data)
 
         # extract raw data for this read
@@ -316,19 +422,10 @@ def resquiggle_read(
                 '/Analyses/' + basecall_group + '/' +
                 read_info.Subgroup + '/Events'][:]
             r_event_means = event_data['mean']
-            r_event_kmers = list(map(lambda x: x.decode(),
-                                     event_data['model_state']))
-            r_model_means = np.array([
-                pore_model.means[kmer] for kmer in r_event_kmers])
-            r_model_inv_vars = np.array([
-                pore_model.inv_var[kmer] for kmer in r_event_kmers])
-        fast5_data.close()
+            r_model_means, r_model_inv_vars = get_event_model_levels(
+                model_lookup, event_data['model_state'])
     except:
-        raise th.TomboError(
-            'Error opening file for re-squiggle. This should have ' +
-            'been caught during the alignment phase. Check that there ' +
-            'are no other tombo processes or processes accessing ' +
-            'these HDF5 files running simultaneously.')
+        raise th.TomboError(FAST5_OPEN_ERROR)
 
     if seg_params is None:
         seg_params = SEG_PARAMS_TABLE[RNA_SAMP_TYPE] if rna else \
@@ -353,29 +450,27 @@ def resquiggle_read(
         alignVals, starts_rel_to_read, norm_signal, min_obs_per_base,
         running_stat_width, timeout, num_cpts_limit)
 
-    new_segs = []
+    # segments from last indel to this one and new segments within each
+    # indel group (plus end of read)
+    seg_blocks = []
     prev_stop = 0
     for group_start, group_end, cpts, group_indels in indel_groups:
-        ## add segments from last indel to this one and new segments
-        new_segs.append(
-            np.append(starts_rel_to_read[prev_stop:group_start+1],
-                      cpts))
+        seg_blocks.append(starts_rel_to_read[prev_stop:group_start+1])
+        seg_blocks.append(cpts)
         prev_stop = group_end
-    # handle end of read
-    new_segs.append(starts_rel_to_read[prev_stop:])
-    new_segs = np.concatenate(new_segs).astype(np.int64)
-    if np.diff(new_segs).min() < 1:
-        raise th.TomboError(
-            'New segments include zero length events.')
-    if new_segs[0] < 0:
-        raise th.TomboError(
-            'New segments start with negative index.')
-    if new_segs[-1] > norm_signal.shape[0]:
-        raise th.TomboError(
-            'New segments end past raw signal values.')
+    seg_blocks.append(starts_rel_to_read[prev_stop:])
+    new_segs = np.empty(sum(len(block) for block in seg_blocks),
+                        dtype=np.int64)
+    seg_pos = 0
+    for block in seg_blocks:
+        new_segs[seg_pos:seg_pos + len(block)] = block
+        seg_pos += len(block)
+    segs_status = c_validate_segs(new_segs, norm_signal.shape[0])
+    if segs_status != 0:
+        raise th.TomboError(SEGS_ERRORS[segs_status])
 
     # get just from alignVals
-    align_seq = ''.join(map(itemgetter(1), alignVals)).replace('-', '')
+    align_seq = alignVals[1][alignVals[1] != GAP_BASE].tobytes().decode()
     if new_segs.shape[0] != len(align_seq) + 1:
         raise th.TomboError('Aligned sequence does not match number ' +
                             'of segments produced.')
@@ -388,8 +483,8 @@ def resquiggle_read(
             scale_values=scale_values)
         # create new hdf5 file to hold new read signal
         th.write_new_fast5_group(
-            fast5_fn, corr_grp, rsqgl_res, norm_type, compute_sd, alignVals,
-            starts_rel_to_read, rna)
+            fast5_data, corr_grp, rsqgl_res, norm_type, compute_sd,
+            alignVals, starts_rel_to_read, rna)
     else:
         # create new hdf5 file to hold corrected read events
         pass
@@ -398,8 +493,10 @@ def resquiggle_read(
         is_filtered = False
         if obs_filter is not None:
             base_lens = np.diff(new_segs)
-            is_filtered = any(np.percentile(base_lens, pctl) > thresh
-                              for pctl, thresh in obs_filter)
+            # compute all filter percentiles from a single sort
+            obs_pctls, obs_threshs = zip(*obs_filter)
+            is_filtered = bool(np.any(
+                np.percentile(base_lens, obs_pctls) > obs_threshs))
 
         mapped_end = genome_loc.Start + len(new_segs) - 1
         return (genome_loc.Chrom, genome_loc.Strand, th.readData(
@@ -416,46 +513,78 @@ def resquiggle_worker(
     num_processed = 0
     skip_index = index_q is None
     if not skip_index: proc_index_data = []
+    model_lookup = None if pore_model is None else get_model_lookup(
+        pore_model)
     while True:
         try:
-            fast5_fn, sgs_align_data = basecalls_q.get(block=False)
-            # None values placed in queue when all files have
-            # been processed
-            if fast5_fn is None: break
+            rsqgl_batch = basecalls_q.get(timeout=QUEUE_TIMEOUT)
         except queue.Empty:
-            sleep(1)
             continue
-
-        num_processed += 1
-        if VERBOSE and num_processed % PROGRESS_INTERVAL == 0:
-            sys.stderr.write('.')
-            sys.stderr.flush()
-        # process different read subgroups separately so that the same
-        # file is never open simultaneously
-        for align_data in sgs_align_data:
-            (alignVals, genome_loc, starts_rel_to_read,
-             read_start_rel_to_raw, read_info, fix_read_start) = align_data
+        # None values placed in queue when all files have
+        # been processed
+        if rsqgl_batch is None: break
+
+        for fast5_fn, sgs_align_data in rsqgl_batch:
+            num_processed += 1
+            if VERBOSE and num_processed % PROGRESS_INTERVAL == 0:
+                sys.stderr.write('.')
+                sys.stderr.flush()
+            # open each file once and process all read subgroups through
+            # the same handle
             try:
-                index_data = resquiggle_read(
-                    fast5_fn, read_start_rel_to_raw, starts_rel_to_read,
-                    norm_type, outlier_thresh, alignVals, fix_read_start,
-                    timeout, num_cpts_limit, genome_loc, read_info,
-                    basecall_group, corr_grp, compute_sd,
-                    pore_model, obs_filter, seg_params, skip_index=skip_index)
-                if not skip_index:
-                    proc_index_data.append(index_data)
-            except Exception as e:
-                # uncomment to identify mysterious errors
-                #raise
-                try:
-                    th.write_error_status(
-                        fast5_fn, corr_grp, read_info.Subgroup, unicode(e))
-                except:
-                    pass
-                failed_reads_q.put((
-                    unicode(e), read_info.Subgroup + ' :: ' + fast5_fn))
+                fast5_data = h5py.File(fast5_fn, 'r+')
+            except:
+                for align_data in sgs_align_data:
+                    failed_reads_q.put((
+                        FAST5_OPEN_ERROR,
+                        align_data[4].Subgroup + ' :: ' + fast5_fn))
+                continue
+            try:
+                for align_data in sgs_align_data:
+                    (alignVals, genome_loc, starts_rel_to_read,
+                     read_start_rel_to_raw, read_info,
+                     fix_read_start) = align_data
+                    try:
+                        index_data = resquiggle_read(
+                            fast5_data, fast5_fn, read_start_rel_to_raw,
+                            starts_rel_to_read, norm_type, outlier_thresh,
+                            alignVals, fix_read_start, timeout,
+                            num_cpts_limit, genome_loc, read_info,
+                            basecall_group, corr_grp, compute_sd,
+                            model_lookup, obs_filter, seg_params,
+                            skip_index=skip_index)
+                        if not skip_index:
+                            proc_index_data.append(index_data)
+                    except Exception as e:
+                        # uncomment to identify mysterious errors
+                        #raise
+                        try:
+                            th.write_error_status(
+                                fast5_data, corr_grp, read_info.Subgroup,
+                                unicode(e))
+                        except:
+                            pass
+                        failed_reads_q.put((
+                            unicode(e),
+                            read_info.Subgroup + ' :: ' + fast5_fn))
+            finally:
+                fast5_data.close()
 
-    if not skip_index: index_q.put(proc_index_data)
+    if not skip_index:
+        # pass index data back through a temporary file so that only the
+        # file name is sent over the queue
+        with NamedTemporaryFile(
+                suffix='.tombo_index.pkl', dir=MAPPER_TMP_DIR,
+                delete=False) as index_fp:
+            try:
+                pickle.dump(proc_index_data, index_fp,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            except:
+                os.remove(index_fp.name)
+                raise
+        index_q.put(index_fp.name)
+    # indicate that this process has finished
+    failed_reads_q.put(None)
 
     return
 
@@ -488,13 +617,40 @@ def fix_raw_starts_for_clipped_bases(
 
     return starts_rel_to_read, read_start_rel_to_raw
 
+def revcomp_codes(seq_codes):
+    """Reverse complement sequence(s) stored as ASCII codes (along the last
+    axis so that both alignment rows can be processed together).
+    """
+    return COMP_BASE_CODES[seq_codes][...,::-1]
+
+def _count_align_ops(alignVals):
+    """Count insertions, deletions, matches and mismatches from read and
+    genome alignment rows.
+    """
+    read_gaps = alignVals[0] == GAP_BASE
+    num_del = np.count_nonzero(read_gaps)
+    num_ins = np.count_nonzero(alignVals[1] == GAP_BASE)
+    num_match = np.count_nonzero(np.logical_and(
+        alignVals[0] == alignVals[1], ~read_gaps))
+    num_mismatch = alignVals.shape[1] - num_del - num_ins - num_match
+
+    return num_ins, num_del, num_match, num_mismatch
+
 def fix_all_clipped_bases(batch_align_data, batch_reads_data):
-    clip_fix_align_data = []
-    for read_fn_sg, (
-            alignVals, genome_loc, start_clipped_bases,
-            end_clipped_bases) in batch_align_data.items():
-        (read_start_rel_to_raw, starts_rel_to_read, basecalls,
-         channel_info, read_id, fix_read_start) = batch_reads_data[read_fn_sg]
+    # group reads by filename (for 2D reads to be processed together
+    # and avoid the same HDF5 file being opened simultaneuously)
+    clip_fix_align_data = defaultdict(list)
+    for (read_fn_sg, read_start_rel_to_raw, starts_rel_to_read, read_id,
+         fix_read_start) in zip(
+             batch_reads_data.read_fn_sgs, batch_reads_data.read_starts,
+             batch_reads_data.starts, batch_reads_data.read_ids,
+             batch_reads_data.fix_read_starts):
+        try:
+            (alignVals, genome_loc, start_clipped_bases,
+             end_clipped_bases) = batch_align_data[read_fn_sg]
+        except KeyError:
+            # read was not successfully aligned
+            continue
         # fix raw start positions to match bases clipped in mapping
         starts_rel_to_read, read_start_rel_to_raw \
             = fix_raw_starts_for_clipped_bases(
@@ -502,55 +658,41 @@ def fix_all_clipped_bases(batch_align_data, batch_reads_data):
                 starts_rel_to_read, read_start_rel_to_raw)
 
         bc_subgroup, fast5_fn = read_fn_sg.split(FASTA_NAME_JOINER)
-        num_ins, num_del, num_match, num_mismatch = 0, 0, 0, 0
-        for rb, gb in alignVals:
-            if rb == '-':
-                num_del += 1
-            elif gb == '-':
-                num_ins += 1
-            elif rb == gb:
-                num_match += 1
-            else:
-                num_mismatch += 1
+        num_ins, num_del, num_match, num_mismatch = _count_align_ops(
+            alignVals)
         read_info = th.alignInfo(
             read_id, bc_subgroup, start_clipped_bases, end_clipped_bases,
             num_ins, num_del, num_match, num_mismatch)
         # print genomic sequence for exact sequence comparison to resquiggle
-        #print('@' + read_id.decode() + '\n' +
-        #      ''.join([str(b) for b in list(zip(*alignVals))[1]
-        #               if b != '-']) + '\n+\n!!!')
+        #print('@' + read_id.decode() + '\n' + alignVals[1][
+        #    alignVals[1] != GAP_BASE].tobytes().decode() + '\n+\n!!!')
 
-        clip_fix_align_data.append((fast5_fn, (
+        clip_fix_align_data[fast5_fn].append((
             alignVals, genome_loc, starts_rel_to_read,
-            read_start_rel_to_raw, read_info, fix_read_start)))
+            read_start_rel_to_raw, read_info, fix_read_start))
 
     return clip_fix_align_data
 
 def clip_m5_alignment(alignVals, start, strand, chrm):
-    # clip read to first matching bases
-    start_clipped_read_bases = 0
-    start_clipped_genome_bases = 0
-    start_clipped_align_bases = 0
-    r_base, g_base = alignVals[0]
-    while r_base == '-' or g_base == '-':
-        start_clipped_read_bases += int(r_base != '-')
-        start_clipped_genome_bases += int(g_base != '-')
-        start_clipped_align_bases += 1
-        r_base, g_base = alignVals[start_clipped_align_bases]
-
-    end_clipped_read_bases = 0
-    end_clipped_genome_bases = 0
-    end_clipped_align_bases = 0
-    r_base, g_base = alignVals[-1]
-    while r_base == '-' or g_base == '-':
-        end_clipped_read_bases += int(r_base != '-')
-        end_clipped_genome_bases += int(g_base != '-')
-        end_clipped_align_bases += 1
-        r_base, g_base = alignVals[-1 * (end_clipped_align_bases + 1)]
-
-    alignVals = alignVals[start_clipped_align_bases:]
-    if end_clipped_align_bases > 0:
-        alignVals = alignVals[:-1*end_clipped_align_bases]
+    # clip read to first and last matching bases
+    is_align_base = np.logical_and(
+        alignVals[0] != GAP_BASE, alignVals[1] != GAP_BASE)
+    if not is_align_base.any():
+        raise th.TomboError('Alignment does not contain any aligned bases.')
+    start_clipped_align_bases = int(np.argmax(is_align_base))
+    end_clipped_align_bases = int(np.argmax(is_align_base[::-1]))
+    align_end = alignVals.shape[1] - end_clipped_align_bases
+
+    start_clipped_read_bases = np.count_nonzero(
+        alignVals[0,:start_clipped_align_bases] != GAP_BASE)
+    start_clipped_genome_bases = np.count_nonzero(
+        alignVals[1,:start_clipped_align_bases] != GAP_BASE)
+    end_clipped_read_bases = np.count_nonzero(
+        alignVals[0,align_end:] != GAP_BASE)
+    end_clipped_genome_bases = np.count_nonzero(
+        alignVals[1,align_end:] != GAP_BASE)
+
+    alignVals = alignVals[:,start_clipped_align_bases:align_end]
 
     if strand == '+' and start_clipped_genome_bases > 0:
         genome_loc = th.genomeLocation(
@@ -569,12 +711,16 @@ def parse_m5_record(r_m5_record):
         raise th.TomboError(
             'Mapping indicates negative strand reference mapping.')
 
-    if r_m5_record['qStrand'] == "+":
-        alignVals = list(zip(r_m5_record['qAlignedSeq'],
-                             r_m5_record['tAlignedSeq']))
-    else:
-        alignVals = list(zip(th.rev_comp(r_m5_record['qAlignedSeq']),
-                             th.rev_comp(r_m5_record['tAlignedSeq'])))
+    read_align, genome_align = (
+        r_m5_record['qAlignedSeq'], r_m5_record['tAlignedSeq'])
+    if len(read_align) != len(genome_align):
+        raise th.TomboError(
+            'Aligned read and genome sequences are not the same length.')
+    # store alignment as read and genome rows of ASCII codes
+    alignVals = np.frombuffer(bytearray(
+        (read_align + genome_align).encode()), np.uint8).reshape(2, -1)
+    if r_m5_record['qStrand'] != "+":
+        alignVals = revcomp_codes(alignVals)
 
     alignVals, start_clipped_bases, end_clipped_bases, genome_loc \
         = clip_m5_alignment(
@@ -585,42 +731,67 @@ def parse_m5_record(r_m5_record):
             end_clipped_bases)
 
 def parse_m5_output(align_output, batch_reads_data):
-    alignments = dict((read_fn_sg, None) for read_fn_sg in batch_reads_data)
+    alignments = dict(
+        (read_fn_sg, None) for read_fn_sg in batch_reads_data.read_fn_sgs)
+    best_scores = {}
     for line in align_output:
-        line = line.decode()
-        r_m5_record = dict(zip(M5_FIELDS, line.strip().split()))
-        if len(r_m5_record) != len(M5_FIELDS):
+        m5_fields = line.decode().split()
+        if len(m5_fields) < len(M5_FIELDS):
             continue
+        qName, score = m5_fields[M5_QNAME_IDX], int(m5_fields[M5_SCORE_IDX])
         # store the alignment if none is stored for this read or
         # if this read has the lowest map quality thus far
-        if alignments[r_m5_record['qName']] is None or \
-           int(alignments[r_m5_record['qName']]['score']) < \
-           int(r_m5_record['score']):
-            alignments[r_m5_record['qName']] = r_m5_record
+        if alignments[qName] is None or best_scores[qName] < score:
+            alignments[qName] = m5_fields
+            best_scores[qName] = score
 
     batch_align_failed_reads = []
     batch_align_data = {}
-    for read_fn_sg, r_m5_record in alignments.items():
-        if r_m5_record is None:
+    for read_fn_sg, m5_fields in alignments.items():
+        if m5_fields is None:
             batch_align_failed_reads.append(
                 ('Alignment not produced.', read_fn_sg))
         else:
             try:
-                batch_align_data[read_fn_sg] = parse_m5_record(r_m5_record)
+                batch_align_data[read_fn_sg] = parse_m5_record(
+                    dict(zip(M5_FIELDS, m5_fields)))
             except Exception as e:
                 batch_align_failed_reads.append((unicode(e), read_fn_sg))
 
     return batch_align_failed_reads, batch_align_data
 
+def parse_cigar_string(cigar_str):
+    """Parse a cigar string into a list of (region length, region type)
+    tuples. Region lengths are decoded from the digit characters preceding
+    each operation with a single vectorized pass over the string.
+    """
+    cigar_codes = np.frombuffer(cigar_str.encode(), np.uint8)
+    is_op = cigar_codes > ord('9')
+    op_poss = np.flatnonzero(is_op)
+    digit_poss = np.flatnonzero(~is_op)
+    # each operation must be preceded by at least one digit and the string
+    # must end with an operation
+    if (op_poss.shape[0] < 1 or
+        op_poss[-1] != cigar_codes.shape[0] - 1 or
+        np.any(np.diff(op_poss) < 2) or op_poss[0] < 1 or
+        np.any(cigar_codes[digit_poss] < ord('0'))):
+        raise th.TomboError('Invalid cigar string produced.')
+    reg_types = cigar_codes[op_poss].tobytes().decode()
+    if any(reg_type not in CIGAR_OPS for reg_type in set(reg_types)):
+        raise th.TomboError('Invalid cigar string produced.')
+
+    # sum digit values scaled by their place within each region length
+    digit_op_idx = np.searchsorted(op_poss, digit_poss)
+    reg_lens = np.bincount(
+        digit_op_idx, weights=(cigar_codes[digit_poss] - ord('0')) *
+        np.power(10.0, op_poss[digit_op_idx] - digit_poss - 1),
+        minlength=op_poss.shape[0])
+
+    return list(zip(reg_lens.astype(np.int64).tolist(), reg_types))
+
 def parse_sam_record(r_sam_record, genome_index):
     def parse_cigar(strand):
-        # parse cigar string
-        cigar = [
-            (int(reg_len), reg_type) for reg_len, reg_type in
-            CIGAR_PAT.findall(r_sam_record['cigar'])]
-        if len(cigar) < 1:
-            raise th.TomboError('Invalid cigar string produced.')
-
+        cigar = parse_cigar_string(r_sam_record['cigar'])
         if strand == '-':
             cigar = cigar[::-1]
 
@@ -628,8 +799,8 @@ def parse_sam_record(r_sam_record, genome_index):
 
     def get_qseq(cigar, strand):
         # record clipped bases and remove from query seq as well as cigar
-        qSeq = r_sam_record['seq'] if strand == '+' else th.rev_comp(
-            r_sam_record['seq'])
+        qSeq = np.frombuffer(r_sam_record['seq'].encode(), np.uint8)
+        if strand == '-': qSeq = revcomp_codes(qSeq)
         start_clipped_bases = 0
         end_clipped_bases = 0
         # handle clipping elements (H and S)
@@ -653,11 +824,11 @@ def parse_sam_record(r_sam_record, genome_index):
     def get_tseq(qSeq, start_clipped_bases, end_clipped_bases, cigar, strand):
         tLen = sum([reg_len for reg_len, reg_type in cigar
                     if reg_type in 'MDN=X'])
-        tSeq = genome_index.get_seq(
+        tSeq = np.frombuffer(genome_index.get_seq(
             r_sam_record['rName'],
             int(r_sam_record['pos']) - 1,
-            int(r_sam_record['pos']) + tLen - 1)
-        if strand == '-': tSeq = th.rev_comp(tSeq)
+            int(r_sam_record['pos']) + tLen - 1).encode(), np.uint8)
+        if strand == '-': tSeq = revcomp_codes(tSeq)
 
         # check that cigar starts and ends with matched bases
         while cigar[0][1] not in 'M=X':
@@ -683,20 +854,23 @@ def parse_sam_record(r_sam_record, genome_index):
         return tSeq, qSeq, start_clipped_bases, end_clipped_bases, cigar
 
     def get_align_vals(tSeq, qSeq, cigar, strand):
-        alignVals = []
-        tPos, qPos = 0, 0
+        # fill alignment rows with gaps and copy in aligned bases
+        alignVals = np.full(
+            (2, sum(reg_len for reg_len, _ in cigar)), GAP_BASE, np.uint8)
+        aPos, tPos, qPos = 0, 0, 0
         for reg_len, reg_type in cigar:
             if reg_type in 'M=X':
-                alignVals.extend(zip(qSeq[qPos:qPos+reg_len],
-                                     tSeq[tPos:tPos+reg_len]))
+                alignVals[0,aPos:aPos+reg_len] = qSeq[qPos:qPos+reg_len]
+                alignVals[1,aPos:aPos+reg_len] = tSeq[tPos:tPos+reg_len]
                 tPos += reg_len
                 qPos += reg_len
             elif reg_type in 'IP':
-                alignVals.extend(zip(qSeq[qPos:qPos+reg_len], repeat('-')))
+                alignVals[0,aPos:aPos+reg_len] = qSeq[qPos:qPos+reg_len]
                 qPos += reg_len
             else:
-                alignVals.extend(zip(repeat('-'), tSeq[tPos:tPos+reg_len]))
+                alignVals[1,aPos:aPos+reg_len] = tSeq[tPos:tPos+reg_len]
                 tPos += reg_len
+            aPos += reg_len
 
         return alignVals
 
@@ -714,32 +888,33 @@ def parse_sam_record(r_sam_record, genome_index):
 def parse_sam_output(align_output, batch_reads_data, genome_index):
     # create dictionary with empty slot to each read
     alignments = dict(
-        (read_fn_sg, None) for read_fn_sg in batch_reads_data)
+        (read_fn_sg, None) for read_fn_sg in batch_reads_data.read_fn_sgs)
+    best_mapqs = {}
     for line in align_output:
         line = line.decode()
         if line.startswith('@'): continue
-        r_sam_record = dict(zip(SAM_FIELDS, line.strip().split()))
-        if len(r_sam_record) < len(SAM_FIELDS): continue
-        if r_sam_record['rName'] == '*': continue
+        sam_fields = line.split()
+        if len(sam_fields) < len(SAM_FIELDS): continue
+        if sam_fields[SAM_RNAME_IDX] == '*': continue
         # store the alignment if none is stored for this read or
         # if this read has the lowest map quality thus far
-        qName = r_sam_record['qName'].replace(FN_SPACE_FILLER, ' ')
-        if alignments[qName] is None or \
-           int(alignments[qName]['mapq']) < \
-           int(r_sam_record['mapq']):
-            alignments[qName] = r_sam_record
+        qName = sam_fields[SAM_QNAME_IDX].replace(FN_SPACE_FILLER, ' ')
+        mapq = int(sam_fields[SAM_MAPQ_IDX])
+        if alignments[qName] is None or best_mapqs[qName] < mapq:
+            alignments[qName] = sam_fields
+            best_mapqs[qName] = mapq
 
     batch_align_failed_reads = []
     batch_align_data = {}
-    for read_fn_sg, r_sam_record in alignments.items():
-        if r_sam_record is None:
+    for read_fn_sg, sam_fields in alignments.items():
+        if sam_fields is None:
             batch_align_failed_reads.append(
                 ('Alignment not produced (if all reads failed ' +
                  'check for index files).', read_fn_sg))
         else:
             try:
                 batch_align_data[read_fn_sg] = parse_sam_record(
-                    r_sam_record, genome_index)
+                    dict(zip(SAM_FIELDS, sam_fields)), genome_index)
             except Exception as e:
                 # uncomment to identify mysterious errors
                 #raise
@@ -760,66 +935,105 @@ def prep_minimap2_options(genome_fn, read_fn, num_align_ps, index_fn):
     mapper_genome = genome_fn if index_fn is None else index_fn
     return ['-ax', 'map-ont', '-t', unicode(num_align_ps), mapper_genome, read_fn]
 
+def write_mapper_input(mapper_stdin, batch_reads_fasta):
+    # if the mapper exits before reading all input, unaligned reads are
+    # reported as failed from the mapper output
+    try:
+        mapper_stdin.write(batch_reads_fasta)
+    except (IOError, OSError):
+        pass
+    try:
+        mapper_stdin.close()
+    except (IOError, OSError):
+        pass
+
+    return
+
 def align_to_genome(batch_reads_data, genome_fn, mapper_data, genome_index,
                     num_align_ps, output_format='sam'):
     # prepare fasta text with batch reads
-    batch_reads_fasta = ''
-    for read_fn_sg, (_, _, basecalls, _, _, _) in \
-        batch_reads_data.items():
+    batch_reads_fasta = []
+    for read_fn_sg, basecalls in zip(
+            batch_reads_data.read_fn_sgs, batch_reads_data.basecalls):
         # note spaces aren't allowed in read names so replace with
         # vertical bars and undo to retain file names
-        batch_reads_fasta += (
-            ">" + read_fn_sg.replace(' ', FN_SPACE_FILLER) + \
-            '\n' + ''.join(basecalls) + '\n')
-
-    read_fp = NamedTemporaryFile(suffix='.fasta')
-    read_fp.write(batch_reads_fasta.encode())
-    read_fp.flush()
-    out_fp = NamedTemporaryFile()
-
+        # basecalls are single byte characters, so assemble bytes directly
+        batch_reads_fasta.extend((
+            b'>', read_fn_sg.replace(' ', FN_SPACE_FILLER).encode(), b'\n',
+            basecalls.tobytes(), b'\n'))
+    batch_reads_fasta = b''.join(batch_reads_fasta)
+
+    # reads are piped to the mapper via stdin and output is parsed from
+    # stdout as it is produced when supported
+    read_fp, out_fp = None, None
     # optionally suppress output from mapper with devnull sink
     with io.open(os.devnull, 'wb') as FNULL:
         if mapper_data.type == 'graphmap':
+            # graphmap does not read from stdin or write to stdout, so
+            # use temporary files
+            read_fp = NamedTemporaryFile(suffix='.fasta', dir=MAPPER_TMP_DIR)
+            read_fp.write(batch_reads_fasta)
+            read_fp.flush()
+            out_fp = NamedTemporaryFile(dir=MAPPER_TMP_DIR)
             mapper_options = prep_graphmap_options(
                 genome_fn, read_fp.name, out_fp.name,
                 output_format, num_align_ps)
-            stdout_sink = FNULL
         elif mapper_data.type == 'bwa_mem':
             mapper_options = prep_bwa_mem_options(
-                genome_fn, read_fp.name, num_align_ps)
-            stdout_sink = out_fp
+                genome_fn, STDIN_FN, num_align_ps)
         elif mapper_data.type == 'minimap2':
             mapper_options = prep_minimap2_options(
-                genome_fn, read_fp.name, num_align_ps, mapper_data.index)
-            stdout_sink = out_fp
+                genome_fn, STDIN_FN, num_align_ps, mapper_data.index)
         else:
             raise th.TomboError('Mapper not supported.')
 
         try:
-            exitStatus = call([mapper_data.exe,] + mapper_options,
-                              stdout=stdout_sink, stderr=FNULL)
-            out_fp.seek(0)
-            align_output = out_fp.readlines()
-            # close files here so that they persist until
-            # after basecalling is finished
-            read_fp.close()
-            out_fp.close()
+            mapper_proc = Popen(
+                [mapper_data.exe,] + mapper_options,
+                stdin=PIPE if read_fp is None else None,
+                stdout=PIPE if out_fp is None else FNULL, stderr=FNULL)
         except:
+            if read_fp is not None:
+                read_fp.close()
+                out_fp.close()
             # whole mapping call failed so all reads failed
             return ([(
                 'Problem running/parsing genome mapper. ' +
                 'Ensure you have a compatible version installed.' +
                 'Potentially failed to locate BWA index files.',
-                read_fn_sg) for read_fn_sg in batch_reads_data], [])
-
-    if output_format == 'sam':
-        batch_parse_failed_reads, batch_align_data = parse_sam_output(
-            align_output, batch_reads_data, genome_index)
-    elif output_format == 'm5':
-        batch_parse_failed_reads, batch_align_data = parse_m5_output(
-            align_output, batch_reads_data)
+                read_fn_sg) for read_fn_sg in
+                     batch_reads_data.read_fn_sgs], {})
+
+    if read_fp is None:
+        # write reads from a separate thread so the mapper output can be
+        # parsed while alignment is ongoing
+        input_thread = threading.Thread(
+            target=write_mapper_input,
+            args=(mapper_proc.stdin, batch_reads_fasta))
+        input_thread.daemon = True
+        input_thread.start()
+        align_output = mapper_proc.stdout
     else:
-        raise th.TomboError('Mapper output type not supported.')
+        mapper_proc.wait()
+        read_fp.close()
+        align_output = out_fp
+
+    # stream mapper output lines and close the stream (and mapper)
+    # only after parsing is finished
+    try:
+        if output_format == 'sam':
+            batch_parse_failed_reads, batch_align_data = parse_sam_output(
+                align_output, batch_reads_data, genome_index)
+        elif output_format == 'm5':
+            batch_parse_failed_reads, batch_align_data = parse_m5_output(
+                align_output, batch_reads_data)
+        else:
+            raise th.TomboError('Mapper output type not supported.')
+    finally:
+        align_output.close()
+        if read_fp is None:
+            input_thread.join()
+        mapper_proc.wait()
 
     clip_fix_align_data = fix_all_clipped_bases(
         batch_align_data, batch_reads_data)
@@ -829,64 +1043,33 @@ def align_to_genome(batch_reads_data, genome_fn, mapper_data, genome_index,
 def fix_stay_states(
         called_dat, starts_rel_to_read, basecalls,
         read_start_rel_to_raw, rna):
-    move_states = called_dat['move'][1:] > 0
+    move_states = (called_dat['move'][1:] > 0).view(np.uint8)
     if rna:
         move_states = move_states[::-1]
-    start_clip = 0
-    event_change_state = move_states[0]
-    while not event_change_state:
-        if start_clip >= len(move_states) - 2:
-            raise th.TomboError(
-                'Read is composed entirely of stay model ' +
-                'states and cannot be processed')
-        start_clip += 1
-        event_change_state = move_states[start_clip]
-    end_clip = 0
-    event_change_state = move_states[-1]
-    while not event_change_state:
-        end_clip += 1
-        event_change_state = move_states[-(end_clip+1)]
-
-    # clip all applicable data structures
-    move_states = move_states[start_clip:]
-    starts_rel_to_read = starts_rel_to_read[start_clip:]
-    basecalls = basecalls[start_clip:]
-    if end_clip > 0:
-        move_states = move_states[:-end_clip]
-        starts_rel_to_read = starts_rel_to_read[:-end_clip]
-        basecalls = basecalls[:-end_clip]
-    if start_clip > 0:
+    # clip stay states from the start and end of the read and remove
+    # internal stay states in a single pass
+    keep_idxs = c_stay_state_keep_idxs(move_states)
+    if keep_idxs is None:
+        raise th.TomboError(
+            'Read is composed entirely of stay model ' +
+            'states and cannot be processed')
+    starts_rel_to_read = starts_rel_to_read[keep_idxs]
+    basecalls = basecalls[keep_idxs[:-1]]
+    if keep_idxs[0] > 0:
         start_clip_obs = starts_rel_to_read[0]
         starts_rel_to_read = starts_rel_to_read - start_clip_obs
         read_start_rel_to_raw += start_clip_obs
 
-    # now actually remove internal stay states
-    move_states = np.insert(
-        move_states, (0, len(move_states) - 1), True)
-    starts_rel_to_read = starts_rel_to_read[move_states]
-    basecalls = basecalls[move_states[:-1]]
-
     return starts_rel_to_read, basecalls, read_start_rel_to_raw
 
-def get_read_data(fast5_fn, basecall_group, basecall_subgroup):
-    try:
-        fast5_data = h5py.File(fast5_fn, 'r')
-    except:
-        raise th.TomboError(
-            'Error opening file for alignment. This should have ' +
-            'been caught during the HDF5 prep phase. Check that there ' +
-            'are no other tombo processes or processes accessing ' +
-            'these HDF5 files running simultaneously.')
-
+def get_read_data(fast5_data, basecall_group, basecall_subgroup):
     try:
+        # resolve the basecall group once and read its attributes once
+        bc_grp = fast5_data['/Analyses/' + basecall_group]
         # get albacore version, or if not specified set to 0.0
-        albacore_version = LooseVersion(fast5_data[
-            '/Analyses/' + basecall_group].attrs.get('version')
-            if 'version' in fast5_data['/Analyses/' +
-                                       basecall_group].attrs else "0.0")
-        called_dat = fast5_data[
-            '/Analyses/' + basecall_group + '/' + basecall_subgroup +
-            '/Events'][:]
+        albacore_version = LooseVersion(
+            bc_grp.attrs.get('version', "0.0"))
+        called_dat = bc_grp[basecall_subgroup + '/Events'][:]
     except:
         raise th.TomboError(
             'No events or corrupted events in file. Likely a ' +
@@ -900,14 +1083,12 @@ def get_read_data(fast5_fn, basecall_group, basecall_subgroup):
 
     try:
         channel_info = th.get_channel_info(fast5_data)
-        fast5_data.close()
     except:
-        raise th.TomboError(
-            'Error getting channel information and closing fast5 file.')
+        raise th.TomboError('Error getting channel information.')
 
     read_id = raw_attrs['read_id']
 
-    if albacore_version >= LooseVersion("2.0"):
+    if albacore_version >= ALBACORE_V2_0:
         read_start_rel_to_raw = called_dat['start'][0].astype(np.int64)
     else:
         abs_event_start = np.round(
@@ -928,24 +1109,33 @@ def get_read_data(fast5_fn, basecall_group, basecall_subgroup):
     # slot is more reliable since it will have greater floating point
     # precision. Relevant discussion on community forum here:
     # https://community.nanoporetech.com/posts/albacore-zero-length-even
-    if albacore_version < LooseVersion("1.0"):
+    if albacore_version < ALBACORE_V1_0:
         last_event = called_dat[-1]
         # convert starts to float64 to minimize floating point errors
-        starts_rel_to_read = np.append(
-            called_dat['start'], last_event['start'] +
-            last_event['length']).astype(np.float64)
+        # (computed in place within a single buffer)
+        event_starts = np.empty(called_dat.shape[0] + 1, dtype=np.float64)
+        event_starts[:-1] = called_dat['start']
+        event_starts[-1] = last_event['start'] + last_event['length']
+        np.multiply(event_starts, channel_info.sampling_rate,
+                    out=event_starts)
         # round to float64 to minimize floating point errors
-        starts_rel_to_read = np.round(
-            starts_rel_to_read *
-            channel_info.sampling_rate).astype('int_') - abs_event_start
+        np.rint(event_starts, out=event_starts)
+        starts_rel_to_read = event_starts.astype('int_')
+        np.subtract(starts_rel_to_read, int(abs_event_start),
+                    out=starts_rel_to_read)
         kmer_dom_pos = 2
         fix_read_start = False
-    elif albacore_version < LooseVersion("2.0"):
+    elif albacore_version < ALBACORE_V2_0:
         # compute event starts from length slot as start slot is less
         # reliable due to storage as a float32
-        starts_rel_to_read = np.cumsum(np.concatenate(
-            [[0,], np.round(called_dat['length'] *
-                            channel_info.sampling_rate).astype('int_')]))
+        event_lens = np.multiply(
+            called_dat['length'], channel_info.sampling_rate)
+        np.rint(event_lens, out=event_lens)
+        # accumulate integer lengths directly into the starts array
+        starts_rel_to_read = np.empty(
+            called_dat.shape[0] + 1, dtype='int_')
+        starts_rel_to_read[0] = 0
+        np.cumsum(event_lens, dtype='int_', out=starts_rel_to_read[1:])
         kmer_dom_pos = 1
         # Fix floating point errors in abs_event_start by comparing to
         # potential breakpoints using resquiggle criterion
@@ -962,13 +1152,15 @@ def get_read_data(fast5_fn, basecall_group, basecall_subgroup):
         # raw basecalling caused the dominant kmer reference base to
         # move to the second position (from the third previously)
         # but raw was intorduced into rna basecalling one minor release later
-        if rna and albacore_version < LooseVersion("2.1"):
+        if rna and albacore_version < ALBACORE_V2_1:
             kmer_dom_pos = 2
         else:
             kmer_dom_pos = 1
         fix_read_start = False
-    basecalls = np.array([event_state.decode()[kmer_dom_pos]
-                          for event_state in called_dat['model_state']])
+    # extract dominant base from each k-mer as a single byte column
+    event_kmers = called_dat['model_state']
+    basecalls = event_kmers.view(
+        ('S1', event_kmers.dtype.itemsize))[:,kmer_dom_pos]
 
     if rna:
         starts_rel_to_read = -1 * (
@@ -1002,32 +1194,57 @@ def get_read_data(fast5_fn, basecall_group, basecall_subgroup):
     return (read_start_rel_to_raw, starts_rel_to_read, basecalls,
             channel_info, read_id, fix_read_start)
 
-def align_and_parse(
-        fast5s_to_process, genome_fn, mapper_data, genome_index,
-        basecall_group, basecall_subgroups, num_align_ps):
-    batch_reads_data = {}
-    batch_get_data_failed_reads = []
-    for fast5_fn in fast5s_to_process:
+def get_fast5_reads_data(fast5_fn, basecall_group, basecall_subgroups):
+    """Extract read data for each basecall subgroup from a single open
+    FAST5 file. Returns a list of (read data, error) tuples for each subgroup.
+    """
+    try:
+        fast5_data = h5py.File(fast5_fn, 'r')
+    except:
+        return [(None, 'Error opening file for alignment. This should have ' +
+                 'been caught during the HDF5 prep phase. Check that there ' +
+                 'are no other tombo processes or processes accessing ' +
+                 'these HDF5 files running simultaneously.')
+                for _ in basecall_subgroups]
+
+    fn_reads_data = []
+    try:
         for bc_subgroup in basecall_subgroups:
             try:
-                read_data = get_read_data(
-                    fast5_fn, basecall_group, bc_subgroup)
-                batch_reads_data[
-                    bc_subgroup + FASTA_NAME_JOINER + fast5_fn] = read_data
+                fn_reads_data.append((get_read_data(
+                    fast5_data, basecall_group, bc_subgroup), None))
             except Exception as e:
                 # uncomment to identify mysterious errors
                 #raise
-                batch_get_data_failed_reads.append((
-                    unicode(e), bc_subgroup + FASTA_NAME_JOINER + fast5_fn))
+                fn_reads_data.append((None, unicode(e)))
+    finally:
+        fast5_data.close()
+
+    return fn_reads_data
+
+def align_and_parse(
+        fast5s_to_process, genome_fn, mapper_data, genome_index,
+        basecall_group, basecall_subgroups, num_align_ps):
+    batch_reads_data = batchReadsData(*([] for _ in batchReadsData._fields))
+    batch_get_data_failed_reads = []
+    for fast5_fn in fast5s_to_process:
+        fn_reads_data = get_fast5_reads_data(
+            fast5_fn, basecall_group, basecall_subgroups)
+        for bc_subgroup, (read_data, err_str) in zip(
+                basecall_subgroups, fn_reads_data):
+            read_fn_sg = bc_subgroup + FASTA_NAME_JOINER + fast5_fn
+            if err_str is None:
+                batch_reads_data.read_fn_sgs.append(read_fn_sg)
+                for field_vals, read_val in zip(
+                        batch_reads_data[1:], read_data):
+                    field_vals.append(read_val)
+            else:
+                batch_get_data_failed_reads.append((err_str, read_fn_sg))
 
-    batch_align_failed_reads, batch_align_data = align_to_genome(
+    # alignment data is grouped by filename
+    batch_align_failed_reads, fn_batch_align_data = align_to_genome(
         batch_reads_data, genome_fn, mapper_data,
         genome_index, num_align_ps)
-    # regroup reads by filename (for 2D reads to be processed together
-    # and avoid the same HDF5 file being opened simultaneuously)
-    fn_batch_align_data = defaultdict(list)
-    for fast5_fn, sg_align_data in batch_align_data:
-        fn_batch_align_data[fast5_fn].append(sg_align_data)
     # uncomment to identify mysterious errors
     #print("Get data errors: " + unicode(batch_get_data_failed_reads))
     #print("Align read errors: " + unicode(batch_align_failed_reads))
@@ -1052,8 +1269,25 @@ def align_reads(
     batch_align_failed_reads, batch_align_data = align_and_parse(
         fast5s_to_process, genome_fn, mapper_data, genome_index,
         basecall_group, basecall_subgroups, num_align_ps)
-    for fast5_fn, sgs_align_data in batch_align_data.items():
-        basecalls_q.put((fast5_fn, sgs_align_data))
+    # write failed read statuses before passing reads on to be resquiggled
+    # so a file is never open in two processes simultaneously (e.g. one
+    # failed and one successful subgroup from the same file)
+    for failed_read in batch_prep_failed_reads + batch_align_failed_reads:
+        try:
+            sg_fn = failed_read[1].split(FASTA_NAME_JOINER)
+            if len(sg_fn) == 2:
+                subgroup, fast5_fn = sg_fn
+            else:
+                subgroup, fast5_fn = None, sg_fn
+            th.write_error_status(
+                fast5_fn, corr_grp, subgroup, failed_read[0])
+        except:
+            pass
+    # send several files per queue item to reduce per-item queue overhead
+    batch_align_data = list(batch_align_data.items())
+    for rsqgl_start in range(0, len(batch_align_data), RSQGL_BATCH_SIZE):
+        basecalls_q.put(batch_align_data[
+            rsqgl_start:rsqgl_start + RSQGL_BATCH_SIZE])
     # uncomment to identify mysterious errors
     #print("Prep reads fail: " + unicode(batch_prep_failed_reads))
     #print("Align reads fail: " + unicode(batch_align_failed_reads))
@@ -1064,30 +1298,26 @@ def alignment_worker(
         fast5_q, basecalls_q, failed_reads_q, genome_fn,
         mapper_data, basecall_group, basecall_subgroups,
         corr_grp, overwrite, num_align_ps):
-    # this is only needed for sam output format (not m5)
+    # open the genome index in each process as open file handles cannot be
+    # passed to processes not started by fork (only needed for sam output)
     genome_index = th.Fasta(genome_fn)
-    while not fast5_q.empty():
-        try:
-            fast5_batch = fast5_q.get(block=False)
-        except queue.Empty:
-            break
+    while True:
+        fast5_batch = fast5_q.get()
+        # None values placed in queue after all batches
+        if fast5_batch is None: break
 
         batch_failed_reads = align_reads(
             fast5_batch, genome_fn, mapper_data,
             genome_index, basecall_group, basecall_subgroups,
             corr_grp, basecalls_q, overwrite, num_align_ps)
         for failed_read in batch_failed_reads:
-            try:
-                sg_fn = failed_read[1].split(FASTA_NAME_JOINER)
-                if len(sg_fn) == 2:
-                    subgroup, fast5_fn = sg_fn
-                else:
-                    subgroup, fast5_fn = None, sg_fn
-                th.write_error_status(
-                    fast5_fn, corr_grp, subgroup, failed_read[0])
-            except:
-                pass
             failed_reads_q.put(failed_read)
+    # flush all batches onto basecalls_q before signaling completion so the
+    # main process cannot add the resquiggle sentinels ahead of them
+    basecalls_q.close()
+    basecalls_q.join_thread()
+    # indicate that this process has finished
+    failed_reads_q.put(None)
 
     return
 
@@ -1100,6 +1330,56 @@ if OPTIMIZE_ALIGN:
         return
 
 
+def add_worker_index_data(reads_index, index_data_fn):
+    """Add index data written by a resquiggle worker and remove the file
+    """
+    try:
+        with io.open(index_data_fn, 'rb') as index_fp:
+            proc_index_data = pickle.load(index_fp)
+    finally:
+        os.remove(index_data_fn)
+    for index_r_data in proc_index_data:
+        reads_index.add_read_data(*index_r_data)
+
+    return
+
+def remove_worker_index_files(index_q):
+    """Remove index data files left in index_q (e.g. after an error or
+    interrupt in the main process)
+    """
+    while True:
+        try:
+            index_data_fn = index_q.get(timeout=QUEUE_TIMEOUT)
+        except queue.Empty:
+            break
+        try:
+            os.remove(index_data_fn)
+        except OSError:
+            pass
+
+    return
+
+def get_failed_reads(failed_reads_q, failed_reads, procs):
+    """Collect failed reads until each process has put a None entry into
+    failed_reads_q indicating that it has finished. Returns the number of
+    processes that finished.
+    """
+    num_finished = 0
+    while num_finished < len(procs):
+        try:
+            failed_read = failed_reads_q.get(timeout=QUEUE_TIMEOUT)
+        except queue.Empty:
+            # don't wait forever if a process exited without finishing
+            if not any(p.is_alive() for p in procs): break
+            continue
+        if failed_read is None:
+            num_finished += 1
+            continue
+        errorType, fn = failed_read
+        failed_reads[errorType].append(fn)
+
+    return num_finished
+
 def resquiggle_all_reads(
         fast5_fns, genome_fn, mapper_data,
         basecall_group, basecall_subgroups, corr_grp, norm_type,
@@ -1107,13 +1387,12 @@ def resquiggle_all_reads(
         align_batch_size, num_align_ps, align_threads_per_proc,
         num_resquiggle_ps, compute_sd, pore_model, skip_index, obs_filter,
         seg_params, fast5s_dir):
-    manager = mp.Manager()
-    fast5_q = manager.Queue()
+    fast5_q = mp.Queue()
     # set maximum number of parsed basecalls to sit in the middle queue
-    basecalls_q = manager.Queue(
-        align_batch_size * ALIGN_BATCH_MULTIPLIER)
-    failed_reads_q = manager.Queue()
-    index_q = manager.Queue() if not skip_index else None
+    basecalls_q = mp.Queue(max(
+        align_batch_size * ALIGN_BATCH_MULTIPLIER // RSQGL_BATCH_SIZE, 1))
+    failed_reads_q = mp.Queue()
+    index_q = mp.Queue() if not skip_index else None
     num_reads = 0
     fast5_batch = []
     for fast5_fn in fast5_fns:
@@ -1125,7 +1404,13 @@ def resquiggle_all_reads(
             fast5_batch = []
     if len(fast5_batch) > 0:
         fast5_q.put(fast5_batch)
+    # add None entries to indicate that all batches have been queued
+    for _ in range(num_align_ps):
+        fast5_q.put(None)
 
+    # build the pyfaidx index file (if applicable) once here, so alignment
+    # processes only open the existing index and don't race to create it
+    th.Fasta(genome_fn, dry_run=True)
     align_args = (
         fast5_q, basecalls_q, failed_reads_q, genome_fn,
         mapper_data, basecall_group, basecall_subgroups,
@@ -1154,56 +1439,41 @@ def resquiggle_all_reads(
     failed_reads = defaultdict(list)
     if index_q is not None:
         reads_index = th.TomboReads([fast5s_dir,], corr_grp, for_writing=True)
-    while any(p.is_alive() for p in align_ps):
-        try:
-            errorType, fn = failed_reads_q.get(block=False)
-            failed_reads[errorType].append(fn)
-        except queue.Empty:
-            sleep(1)
-            continue
-
-    # add None entried to basecalls_q to indicate that all reads have
-    # been basecalled and processed
-    for _ in range(num_resquiggle_ps):
-        basecalls_q.put((None, None))
-
-    while any(p.is_alive() for p in resquiggle_ps):
-        try:
-            errorType, fn = failed_reads_q.get(block=False)
-            failed_reads[errorType].append(fn)
-        except queue.Empty:
-            try:
-                proc_index_data = index_q.get(block=False)
-                for index_r_data in proc_index_data:
-                    reads_index.add_read_data(*index_r_data)
-            except queue.Empty:
-                sleep(1)
-                continue
-
-    # empty any entries left in queue after processes have finished
-    while not failed_reads_q.empty():
-        errorType, fn = failed_reads_q.get(block=False)
-        failed_reads[errorType].append(fn)
-    while not index_q.empty():
-        proc_index_data = index_q.get(block=False)
-        for index_r_data in proc_index_data:
-            reads_index.add_read_data(*index_r_data)
+    try:
+        get_failed_reads(failed_reads_q, failed_reads, align_ps)
+
+        # add None entried to basecalls_q to indicate that all reads have
+        # been basecalled and processed
+        for _ in range(num_resquiggle_ps):
+            basecalls_q.put(None)
+
+        num_rsqgl_finished = get_failed_reads(
+            failed_reads_q, failed_reads, resquiggle_ps)
+        if index_q is not None:
+            # each finished resquiggle process sent one index data file
+            for _ in range(num_rsqgl_finished):
+                add_worker_index_data(reads_index, index_q.get())
+    finally:
+        if index_q is not None:
+            remove_worker_index_files(index_q)
 
     # print newline after read progress dots
     if VERBOSE: sys.stderr.write('\n')
-    reads_index.write_index_file()
+    if index_q is not None:
+        reads_index.write_index_file()
 
     return dict(failed_reads)
 
 def check_for_albacore(files, basecall_group, num_reads=50):
     has_albacore = False
-    for fast5_fn in np.random.choice(files, num_reads):
+    for fast5_fn in np.random.choice(
+            files, min(num_reads, len(files)), replace=False):
         try:
-            fast5_data = h5py.File(fast5_fn, 'r')
-            if fast5_data['/Analyses/' + basecall_group].attrs.get('name') == \
-               ALBACORE_TEXT:
-                has_albacore = True
-                break
+            with h5py.File(fast5_fn, 'r') as fast5_data:
+                if fast5_data['/Analyses/' + basecall_group].attrs.get(
+                        'name') == ALBACORE_TEXT:
+                    has_albacore = True
+                    break
         except:
             continue
 
@@ -1235,6 +1505,9 @@ def _event_resquiggle_main(args):
         mapper_data = mapperData(args.bwa_mem_executable, 'bwa_mem')
     else:
         mapper_data = mapperData(args.graphmap_executable, 'graphmap')
+    if MAPPER_TMP_DIR is not None and not os.path.isdir(MAPPER_TMP_DIR):
+        th.error_message_and_exit(
+            'TOMBO_TMPDIR environment variable is not a directory.')
 
     if VERBOSE: th.status_message('Getting file list.')
     try:
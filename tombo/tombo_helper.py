@@ -7,6 +7,7 @@ import io
 import re
 import sys
 import queue
+import mmap
 import random
 
 # Future warning from cython in h5py
@@ -741,11 +742,60 @@ def get_rec_names(fasta_fn):
 
     return all_rec_ids
 
+faiRecord = namedtuple('faiRecord', (
+    'length', 'offset', 'line_bases', 'line_width'))
+
+class _MmapFastaSeq(object):
+    """Sequence from a memory mapped FASTA file which supports ``len`` and slicing like an in memory sequence string
+    """
+    def __init__(self, fasta_mmap, fai_rec):
+        self.fasta_mmap = fasta_mmap
+        self.fai_rec = fai_rec
+
+    def _file_pos(self, pos):
+        return (self.fai_rec.offset +
+                (pos // self.fai_rec.line_bases) * self.fai_rec.line_width +
+                (pos % self.fai_rec.line_bases))
+
+    def __len__(self):
+        return self.fai_rec.length
+
+    def __getitem__(self, reg):
+        start, end, _ = reg.indices(self.fai_rec.length)
+        if end <= start:
+            return ''
+        # remove line endings within the requested file region
+        return self.fasta_mmap[
+            self._file_pos(start):self._file_pos(end - 1) + 1].replace(
+                b'\n', b'').replace(b'\r', b'').decode()
+
 class Fasta(object):
-    """Fasta file sequence format wrapper class. Will load faidx via ``pyfaidx`` package if installed, else the fasta will be loaded into memory for sequence extraction.
+    """Fasta file sequence format wrapper class. Will load faidx via ``pyfaidx`` package if installed. Else, if a faidx index file exists, the fasta will be memory mapped (sharing memory across processes), else the fasta will be loaded into memory for sequence extraction.
 
     .. automethod:: __init__
     """
+    def _load_fai_mmap(self):
+        fai_fn = self.fasta_fn + '.fai'
+        if (not os.path.exists(fai_fn) or
+            os.path.getmtime(fai_fn) < os.path.getmtime(self.fasta_fn)):
+            return None
+        try:
+            fai_recs = []
+            with io.open(fai_fn) as fai_fp:
+                for line in fai_fp:
+                    fai_fields = line.split()
+                    fai_recs.append((fai_fields[0], faiRecord(
+                        *map(int, fai_fields[1:5]))))
+            with io.open(self.fasta_fn, 'rb') as fasta_fp:
+                # mapping remains valid after the file is closed
+                fasta_mmap = mmap.mmap(
+                    fasta_fp.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, OSError, ValueError, IndexError, TypeError):
+            return None
+
+        return dict((chrm, _MmapFastaSeq(fasta_mmap, fai_rec))
+                    for chrm, fai_rec in fai_recs)
+
     def _load_in_mem(self):
         genome_index = {}
         curr_id = None
@@ -788,7 +838,7 @@ class Fasta(object):
         Args:
             fasta_fn (str): path to fasta file
             dry_run (bool): when pyfaidx is not installed, don't actually read sequence into memory.
-            force_in_mem (bool): force genome to be loaded into memory even if pyfaidx is installed allowing on-disk access
+            force_in_mem (bool): force genome to be loaded into memory even if pyfaidx is installed or a faidx index file exists allowing on-disk access
             assume_dna_bases (bool): skip check for DNA or RNA bases (default: False)
         """
         self.fasta_fn = resolve_path(fasta_fn)
@@ -805,7 +855,9 @@ class Fasta(object):
         except ImportError:
             self.has_pyfaidx = False
             if not dry_run:
-                self.index = self._load_in_mem()
+                self.index = None if force_in_mem else self._load_fai_mmap()
+                if self.index is None:
+                    self.index = self._load_in_mem()
         if not dry_run:
             self.has_rna_bases = (assume_dna_base or
                                   self._index_contains_uridines())
@@ -2323,10 +2375,15 @@ def prep_fast5(fast5_fn, corr_grp, overwrite, in_place,
 
     return
 
-def write_error_status(fn, corr_grp, bc_subgrp, error_text):
-    """Write error message for a read into the FAST5 file
+def write_error_status(fast5_data, corr_grp, bc_subgrp, error_text):
+    """Write error message for a read into the FAST5 file (open file handle
+    or filename)
     """
-    with h5py.File(fn, 'r+') as fast5_data:
+    do_close = False
+    if not isinstance(fast5_data, h5py.File):
+        fast5_data = h5py.File(fast5_data, 'r+')
+        do_close = True
+    try:
         analysis_grp = fast5_data['/Analyses']
         corr_grp = analysis_grp[corr_grp]
         if bc_subgrp is not None:
@@ -2335,6 +2392,9 @@ def write_error_status(fn, corr_grp, bc_subgrp, error_text):
             corr_subgrp.attrs['status'] = error_text
         else:
             corr_grp.attrs['status'] = error_text
+    finally:
+        if do_close:
+            fast5_data.close()
 
     return
 
@@ -2364,11 +2424,8 @@ def write_new_fast5_group(
                    (str('base'), 'S1')])
 
         if alignVals is not None:
-            r_align_vals, g_align_vals = zip(*alignVals)
-            np_read_align = np.chararray(len(alignVals))
-            np_read_align[:] = r_align_vals
-            np_genome_align = np.chararray(len(alignVals))
-            np_genome_align[:] = g_align_vals
+            # alignment read and genome rows are stored as ASCII codes
+            np_read_align, np_genome_align = alignVals.view('S1')
     except:
         raise TomboError('Error computing new events')
 